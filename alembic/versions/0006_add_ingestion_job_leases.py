@@ -0,0 +1,59 @@
+"""Add worker lease columns to ingestion jobs
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in the database."""
+    inspector = sa.inspect(op.get_bind())
+    return column_name in {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def upgrade() -> None:
+    """Add lease owner/expiry used by `marketpipe worker` (idempotent).
+
+    Only PostgreSQL job stores are migrated here; SQLite job stores receive
+    the same columns from ``marketpipe.migrations`` (007_ingestion_job_leases).
+    """
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    if not _column_exists("ingestion_jobs", "lease_owner"):
+        op.add_column("ingestion_jobs", sa.Column("lease_owner", sa.String(128), nullable=True))
+    if not _column_exists("ingestion_jobs", "lease_expires_at"):
+        op.add_column(
+            "ingestion_jobs",
+            sa.Column("lease_expires_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_lease "
+        "ON ingestion_jobs (state, lease_expires_at)"
+    )
+
+
+def downgrade() -> None:
+    """Drop lease columns."""
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS idx_ingestion_jobs_lease")
+    op.drop_column("ingestion_jobs", "lease_expires_at")
+    op.drop_column("ingestion_jobs", "lease_owner")
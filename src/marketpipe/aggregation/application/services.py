@@ -4,16 +4,26 @@ from __future__ import annotations
 import logging
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from marketpipe.bootstrap import get_event_bus
 from marketpipe.domain.events import IngestionJobCompleted
 from marketpipe.domain.value_objects import Symbol
+from marketpipe.infrastructure.messaging.stage_executor import (
+    StageExecutor,
+    StageSettings,
+    register_stage,
+)
+from marketpipe.ingestion.domain.events import as_job_completed
 
 from ..domain.events import AggregationCompleted, AggregationFailed
 from ..domain.services import AggregationDomainService
 from ..domain.value_objects import DEFAULT_SPECS
 from ..infrastructure.duckdb_engine import DuckDBAggregationEngine
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class AggregationRunnerService:
     """Application service for coordinating aggregation operations."""
@@ -106,6 +116,20 @@ class AggregationRunnerService:
             # Re-raise to maintain error visibility
             raise
 
+    def aggregate_symbol(self, job_id: str, symbol: str, table: pa.Table) -> int:
+        """Aggregate one symbol's freshly stored bars without reloading them.
+
+        Args:
+            job_id: Ingestion job identifier
+            symbol: Symbol the bars belong to
+            table: Arrow table of the symbol's 1-minute bars
+
+        Returns:
+            Number of frames written
+        """
+        sql_pairs = [(spec, self._domain.duckdb_sql(spec)) for spec in DEFAULT_SPECS]
+        return self._engine.aggregate_table(job_id, symbol, table, sql_pairs)
+
     def run_manual_aggregation(self, job_id: str) -> None:
         """Run aggregation manually for a specific job.
 
@@ -154,11 +178,44 @@ class AggregationRunnerService:
         return cls(engine=engine, domain=domain)
 
     @classmethod
-    def register(cls) -> None:
-        """Register event listener for ingestion completed events."""
+    def register(cls, settings: Optional[StageSettings] = None) -> StageExecutor:
+        """Register event listener for ingestion completed events.
+
+        Aggregation runs on the "aggregation" stage pool, so publishers of
+        ``IngestionJobCompleted`` do not wait for it.
+
+        Args:
+            settings: Stage settings (default: ``$MARKETPIPE_AGGREGATION_STAGE_*``)
+
+        Returns:
+            The stage executor subscribed to the event bus and registered
+            for ingestion coordinators' publishers
+        """
+        settings = settings or StageSettings.from_env("aggregation")
         service = cls.build_default()
-        get_event_bus().subscribe(IngestionJobCompleted, service.handle_ingestion_completed)
+        handler = (
+            handle_ingestion_completed_in_worker
+            if settings.mode == "process"
+            else service.handle_ingestion_completed
+        )
+        stage = StageExecutor("aggregation", handler, settings)
+        get_event_bus().subscribe(IngestionJobCompleted, stage)
+        # Ingestion coordinators publish on their own async publisher
+        register_stage(stage, "ingestion_job_completed", as_job_completed)
 
         logging.getLogger(cls.__name__).info(
-            "Aggregation service registered for IngestionJobCompleted events"
+            f"Aggregation service registered for IngestionJobCompleted events "
+            f"({settings.mode}, {settings.workers} workers)"
         )
+        return stage
+
+
+_worker_service: Optional[AggregationRunnerService] = None
+
+
+def handle_ingestion_completed_in_worker(event: IngestionJobCompleted) -> None:
+    """Process-pool entry point using one default service per worker process."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = AggregationRunnerService.build_default()
+    _worker_service.handle_ingestion_completed(event)
@@ -1,7 +1,15 @@
 # SPDX-License-Identifier: Apache-2.0
 """Aggregation domain layer."""
 
+from .indicators import IndicatorSpec, compile_indicator_sql, parse_indicators
 from .services import AggregationDomainService
 from .value_objects import DEFAULT_SPECS, FrameSpec
 
-__all__ = ["FrameSpec", "DEFAULT_SPECS", "AggregationDomainService"]
+__all__ = [
+    "FrameSpec",
+    "DEFAULT_SPECS",
+    "AggregationDomainService",
+    "IndicatorSpec",
+    "compile_indicator_sql",
+    "parse_indicators",
+]
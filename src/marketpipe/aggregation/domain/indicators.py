@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Technical indicators compiled to DuckDB window-function SQL.
+
+Indicators run inside DuckDB over the ``bars_*`` views or raw partitions, so
+a whole lake can be scored without pulling bars into Python. Every
+indicator is computed per symbol in timestamp order:
+
+    source ─▶ base (row number, previous close, log return per symbol)
+           ─▶ EWM CTEs (ema, rsi, atr) ─▶ rolling windows ─▶ one row per bar
+
+Specs are written ``kind:period[:arg]``, e.g. ``sma:20``, ``ema:12:high``,
+``rsi:14``, ``atr:14``, ``volatility:20``, ``vwap_bands:20:2.5`` or
+``zscore:50``. The optional argument is the price column for sma, ema and
+zscore, and the band width in standard deviations for vwap_bands.
+
+Warm-up rows are NULL: a value is emitted once ``period`` bars (``period``
+returns for volatility and rsi) are available, matching
+``OHLCVCalculationService.calculate_sma`` and ``calculate_volatility``.
+
+Exponentially weighted indicators use the recursive form seeded with the
+first value (pandas ``ewm(adjust=False)``): ``alpha = 2 / (period + 1)`` for
+ema and Wilder's ``alpha = 1 / period`` for rsi and atr. SQL windows cannot
+recurse, so the recursion is unrolled: rows are split into blocks of B rows
+per symbol, each row sums its block so far with weights relative to the
+block start, and adds the previous block's total decayed to the row. Blocks
+before that weigh less than ``(1 - alpha) ** B`` (below 1e-17), so the
+result equals the recursion to float precision.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Union
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+INDICATOR_KINDS = ("sma", "ema", "volatility", "rsi", "atr", "vwap_bands", "zscore")
+_COLUMN_ARG_KINDS = ("sma", "ema", "zscore")
+# Decay of the dropped history in the EWM unrolling: exp(-40) ~ 4e-18
+_EWM_BLOCK_DECAY = 40.0
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """One indicator over one price column.
+
+    Attributes:
+        kind: Indicator kind, one of ``INDICATOR_KINDS``
+        period: Window length in bars
+        column: Price column for sma, ema and zscore
+        width: Band width in standard deviations for vwap_bands
+    """
+
+    kind: str
+    period: int
+    column: str = "close"
+    width: float = 2.0
+
+    def __post_init__(self) -> None:
+        if self.kind not in INDICATOR_KINDS:
+            raise ValueError(
+                f"Unknown indicator {self.kind!r}; expected one of: {', '.join(INDICATOR_KINDS)}"
+            )
+        minimum = 1 if self.kind == "sma" else 2
+        if self.period < minimum:
+            raise ValueError(f"{self.kind} period must be at least {minimum}")
+        if self.column not in PRICE_COLUMNS:
+            raise ValueError(f"column must be one of: {', '.join(PRICE_COLUMNS)}")
+        if self.width <= 0:
+            raise ValueError("width must be positive")
+
+    @classmethod
+    def parse(cls, text: str) -> IndicatorSpec:
+        """Parse ``kind:period[:arg]`` (see the module docstring)."""
+        parts = [p.strip() for p in text.strip().lower().split(":")]
+        if len(parts) not in (2, 3) or not parts[1].isdigit():
+            raise ValueError(f"Invalid indicator {text!r}; expected kind:period[:arg]")
+        kind, period = parts[0], int(parts[1])
+        if len(parts) == 2:
+            return cls(kind, period)
+        if kind in _COLUMN_ARG_KINDS:
+            return cls(kind, period, column=parts[2])
+        if kind == "vwap_bands":
+            try:
+                return cls(kind, period, width=float(parts[2]))
+            except ValueError:
+                raise ValueError(f"Invalid band width in {text!r}") from None
+        raise ValueError(f"{kind} takes no argument: {text!r}")
+
+    @property
+    def name(self) -> str:
+        """Output column name, e.g. ``sma_20`` or ``ema_12_high``."""
+        name = f"{self.kind}_{self.period}"
+        if self.kind in _COLUMN_ARG_KINDS and self.column != "close":
+            name += f"_{self.column}"
+        return name
+
+    @property
+    def output_columns(self) -> tuple[str, ...]:
+        """Columns this indicator adds to the result."""
+        if self.kind == "vwap_bands":
+            return (f"vwap_{self.period}", f"vwap_upper_{self.period}", f"vwap_lower_{self.period}")
+        return (self.name,)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+IndicatorLike = Union[IndicatorSpec, str]
+
+
+def parse_indicators(specs: Iterable[IndicatorLike]) -> list[IndicatorSpec]:
+    """Parse specs, dropping duplicates while keeping order.
+
+    Raises:
+        ValueError: If no indicator is given, a spec is invalid or two
+            indicators produce the same output column
+    """
+    parsed: list[IndicatorSpec] = []
+    for spec in specs:
+        spec = spec if isinstance(spec, IndicatorSpec) else IndicatorSpec.parse(spec)
+        if spec not in parsed:
+            parsed.append(spec)
+    if not parsed:
+        raise ValueError("At least one indicator is required")
+    columns = [c for spec in parsed for c in spec.output_columns]
+    duplicates = sorted({c for c in columns if columns.count(c) > 1})
+    if duplicates:
+        raise ValueError(f"Indicators produce the same column: {', '.join(duplicates)}")
+    return parsed
+
+
+def _ewm_ctes(name: str, value_sql: str, alpha: float, first_row: int) -> list[str]:
+    """CTEs computing ``name.value``, the recursive EWM of ``value_sql`` over ``base``.
+
+    The series starts at row ``first_row`` of each symbol; ``value`` is
+    ``alpha * S + (1 - alpha) ** (j + 1) * x0`` with ``S`` the decayed sum of
+    the series up to index ``j`` and ``x0`` its first value.
+    """
+    decay = 1.0 - alpha
+    block = math.ceil(_EWM_BLOCK_DECAY / -math.log(decay))
+    j = f"(rn - {first_row})"
+    return [
+        f"""{name}_part AS (
+        SELECT symbol, rn, {j} // {block} AS blk, {j} % {block} AS k,
+            SUM(x * POW({decay!r}, -({j} % {block}))) OVER (
+                PARTITION BY symbol, {j} // {block} ORDER BY rn
+            ) AS part,
+            FIRST_VALUE(x) OVER (PARTITION BY symbol ORDER BY rn) AS x0
+        FROM (SELECT symbol, rn, {value_sql} AS x FROM base WHERE rn >= {first_row})
+    )""",
+        f"""{name}_carry AS (
+        SELECT symbol, blk + 1 AS blk, arg_max(part, k) * POW({decay!r}, max(k)) AS carry
+        FROM {name}_part GROUP BY symbol, blk
+    )""",
+        f"""{name} AS (
+        SELECT p.symbol, p.rn,
+            {alpha!r} * (POW({decay!r}, p.k) * p.part
+                + COALESCE(c.carry, 0) * POW({decay!r}, p.k + 1))
+            + POW({decay!r}, p.rn - {first_row} + 1) * p.x0 AS value
+        FROM {name}_part p LEFT JOIN {name}_carry c ON c.symbol = p.symbol AND c.blk = p.blk
+    )""",
+    ]
+
+
+def _rolling(period: int) -> str:
+    """Window over the last ``period`` rows of the symbol, ending at the current row."""
+    frame = f"ROWS BETWEEN {period - 1} PRECEDING AND CURRENT ROW"
+    return f"OVER (PARTITION BY b.symbol ORDER BY b.rn {frame})"
+
+
+def _after_warm_up(rows: int, value_sql: str) -> str:
+    """``value_sql`` once a symbol has more than ``rows`` rows before it, else NULL."""
+    return f"CASE WHEN b.rn >= {rows} THEN {value_sql} END"
+
+
+def compile_indicator_sql(
+    specs: Iterable[IndicatorLike], src_table: str = "bars", where: str = ""
+) -> str:
+    """Compile indicators into one DuckDB query over ``src_table``.
+
+    Args:
+        specs: Indicators as ``IndicatorSpec`` or ``kind:period[:arg]`` strings
+        src_table: Table, view or table function with symbol, ts_ns and OHLCV columns
+        where: Optional filter applied to the source before any window, e.g. on symbol
+
+    Returns:
+        SQL selecting symbol, ts_ns and every indicator column, ordered by symbol and ts_ns
+    """
+    parsed = parse_indicators(specs)
+    ctes = [f"""base AS (
+        SELECT symbol, ts_ns, CAST(open AS DOUBLE) AS open, CAST(high AS DOUBLE) AS high,
+            CAST(low AS DOUBLE) AS low, CAST(close AS DOUBLE) AS close, volume,
+            ROW_NUMBER() OVER w - 1 AS rn,
+            CAST(LAG(close) OVER w AS DOUBLE) AS prev_close,
+            LN(CAST(close AS DOUBLE) / LAG(close) OVER w) AS log_return
+        FROM {src_table}
+        {f"WHERE {where}" if where else ""}
+        WINDOW w AS (PARTITION BY symbol ORDER BY ts_ns)
+    )"""]
+    joins: list[str] = []
+    selects: list[str] = []
+
+    def ewm(name: str, value_sql: str, alpha: float, first_row: int) -> str:
+        if name not in joins:
+            ctes.extend(_ewm_ctes(name, value_sql, alpha, first_row))
+            joins.append(name)
+        return f"{name}.value"
+
+    for spec in parsed:
+        n = spec.period
+        if spec.kind == "sma":
+            value = _after_warm_up(n - 1, f"AVG(b.{spec.column}) {_rolling(n)}")
+        elif spec.kind == "ema":
+            value = _after_warm_up(n - 1, ewm(spec.name, spec.column, 2.0 / (n + 1), 0))
+        elif spec.kind == "zscore":
+            mean = f"AVG(b.{spec.column}) {_rolling(n)}"
+            std = f"STDDEV_SAMP(b.{spec.column}) {_rolling(n)}"
+            value = _after_warm_up(n - 1, f"(b.{spec.column} - {mean}) / NULLIF({std}, 0)")
+        elif spec.kind == "volatility":
+            value = _after_warm_up(n, f"STDDEV_SAMP(b.log_return) {_rolling(n)}")
+        elif spec.kind == "rsi":
+            gain = ewm(f"rsi_gain_{n}", "GREATEST(close - prev_close, 0)", 1.0 / n, 1)
+            loss = ewm(f"rsi_loss_{n}", "GREATEST(prev_close - close, 0)", 1.0 / n, 1)
+            value = _after_warm_up(
+                n,
+                f"CASE WHEN {loss} = 0 THEN 100.0 ELSE 100.0 - 100.0 / (1 + {gain} / {loss}) END",
+            )
+        elif spec.kind == "atr":
+            true_range = (
+                "CASE WHEN prev_close IS NULL THEN high - low ELSE GREATEST("
+                "high - low, ABS(high - prev_close), ABS(low - prev_close)) END"
+            )
+            value = _after_warm_up(n - 1, ewm(f"atr_{n}", true_range, 1.0 / n, 0))
+        else:  # vwap_bands
+            typical = "(b.high + b.low + b.close) / 3"
+            volume = f"SUM(b.volume) {_rolling(n)}"
+            vwap = f"SUM({typical} * b.volume) {_rolling(n)} / NULLIF({volume}, 0)"
+            second = f"SUM({typical} * {typical} * b.volume) {_rolling(n)} / NULLIF({volume}, 0)"
+            band = f"{spec.width!r} * SQRT(GREATEST({second} - POW({vwap}, 2), 0))"
+            middle, upper, lower = spec.output_columns
+            selects += [
+                f"{_after_warm_up(n - 1, vwap)} AS {middle}",
+                f"{_after_warm_up(n - 1, f'{vwap} + {band}')} AS {upper}",
+                f"{_after_warm_up(n - 1, f'{vwap} - {band}')} AS {lower}",
+            ]
+            continue
+        selects.append(f"{value} AS {spec.name}")
+
+    join_sql = "".join(
+        f"\n    LEFT JOIN {name} ON {name}.symbol = b.symbol AND {name}.rn = b.rn" for name in joins
+    )
+    return (
+        "WITH "
+        + ",\n    ".join(ctes)
+        + "\nSELECT b.symbol, b.ts_ns,\n    "
+        + ",\n    ".join(selects)
+        + f"\nFROM base b{join_sql}\nORDER BY b.symbol, b.ts_ns"
+    )
+
+
+__all__ = [
+    "INDICATOR_KINDS",
+    "IndicatorLike",
+    "IndicatorSpec",
+    "compile_indicator_sql",
+    "parse_indicators",
+]
@@ -1,31 +1,50 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+from marketpipe.domain.calendar import NS_PER_DAY, NS_PER_MINUTE
+
 from .value_objects import FrameSpec
 
+# 13:30 UTC, the open without DST, for days outside the calendar
+_NOMINAL_OPEN_NS = (13 * 60 + 30) * NS_PER_MINUTE
+
 
 class AggregationDomainService:
     """Pure logic for resampling 1-minute bars to higher frames using DuckDB SQL strings."""
 
     @staticmethod
-    def duckdb_sql(frame: FrameSpec, src_table: str = "bars") -> str:
-        """Generate DuckDB SQL for aggregating 1-minute bars to specified timeframe."""
+    def duckdb_sql(
+        frame: FrameSpec, src_table: str = "bars", sessions_table: str = "sessions"
+    ) -> str:
+        """Generate DuckDB SQL for aggregating 1-minute bars to specified timeframe.
+
+        Daily bars group the bars of each UTC day and are stamped with that
+        day's session open from ``sessions_table`` (``day``, ``open_ns``
+        columns, see ``TradingCalendar.session_table``), so they follow DST.
+        Days missing from it fall back to 13:30 UTC.
+        """
         window_ns = frame.seconds * 1_000_000_000
 
-        # Special handling for daily bars - align to market open (13:30 UTC)
         if frame.name == "1d":
             return f"""
+            WITH days AS (
+                SELECT
+                    symbol,
+                    ts_ns // {NS_PER_DAY} AS day,
+                    first(open ORDER BY ts_ns)  AS open,
+                    max(high)    AS high,
+                    min(low)     AS low,
+                    last(close ORDER BY ts_ns)  AS close,
+                    sum(volume)  AS volume
+                FROM {src_table}
+                GROUP BY symbol, ts_ns // {NS_PER_DAY}
+            )
             SELECT
-                symbol,
-                -- Align to market open: convert to UTC date, then add 13.5 hours (13:30 UTC)
-                CAST((extract(epoch from date_trunc('day', to_timestamp(ts_ns / 1000000000) AT TIME ZONE 'UTC')) + 13.5 * 3600) * 1000000000 AS BIGINT) AS ts_ns,
-                first(open ORDER BY ts_ns)  AS open,
-                max(high)    AS high,
-                min(low)     AS low,
-                last(close ORDER BY ts_ns)  AS close,
-                sum(volume)  AS volume
-            FROM {src_table}
-            GROUP BY symbol, date_trunc('day', to_timestamp(ts_ns / 1000000000) AT TIME ZONE 'UTC')
+                d.symbol,
+                COALESCE(s.open_ns, d.day * {NS_PER_DAY} + {_NOMINAL_OPEN_NS}) AS ts_ns,
+                d.open, d.high, d.low, d.close, d.volume
+            FROM days d
+            LEFT JOIN {sessions_table} s ON s.day = d.day
             ORDER BY symbol, ts_ns
             """
         else:
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 """Aggregation infrastructure layer."""
 
-from . import duckdb_views
+from . import duckdb_views, indicators
 from .duckdb_engine import DuckDBAggregationEngine
 
-__all__ = ["DuckDBAggregationEngine", "duckdb_views"]
+__all__ = ["DuckDBAggregationEngine", "duckdb_views", "indicators"]
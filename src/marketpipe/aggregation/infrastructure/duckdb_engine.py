@@ -9,6 +9,8 @@ import duckdb
 import pandas as pd
 import pyarrow as pa
 
+from marketpipe.config.calendar import configured_calendar
+from marketpipe.domain.calendar import NS_PER_DAY
 from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
 
 from ..domain.value_objects import FrameSpec
@@ -60,36 +62,86 @@ class DuckDBAggregationEngine:
                     df = df.copy()
                     df["symbol"] = symbol
 
-                # Register DataFrame as table in DuckDB
-                con.register("bars", pa.Table.from_pandas(df))
+                self._aggregate_bars(con, pa.Table.from_pandas(df), symbol, job_id, frame_sql_pairs)
 
-                # Execute aggregation for each timeframe
-                for spec, sql in frame_sql_pairs:
-                    self.log.debug(f"Executing aggregation for {spec.name} frame")
+            con.close()
+            self.log.info(f"Completed aggregation for job {job_id}")
 
-                    try:
-                        # Execute aggregation SQL
-                        result_df = con.execute(sql).fetch_df()
+        except Exception as e:
+            self.log.error(f"Aggregation failed for job {job_id}: {e}")
+            raise
 
-                        if result_df.empty:
-                            self.log.warning(f"No aggregated data for {symbol} {spec.name}")
-                            continue
+    def aggregate_table(
+        self,
+        job_id: str,
+        symbol: str,
+        table: pa.Table,
+        frame_sql_pairs: list[tuple[FrameSpec, str]],
+    ) -> int:
+        """Aggregate one symbol's 1-minute bars held in memory.
 
-                        # Write aggregated data using the new storage engine
-                        self._write_aggregated_data(result_df, symbol, spec, job_id)
+        Used by pipelined ingestion, which hands each symbol's bars over as
+        soon as they are stored instead of re-reading the job from disk.
+        Safe to call from several threads at once.
 
-                        self.log.info(f"Aggregated {len(result_df)} {spec.name} bars for {symbol}")
+        Args:
+            job_id: Ingestion job identifier
+            symbol: Symbol the bars belong to
+            table: Arrow table with ts_ns, open, high, low, close, volume
+            frame_sql_pairs: List of (FrameSpec, SQL) tuples for aggregation
 
-                    except Exception as e:
-                        self.log.error(f"Failed to aggregate {symbol} to {spec.name}: {e}")
-                        continue
+        Returns:
+            Number of frames written
+        """
+        if "symbol" not in table.column_names:
+            table = table.append_column("symbol", pa.repeat(symbol, table.num_rows))
 
+        con = duckdb.connect(":memory:")
+        try:
+            return self._aggregate_bars(con, table, symbol, job_id, frame_sql_pairs)
+        finally:
             con.close()
-            self.log.info(f"Completed aggregation for job {job_id}")
 
-        except Exception as e:
-            self.log.error(f"Aggregation failed for job {job_id}: {e}")
-            raise
+    def _aggregate_bars(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        table: pa.Table,
+        symbol: str,
+        job_id: str,
+        frame_sql_pairs: list[tuple[FrameSpec, str]],
+    ) -> int:
+        """Run every frame's SQL over one symbol's bars and write the results."""
+        # Register table in DuckDB, with the sessions daily bars are stamped from
+        con.register("bars", table)
+        ts_ns = table.column("ts_ns").to_numpy().astype("int64")
+        con.register("sessions", pa.table(configured_calendar().session_table(ts_ns // NS_PER_DAY)))
+
+        frames_written = 0
+        # Execute aggregation for each timeframe
+        for spec, sql in frame_sql_pairs:
+            self.log.debug(f"Executing aggregation for {spec.name} frame")
+
+            try:
+                # Execute aggregation SQL
+                result_df = con.execute(sql).fetch_df()
+
+                if result_df.empty:
+                    self.log.warning(f"No aggregated data for {symbol} {spec.name}")
+                    continue
+
+                # Write aggregated data using the new storage engine
+                self._write_aggregated_data(result_df, symbol, spec, job_id)
+                frames_written += 1
+
+                self.log.info(f"Aggregated {len(result_df)} {spec.name} bars for {symbol}")
+
+            except Exception as e:
+                self.log.error(f"Failed to aggregate {symbol} to {spec.name}: {e}")
+                continue
+
+        con.unregister("bars")
+        con.unregister("sessions")
+        return frames_written
 
     def _write_aggregated_data(
         self, df: pd.DataFrame, symbol: str, spec: FrameSpec, job_id: str
@@ -138,16 +190,7 @@ class DuckDBAggregationEngine:
         Returns:
             DataFrame with aggregated OHLCV data
         """
-        # Use the new storage engine to load data
-        df = self._agg_storage.load_symbol_data(symbol=symbol, frame=frame.name)
-
-        if df.empty:
-            return df
-
-        # Apply time filtering if specified
-        if start_ts is not None and "ts_ns" in df.columns:
-            df = df[df["ts_ns"] >= start_ts]
-        if end_ts is not None and "ts_ns" in df.columns:
-            df = df[df["ts_ns"] <= end_ts]
-
-        return df
+        # Time filters are pushed down to the Parquet scan
+        return self._agg_storage.load_symbol_data(
+            symbol=symbol, frame=frame.name, start_ts=start_ts, end_ts=end_ts
+        )
@@ -11,6 +11,8 @@ from typing import Union
 import duckdb
 import pandas as pd
 
+from marketpipe.infrastructure.storage.layout import LAYOUT_CLUSTERED, detect_layout
+
 # Default path to aggregated data - can be overridden for testing
 AGG_ROOT = Path("data/agg")
 
@@ -31,6 +33,22 @@ def _get_connection() -> duckdb.DuckDBPyConnection:
     return con
 
 
+def bars_scan_sql(glob: str, *, union_by_name: bool = False) -> str:
+    """``SELECT`` over the bar files matching ``glob``, with a DATE ``date`` column.
+
+    Compacted buckets keep the hive ``date=`` key with a month or year label
+    (``date=2024-01``), so the key is read as text and replaced by each
+    bar's UTC date taken from ``ts_ns``.
+    """
+    options = "hive_partitioning=1, hive_types={'date': VARCHAR}"
+    if union_by_name:
+        options += ", union_by_name=1"
+    return (
+        "SELECT * REPLACE (CAST(make_timestamp(ts_ns // 1000) AS DATE) AS date) "
+        f"FROM parquet_scan('{glob}', {options})"
+    )
+
+
 def _attach_partition(frame: str) -> None:
     """Attach a timeframe partition as a view.
 
@@ -46,16 +64,18 @@ def _attach_partition(frame: str) -> None:
             f"CREATE OR REPLACE VIEW bars_{frame} AS "
             f"SELECT NULL::VARCHAR as symbol, NULL::BIGINT as ts_ns, "
             f"NULL::DOUBLE as open, NULL::DOUBLE as high, NULL::DOUBLE as low, "
-            f"NULL::DOUBLE as close, NULL::BIGINT as volume, NULL::VARCHAR as date "
+            f"NULL::DOUBLE as close, NULL::BIGINT as volume, NULL::DATE as date "
             f"WHERE 1=0"
         )
         return
 
-    # Create view using Hive partitioning
-    view_sql = (
-        f"CREATE OR REPLACE VIEW bars_{frame} AS "
-        f"SELECT * FROM parquet_scan('{path}/**/*.parquet', hive_partitioning=1)"
-    )
+    # Create view using Hive partitioning; clustered frames hold every symbol
+    # in one file per day, so only their day directories are scanned
+    if detect_layout(path) == LAYOUT_CLUSTERED:
+        scan = bars_scan_sql(f"{path}/date=*/*.parquet", union_by_name=True)
+    else:
+        scan = bars_scan_sql(f"{path}/**/*.parquet")
+    view_sql = f"CREATE OR REPLACE VIEW bars_{frame} AS {scan}"
 
     try:
         _get_connection().execute(view_sql)
@@ -67,7 +87,7 @@ def _attach_partition(frame: str) -> None:
             f"CREATE OR REPLACE VIEW bars_{frame} AS "
             f"SELECT NULL::VARCHAR as symbol, NULL::BIGINT as ts_ns, "
             f"NULL::DOUBLE as open, NULL::DOUBLE as high, NULL::DOUBLE as low, "
-            f"NULL::DOUBLE as close, NULL::BIGINT as volume, NULL::VARCHAR as date "
+            f"NULL::DOUBLE as close, NULL::BIGINT as volume, NULL::DATE as date "
             f"WHERE 1=0"
         )
 
@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Run indicator SQL over the lake and materialize the results to Parquet.
+
+Sources are the aggregated ``bars_<frame>`` views of ``duckdb_views`` or a
+raw frame directory (either layout). Materialized indicators are written
+per symbol and read back without recomputing anything:
+
+    <root>/frame=1d/symbol=AAPL/data_0.parquet   # symbol, ts_ns, sma_20, ...
+
+Indicator values depend only on earlier bars, so ``end`` is pushed down to
+the source while ``start`` only filters the output: the values for a range
+equal those of a full-history run.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Union
+
+import duckdb
+import pandas as pd
+
+from marketpipe.infrastructure.storage.layout import LAYOUT_CLUSTERED, detect_layout
+
+from ..domain.indicators import IndicatorLike, compile_indicator_sql, parse_indicators
+from . import duckdb_views
+
+# Default root of materialized indicators
+INDICATOR_ROOT = Path("data/indicators")
+
+logger = logging.getLogger(__name__)
+
+
+def _day_ns(day: date) -> int:
+    """Nanoseconds since the epoch at UTC midnight of ``day``."""
+    midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return int(midnight.timestamp()) * 1_000_000_000
+
+
+def _sql_list(values: Iterable[str]) -> str:
+    return ", ".join("'" + v.replace("'", "''") + "'" for v in values)
+
+
+def _frame_glob(frame_path: Path) -> str:
+    """Parquet glob of a frame directory in either layout."""
+    if detect_layout(frame_path) == LAYOUT_CLUSTERED:
+        return str(frame_path / "date=*" / "*.parquet")
+    return str(frame_path / "**" / "*.parquet")
+
+
+def indicator_source(
+    frame: str = "1d", raw_root: Optional[Union[str, Path]] = None
+) -> tuple[duckdb.DuckDBPyConnection, str]:
+    """Connection and source relation for indicator queries.
+
+    Args:
+        frame: Frame to read (``bars_<frame>`` view, or ``frame=<frame>`` under raw_root)
+        raw_root: Read raw partitions under this root instead of the aggregated views
+
+    Raises:
+        FileNotFoundError: If raw_root has no data for the frame
+    """
+    con = duckdb_views._get_connection()
+    if raw_root is None:
+        duckdb_views.ensure_views()
+        return con, f"bars_{frame}"
+
+    frame_path = Path(raw_root) / f"frame={frame}"
+    if not any(frame_path.rglob("*.parquet")):
+        raise FileNotFoundError(f"No raw data for frame {frame} under {raw_root}")
+    glob = _frame_glob(frame_path).replace("'", "''")
+    return con, f"({duckdb_views.bars_scan_sql(glob, union_by_name=True)})"
+
+
+def indicator_query(
+    indicators: Iterable[IndicatorLike],
+    source: str,
+    *,
+    symbols: Optional[Iterable[str]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> str:
+    """SQL computing indicators over ``source`` for symbols and an inclusive date range."""
+    where = []
+    if symbols:
+        where.append(f"symbol IN ({_sql_list(symbols)})")
+    if end is not None:
+        where.append(f"ts_ns < {_day_ns(end + timedelta(days=1))}")
+    sql = compile_indicator_sql(indicators, source, " AND ".join(where))
+    if start is None:
+        return sql
+    return f"SELECT * FROM ({sql}) WHERE ts_ns >= {_day_ns(start)} ORDER BY symbol, ts_ns"
+
+
+def compute_indicators(
+    indicators: Iterable[IndicatorLike],
+    *,
+    frame: str = "1d",
+    symbols: Optional[Iterable[str]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    raw_root: Optional[Union[str, Path]] = None,
+) -> pd.DataFrame:
+    """Compute indicators in DuckDB.
+
+    Args:
+        indicators: ``IndicatorSpec`` objects or ``kind:period[:arg]`` strings
+        frame: Frame to read
+        symbols: Only these symbols (default: all)
+        start: First trading day to return
+        end: Last trading day to return
+        raw_root: Read raw partitions under this root instead of the aggregated views
+
+    Returns:
+        symbol, ts_ns and one column per indicator output, ordered by symbol and ts_ns
+    """
+    specs = parse_indicators(indicators)
+    con, source = indicator_source(frame, raw_root)
+    sql = indicator_query(specs, source, symbols=symbols, start=start, end=end)
+    logger.debug(f"Computing {len(specs)} indicators over {source}")
+    return con.execute(sql).fetch_df()
+
+
+def materialize_indicators(
+    indicators: Iterable[IndicatorLike],
+    output_root: Union[str, Path] = INDICATOR_ROOT,
+    *,
+    frame: str = "1d",
+    symbols: Optional[Iterable[str]] = None,
+    raw_root: Optional[Union[str, Path]] = None,
+) -> int:
+    """Compute indicators over full history and write them to Parquet by symbol.
+
+    Existing results for the written symbols (every symbol when ``symbols``
+    is not given) are replaced.
+
+    Returns:
+        Number of rows written
+    """
+    specs = parse_indicators(indicators)
+    symbol_list = list(symbols or [])
+    con, source = indicator_source(frame, raw_root)
+    sql = indicator_query(specs, source, symbols=symbol_list)
+
+    frame_path = Path(output_root) / f"frame={frame}"
+    if not symbol_list:
+        shutil.rmtree(frame_path, ignore_errors=True)
+    for symbol in symbol_list:
+        shutil.rmtree(frame_path / f"symbol={symbol}", ignore_errors=True)
+    frame_path.mkdir(parents=True, exist_ok=True)
+
+    target = str(frame_path).replace("'", "''")
+    rows = con.execute(
+        f"COPY ({sql}) TO '{target}' "
+        "(FORMAT PARQUET, PARTITION_BY (symbol), OVERWRITE_OR_IGNORE 1)"
+    ).fetchone()
+    count = int(rows[0]) if rows else 0
+    logger.info(f"Materialized {count} rows of {len(specs)} indicators to {frame_path}")
+    return count
+
+
+def load_indicators(
+    output_root: Union[str, Path] = INDICATOR_ROOT,
+    *,
+    frame: str = "1d",
+    symbols: Optional[Iterable[str]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> pd.DataFrame:
+    """Read materialized indicators.
+
+    Returns:
+        symbol, ts_ns and the materialized indicator columns, ordered by symbol and ts_ns;
+        empty when nothing has been materialized for the frame
+    """
+    frame_path = Path(output_root) / f"frame={frame}"
+    if not any(frame_path.rglob("*.parquet")):
+        return pd.DataFrame(columns=["symbol", "ts_ns"])
+
+    where = ["TRUE"]
+    if symbols:
+        where.append(f"symbol IN ({_sql_list(symbols)})")
+    if start is not None:
+        where.append(f"ts_ns >= {_day_ns(start)}")
+    if end is not None:
+        where.append(f"ts_ns < {_day_ns(end + timedelta(days=1))}")
+    glob = str(frame_path / "symbol=*" / "*.parquet").replace("'", "''")
+    con = duckdb.connect(":memory:")
+    try:
+        df = con.execute(
+            f"SELECT * EXCLUDE (frame) FROM read_parquet('{glob}', hive_partitioning=1) "
+            f"WHERE {' AND '.join(where)} ORDER BY symbol, ts_ns"
+        ).fetch_df()
+    finally:
+        con.close()
+    # Hive partitioning appends the partition key; keep the computed column order
+    return df[["symbol", *[c for c in df.columns if c != "symbol"]]]
+
+
+__all__ = [
+    "INDICATOR_ROOT",
+    "compute_indicators",
+    "indicator_query",
+    "indicator_source",
+    "load_indicators",
+    "materialize_indicators",
+]
@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: Apache-2.0
+"""End-to-end ingestion benchmarks (``marketpipe bench``)."""
+
+from .results import (
+    BenchResult,
+    Comparison,
+    ResultStore,
+    compare_results,
+    load_baseline,
+    save_baseline,
+)
+from .runner import run_scenario
+from .scenarios import SCENARIOS, BenchScenario, get_scenario
+
+__all__ = [
+    "BenchResult",
+    "BenchScenario",
+    "Comparison",
+    "ResultStore",
+    "SCENARIOS",
+    "compare_results",
+    "get_scenario",
+    "load_baseline",
+    "run_scenario",
+    "save_baseline",
+]
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark results, their store and regression checks against a baseline.
+
+Every run is appended to a JSON-lines file; a baseline is a JSON object
+holding one chosen result per scenario. ``compare_results`` matches the
+latest run of each scenario with its baseline entry:
+
+    data/bench/results.jsonl   {"scenario": "smoke", "bars_per_second": 48211.3, ...}
+    data/bench/baseline.json   {"smoke": {...}, "wide": {...}}
+
+Throughput dropping, or peak RSS growing, by more than the threshold is a
+regression. Stage times are reported alongside but do not fail a
+comparison: they are cumulative across concurrently processed symbols and
+too noisy on short runs.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+RESULTS_PATH = Path("data/bench/results.jsonl")
+BASELINE_PATH = Path("data/bench/baseline.json")
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Outcome of one scenario run.
+
+    Attributes:
+        scenario: Scenario name
+        bars: Bars stored by the ingestion job
+        seconds: Wall time of the job, including validation and aggregation
+        stages: Cumulative seconds per stage (fetch, validate, store, ...)
+        peak_rss_mb: Peak resident set size during the run
+        params: Scenario shape (symbols, days, timeframe, source)
+        recorded_at: ISO timestamp of the run
+        python: Python version the run used
+    """
+
+    scenario: str
+    bars: int
+    seconds: float
+    stages: dict[str, float] = field(default_factory=dict)
+    peak_rss_mb: float = 0.0
+    params: dict[str, Any] = field(default_factory=dict)
+    recorded_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    python: str = field(default_factory=platform.python_version)
+
+    @property
+    def bars_per_second(self) -> float:
+        return self.bars / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["bars_per_second"] = round(self.bars_per_second, 1)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchResult:
+        fields = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in fields})
+
+
+class ResultStore:
+    """Append-only JSON-lines store of benchmark results."""
+
+    def __init__(self, path: Union[str, Path] = RESULTS_PATH):
+        self.path = Path(path)
+
+    def append(self, result: BenchResult) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(result.to_dict(), sort_keys=True) + "\n")
+
+    def load(self) -> list[BenchResult]:
+        """All stored results, oldest first (empty when nothing was stored)."""
+        if not self.path.exists():
+            return []
+        with self.path.open(encoding="utf-8") as f:
+            return [BenchResult.from_dict(json.loads(line)) for line in f if line.strip()]
+
+    def latest(self) -> dict[str, BenchResult]:
+        """Most recent result of each scenario."""
+        return {result.scenario: result for result in self.load()}
+
+
+def save_baseline(results: dict[str, BenchResult], path: Union[str, Path] = BASELINE_PATH) -> Path:
+    """Merge results into the baseline file, replacing entries of the same scenarios."""
+    path = Path(path)
+    baseline = load_baseline(path)
+    baseline.update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({name: r.to_dict() for name, r in sorted(baseline.items())}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def load_baseline(path: Union[str, Path] = BASELINE_PATH) -> dict[str, BenchResult]:
+    """Baseline results by scenario (empty when there is no baseline yet)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {name: BenchResult.from_dict(result) for name, result in data.items()}
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A scenario's latest result against its baseline.
+
+    Attributes:
+        scenario: Scenario name
+        current: Latest result
+        baseline: Baseline result, or None when the scenario has none
+        threshold: Relative change that counts as a regression
+    """
+
+    scenario: str
+    current: BenchResult
+    baseline: Optional[BenchResult]
+    threshold: float = DEFAULT_THRESHOLD
+
+    @staticmethod
+    def _change(current: float, baseline: float) -> Optional[float]:
+        return (current - baseline) / baseline if baseline > 0 else None
+
+    @property
+    def throughput_change(self) -> Optional[float]:
+        """Relative change of bars per second (negative is slower)."""
+        if self.baseline is None:
+            return None
+        return self._change(self.current.bars_per_second, self.baseline.bars_per_second)
+
+    @property
+    def rss_change(self) -> Optional[float]:
+        """Relative change of peak RSS (positive is more memory)."""
+        if self.baseline is None:
+            return None
+        return self._change(self.current.peak_rss_mb, self.baseline.peak_rss_mb)
+
+    @property
+    def stage_changes(self) -> dict[str, Optional[float]]:
+        """Relative change of each stage's time present in both results."""
+        if self.baseline is None:
+            return {}
+        return {
+            stage: self._change(seconds, self.baseline.stages[stage])
+            for stage, seconds in self.current.stages.items()
+            if stage in self.baseline.stages
+        }
+
+    @property
+    def params_changed(self) -> bool:
+        return self.baseline is not None and self.baseline.params != self.current.params
+
+    @property
+    def regressions(self) -> list[str]:
+        """Human-readable regressions; empty when the scenario is within threshold."""
+        found = []
+        throughput = self.throughput_change
+        if throughput is not None and throughput < -self.threshold:
+            found.append(
+                f"throughput {self.current.bars_per_second:,.0f} bars/s vs "
+                f"{self.baseline.bars_per_second:,.0f} ({throughput:+.1%})"  # type: ignore[union-attr]
+            )
+        rss = self.rss_change
+        if rss is not None and rss > self.threshold:
+            found.append(
+                f"peak RSS {self.current.peak_rss_mb:,.0f} MB vs "
+                f"{self.baseline.peak_rss_mb:,.0f} MB ({rss:+.1%})"  # type: ignore[union-attr]
+            )
+        return found
+
+
+def compare_results(
+    current: dict[str, BenchResult],
+    baseline: dict[str, BenchResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare results with the baseline, one comparison per current scenario."""
+    if threshold < 0:
+        raise ValueError("threshold must not be negative")
+    return [
+        Comparison(name, result, baseline.get(name), threshold)
+        for name, result in sorted(current.items())
+    ]
+
+
+__all__ = [
+    "BASELINE_PATH",
+    "DEFAULT_THRESHOLD",
+    "RESULTS_PATH",
+    "BenchResult",
+    "Comparison",
+    "ResultStore",
+    "compare_results",
+    "load_baseline",
+    "save_baseline",
+]
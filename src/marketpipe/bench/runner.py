@@ -0,0 +1,397 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Run a benchmark scenario through the real ingestion coordinator.
+
+The coordinator is wired as ``marketpipe ingest --pipelined`` wires it,
+except that every store lives in a scratch directory and each stage is
+wrapped to time its calls:
+
+    provider.fetch_bars ─▶ validator.validate_bars ─▶ storage.store_bars
+        "fetch"               "validate"                 "store"
+                                                           │ submit (inline)
+                               "pipeline_validation" ◀─────┴────▶ "aggregate"
+
+Stage times are summed over symbols, which the coordinator processes
+concurrently, so they can add up to more than the wall time. Peak RSS is
+sampled with psutil while the job runs, falling back to the process
+high-water mark from ``resource`` when psutil is not installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
+
+from .results import BenchResult
+from .scenarios import BenchScenario
+
+if TYPE_CHECKING:
+    from marketpipe.domain.market_data import IMarketDataProvider
+
+DEFAULT_WORKERS = 4
+
+
+class StageTimer:
+    """Thread-safe cumulative timer per stage name."""
+
+    def __init__(self):
+        self._totals: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._totals[stage] = self._totals.get(stage, 0.0) + elapsed
+
+    def totals(self) -> dict[str, float]:
+        with self._lock:
+            return {stage: round(seconds, 4) for stage, seconds in self._totals.items()}
+
+    def wrap(self, target: Any, **stages: str) -> Any:
+        """Proxy of ``target`` timing the given methods, e.g. ``fetch_bars="fetch"``."""
+        return _Timed(target, self, stages)
+
+
+class _Timed:
+    """Forwards attribute access, timing the methods mapped to a stage."""
+
+    def __init__(self, target: Any, timer: StageTimer, stages: dict[str, str]):
+        self._target = target
+        self._timer = timer
+        self._stages = stages
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        stage = self._stages.get(name)
+        if stage is None:
+            return attr
+        timer = self._timer
+
+        if inspect.iscoroutinefunction(attr):
+
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                with timer.time(stage):
+                    return await attr(*args, **kwargs)
+
+            return timed_async
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with timer.time(stage):
+                return attr(*args, **kwargs)
+
+        return timed
+
+
+class PeakRssSampler:
+    """Samples the resident set size on a background thread."""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        try:
+            import psutil
+
+            self._process: Any = psutil.Process()
+        except ImportError:
+            self._process = None
+
+    def _sample(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, self._process.memory_info().rss)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> PeakRssSampler:
+        if self._process is not None:
+            self._sample()
+            self._thread = threading.Thread(target=self._run, name="bench-rss", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._sample()
+        else:
+            self.peak_bytes = _max_rss_bytes()
+
+    @property
+    def peak_mb(self) -> float:
+        return round(self.peak_bytes / 2**20, 1)
+
+
+def _max_rss_bytes() -> int:
+    try:
+        import resource
+    except ImportError:  # Windows without psutil
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class _ValidationAdapter:
+    """Coordinator-facing validator, as wired by ``marketpipe ingest``."""
+
+    def __init__(self):
+        from marketpipe.config.calendar import configured_calendar
+        from marketpipe.validation.domain.services import ValidationDomainService
+
+        self._domain_service = ValidationDomainService(configured_calendar())
+
+    async def validate_bars(self, bars):
+        symbol = bars[0].symbol.value if bars else "UNKNOWN"
+        result = self._domain_service.validate_bars(symbol, bars)
+        is_valid = not result.errors
+
+        class AdapterResult:
+            pass
+
+        adapted = AdapterResult()
+        adapted.is_valid = is_valid  # type: ignore[attr-defined]
+        adapted.valid_bars = bars if is_valid else []  # type: ignore[attr-defined]
+        adapted.errors = result.errors  # type: ignore[attr-defined]
+        return adapted
+
+
+@contextlib.contextmanager
+def _isolated_stores(workdir: Path) -> Iterator[None]:
+    """Point the metrics database, response cache and aggregate views at ``workdir``.
+
+    A fresh response cache keeps pages cached by earlier runs from skipping
+    the HTTP stage.
+    """
+    from marketpipe.aggregation.infrastructure import duckdb_views
+    from marketpipe.ingestion.infrastructure.response_cache import CACHE_DIR_ENV
+
+    env = {
+        "METRICS_DB_PATH": str(workdir / "db" / "metrics.db"),
+        CACHE_DIR_ENV: str(workdir / "http_cache"),
+    }
+    previous_env = {name: os.environ.get(name) for name in env}
+    previous_agg_root = duckdb_views.AGG_ROOT
+    os.environ.update(env)
+    duckdb_views.set_agg_root(workdir / "agg")
+    try:
+        yield
+    finally:
+        for name, value in previous_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        duckdb_views.set_agg_root(previous_agg_root)
+
+
+def _build_provider(scenario: BenchScenario, base_url: Optional[str]) -> IMarketDataProvider:
+    """The bundled adapter of the scenario's source.
+
+    Built from its class rather than through the global provider registry,
+    which callers (and tests) may have cleared or filled with other providers.
+    """
+    from marketpipe.ingestion.infrastructure.fake_adapter import FakeMarketDataAdapter
+    from marketpipe.ingestion.infrastructure.polygon_adapter import PolygonMarketDataAdapter
+
+    if scenario.source == "http":
+        assert base_url is not None, "http scenarios run against the stub server"
+        # Polygon, because its adapter honours the requested timeframe
+        return PolygonMarketDataAdapter(
+            api_key="bench", base_url=base_url, rate_limit_per_minute=1_000_000
+        )
+    return FakeMarketDataAdapter(supported_symbols=scenario.symbol_names)
+
+
+async def _run_job(
+    scenario: BenchScenario,
+    workdir: Path,
+    timer: StageTimer,
+    workers: int,
+    base_url: Optional[str],
+) -> dict[str, Any]:
+    from marketpipe.aggregation.application.services import AggregationRunnerService
+    from marketpipe.aggregation.domain.services import AggregationDomainService
+    from marketpipe.aggregation.infrastructure.duckdb_engine import DuckDBAggregationEngine
+    from marketpipe.config.calendar import configured_calendar
+    from marketpipe.domain.value_objects import Symbol, TimeRange
+    from marketpipe.infrastructure.events import InMemoryEventPublisher
+    from marketpipe.infrastructure.messaging.stage_executor import StageSettings
+    from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+    from marketpipe.ingestion.application.commands import CreateIngestionJobCommand
+    from marketpipe.ingestion.application.services import (
+        IngestionCoordinatorService,
+        IngestionJobService,
+    )
+    from marketpipe.ingestion.domain.services import (
+        IngestionDomainService,
+        IngestionProgressTracker,
+    )
+    from marketpipe.ingestion.domain.storage import IDataStorage
+    from marketpipe.ingestion.domain.value_objects import (
+        BatchConfiguration,
+        IngestionConfiguration,
+    )
+    from marketpipe.ingestion.infrastructure.repositories import (
+        SqliteCheckpointRepository,
+        SqliteIngestionJobRepository,
+        SqliteMetricsRepository,
+    )
+    from marketpipe.ingestion.infrastructure.symbol_pipeline import SymbolPipeline
+    from marketpipe.validation.application.services import ValidationRunnerService
+    from marketpipe.validation.domain.services import ValidationDomainService
+    from marketpipe.validation.infrastructure.repositories import CsvReportRepository
+
+    raw_root = workdir / "raw"
+    db_dir = workdir / "db"
+    db_dir.mkdir(parents=True, exist_ok=True)
+
+    job_repo = SqliteIngestionJobRepository(db_dir / "ingestion_jobs.db")
+    checkpoint_repo = SqliteCheckpointRepository(db_dir / "core.db")
+    metrics_repo = SqliteMetricsRepository(db_dir / "metrics.db")
+    event_publisher = InMemoryEventPublisher()
+
+    symbol_pipeline = SymbolPipeline(
+        aggregation=timer.wrap(
+            AggregationRunnerService(
+                DuckDBAggregationEngine(raw_root, workdir / "agg"), AggregationDomainService()
+            ),
+            aggregate_symbol="aggregate",
+        ),
+        validation=timer.wrap(
+            ValidationRunnerService(
+                ParquetStorageEngine(raw_root),
+                ValidationDomainService(configured_calendar()),
+                CsvReportRepository(workdir / "reports"),
+            ),
+            validate_symbol="pipeline_validation",
+        ),
+        settings=StageSettings(mode="inline"),
+    )
+
+    job_service = IngestionJobService(
+        job_repository=job_repo,
+        checkpoint_repository=checkpoint_repo,
+        metrics_repository=metrics_repo,
+        domain_service=IngestionDomainService(),
+        progress_tracker=IngestionProgressTracker(),
+        event_publisher=event_publisher,
+    )
+    coordinator = IngestionCoordinatorService(
+        job_service=job_service,
+        job_repository=job_repo,
+        checkpoint_repository=checkpoint_repo,
+        metrics_repository=metrics_repo,
+        market_data_provider=timer.wrap(_build_provider(scenario, base_url), fetch_bars="fetch"),
+        data_validator=timer.wrap(_ValidationAdapter(), validate_bars="validate"),
+        data_storage=cast(
+            IDataStorage, timer.wrap(ParquetStorageEngine(raw_root), store_bars="store")
+        ),
+        event_publisher=event_publisher,
+        symbol_pipeline=symbol_pipeline,
+    )
+
+    command = CreateIngestionJobCommand(
+        symbols=[Symbol(s) for s in scenario.symbol_names],
+        time_range=TimeRange.from_dates(scenario.start, scenario.end),
+        configuration=IngestionConfiguration(
+            output_path=raw_root,
+            compression="snappy",
+            max_workers=workers,
+            batch_size=10_000,
+            rate_limit_per_minute=200,
+            feed_type="delayed" if scenario.source == "http" else "iex",
+            timeframe=scenario.timeframe,
+            incremental=False,
+        ),
+        batch_config=BatchConfiguration.default(),
+    )
+
+    try:
+        job_id = await job_service.create_job(command)
+        return await coordinator.execute_job(job_id)
+    finally:
+        symbol_pipeline.shutdown()
+        coordinator.close()
+        await asyncio.gather(
+            *(
+                repo.close_connections()
+                for repo in (job_repo, checkpoint_repo, metrics_repo)
+                if hasattr(repo, "close_connections")
+            ),
+            return_exceptions=True,
+        )
+
+
+def run_scenario(
+    scenario: BenchScenario,
+    workdir: Optional[Union[str, Path]] = None,
+    workers: int = DEFAULT_WORKERS,
+) -> BenchResult:
+    """Ingest, validate and aggregate a scenario end to end and measure the run.
+
+    Args:
+        scenario: Scenario to run
+        workdir: Directory for the run's Parquet files and databases
+            (default: a temporary directory removed afterwards)
+        workers: Symbols ingested concurrently
+
+    Returns:
+        Result with throughput, stage times and peak RSS
+
+    Raises:
+        RuntimeError: If the job stores no bars
+    """
+    with contextlib.ExitStack() as stack:
+        if workdir is None:
+            workdir = stack.enter_context(tempfile.TemporaryDirectory(prefix="marketpipe-bench-"))
+        workdir = Path(workdir)
+        stack.enter_context(_isolated_stores(workdir))
+
+        base_url = None
+        if scenario.source == "http":
+            from .stub_server import StubBarServer
+
+            base_url = stack.enter_context(StubBarServer()).base_url
+
+        timer = StageTimer()
+        with PeakRssSampler() as rss:
+            started = time.perf_counter()
+            summary = asyncio.run(_run_job(scenario, workdir, timer, workers, base_url))
+            seconds = time.perf_counter() - started
+
+    bars = int(summary.get("total_bars", 0))
+    if bars == 0:
+        raise RuntimeError(f"Scenario {scenario.name!r} stored no bars: {summary}")
+    return BenchResult(
+        scenario=scenario.name,
+        bars=bars,
+        seconds=round(seconds, 4),
+        stages=timer.totals(),
+        peak_rss_mb=rss.peak_mb,
+        params={
+            "symbols": scenario.symbols,
+            "days": scenario.days,
+            "timeframe": scenario.timeframe,
+            "source": scenario.source,
+            "workers": workers,
+        },
+    )
+
+
+__all__ = ["DEFAULT_WORKERS", "PeakRssSampler", "StageTimer", "run_scenario"]
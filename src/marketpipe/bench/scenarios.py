@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark scenarios of the ingestion pipeline.
+
+A scenario fixes the shape of one end-to-end run: how many symbols, how
+many days and which timeframe, and whether bars come from the in-process
+``fake`` provider or over HTTP from a local Polygon-style stub server
+(``http``). Presets cover the common shapes; ad-hoc scenarios are built
+from the same fields:
+
+    smoke   fake   2 symbols x  2 days  1m
+    wide    fake  20 symbols x  2 days  1m
+    long    fake   2 symbols x 20 days  1m
+    http    http   5 symbols x  3 days  1m
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+SCENARIO_SOURCES = ("fake", "http")
+TIMEFRAMES = ("1m", "5m", "15m", "30m", "1h", "4h", "1d")
+# Ingestion jobs span at most 30 days and must end within the last two years
+MAX_DAYS = 30
+
+
+def start_date(today: Optional[date] = None) -> date:
+    """First day of every scenario: the Monday at least five weeks before ``today``.
+
+    Scenarios always start on a Monday in the recent past, so a run never
+    reaches into the future and its bar count depends only on its shape.
+    """
+    anchor = (today or date.today()) - timedelta(weeks=5)
+    return anchor - timedelta(days=anchor.weekday())
+
+
+@dataclass(frozen=True)
+class BenchScenario:
+    """Shape of one benchmark run.
+
+    Attributes:
+        name: Key results are stored and compared under
+        symbols: Number of symbols ingested (``SYM000``, ``SYM001``, ...)
+        days: Number of calendar days ingested from ``start_date()``
+        timeframe: Bar timeframe requested from the provider
+        source: ``fake`` (in-process provider) or ``http`` (local stub server)
+    """
+
+    name: str
+    symbols: int
+    days: int
+    timeframe: str = "1m"
+    source: str = "fake"
+
+    def __post_init__(self) -> None:
+        if self.symbols < 1 or self.days < 1:
+            raise ValueError("symbols and days must be at least 1")
+        if self.days > MAX_DAYS:
+            raise ValueError(f"days must be at most {MAX_DAYS} (one ingestion job)")
+        if self.timeframe not in TIMEFRAMES:
+            raise ValueError(f"timeframe must be one of: {', '.join(TIMEFRAMES)}")
+        if self.source not in SCENARIO_SOURCES:
+            raise ValueError(f"source must be one of: {', '.join(SCENARIO_SOURCES)}")
+
+    @classmethod
+    def custom(
+        cls, symbols: int, days: int, timeframe: str = "1m", source: str = "fake"
+    ) -> BenchScenario:
+        """Ad-hoc scenario named after its shape, e.g. ``fake-10x5d-1m``."""
+        return cls(f"{source}-{symbols}x{days}d-{timeframe}", symbols, days, timeframe, source)
+
+    @property
+    def symbol_names(self) -> list[str]:
+        return [f"SYM{i:03d}" for i in range(self.symbols)]
+
+    @property
+    def start(self) -> date:
+        return start_date()
+
+    @property
+    def end(self) -> date:
+        """Exclusive end date of the ingested range."""
+        return self.start + timedelta(days=self.days)
+
+    def describe(self) -> str:
+        return f"{self.source} {self.symbols} symbols x {self.days} days {self.timeframe}"
+
+
+SCENARIOS = {
+    s.name: s
+    for s in (
+        BenchScenario("smoke", symbols=2, days=2),
+        BenchScenario("wide", symbols=20, days=2),
+        BenchScenario("long", symbols=2, days=20),
+        BenchScenario("http", symbols=5, days=3, source="http"),
+    )
+}
+
+
+def get_scenario(name: str) -> BenchScenario:
+    """Preset scenario by name.
+
+    Raises:
+        KeyError: If no preset has that name
+    """
+    try:
+        return SCENARIOS[name]
+    except KeyError:
+        raise KeyError(f"Unknown scenario {name!r}; available: {', '.join(SCENARIOS)}") from None
+
+
+__all__ = ["MAX_DAYS", "SCENARIOS", "BenchScenario", "get_scenario", "start_date"]
@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Local HTTP server answering Polygon aggregate requests with synthetic bars.
+
+Benchmarks of the ``http`` source point the Polygon adapter at this server
+so the run pays for real HTTP round trips, JSON decoding and pagination
+without touching the network or a quota:
+
+    GET /v2/aggs/ticker/AAPL/range/1/minute/2024-01-02/2024-01-03?limit=1000
+      ─▶ {"status": "OK", "results": [{"t", "o", "h", "l", "c", "v", "n", "vw"}, ...],
+          "next_url": ".../2024-01-03?cursor=1000"}
+
+Bars cover the requested days (UTC) and come from a
+``SyntheticBarGenerator``, so repeated requests return the same data. The
+generator's fault rates apply too: bar faults show up in the results, a
+rate-limited request is answered with HTTP 429 and ``Retry-After``, and a
+timed-out request stalls for ``stall_seconds`` before it is answered.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from marketpipe.domain.analytics import OHLCVColumns
+from marketpipe.domain.calendar import EPOCH, NS_PER_DAY
+from marketpipe.ingestion.infrastructure.synthetic import SyntheticBarGenerator
+
+_PATH = re.compile(
+    r"^/v2/aggs/ticker/(?P<symbol>[^/]+)/range/(?P<multiplier>\d+)/(?P<timespan>minute|hour|day)"
+    r"/(?P<start>\d{4}-\d{2}-\d{2})/(?P<end>\d{4}-\d{2}-\d{2})$"
+)
+_TIMESPAN_SECONDS = {"minute": 60, "hour": 3_600, "day": 86_400}
+
+
+def polygon_results(columns: OHLCVColumns) -> list[dict[str, Any]]:
+    """Polygon ``results`` rows of a synthetic batch."""
+    return [
+        {"t": ts // 1_000_000, "o": o, "h": h, "l": lo, "c": c, "v": v, "n": int(n), "vw": vw}
+        for ts, o, h, lo, c, v, n, vw in zip(
+            columns.ts_ns.tolist(),
+            columns.open.tolist(),
+            columns.high.tolist(),
+            columns.low.tolist(),
+            columns.close.tolist(),
+            columns.volume.tolist(),
+            columns.trade_count.tolist(),
+            columns.vwap.tolist(),
+        )
+    ]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StubBarServer._Server
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        url = urlsplit(self.path)
+        match = _PATH.match(url.path)
+        if not match:
+            self._send(404, {"status": "ERROR", "error": f"Unknown path {url.path}"})
+            return
+        query = parse_qs(url.query)
+        limit = int(query.get("limit", ["5000"])[0])
+        offset = int(query.get("cursor", ["0"])[0])
+
+        stub = self.server.stub
+        fault = stub.next_fault(match["symbol"])
+        if fault == "rate_limited":
+            self._send(
+                429,
+                {"status": "ERROR", "error": "Simulated rate limit"},
+                {"Retry-After": str(stub.retry_after)},
+            )
+            return
+        if fault == "timeout":
+            time.sleep(stub.stall_seconds)
+
+        results = stub.results(
+            match["symbol"],
+            int(match["multiplier"]),
+            match["timespan"],
+            date.fromisoformat(match["start"]),
+            date.fromisoformat(match["end"]),
+        )
+        body: dict[str, Any] = {
+            "status": "OK",
+            "ticker": match["symbol"],
+            "results": results[offset : offset + limit],
+            "resultsCount": len(results[offset : offset + limit]),
+        }
+        if offset + limit < len(results):
+            body["next_url"] = f"{stub.base_url}{url.path}?cursor={offset + limit}&limit={limit}"
+        self._send(200, body)
+
+    def _send(
+        self, status: int, body: dict[str, Any], headers: Optional[dict[str, str]] = None
+    ) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except ConnectionError:
+            pass  # The client gave up, e.g. on a stalled request
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # Keep benchmark output clean
+
+
+class StubBarServer:
+    """Threaded Polygon-style bar server on a free local port.
+
+    Use as a context manager; ``base_url`` is what the Polygon adapter's
+    ``base_url`` should be set to.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free one)
+        generator: Source of the bars and faults (default: fault-free, seed 0)
+        retry_after: ``Retry-After`` seconds of rate-limited responses
+        stall_seconds: How long timed-out requests stall before answering
+    """
+
+    class _Server(ThreadingHTTPServer):
+        daemon_threads = True
+        stub: StubBarServer
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        generator: Optional[SyntheticBarGenerator] = None,
+        retry_after: int = 1,
+        stall_seconds: float = 35.0,
+    ):
+        self.generator = generator or SyntheticBarGenerator()
+        self.retry_after = retry_after
+        self.stall_seconds = stall_seconds
+        self._server = self._Server((host, port), _Handler)
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+        self._cache: dict[tuple, list[dict[str, Any]]] = {}
+        self._attempts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.faults: dict[str, int] = {}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def next_fault(self, symbol: str) -> Optional[str]:
+        """Fault of the symbol's next request, counting requests and faults."""
+        with self._lock:
+            self.requests += 1
+            attempt = self._attempts.get(symbol, 0)
+            self._attempts[symbol] = attempt + 1
+            fault = self.generator.request_fault(symbol, attempt)
+            if fault is not None:
+                self.faults[fault] = self.faults.get(fault, 0) + 1
+            return fault
+
+    def results(
+        self, symbol: str, multiplier: int, timespan: str, start: date, end: date
+    ) -> list[dict[str, Any]]:
+        """Rows for a request, generated once and reused for every page."""
+        key = (symbol, multiplier, timespan, start, end)
+        with self._lock:
+            if key not in self._cache:
+                first = (start - EPOCH).days * NS_PER_DAY
+                last = ((end - EPOCH).days + 1) * NS_PER_DAY
+                frame_seconds = multiplier * _TIMESPAN_SECONDS[timespan]
+                self._cache[key] = polygon_results(
+                    self.generator.generate(symbol, first, last, frame_seconds)
+                )
+            return self._cache[key]
+
+    def start(self) -> StubBarServer:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-bar-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> StubBarServer:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+__all__ = ["StubBarServer", "polygon_results"]
@@ -94,17 +94,24 @@ _USING_TYER_STUB = getattr(_TyperAttr, "__name__", "") == "_Typer"
 if not _USING_TYER_STUB:
 
     # Import and register command modules
+    from .bench import bench_app
+    from .compact import compact
     from .factory_reset import factory_reset
     from .health_check import health_check_command
+    from .indicators import indicators_app
     from .jobs import jobs_app
     from .ohlcv_aggregate import aggregate_deprecated, aggregate_ohlcv, aggregate_ohlcv_convenience
     from .ohlcv_backfill import app as backfill_app
     from .ohlcv_ingest import ingest_deprecated, ingest_ohlcv, ingest_ohlcv_convenience
     from .ohlcv_validate import validate_deprecated, validate_ohlcv, validate_ohlcv_convenience
+    from .outbox import outbox_app
     from .prune import prune_app
     from .query import query
+    from .relayout import relayout
+    from .shards import shards_app
     from .symbols import app as symbols_app
     from .utils import metrics, migrate, providers
+    from .worker import worker
 
     # Register OHLCV sub-app commands
     ohlcv_app.command(name="ingest", add_help_option=False)(ingest_ohlcv)
@@ -136,6 +143,9 @@ if not _USING_TYER_STUB:
     app.command()(providers)
     app.command()(migrate)
     app.command(name="health-check")(health_check_command)
+    app.command()(compact)
+    app.command()(relayout)
+    app.command()(worker)
 
     # Administrative commands
     app.command(name="factory-reset")(factory_reset)
@@ -147,6 +157,10 @@ if not _USING_TYER_STUB:
     app.add_typer(prune_app, name="prune")
     app.add_typer(symbols_app, name="symbols")
     app.add_typer(jobs_app, name="jobs")
+    app.add_typer(outbox_app, name="outbox")
+    app.add_typer(shards_app, name="shards")
+    app.add_typer(indicators_app, name="indicators")
+    app.add_typer(bench_app, name="bench")
 
 
 if __name__ == "__main__":
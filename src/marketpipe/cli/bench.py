@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: Apache-2.0
+"""End-to-end ingestion benchmark commands."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+bench_app = typer.Typer(
+    name="bench", help="Benchmark end-to-end ingestion throughput", add_completion=False
+)
+
+_RESULTS_HELP = "Results file runs are appended to (default: data/bench/results.jsonl)"
+_BASELINE_HELP = "Baseline file (default: data/bench/baseline.json)"
+
+
+def _format_result(result) -> str:
+    stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in result.stages.items())
+    return (
+        f"{result.scenario}: {result.bars:,} bars in {result.seconds:.2f}s "
+        f"({result.bars_per_second:,.0f} bars/s), peak RSS {result.peak_rss_mb:,.0f} MB\n"
+        f"  stages: {stages or '-'}"
+    )
+
+
+@bench_app.command("list")
+def list_scenarios():
+    """List the preset benchmark scenarios."""
+    from marketpipe.bench import SCENARIOS
+
+    for scenario in SCENARIOS.values():
+        typer.echo(f"{scenario.name:<8} {scenario.describe()}")
+
+
+@bench_app.command()
+def run(
+    scenarios: Optional[list[str]] = typer.Argument(
+        None, help="Preset scenarios to run (default: smoke)"
+    ),
+    symbols: Optional[int] = typer.Option(
+        None, "--symbols", help="Run a custom scenario with this many symbols"
+    ),
+    days: Optional[int] = typer.Option(None, "--days", help="Days of the custom scenario"),
+    timeframe: str = typer.Option("1m", "--timeframe", help="Timeframe of the custom scenario"),
+    source: str = typer.Option(
+        "fake", "--source", help="Bar source of the custom scenario: fake or http"
+    ),
+    repeat: int = typer.Option(
+        1, "--repeat", "-r", help="Runs per scenario; the median throughput is recorded"
+    ),
+    workers: int = typer.Option(4, "--workers", help="Symbols ingested concurrently"),
+    results: Optional[Path] = typer.Option(None, "--results", help=_RESULTS_HELP),
+    save_baseline: bool = typer.Option(
+        False, "--save-baseline", help="Also make these results the baseline"
+    ),
+    baseline: Optional[Path] = typer.Option(None, "--baseline", help=_BASELINE_HELP),
+):
+    """Ingest, validate and aggregate benchmark scenarios and record the results.
+
+    Bars come from the fake provider, or over HTTP from a local Polygon-style
+    stub server for the ``http`` source. All data is written to a temporary
+    directory; only the results file (and baseline) are kept.
+
+    Examples:
+        marketpipe bench run smoke wide --repeat 3
+        marketpipe bench run --symbols 50 --days 5 --timeframe 5m --source http
+        marketpipe bench run smoke http --save-baseline
+    """
+    from marketpipe.bench import (
+        BenchScenario,
+        ResultStore,
+        get_scenario,
+        run_scenario,
+    )
+    from marketpipe.bench import save_baseline as write_baseline
+    from marketpipe.bench.results import BASELINE_PATH, RESULTS_PATH
+
+    if repeat < 1 or workers < 1:
+        typer.echo("❌ --repeat and --workers must be at least 1", err=True)
+        raise typer.Exit(2)
+    if (symbols is None) != (days is None):
+        typer.echo("❌ A custom scenario needs both --symbols and --days", err=True)
+        raise typer.Exit(2)
+
+    selected = []
+    try:
+        selected = [get_scenario(name) for name in scenarios or []]
+        if symbols is not None and days is not None:
+            selected.append(BenchScenario.custom(symbols, days, timeframe, source))
+    except (KeyError, ValueError) as e:
+        typer.echo(f"❌ {e.args[0]}", err=True)
+        raise typer.Exit(2) from e
+    if not selected:
+        selected = [get_scenario("smoke")]
+
+    store = ResultStore(results or RESULTS_PATH)
+    recorded = {}
+    for scenario in selected:
+        typer.echo(f"⏱️  {scenario.name} ({scenario.describe()})")
+        runs = sorted(
+            (run_scenario(scenario, workers=workers) for _ in range(repeat)),
+            key=lambda r: r.bars_per_second,
+        )
+        result = runs[len(runs) // 2]
+        store.append(result)
+        recorded[scenario.name] = result
+        typer.echo(_format_result(result))
+
+    typer.echo(f"📝 Results appended to {store.path}")
+    if save_baseline:
+        path = write_baseline(recorded, baseline or BASELINE_PATH)
+        typer.echo(f"📌 Baseline updated: {path}")
+
+
+@bench_app.command()
+def compare(
+    results: Optional[Path] = typer.Option(None, "--results", help=_RESULTS_HELP),
+    baseline: Optional[Path] = typer.Option(None, "--baseline", help=_BASELINE_HELP),
+    threshold: float = typer.Option(
+        0.10, "--threshold", "-t", help="Relative slowdown or memory growth that fails"
+    ),
+):
+    """Compare the latest result of each scenario with the baseline.
+
+    Exits with 1 when a scenario's throughput dropped, or its peak RSS grew,
+    by more than the threshold.
+
+    Examples:
+        marketpipe bench compare
+        marketpipe bench compare --threshold 0.2 --baseline ci/baseline.json
+    """
+    from marketpipe.bench import ResultStore, compare_results, load_baseline
+    from marketpipe.bench.results import BASELINE_PATH, RESULTS_PATH
+
+    if threshold < 0:
+        typer.echo("❌ --threshold must not be negative", err=True)
+        raise typer.Exit(2)
+
+    latest = ResultStore(results or RESULTS_PATH).latest()
+    baseline_path = baseline or BASELINE_PATH
+    reference = load_baseline(baseline_path)
+    if not latest:
+        typer.echo("❌ No benchmark results yet; run `marketpipe bench run` first", err=True)
+        raise typer.Exit(1)
+    if not reference:
+        typer.echo(f"❌ No baseline at {baseline_path}; use `bench run --save-baseline`", err=True)
+        raise typer.Exit(1)
+
+    regressed = False
+    for comparison in compare_results(latest, reference, threshold):
+        if comparison.baseline is None:
+            typer.echo(f"➖ {comparison.scenario}: no baseline")
+            continue
+        stages = ", ".join(
+            f"{stage} {change:+.0%}"
+            for stage, change in comparison.stage_changes.items()
+            if change is not None
+        )
+        throughput = comparison.throughput_change
+        summary = (
+            f"{comparison.current.bars_per_second:,.0f} bars/s ({throughput:+.1%})"
+            if throughput is not None
+            else "no throughput"
+        )
+        if comparison.regressions:
+            regressed = True
+            typer.echo(f"❌ {comparison.scenario}: " + "; ".join(comparison.regressions))
+        else:
+            typer.echo(f"✅ {comparison.scenario}: {summary}")
+        if stages:
+            typer.echo(f"  stages: {stages}")
+        if comparison.params_changed:
+            typer.echo("  ⚠️  scenario parameters differ from the baseline")
+
+    if regressed:
+        raise typer.Exit(1)
+
+
+@bench_app.command()
+def serve(
+    port: int = typer.Option(8089, "--port", "-p", help="Port to listen on"),
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to listen on"),
+    seed: int = typer.Option(0, "--seed", help="Seed of the generated bars and faults"),
+    sessions: str = typer.Option(
+        "all", "--sessions", help="Bars around the clock (all) or in exchange sessions (regular)"
+    ),
+    faults: str = typer.Option(
+        "", "--faults", help='Fault rates, e.g. "gaps=0.01,duplicates=0.001,rate_limited=0.05"'
+    ),
+    retry_after: int = typer.Option(1, "--retry-after", help="Retry-After of 429 responses"),
+    stall_seconds: float = typer.Option(
+        35.0, "--stall-seconds", help="How long timed-out requests stall"
+    ),
+):
+    """Serve synthetic bars over a Polygon-compatible HTTP API until interrupted.
+
+    Point the Polygon provider's ``base_url`` at the printed URL to load-test
+    ingestion, optionally with injected gaps, duplicates, out-of-order bars,
+    OHLC violations, 429s and timeouts.
+
+    Examples:
+        marketpipe bench serve --port 8089
+        marketpipe bench serve --sessions regular --faults "gaps=0.01,rate_limited=0.02"
+    """
+    import time
+
+    from marketpipe.bench.stub_server import StubBarServer
+    from marketpipe.ingestion.infrastructure.synthetic import FaultRates, SyntheticBarGenerator
+
+    try:
+        generator = SyntheticBarGenerator(
+            seed=seed, sessions=sessions, faults=FaultRates.parse(faults)
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(2) from e
+
+    with StubBarServer(
+        host, port, generator, retry_after=retry_after, stall_seconds=stall_seconds
+    ) as server:
+        typer.echo(f"🛰️  Serving synthetic bars at {server.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+    typer.echo(f"Served {server.requests} requests; faults: {server.faults or 'none'}")
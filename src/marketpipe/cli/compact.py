@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Parquet compaction command."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Optional
+
+import humanize
+import typer
+
+# Heavy imports moved inside functions to optimize --help performance
+
+
+def compact(
+    root: Optional[Path] = typer.Option(
+        None,
+        "--root",
+        help="Storage root to compact (default: $MARKETPIPE_RAW_ROOT or data/raw)",
+    ),
+    frames: Optional[list[str]] = typer.Option(
+        None, "--frame", "-f", help="Only compact this frame (repeatable)"
+    ),
+    symbols: Optional[list[str]] = typer.Option(
+        None, "--symbol", "-s", help="Only compact this symbol (repeatable)"
+    ),
+    granularity: str = typer.Option(
+        "month", "--granularity", "-g", help="Bucket size: day, month or year"
+    ),
+    min_files: int = typer.Option(
+        2, "--min-files", help="Only rewrite buckets with at least this many files"
+    ),
+    settle_days: int = typer.Option(
+        1, "--settle-days", help="Skip buckets whose last day is newer than this many days"
+    ),
+    row_group_size: int = typer.Option(
+        128 * 1024, "--row-group-size", help="Rows per row group in compacted files"
+    ),
+    max_mb_per_sec: Optional[float] = typer.Option(
+        None, "--max-mb-per-sec", help="Throttle compaction IO to this many MB/s"
+    ),
+    interval: Optional[float] = typer.Option(
+        None,
+        "--interval",
+        help="Keep running and compact every N seconds (background mode)",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be compacted without making changes"
+    ),
+):
+    """Merge small per-day Parquet files into per-symbol bucket files.
+
+    Files are merged into one file per frame/symbol/bucket, sorted by ts_ns,
+    and swapped in atomically. Open buckets (the current month by default)
+    are left alone until they settle.
+
+    Examples:
+        marketpipe compact --dry-run                      # Preview monthly compaction
+        marketpipe compact --root data/agg -f 5m -f 15m   # Compact aggregated frames
+        marketpipe compact --interval 3600 --max-mb-per-sec 20
+    """
+    from marketpipe.infrastructure.storage.compaction import (
+        CompactionPolicy,
+        CompactionScheduler,
+        ParquetCompactor,
+    )
+
+    storage_root = root or Path(os.environ.get("MARKETPIPE_RAW_ROOT", "data/raw"))
+    if not storage_root.exists():
+        typer.echo(f"❌ Directory does not exist: {storage_root}", err=True)
+        raise typer.Exit(1)
+
+    try:
+        policy = CompactionPolicy(
+            granularity=granularity,
+            min_files=min_files,
+            settle_days=settle_days,
+            row_group_size=row_group_size,
+            max_bytes_per_second=max_mb_per_sec * 1024 * 1024 if max_mb_per_sec else None,
+        )
+    except ValueError as e:
+        typer.echo(f"❌ Invalid compaction settings: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    compactor = ParquetCompactor(storage_root, policy)
+
+    if interval is not None:
+        if dry_run:
+            typer.echo("❌ --dry-run cannot be combined with --interval", err=True)
+            raise typer.Exit(1)
+        typer.echo(f"🗜️ Compacting {storage_root} every {interval:g}s (Ctrl+C to stop)")
+        scheduler = CompactionScheduler(
+            compactor, interval_seconds=interval, frames=frames, symbols=symbols
+        )
+        try:
+            asyncio.run(scheduler.run_forever())
+        except KeyboardInterrupt:
+            typer.echo("\n👋 Compaction stopped")
+        return
+
+    typer.echo(f"🗜️ Compacting {storage_root} into {granularity} buckets")
+    results = compactor.run(frames, symbols, dry_run=dry_run)
+
+    if not results:
+        typer.echo("✨ Nothing to compact")
+        return
+
+    files = sum(len(r.task.source_files) for r in results)
+    for result in results:
+        task = result.task
+        prefix = "[DRY RUN] Would merge" if dry_run else "Merged"
+        typer.echo(
+            f"{prefix} {len(task.source_files)} files -> "
+            f"{result.output_path.parent.relative_to(storage_root)}"
+        )
+
+    if dry_run:
+        typer.echo(
+            f"\n🔍 Dry run complete: {files} files in {len(results)} buckets "
+            f"({humanize.naturalsize(sum(r.bytes_read for r in results))})"
+        )
+    else:
+        bytes_read = sum(r.bytes_read for r in results)
+        bytes_written = sum(r.bytes_written for r in results)
+        typer.secho(
+            f"\n✅ Compacted {files} files into {len(results)} "
+            f"({humanize.naturalsize(bytes_read)} -> {humanize.naturalsize(bytes_written)})",
+            fg="green",
+        )
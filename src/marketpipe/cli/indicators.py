@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Technical indicator commands."""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+indicators_app = typer.Typer(
+    name="indicators", help="Compute technical indicators with DuckDB", add_completion=False
+)
+
+
+def _parse_symbols(symbols: Optional[str]) -> list[str]:
+    return [s.strip().upper() for s in (symbols or "").split(",") if s.strip()]
+
+
+def _parse_day(value: Optional[str], option: str) -> Optional[date]:
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        typer.echo(f"❌ {option} must be YYYY-MM-DD, got {value!r}", err=True)
+        raise typer.Exit(2) from None
+
+
+def _print_frame(df, csv: bool, limit: int) -> None:
+    """Print a result as CSV or a table of at most ``limit`` rows."""
+    if df.empty:
+        print("No indicator values for the selection")
+        return
+    if csv:
+        df.to_csv(sys.stdout, index=False)
+        return
+    shown = df.head(limit)
+    if len(df) > limit:
+        print(f"🔍 Showing first {limit} of {len(df)} rows:")
+    try:
+        print(shown.to_markdown(index=False, tablefmt="grid"))
+    except ImportError:
+        print(shown.to_string(index=False))
+
+
+@indicators_app.command()
+def compute(
+    indicator: list[str] = typer.Option(
+        ..., "--indicator", "-i", help="Indicator as kind:period[:arg], e.g. sma:20 (repeatable)"
+    ),
+    frame: str = typer.Option("1d", "--frame", "-f", help="Bar frame to read"),
+    symbols: Optional[str] = typer.Option(
+        None, "--symbols", "-s", help="Comma-separated symbols (default: all)"
+    ),
+    start: Optional[str] = typer.Option(None, "--start", help="First day to show (YYYY-MM-DD)"),
+    end: Optional[str] = typer.Option(None, "--end", help="Last day to show (YYYY-MM-DD)"),
+    raw_root: Optional[Path] = typer.Option(
+        None, "--raw-root", help="Read raw partitions under this root instead of bars_<frame>"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Materialize full history to Parquet under this root"
+    ),
+    csv: bool = typer.Option(False, "--csv", help="Output CSV to stdout"),
+    limit: int = typer.Option(50, "--limit", "-l", help="Limit number of rows in table output"),
+):
+    """Compute indicators over the lake in DuckDB.
+
+    Kinds: sma, ema, volatility, rsi, atr, vwap_bands, zscore. The optional
+    argument is the price column for sma/ema/zscore and the band width for
+    vwap_bands.
+
+    Examples:
+        marketpipe indicators compute -i sma:20 -i rsi:14 --symbols AAPL,MSFT
+        marketpipe indicators compute -i ema:12:high --frame 1m --raw-root data/raw --csv
+        marketpipe indicators compute -i vwap_bands:20:2 -i atr:14 -o data/indicators
+    """
+    from marketpipe.aggregation.infrastructure import duckdb_views
+    from marketpipe.aggregation.infrastructure.indicators import (
+        compute_indicators,
+        materialize_indicators,
+    )
+
+    agg_root = os.environ.get("MARKETPIPE_AGG_ROOT")
+    if agg_root:
+        duckdb_views.set_agg_root(agg_root)
+    symbol_list = _parse_symbols(symbols)
+    first, last = _parse_day(start, "--start"), _parse_day(end, "--end")
+
+    if output is not None and (first or last):
+        typer.echo("❌ --start/--end cannot be combined with --output", err=True)
+        raise typer.Exit(2)
+
+    try:
+        if output is not None:
+            rows = materialize_indicators(
+                indicator, output, frame=frame, symbols=symbol_list, raw_root=raw_root
+            )
+            print(f"✅ Materialized {rows} rows to {output / f'frame={frame}'}")
+            return
+        df = compute_indicators(
+            indicator, frame=frame, symbols=symbol_list, start=first, end=last, raw_root=raw_root
+        )
+    except (ValueError, FileNotFoundError) as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(2) from e
+    except Exception as e:
+        typer.echo(f"❌ Indicator computation failed: {e}", err=True)
+        raise typer.Exit(1) from e
+    _print_frame(df, csv, limit)
+
+
+@indicators_app.command()
+def show(
+    root: Path = typer.Option(
+        Path("data/indicators"), "--root", "-r", help="Root of materialized indicators"
+    ),
+    frame: str = typer.Option("1d", "--frame", "-f", help="Bar frame"),
+    symbols: Optional[str] = typer.Option(
+        None, "--symbols", "-s", help="Comma-separated symbols (default: all)"
+    ),
+    start: Optional[str] = typer.Option(None, "--start", help="First day to show (YYYY-MM-DD)"),
+    end: Optional[str] = typer.Option(None, "--end", help="Last day to show (YYYY-MM-DD)"),
+    csv: bool = typer.Option(False, "--csv", help="Output CSV to stdout"),
+    limit: int = typer.Option(50, "--limit", "-l", help="Limit number of rows in table output"),
+):
+    """Read materialized indicators without recomputing them.
+
+    Examples:
+        marketpipe indicators show --symbols AAPL --start 2024-06-01
+        marketpipe indicators show --root data/indicators --frame 1h --csv
+    """
+    from marketpipe.aggregation.infrastructure.indicators import load_indicators
+
+    df = load_indicators(
+        root,
+        frame=frame,
+        symbols=_parse_symbols(symbols),
+        start=_parse_day(start, "--start"),
+        end=_parse_day(end, "--end"),
+    )
+    _print_frame(df, csv, limit)
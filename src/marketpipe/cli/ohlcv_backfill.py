@@ -69,6 +69,7 @@ def backfill_ohlcv(  # noqa: PLR0913 – CLI has many options
     from marketpipe.bootstrap import bootstrap
     from marketpipe.cli.ohlcv_ingest import _ingest_impl  # pylint: disable=protected-access
     from marketpipe.config import ConfigVersionError, load_config
+    from marketpipe.config.calendar import configured_calendar
     from marketpipe.domain.events import BackfillJobCompleted, BackfillJobFailed
     from marketpipe.infrastructure.events import InMemoryEventPublisher
     from marketpipe.ingestion.services.gap_detector import GapDetectorService
@@ -114,7 +115,7 @@ def backfill_ohlcv(  # noqa: PLR0913 – CLI has many options
     # Detect gaps & execute ingestion per gap (synchronously)
     # ------------------------------------------------------------------
     parquet_root = Path("data/output")  # writer.write_parquet default in ingest
-    detector = GapDetectorService(parquet_root)
+    detector = GapDetectorService(parquet_root, calendar=configured_calendar())
 
     event_bus = InMemoryEventPublisher()
 
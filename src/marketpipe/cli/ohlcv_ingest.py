@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 import sys
@@ -21,6 +22,7 @@ from marketpipe.cli.validators import (
     validate_config_file,
     validate_date_range,
     validate_output_dir,
+    validate_shard,
     validate_symbols,
     validate_workers,
 )
@@ -174,10 +176,25 @@ class CleanAsyncExecution:
 def _build_ingestion_services(
     provider_config: Optional[dict[str, Any]] = None,
     output_path: str = "data/raw",
+    symbol_pipeline=None,
+    job_repo=None,
+    symbol_executor=None,
 ) -> tuple:
-    """Build and wire the DDD ingestion services with shared storage engine."""
+    """Build and wire the DDD ingestion services with shared storage engine.
+
+    With a ``symbol_pipeline`` the coordinator validates and aggregates each
+    symbol as soon as it is stored, instead of leaving both to a later run.
+    ``job_repo`` replaces the local SQLite job store, e.g. with the shared
+    store from ``_build_shared_job_repository`` used by workers. A
+    ``symbol_executor`` (``SymbolProcessPool``) ingests the symbols in worker
+    processes. ``$MARKETPIPE_MEMORY_BUDGET_MB`` bounds the bars each process
+    holds in flight. Post-ingestion stages registered at bootstrap are
+    subscribed to the coordinator's event publisher.
+    """
     # Lazy imports for performance optimization
+    from marketpipe.config.calendar import configured_calendar
     from marketpipe.infrastructure.events import InMemoryEventPublisher
+    from marketpipe.infrastructure.messaging.stage_executor import subscribe_registered_stages
     from marketpipe.infrastructure.repositories.sqlite_domain import (
         SqliteOHLCVRepository,
         SqliteSymbolBarsRepository,
@@ -191,6 +208,7 @@ def _build_ingestion_services(
         IngestionDomainService,
         IngestionProgressTracker,
     )
+    from marketpipe.ingestion.infrastructure.memory_budget import get_memory_budget
     from marketpipe.ingestion.infrastructure.provider_loader import build_provider
     from marketpipe.ingestion.infrastructure.repositories import (
         SqliteCheckpointRepository,
@@ -239,7 +257,8 @@ def _build_ingestion_services(
 
     # Repository setup - use base_data_dir instead of hardcoded "data"
     core_db_path = db_dir / "core.db"
-    job_repo = SqliteIngestionJobRepository(base_data_dir / "ingestion_jobs.db")
+    if job_repo is None:
+        job_repo = SqliteIngestionJobRepository(base_data_dir / "ingestion_jobs.db")
     checkpoint_repo = SqliteCheckpointRepository(core_db_path)
     metrics_repo = SqliteMetricsRepository(base_data_dir / "metrics.db")
 
@@ -251,11 +270,14 @@ def _build_ingestion_services(
     domain_service = IngestionDomainService()
     progress_tracker = IngestionProgressTracker()
     event_publisher = InMemoryEventPublisher()  # Simple in-memory publisher
+    # Aggregation and validation stages registered at bootstrap hear job
+    # completions from this publisher without it awaiting them
+    subscribe_registered_stages(event_publisher)
 
     # Create validation adapter that matches coordinator service interface
     class ValidationAdapter:
         def __init__(self):
-            self._domain_service = ValidationDomainService()
+            self._domain_service = ValidationDomainService(configured_calendar())
 
         async def validate_bars(self, bars):
             # Extract symbol from first bar or use default
@@ -296,11 +318,102 @@ def _build_ingestion_services(
         data_validator=data_validator,
         data_storage=cast(IDataStorage, storage_engine),  # Adapter cast for typing
         event_publisher=event_publisher,
+        symbol_pipeline=symbol_pipeline,
+        symbol_executor=symbol_executor,
+        memory_budget=get_memory_budget(),
     )
 
     return job_service, coordinator_service
 
 
+def _build_worker_coordinator(provider_config: dict[str, Any], output_path: str):
+    """Coordinator of a ``SymbolProcessPool`` worker process (must stay module-level)."""
+    return _build_ingestion_services(provider_config, output_path)[1]
+
+
+def _build_shared_job_repository():
+    """Job store shared by ``ingest --enqueue`` and ``marketpipe worker``.
+
+    PostgreSQL when ``$DATABASE_URL`` points at one (so workers on several
+    hosts share a queue), otherwise the local ``data/ingestion_jobs.db``.
+    """
+    from marketpipe.ingestion.infrastructure.repositories import SqliteIngestionJobRepository
+
+    database_url = os.getenv("DATABASE_URL")
+    if database_url and database_url.split("://", 1)[0].startswith("postgres"):
+        from marketpipe.ingestion.infrastructure.repository_factory import (
+            create_ingestion_job_repository_with_url,
+        )
+
+        return create_ingestion_job_repository_with_url(database_url)
+    db_path = Path("./data") / "ingestion_jobs.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    return SqliteIngestionJobRepository(db_path)
+
+
+def _build_provider_config(provider: str, feed_type: str) -> dict[str, Any]:
+    """Provider configuration for ``build_provider`` from environment credentials.
+
+    Raises:
+        typer.Exit: If the provider is unsupported or its credentials are missing
+    """
+    provider_config: dict[str, Any] = {
+        "provider": provider,
+    }
+
+    if provider == "alpaca":
+        api_key = os.getenv("ALPACA_KEY")
+        api_secret = os.getenv("ALPACA_SECRET")
+        if api_key and api_secret:
+            provider_config.update(
+                {
+                    "api_key": api_key,
+                    "api_secret": api_secret,
+                    "base_url": "https://data.alpaca.markets/v2",
+                    "feed_type": feed_type,
+                    "rate_limit_per_min": 200,
+                }
+            )
+    elif provider == "iex":
+        iex_token = os.getenv("IEX_TOKEN")
+        if not iex_token:
+            print("❌ IEX provider selected but IEX_TOKEN is not set in environment")
+            raise typer.Exit(1)
+        provider_config.update(
+            {
+                "api_token": iex_token,
+                "is_sandbox": False,
+                "rate_limit_per_min": 500,
+            }
+        )
+    elif provider == "polygon":
+        polygon_key = os.getenv("POLYGON_API_KEY") or os.getenv("MP_POLYGON_API_KEY")
+        if not polygon_key:
+            print(
+                "❌ Polygon provider selected but neither POLYGON_API_KEY nor MP_POLYGON_API_KEY is set"
+            )
+            raise typer.Exit(1)
+
+        polygon_base_url = os.getenv("POLYGON_BASE_URL", "https://api.polygon.io")
+        provider_config.update(
+            {
+                "api_key": polygon_key,
+                "base_url": polygon_base_url,
+                "rate_limit_per_minute": 5,  # Free tier limit
+            }
+        )
+    elif provider != "fake":
+        print(f"❌ Unsupported provider: {provider}")
+        raise typer.Exit(1)
+
+    return provider_config
+
+
+def _provider_rate_limit(provider_config: dict[str, Any]) -> Optional[int]:
+    """Requests per minute allowed by the provider, or None if it has no quota."""
+    return provider_config.get("rate_limit_per_min") or provider_config.get("rate_limit_per_minute")
+
+
 async def _cleanup_async_resources(*repositories) -> None:
     """Clean up async resources with proper error handling."""
     cleanup_tasks = []
@@ -361,14 +474,21 @@ def _check_boundaries(path: str, symbol: str, start: str, end: str, provider: st
         # Connect to DuckDB first (this is where the test expects the exception)
         conn = duckdb.connect()
 
-        # Look for data in the correct path structure: frame=1m/symbol={symbol}
-        symbol_path = Path(path) / "frame=1m" / f"symbol={symbol}"
+        from marketpipe.infrastructure.storage.layout import LAYOUT_CLUSTERED, detect_layout
+
+        # Look for data in the correct path structure: frame=1m/symbol={symbol},
+        # or frame=1m/date=* for frames using the clustered layout
+        frame_path = Path(path) / "frame=1m"
+        if detect_layout(frame_path) == LAYOUT_CLUSTERED:
+            symbol_path, pattern = frame_path, "date=*/*.parquet"
+        else:
+            symbol_path, pattern = frame_path / f"symbol={symbol}", "**/*.parquet"
 
         if not symbol_path.exists():
             print(f"ERROR: No data found for symbol {symbol}", file=sys.stderr)
             sys.exit(1)
 
-        parquet_files = list(symbol_path.glob("**/*.parquet"))
+        parquet_files = list(symbol_path.glob(pattern))
         if not parquet_files:
             print(f"ERROR: No parquet files found for symbol {symbol}", file=sys.stderr)
             sys.exit(1)
@@ -379,7 +499,7 @@ def _check_boundaries(path: str, symbol: str, start: str, end: str, provider: st
             MIN(DATE(to_timestamp(ts_ns / 1000000000))) as min_date,
             MAX(DATE(to_timestamp(ts_ns / 1000000000))) as max_date,
             COUNT(*) as bar_count
-        FROM read_parquet('{symbol_path}/**/*.parquet')
+        FROM read_parquet('{symbol_path}/{pattern}', union_by_name=true)
         WHERE symbol = '{symbol}'
         """
 
@@ -417,6 +537,38 @@ def _check_boundaries(path: str, symbol: str, start: str, end: str, provider: st
         sys.exit(1)
 
 
+def _run_traced(run_ingestion, trace: Optional[Path], profile: bool):
+    """Run the ingestion coroutine with stage tracing and, optionally, CPU sampling.
+
+    The trace and profile are written even when ingestion fails.
+    """
+    from marketpipe.profiling import SamplingProfiler
+    from marketpipe.tracing import tracing
+
+    profiler = SamplingProfiler() if profile else None
+    with tracing(trace) as tracer:
+        try:
+            if profiler is not None:
+                profiler.start()
+            return asyncio.run(run_ingestion())
+        finally:
+            if profiler is not None:
+                profiler.stop()
+                stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                profile_path = profiler.write(Path("data/profiles") / f"ingest-{stamp}.folded")
+            stages = tracer.stage_totals()
+            if stages:
+                print("⏱️  Stage time (summed over concurrent symbols):")
+                for stage, (count, seconds) in stages.items():
+                    print(f"  {stage:<22} {seconds:>9.3f}s  x{count}")
+            if trace is not None:
+                print(f"🧭 Trace written to {trace}")
+            if profiler is not None:
+                print(f"🔥 CPU profile ({profiler.samples} samples) written to {profile_path}")
+                for function, samples in profiler.top(5):
+                    print(f"  {samples / max(profiler.samples, 1):>6.1%}  {function}")
+
+
 def _ingest_impl(
     # Config file option
     config: Optional[Path] = None,
@@ -431,6 +583,13 @@ def _ingest_impl(
     provider: Optional[str] = None,
     feed_type: Optional[str] = None,
     timeframe: Optional[str] = None,
+    incremental: bool = False,
+    pipelined: bool = False,
+    enqueue: bool = False,
+    shard_index: Optional[int] = None,
+    shard_count: Optional[int] = None,
+    trace: Optional[Path] = None,
+    profile: bool = False,
 ):
     """Implementation of the ingest functionality."""
     # Lazy imports for performance optimization (only load when command executes)
@@ -473,6 +632,9 @@ def _ingest_impl(
                     "provider": provider,
                     "feed_type": feed_type,
                     "timeframe": timeframe,
+                    "incremental": incremental or None,
+                    "shard_index": shard_index,
+                    "shard_count": shard_count,
                 }
                 # Add symbols/start/end overrides if provided
                 if symbols is not None:
@@ -511,6 +673,9 @@ def _ingest_impl(
                     provider=resolved_provider,
                     feed_type=feed_type or default_feed_type,
                     timeframe=timeframe or "1m",
+                    incremental=incremental,
+                    shard_index=shard_index or 0,
+                    shard_count=shard_count or 1,
                 )
 
             # Now that we have job_config, run bootstrap (skip for fake provider)
@@ -546,6 +711,21 @@ def _ingest_impl(
                     clamped_start = today.fromordinal(today.toordinal() - 1)
                     job_config = job_config.merge_overrides(start=clamped_start, end=clamped_end)
 
+            # Keep only this node's share of the symbols
+            if job_config.shard_count > 1:
+                from marketpipe.ingestion.domain.sharding import ShardSpec, select_shard
+
+                shard = ShardSpec(job_config.shard_index, job_config.shard_count)
+                shard_symbols = select_shard(job_config.symbols, shard)
+                print(
+                    f"🧩 Shard {shard}: {len(shard_symbols)} of "
+                    f"{len(job_config.symbols)} symbols"
+                )
+                if not shard_symbols:
+                    print("✅ No symbols fall on this shard; nothing to ingest")
+                    return
+                job_config = job_config.merge_overrides(symbols=shard_symbols)
+
             # Display configuration summary
             print("📊 Ingestion Configuration:")
             print(f"  Symbols: {', '.join(job_config.symbols)}")
@@ -563,55 +743,38 @@ def _ingest_impl(
             print("\n🚀 Starting ingestion process...")
 
             # Build provider configuration (do not hard-fail here; allow services builder to handle)
-            provider_config: dict[str, Any] = {
-                "provider": job_config.provider,
-            }
+            provider_config = _build_provider_config(job_config.provider, job_config.feed_type)
 
-            if job_config.provider == "alpaca":
-                api_key = os.getenv("ALPACA_KEY")
-                api_secret = os.getenv("ALPACA_SECRET")
-                if api_key and api_secret:
-                    provider_config.update(
-                        {
-                            "api_key": api_key,
-                            "api_secret": api_secret,
-                            "base_url": "https://data.alpaca.markets/v2",
-                            "feed_type": job_config.feed_type,
-                            "rate_limit_per_min": 200,
-                        }
-                    )
-            elif job_config.provider == "iex":
-                iex_token = os.getenv("IEX_TOKEN")
-                if not iex_token:
-                    print("❌ IEX provider selected but IEX_TOKEN is not set in environment")
-                    raise typer.Exit(1)
-                provider_config.update(
-                    {
-                        "api_token": iex_token,
-                        "is_sandbox": False,
-                    }
-                )
-            elif job_config.provider == "polygon":
-                polygon_key = os.getenv("POLYGON_API_KEY") or os.getenv("MP_POLYGON_API_KEY")
-                if not polygon_key:
-                    print(
-                        "❌ Polygon provider selected but neither POLYGON_API_KEY nor MP_POLYGON_API_KEY is set"
-                    )
-                    raise typer.Exit(1)
+            symbol_pipeline = None
+            if pipelined:
+                from marketpipe.ingestion.infrastructure.symbol_pipeline import SymbolPipeline
+
+                symbol_pipeline = SymbolPipeline.build_default()
 
-                polygon_base_url = os.getenv("POLYGON_BASE_URL", "https://api.polygon.io")
-                provider_config.update(
-                    {
-                        "api_key": polygon_key,
-                        "base_url": polygon_base_url,
-                    }
+            # An explicit --workers N shards the symbols across N processes
+            symbol_executor = None
+            if workers and workers > 1 and len(job_config.symbols) > 1 and not enqueue:
+                if pipelined:
+                    raise ValueError(
+                        "--pipelined hands bars to in-process stages; run it without --workers"
+                    )
+                from marketpipe.ingestion.infrastructure.process_pool import SymbolProcessPool
+
+                symbol_executor = SymbolProcessPool(
+                    functools.partial(
+                        _build_worker_coordinator, provider_config, job_config.output_path
+                    ),
+                    workers=min(workers, len(job_config.symbols)),
+                    rate_limit_per_min=_provider_rate_limit(provider_config),
                 )
-            elif job_config.provider != "fake":
-                print(f"❌ Unsupported provider: {job_config.provider}")
-                raise typer.Exit(1)
+                print(f"  Worker processes: {symbol_executor.workers}")
 
             job_service, coordinator_service = _build_ingestion_services(
-                provider_config, job_config.output_path
+                provider_config,
+                job_config.output_path,
+                symbol_pipeline=symbol_pipeline,
+                job_repo=_build_shared_job_repository() if enqueue else None,
+                symbol_executor=symbol_executor,
             )
 
             # Create domain command
@@ -626,6 +789,7 @@ def _ingest_impl(
                     rate_limit_per_minute=200,  # Default rate limit
                     feed_type=job_config.feed_type,
                     timeframe=job_config.timeframe if hasattr(job_config, "timeframe") else "1m",
+                    incremental=job_config.incremental,
                 ),
                 batch_config=BatchConfiguration.default(),
             )
@@ -637,6 +801,8 @@ def _ingest_impl(
                     print("📝 Creating ingestion job...")
                     job_id = await job_service.create_job(command)
                     print(f"✅ Created job: {job_id}")
+                    if enqueue:
+                        return job_id, None
 
                     # Execute job
                     print("⚡ Starting job execution...")
@@ -644,6 +810,11 @@ def _ingest_impl(
 
                     return job_id, result
                 finally:
+                    if symbol_pipeline is not None:
+                        symbol_pipeline.shutdown()
+                    if symbol_executor is not None:
+                        symbol_executor.shutdown()
+                    coordinator_service.close()
                     # Ensure proper cleanup of async resources
                     await _cleanup_async_resources(
                         job_service._job_repository,
@@ -655,7 +826,16 @@ def _ingest_impl(
                     )
 
             # Run asyncio with clean error suppression
-            job_id, result = asyncio.run(run_ingestion())
+            if trace is None and not profile:
+                job_id, result = asyncio.run(run_ingestion())
+            else:
+                if symbol_executor is not None:
+                    print("ℹ️  Only this process is traced; worker processes are not")
+                job_id, result = _run_traced(run_ingestion, trace, profile)
+
+            if result is None:
+                print(f"📥 Job {job_id} queued; start `marketpipe worker` to run it")
+                return
 
             # Report results
             print("✅ Job completed successfully!")
@@ -666,6 +846,8 @@ def _ingest_impl(
 
             if result.get("symbols_failed", 0) > 0:
                 print(f"⚠️  Failed symbols: {result.get('symbols_failed', 0)}")
+            if "pipeline" in result:
+                print(f"📊 Aggregated frames written: {result['pipeline']['frames_written']}")
 
             # Post-ingestion verification: check boundaries for each symbol
             print("\n🔍 Running post-ingestion verification...")
@@ -744,7 +926,7 @@ def ingest_ohlcv(
     workers: int = typer.Option(
         None,
         "--workers",
-        help="Number of worker threads (overrides config)",
+        help="Worker processes to shard symbols across (overrides config)",
     ),
     provider: str = typer.Option(
         None,
@@ -761,6 +943,41 @@ def ingest_ohlcv(
         "--timeframe",
         help="Bar timeframe: 1m, 5m, 15m, 30m, 1h, 4h, 1d (overrides config, default: 1m)",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only fetch trading days that are missing or stale in storage",
+    ),
+    pipelined: bool = typer.Option(
+        False,
+        "--pipelined",
+        help="Validate and aggregate each symbol as soon as its bars are stored",
+    ),
+    enqueue: bool = typer.Option(
+        False,
+        "--enqueue",
+        help="Queue the job for `marketpipe worker` instead of running it",
+    ),
+    shard_index: int = typer.Option(
+        None,
+        "--shard-index",
+        help="Shard of the symbols this node ingests, 0-based (overrides config)",
+    ),
+    shard_count: int = typer.Option(
+        None,
+        "--shard-count",
+        help="Nodes the symbols are split across (overrides config)",
+    ),
+    trace: Path = typer.Option(
+        None,
+        "--trace",
+        help="Write per-stage spans to this Chrome trace (*.otlp.json: OTLP-JSON) file",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Sample a CPU profile of the run into data/profiles/",
+    ),
     help_flag: bool = typer.Option(
         False,
         "--help",
@@ -785,10 +1002,17 @@ Options:
   --end TEXT                  End date (YYYY-MM-DD)
   --batch-size INTEGER        Bars per request (overrides config)
   --output PATH               Output directory (overrides config)
-  --workers INTEGER           Number of worker threads (overrides config)
+  --workers INTEGER           Worker processes to shard symbols across (overrides config)
   --provider TEXT             Market data provider (overrides config)
   --feed-type TEXT            Data feed type (overrides config)
   --timeframe TEXT            Bar timeframe: 1m, 5m, 15m, 30m, 1h, 4h, 1d (default: 1m)
+  --incremental               Only fetch trading days missing or stale in storage
+  --pipelined                 Validate and aggregate each symbol as soon as it is stored
+  --enqueue                   Queue the job for `marketpipe worker` instead of running it
+  --shard-index INTEGER       Shard of the symbols this node ingests, 0-based
+  --shard-count INTEGER       Nodes the symbols are split across by consistent hashing
+  --trace PATH                Write per-stage spans to a Chrome trace (*.otlp.json: OTLP)
+  --profile                   Sample a CPU profile of the run into data/profiles/
   -h, --help                  Show this message and exit
 """
         typer.echo(help_text.strip())
@@ -828,6 +1052,7 @@ Options:
 
     # Numeric / path validations
     validate_workers(workers)
+    validate_shard(shard_index, shard_count)
     validate_batch_size(batch_size)
     validate_output_dir(output_path)
 
@@ -882,6 +1107,13 @@ Options:
         provider=provider,
         feed_type=feed_type,
         timeframe=timeframe,
+        incremental=incremental,
+        pipelined=pipelined,
+        enqueue=enqueue,
+        shard_index=shard_index,
+        shard_count=shard_count,
+        trace=trace,
+        profile=profile,
     )
 
 
@@ -917,7 +1149,7 @@ def ingest_ohlcv_convenience(
     workers: int = typer.Option(
         None,
         "--workers",
-        help="Number of worker threads (overrides config)",
+        help="Worker processes to shard symbols across (overrides config)",
     ),
     provider: str = typer.Option(
         None, "--provider", help="Market data provider (overrides config)"
@@ -928,6 +1160,41 @@ def ingest_ohlcv_convenience(
         "--timeframe",
         help="Bar timeframe: 1m, 5m, 15m, 30m, 1h, 4h, 1d (overrides config, default: 1m)",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only fetch trading days that are missing or stale in storage",
+    ),
+    pipelined: bool = typer.Option(
+        False,
+        "--pipelined",
+        help="Validate and aggregate each symbol as soon as its bars are stored",
+    ),
+    enqueue: bool = typer.Option(
+        False,
+        "--enqueue",
+        help="Queue the job for `marketpipe worker` instead of running it",
+    ),
+    shard_index: int = typer.Option(
+        None,
+        "--shard-index",
+        help="Shard of the symbols this node ingests, 0-based (overrides config)",
+    ),
+    shard_count: int = typer.Option(
+        None,
+        "--shard-count",
+        help="Nodes the symbols are split across (overrides config)",
+    ),
+    trace: Path = typer.Option(
+        None,
+        "--trace",
+        help="Write per-stage spans to this Chrome trace (*.otlp.json: OTLP-JSON) file",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Sample a CPU profile of the run into data/profiles/",
+    ),
     help_flag: bool = typer.Option(
         False,
         "--help",
@@ -952,10 +1219,17 @@ Options:
   --end TEXT                  End date (YYYY-MM-DD)
   --batch-size INTEGER        Bars per request (overrides config)
   --output PATH               Output directory (overrides config)
-  --workers INTEGER           Number of worker threads (overrides config)
+  --workers INTEGER           Worker processes to shard symbols across (overrides config)
   --provider TEXT             Market data provider (overrides config)
   --feed-type TEXT            Data feed type (overrides config)
   --timeframe TEXT            Bar timeframe: 1m, 5m, 15m, 30m, 1h, 4h, 1d (default: 1m)
+  --incremental               Only fetch trading days missing or stale in storage
+  --pipelined                 Validate and aggregate each symbol as soon as it is stored
+  --enqueue                   Queue the job for `marketpipe worker` instead of running it
+  --shard-index INTEGER       Shard of the symbols this node ingests, 0-based
+  --shard-count INTEGER       Nodes the symbols are split across by consistent hashing
+  --trace PATH                Write per-stage spans to a Chrome trace (*.otlp.json: OTLP)
+  --profile                   Sample a CPU profile of the run into data/profiles/
   -h, --help                  Show this message and exit
 """
         typer.echo(help_text.strip())
@@ -970,6 +1244,7 @@ Options:
         validate_feed_type(provider, feed_type)
 
     validate_workers(workers)
+    validate_shard(shard_index, shard_count)
     validate_batch_size(batch_size)
     validate_output_dir(output_path)
 
@@ -1044,6 +1319,13 @@ Options:
         provider=provider,
         feed_type=feed_type,
         timeframe=timeframe,
+        incremental=incremental,
+        pipelined=pipelined,
+        enqueue=enqueue,
+        shard_index=shard_index,
+        shard_count=shard_count,
+        trace=trace,
+        profile=profile,
     )
 
 
@@ -1070,12 +1352,18 @@ def ingest_deprecated(
     ),
     output_path: str = typer.Option(None, "--output", help="Output directory (overrides config)"),
     workers: int = typer.Option(
-        None, "--workers", help="Number of worker threads (overrides config)"
+        None, "--workers", help="Worker processes to shard symbols across (overrides config)"
     ),
     provider: str = typer.Option(
         None, "--provider", help="Market data provider (overrides config)"
     ),
     feed_type: str = typer.Option(None, "--feed-type", help="Data feed type (overrides config)"),
+    trace: Path = typer.Option(
+        None, "--trace", help="Write per-stage spans to this Chrome trace (*.otlp.json: OTLP-JSON)"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Sample a CPU profile of the run into data/profiles/"
+    ),
 ):
     """[DEPRECATED] Use 'ingest-ohlcv' or 'ohlcv ingest' instead."""
     print("⚠️  Warning: 'ingest' is deprecated. Use 'ingest-ohlcv' or 'ohlcv ingest' instead.")
@@ -1091,4 +1379,6 @@ def ingest_deprecated(
         provider=provider,
         feed_type=feed_type,
         timeframe=None,  # Use default timeframe
+        trace=trace,
+        profile=profile,
     )
@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Event outbox commands for MarketPipe."""
+
+from __future__ import annotations
+
+import os
+import signal
+from pathlib import Path
+from typing import Callable, Optional
+
+import typer
+
+outbox_app = typer.Typer(
+    name="outbox", help="Durable event outbox delivery commands", add_completion=False
+)
+
+CONSUMERS = ("aggregation", "validation")
+
+
+def _default_db_path() -> Path:
+    """Ingestion jobs database the ingest command writes the outbox into."""
+    return Path(os.getenv("MARKETPIPE_INGESTION_DB_PATH", "data/ingestion_jobs.db"))
+
+
+def _build_consumer(consumer: str) -> Callable:
+    """Delivery function running a post-processing stage synchronously."""
+    if consumer == "aggregation":
+        from marketpipe.aggregation.application.services import AggregationRunnerService
+
+        handle = AggregationRunnerService.build_default().handle_ingestion_completed
+    elif consumer == "validation":
+        from marketpipe.validation.application.services import ValidationRunnerService
+
+        handle = ValidationRunnerService.build_default().handle_ingestion_completed
+    else:
+        raise typer.BadParameter(f"Unknown consumer {consumer!r}; choose from {CONSUMERS}")
+
+    from marketpipe.ingestion.domain.events import as_job_completed
+
+    def deliver(event) -> None:
+        completed = as_job_completed(event)
+        if completed is not None:
+            handle(completed)
+
+    return deliver
+
+
+def _open_outbox(db: Optional[Path], max_attempts: int):
+    from marketpipe.infrastructure.messaging.outbox import SqliteEventOutbox
+
+    db_path = db or _default_db_path()
+    if not db_path.exists():
+        typer.echo(f"❌ Database not found: {db_path}")
+        typer.echo("💡 Run an ingestion with MARKETPIPE_EVENT_OUTBOX=1 first")
+        raise typer.Exit(1)
+    return SqliteEventOutbox(db_path, max_attempts=max_attempts)
+
+
+@outbox_app.command()
+def dispatch(
+    consumer: str = typer.Option(
+        "aggregation", "--consumer", "-c", help=f"Consumer to deliver to ({', '.join(CONSUMERS)})"
+    ),
+    db: Optional[Path] = typer.Option(None, "--db", help="Ingestion jobs database"),
+    once: bool = typer.Option(False, "--once", help="Deliver everything due, then exit"),
+    batch_size: int = typer.Option(100, "--batch-size", help="Events per transaction"),
+    max_attempts: int = typer.Option(10, "--max-attempts", help="Attempts before dead-lettering"),
+    poll_interval: float = typer.Option(1.0, "--poll-interval", help="Seconds between polls"),
+):
+    """Deliver outbox events to a post-processing consumer.
+
+    Runs until interrupted; undelivered events from earlier runs are picked
+    up on start. Run one dispatcher per consumer.
+
+    Examples:
+        marketpipe outbox dispatch --consumer aggregation
+        marketpipe outbox dispatch --consumer validation --once
+    """
+    from marketpipe.infrastructure.messaging.outbox import OutboxDispatcher
+
+    outbox = _open_outbox(db, max_attempts)
+    dispatcher = OutboxDispatcher(
+        outbox, _build_consumer(consumer), consumer=consumer, batch_size=batch_size
+    )
+
+    if once:
+        delivered = dispatcher.drain()
+        typer.echo(f"✅ Delivered {delivered} event(s) to {consumer}")
+        return
+
+    typer.echo(f"📬 Dispatching {outbox.db_path} to {consumer} (Ctrl+C to stop)")
+    signal.signal(signal.SIGTERM, lambda *_: dispatcher.stop())
+    try:
+        dispatcher.run(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    typer.echo("👋 Dispatcher stopped")
+
+
+@outbox_app.command()
+def status(
+    db: Optional[Path] = typer.Option(None, "--db", help="Ingestion jobs database"),
+    max_attempts: int = typer.Option(10, "--max-attempts", help="Attempts before dead-lettering"),
+):
+    """Show delivered, pending and dead-lettered events per consumer."""
+    outbox = _open_outbox(db, max_attempts)
+    consumers = sorted(set(CONSUMERS) | set(outbox.consumers()))
+
+    typer.echo(f"{'Consumer':<16} {'Total':>8} {'Delivered':>10} {'Pending':>8} {'Dead':>6}")
+    for name in consumers:
+        stats = outbox.stats(name)
+        typer.echo(
+            f"{name:<16} {stats.total:>8} {stats.delivered:>10} {stats.pending:>8} {stats.dead:>6}"
+        )
+
+
+@outbox_app.command()
+def requeue(
+    consumer: str = typer.Option(..., "--consumer", "-c", help="Consumer to requeue for"),
+    db: Optional[Path] = typer.Option(None, "--db", help="Ingestion jobs database"),
+    max_attempts: int = typer.Option(10, "--max-attempts", help="Attempts before dead-lettering"),
+):
+    """Give dead-lettered events of a consumer a fresh set of attempts."""
+    outbox = _open_outbox(db, max_attempts)
+    count = outbox.requeue_dead(consumer)
+    typer.echo(f"🔁 Requeued {count} dead-lettered event(s) for {consumer}")
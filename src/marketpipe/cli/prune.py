@@ -107,13 +107,18 @@ def prune_parquet(
                         except ValueError:
                             continue
 
-                    # Try date= prefix format
+                    # Try date= prefix format (compacted buckets use YYYY-MM or YYYY;
+                    # they are only pruned once their last day is past the cutoff)
                     if part.startswith("date="):
-                        try:
-                            date_found = dt.date.fromisoformat(part[5:])
-                            break
-                        except ValueError:
+                        from marketpipe.infrastructure.storage.parquet_engine import (
+                            ParquetStorageEngine,
+                        )
+
+                        span = ParquetStorageEngine.partition_span(part[5:])
+                        if span is None:
                             continue
+                        date_found = span[1]
+                        break
 
                     # Try YYYY/MM/DD structure (check if we have year/month/day pattern)
                     if len(path_parts) >= 3:
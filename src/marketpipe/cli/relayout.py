@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Partition layout migration command."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+# Heavy imports moved inside functions to optimize --help performance
+
+
+def relayout(
+    to: str = typer.Option(..., "--to", "-t", help="Target layout: symbol or clustered"),
+    root: Optional[Path] = typer.Option(
+        None,
+        "--root",
+        help="Storage root to migrate (default: $MARKETPIPE_RAW_ROOT or data/raw)",
+    ),
+    frames: Optional[list[str]] = typer.Option(
+        None, "--frame", "-f", help="Only migrate this frame (repeatable; default: all)"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be rewritten without making changes"
+    ),
+):
+    """Convert frames between the per-symbol and symbol-clustered layouts.
+
+    The clustered layout stores one file per frame and day holding every
+    symbol, so universe-wide scans of a day open one file instead of one per
+    symbol. Frames are rewritten in place; readers wait for the migration, but
+    ingestion into the frame should be stopped while it runs.
+
+    Examples:
+        marketpipe relayout --to clustered --frame 1d --dry-run
+        marketpipe relayout --to clustered --root data/agg -f 1d -f 1h
+        marketpipe relayout --to symbol --frame 1d
+    """
+    from marketpipe.infrastructure.storage.layout import LAYOUTS
+    from marketpipe.infrastructure.storage.relayout import LayoutMigrator
+
+    if to not in LAYOUTS:
+        typer.echo(f"❌ Unknown layout: {to}. Valid layouts: {', '.join(LAYOUTS)}", err=True)
+        raise typer.Exit(1)
+
+    storage_root = root or Path(os.environ.get("MARKETPIPE_RAW_ROOT", "data/raw"))
+    if not storage_root.exists():
+        typer.echo(f"❌ Directory does not exist: {storage_root}", err=True)
+        raise typer.Exit(1)
+
+    migrator = LayoutMigrator(storage_root)
+    targets = frames or migrator.frames()
+    if not targets:
+        typer.echo("✨ No frames to migrate")
+        return
+
+    typer.echo(f"🔀 Migrating {storage_root} to the {to} layout")
+    failed = False
+    for frame in targets:
+        try:
+            result = migrator.migrate(frame, to, dry_run=dry_run)
+        except (FileNotFoundError, ValueError) as e:
+            typer.echo(f"❌ frame={frame}: {e}", err=True)
+            failed = True
+            continue
+
+        if result.source_layout == result.target_layout:
+            typer.echo(f"frame={frame}: already {to}")
+        elif dry_run:
+            typer.echo(
+                f"[DRY RUN] Would rewrite frame={frame} ({result.source_layout} -> {to}): "
+                f"{result.files_read} files over {result.days} days"
+            )
+        else:
+            typer.echo(
+                f"frame={frame} ({result.source_layout} -> {to}): {result.files_read} files "
+                f"-> {result.files_written} files, {result.rows:,} rows over {result.days} days"
+            )
+
+    if failed:
+        raise typer.Exit(1)
+    if not dry_run:
+        typer.secho(f"\n✅ Frames now use the {to} layout", fg="green")
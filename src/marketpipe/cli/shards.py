@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Symbol sharding commands for multi-node ingestion."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+shards_app = typer.Typer(
+    name="shards", help="Split symbols across ingestion nodes", add_completion=False
+)
+
+
+def _load_universe(config: Optional[Path], symbols: Optional[str]) -> tuple[list[str], dict]:
+    """Symbol universe and config defaults from ``--symbols`` or a config file."""
+    defaults: dict = {}
+    universe: list[str] = []
+    if config is not None:
+        from marketpipe.config import load_config
+
+        job_config = load_config(config)
+        universe = list(job_config.symbols)
+        defaults = {
+            "shard_count": job_config.shard_count,
+            "output_path": job_config.output_path,
+            "timeframe": job_config.timeframe,
+        }
+    if symbols:
+        universe = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+    if not universe:
+        typer.echo("❌ Provide --symbols or a --config file listing symbols", err=True)
+        raise typer.Exit(2)
+    return list(dict.fromkeys(universe)), defaults
+
+
+def _resolve_shard_count(shard_count: Optional[int], defaults: dict) -> int:
+    count = shard_count or defaults.get("shard_count") or 1
+    if count < 1:
+        typer.echo("❌ --shard-count must be positive", err=True)
+        raise typer.Exit(2)
+    return count
+
+
+@shards_app.command()
+def assign(
+    symbols: Optional[str] = typer.Option(
+        None, "--symbols", "-s", help="Comma-separated symbol universe"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", "-c", help="Ingestion config whose symbols form the universe"
+    ),
+    shard_count: Optional[int] = typer.Option(
+        None, "--shard-count", "-n", help="Number of shards (default: config or 1)"
+    ),
+):
+    """Show which shard ingests each symbol.
+
+    Examples:
+        marketpipe shards assign --symbols AAPL,MSFT,NVDA,AMZN --shard-count 2
+        marketpipe shards assign --config universe.yaml
+    """
+    from marketpipe.ingestion.domain.sharding import ConsistentHashRing
+
+    universe, defaults = _load_universe(config, symbols)
+    count = _resolve_shard_count(shard_count, defaults)
+
+    assignment = ConsistentHashRing(count).assign(universe)
+    for shard, owned in assignment.items():
+        typer.echo(f"Shard {shard}/{count} ({len(owned)} symbols): {', '.join(owned) or '-'}")
+
+
+@shards_app.command()
+def verify(
+    day: str = typer.Option(..., "--date", "-d", help="Trading day to check (YYYY-MM-DD)"),
+    symbols: Optional[str] = typer.Option(
+        None, "--symbols", "-s", help="Comma-separated symbol universe"
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "--config", "-c", help="Ingestion config whose symbols form the universe"
+    ),
+    shard_count: Optional[int] = typer.Option(
+        None, "--shard-count", "-n", help="Number of shards (default: config or 1)"
+    ),
+    output_path: Optional[Path] = typer.Option(
+        None, "--output", help="Storage root the shards wrote to (default: config or data/output)"
+    ),
+    timeframe: Optional[str] = typer.Option(
+        None, "--timeframe", help="Bar timeframe to check (default: config or 1m)"
+    ),
+):
+    """Verify that the shards together stored every symbol for a day.
+
+    Reads partition metadata only. Each symbol belongs to exactly one shard,
+    so shards never overlap; every symbol without stored bars is reported
+    under the shard responsible for it. Exits with 1 when there are gaps.
+
+    Examples:
+        marketpipe shards verify --config universe.yaml --date 2026-10-16
+        marketpipe shards verify -s AAPL,MSFT -n 2 --date 2026-10-16 --output data/raw
+    """
+    from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+    from marketpipe.ingestion.domain.sharding import verify_shard_coverage
+
+    try:
+        trading_day = date.fromisoformat(day)
+    except ValueError as e:
+        typer.echo(f"❌ Invalid --date {day!r}; use YYYY-MM-DD", err=True)
+        raise typer.Exit(2) from e
+
+    universe, defaults = _load_universe(config, symbols)
+    count = _resolve_shard_count(shard_count, defaults)
+    root = output_path or Path(defaults.get("output_path") or "data/output")
+    frame = timeframe or defaults.get("timeframe") or "1m"
+    if not root.exists():
+        typer.echo(f"❌ Storage root not found: {root}", err=True)
+        raise typer.Exit(1)
+
+    engine = ParquetStorageEngine(root)
+
+    def is_covered(symbol: str) -> bool:
+        coverage = engine.partition_coverage(frame, symbol, trading_day, trading_day)
+        return any(c.is_complete for c in coverage.values())
+
+    report = verify_shard_coverage(universe, count, is_covered)
+
+    typer.echo(f"Coverage of {len(universe)} symbols on {trading_day} ({frame}, {count} shards)")
+    for shard in report:
+        status = "✅" if shard.is_complete else "❌"
+        line = f"{status} Shard {shard.index}/{count}: {shard.covered}/{len(shard.symbols)}"
+        if shard.missing:
+            line += f" missing {', '.join(shard.missing)}"
+        typer.echo(line)
+
+    missing = sum(len(shard.missing) for shard in report)
+    if missing:
+        typer.echo(f"❌ {missing} symbol(s) missing for {trading_day}")
+        raise typer.Exit(1)
+    typer.echo(f"✅ All {len(universe)} symbols covered for {trading_day}")
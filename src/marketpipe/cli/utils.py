@@ -42,12 +42,18 @@ def metrics(
     ),
     plot: bool = typer.Option(False, "--plot", help="Show ASCII sparkline plots"),
     list_metrics: bool = typer.Option(False, "--list", help="List available metrics"),
+    debug_endpoints: bool = typer.Option(
+        False,
+        "--debug-endpoints",
+        help="Also serve /debug/ profiling and introspection endpoints (async server only)",
+    ),
 ):
     """Manage and view MarketPipe metrics.
 
     Examples:
         marketpipe metrics --port 8000                 # Start async Prometheus server
         marketpipe metrics --port 8000 --legacy-metrics # Start legacy blocking server
+        marketpipe metrics --port 8000 --debug-endpoints # Also serve /debug/ endpoints
         marketpipe metrics --list                      # List available metrics
         marketpipe metrics --metric ingestion_bars     # Show metric history
         marketpipe metrics --avg 1h --plot             # Show hourly averages with plot
@@ -80,7 +86,9 @@ def metrics(
                 async def run_async_server():
                     try:
                         # Start the Prometheus metrics server
-                        await start_async_server(port=port, host="localhost")
+                        await start_async_server(
+                            port=port, host="localhost", debug=debug_endpoints or None
+                        )
 
                         # Start the human-friendly dashboard on port+1
                         from marketpipe.cli.metrics_dashboard import serve_metrics_dashboard
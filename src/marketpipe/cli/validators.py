@@ -14,6 +14,7 @@ __all__ = [
     "validate_symbols",
     "validate_output_dir",
     "validate_workers",
+    "validate_shard",
     "validate_batch_size",
     "validate_config_file",
     "validate_provider",
@@ -136,6 +137,17 @@ def validate_workers(workers: Optional[int]) -> None:
         cli_error("invalid number of workers; maximum is 20", code=2)
 
 
+def validate_shard(shard_index: Optional[int], shard_count: Optional[int]) -> None:
+    if shard_count is not None and shard_count < 1:
+        cli_error("--shard-count must be positive", code=2)
+    if shard_index is None:
+        return
+    if shard_index < 0:
+        cli_error("--shard-index must not be negative", code=2)
+    if shard_count is not None and shard_index >= shard_count:
+        cli_error(f"--shard-index must be less than --shard-count ({shard_count})", code=2)
+
+
 def validate_batch_size(size: Optional[int]) -> None:
     if size is None:
         return
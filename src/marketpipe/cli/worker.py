@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Ingestion worker daemon command."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+# Heavy imports moved inside functions to optimize --help performance
+
+
+def worker(
+    provider: str = typer.Option("alpaca", "--provider", help="Market data provider"),
+    feed_type: Optional[str] = typer.Option(
+        None, "--feed-type", help="Data feed type (default: iex for alpaca)"
+    ),
+    output_path: Path = typer.Option(
+        Path("data/raw"), "--output", help="Directory claimed jobs write bars to"
+    ),
+    concurrency: Optional[int] = typer.Option(
+        None,
+        "--concurrency",
+        "-n",
+        help="Jobs run at once (default: $MARKETPIPE_WORKER_CONCURRENCY or 1)",
+    ),
+    lease_seconds: Optional[float] = typer.Option(
+        None,
+        "--lease-seconds",
+        help="Lease on claimed jobs (default: $MARKETPIPE_WORKER_LEASE_SECONDS or 60)",
+    ),
+    poll_interval: Optional[float] = typer.Option(
+        None,
+        "--poll-interval",
+        help="Seconds between polls of an empty queue (default: $MARKETPIPE_WORKER_POLL_SECONDS or 5)",
+    ),
+    worker_id: Optional[str] = typer.Option(
+        None, "--worker-id", help="Lease owner name (default: host:pid:random)"
+    ),
+    once: bool = typer.Option(False, "--once", help="Exit when the queue is empty"),
+    metrics_port: Optional[int] = typer.Option(
+        None, "--metrics-port", help="Serve Prometheus metrics from the worker on this port"
+    ),
+    debug_endpoints: bool = typer.Option(
+        False,
+        "--debug-endpoints",
+        help="Also serve /debug/ profiling and introspection endpoints on the metrics port",
+    ),
+):
+    """Run queued ingestion jobs, sharing the queue with other workers.
+
+    Claims PENDING jobs (queued with ``ingest --enqueue``) under a lease that
+    is renewed while they run. Jobs of workers that died are reclaimed once
+    their lease expires. The queue is ``$DATABASE_URL`` when it points at
+    PostgreSQL, so workers on several hosts can share it, otherwise
+    ``data/ingestion_jobs.db``.
+
+    With ``--metrics-port`` the worker serves its metrics itself; add
+    ``--debug-endpoints`` to profile it, dump its tasks or inspect its
+    rate limiter and queues while it runs.
+
+    Examples:
+        marketpipe worker --provider alpaca --feed-type iex --concurrency 4
+        marketpipe worker --provider fake --once
+        marketpipe worker --metrics-port 8001 --debug-endpoints
+    """
+    from marketpipe.cli.ohlcv_ingest import (
+        _build_ingestion_services,
+        _build_provider_config,
+        _build_shared_job_repository,
+        _cleanup_async_resources,
+    )
+    from marketpipe.cli.validators import validate_feed_type, validate_provider
+    from marketpipe.ingestion.application.worker import IngestionWorker, WorkerSettings
+
+    if provider == "alpaca" and feed_type is None:
+        feed_type = "iex"
+    validate_provider(provider)
+    validate_feed_type(provider, feed_type)
+    if debug_endpoints and metrics_port is None:
+        typer.echo("❌ --debug-endpoints needs --metrics-port", err=True)
+        raise typer.Exit(2)
+
+    defaults = WorkerSettings.from_env()
+    try:
+        settings = WorkerSettings(
+            concurrency=concurrency if concurrency is not None else defaults.concurrency,
+            lease_seconds=lease_seconds if lease_seconds is not None else defaults.lease_seconds,
+            poll_interval=poll_interval if poll_interval is not None else defaults.poll_interval,
+            worker_id=worker_id or defaults.worker_id,
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-5s [%(name)s] %(message)s")
+
+    provider_config = _build_provider_config(provider, feed_type or "iex")
+    job_repo = _build_shared_job_repository()
+    _, coordinator = _build_ingestion_services(provider_config, str(output_path), job_repo=job_repo)
+
+    async def run_worker() -> int:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows / non-main thread: Ctrl+C raises instead
+
+        if metrics_port is not None:
+            from marketpipe.metrics_server import start_async_server
+
+            try:
+                await start_async_server(metrics_port, debug=debug_endpoints or None)
+            except RuntimeError as e:
+                typer.echo(f"❌ Failed to start metrics server: {e}", err=True)
+                raise typer.Exit(2) from e
+
+        ingestion_worker = IngestionWorker(
+            job_repo, lambda job: coordinator.execute_job(job.job_id), settings
+        )
+        try:
+            return await ingestion_worker.run(stop, until_idle=once)
+        finally:
+            if metrics_port is not None:
+                from marketpipe.metrics_server import stop_async_server
+
+                await stop_async_server()
+            coordinator.close()
+            await _cleanup_async_resources(
+                job_repo,
+                coordinator._checkpoint_repository,
+                coordinator._metrics_repository,
+            )
+
+    typer.echo(
+        f"👷 Worker {settings.worker_id}: {settings.concurrency} concurrent job(s), "
+        f"lease {settings.lease_seconds:g}s"
+    )
+    completed = asyncio.run(run_worker())
+    typer.echo(f"✅ Worker {settings.worker_id} completed {completed} job(s)")
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Trading calendar span setting.
+
+The domain's ``default_calendar`` takes its span of years as an argument;
+this module reads the span from the environment so that the calendar never
+depends on process configuration.
+
+Environment Variables:
+    MARKETPIPE_CALENDAR_YEARS: first and last year of the calendar, e.g.
+        ``1995-2050`` (default ``2000-2040``)
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from marketpipe.domain.calendar import DEFAULT_CALENDAR_YEARS, TradingCalendar, default_calendar
+
+CALENDAR_YEARS_ENV = "MARKETPIPE_CALENDAR_YEARS"
+
+
+def configured_calendar_years(value: Optional[str] = None) -> tuple[int, int]:
+    """Span of ``value``, or of ``$MARKETPIPE_CALENDAR_YEARS`` when None.
+
+    Raises:
+        ValueError: If the span does not look like ``2000-2040``
+    """
+    if value is None:
+        value = os.environ.get(CALENDAR_YEARS_ENV, "")
+    value = value.strip()
+    if not value:
+        return DEFAULT_CALENDAR_YEARS
+    try:
+        first, _, last = value.partition("-")
+        return int(first), int(last or first)
+    except ValueError:
+        raise ValueError(f"{CALENDAR_YEARS_ENV} must look like 2000-2040, got {value!r}") from None
+
+
+def configured_calendar() -> TradingCalendar:
+    """The shared exchange calendar for the configured span of years."""
+    return default_calendar(configured_calendar_years())
+
+
+__all__ = ["CALENDAR_YEARS_ENV", "configured_calendar", "configured_calendar_years"]
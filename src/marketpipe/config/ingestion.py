@@ -44,6 +44,15 @@ class IngestionJobConfig(BaseModel):
     timeframe: str = Field(default="1m", description="Bar timeframe (1m, 5m, 15m, 30m, 1h, 4h, 1d)")
     output_path: str = Field(default="./data", description="Output directory for data files")
     workers: int = Field(default=4, description="Number of worker threads", ge=1, le=32)
+    incremental: bool = Field(
+        default=False, description="Only fetch trading days missing from storage"
+    )
+    shard_index: int = Field(
+        default=0, description="Shard of the symbols this node ingests (0-based)", ge=0
+    )
+    shard_count: int = Field(
+        default=1, description="Nodes the symbols are split across by consistent hashing", ge=1
+    )
 
     class Config:
         extra = "forbid"  # Reject unknown keys
@@ -121,6 +130,16 @@ class IngestionJobConfig(BaseModel):
             raise ValueError("start date must be before end date")
         return self
 
+    @model_validator(mode="after")
+    def validate_shard(self) -> IngestionJobConfig:
+        """Validate that the shard index falls within the shard count."""
+        if self.shard_index >= self.shard_count:
+            raise ValueError(
+                f"shard_index must be less than shard_count ({self.shard_count}), "
+                f"got {self.shard_index}"
+            )
+        return self
+
     @classmethod
     def from_yaml(cls, path: PathLike) -> IngestionJobConfig:
         """Load configuration from YAML file.
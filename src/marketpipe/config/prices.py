@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Price backend setting.
+
+Providers and validation build prices with the class of the configured
+backend. The domain's ``price_type`` only maps a backend name to its class;
+this module reads the name from the environment so that value objects never
+depend on process configuration.
+
+Environment Variables:
+    MARKETPIPE_PRICE_BACKEND: ``decimal`` (default, :class:`Price`) or
+        ``fixed`` (:class:`FixedPrice`)
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from marketpipe.domain.value_objects import PriceType, price_type
+
+PRICE_BACKEND_ENV = "MARKETPIPE_PRICE_BACKEND"
+
+
+def configured_price_type(backend: Optional[str] = None) -> PriceType:
+    """Price class of ``backend``, or of ``$MARKETPIPE_PRICE_BACKEND`` when None.
+
+    Adapters and validation call this with their ``price_backend`` argument,
+    so the environment decides the price class of every bar they build
+    unless a backend is given explicitly.
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    return price_type(backend or os.environ.get(PRICE_BACKEND_ENV) or "decimal")
+
+
+__all__ = ["PRICE_BACKEND_ENV", "configured_price_type"]
@@ -14,7 +14,7 @@ from typing import Optional
 
 from .entities import OHLCVBar
 from .events import BarCollectionCompleted, BarCollectionStarted, DomainEvent, MarketDataReceived
-from .value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from .value_objects import Price, PriceLike, Symbol, TimeRange, Timestamp, Volume
 
 
 class SymbolBarsAggregate:
@@ -34,8 +34,8 @@ class SymbolBarsAggregate:
         self._is_complete = False
         self._collection_started = False
         # Running totals for efficient calculations
-        self._running_high: Optional[Price] = None
-        self._running_low: Optional[Price] = None
+        self._running_high: Optional[PriceLike] = None
+        self._running_low: Optional[PriceLike] = None
         self._running_volume: Volume = Volume(0)
 
     @property
@@ -174,16 +174,19 @@ class SymbolBarsAggregate:
         """Check if there are time gaps in the minute-by-minute data.
 
         Returns:
-            True if there are missing minutes in the trading day
+            True if there are fewer bars than minutes in the day's session
         """
         if len(self._bars) < 2:
             return False
 
-        sorted_bars = self.get_all_bars()
-        expected_minutes = 390  # 6.5 hours * 60 minutes (regular trading hours)
+        from .calendar import default_calendar
+
+        try:
+            expected_minutes = int(default_calendar().expected_bars([self._trading_date])[0])
+        except ValueError:
+            expected_minutes = 390  # 6.5 hours * 60 minutes (regular trading hours)
 
-        # Simple gap detection - in reality would need market calendar
-        return len(sorted_bars) < expected_minutes
+        return len(self._bars) < expected_minutes
 
     def complete_collection(self) -> None:
         """Mark the bar collection as complete and raise domain event.
@@ -477,12 +480,12 @@ class DailySummary:
 
     symbol: Symbol
     trading_date: date
-    open_price: Price
-    high_price: Price
-    low_price: Price
-    close_price: Price
+    open_price: PriceLike
+    high_price: PriceLike
+    low_price: PriceLike
+    close_price: PriceLike
     volume: Volume
-    vwap: Optional[Price]
+    vwap: Optional[PriceLike]
     bar_count: int
     first_bar_time: Timestamp
     last_bar_time: Timestamp
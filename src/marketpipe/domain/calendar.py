@@ -0,0 +1,338 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Exchange trading calendar precomputed into arrays.
+
+US equity sessions (NYSE rules) are computed once for a span of years:
+holidays with their weekend observance, early closes, and the exchange's
+DST offset. Each calendar day of the span gets one slot in a few NumPy
+arrays, so a date lookup is an index computation and timestamp checks
+over whole batches are array comparisons:
+
+    date / ts_ns ─▶ epoch day ─▶ day - first_day ─▶ open_ns[i], close_ns[i], ...
+
+Sessions always fall within one UTC date (09:30-16:00 New York is
+13:30-21:00 UTC), so the UTC day of a timestamp selects its session.
+Non-session days keep their nominal 09:30 open and have ``close == open``,
+which makes every mask test an empty session false.
+
+The span defaults to 2000-2040; callers pass another span in (see
+``marketpipe.config.calendar`` for the environment setting). Lookups
+outside it raise ``ValueError`` rather than guessing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Optional, Union
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MINUTE = 60 * NS_PER_SECOND
+NS_PER_DAY = 86_400 * NS_PER_SECOND
+EPOCH = date(1970, 1, 1)
+EXCHANGE_TIMEZONE = "America/New_York"
+DEFAULT_CALENDAR_YEARS = (2000, 2040)
+
+REGULAR_OPEN = time(9, 30)
+REGULAR_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+
+# Unscheduled full-day closures
+SPECIAL_CLOSURES = {
+    date(2001, 9, 11): "September 11",
+    date(2001, 9, 12): "September 11",
+    date(2001, 9, 13): "September 11",
+    date(2001, 9, 14): "September 11",
+    date(2004, 6, 11): "Reagan National Day of Mourning",
+    date(2007, 1, 2): "Ford National Day of Mourning",
+    date(2012, 10, 29): "Hurricane Sandy",
+    date(2012, 10, 30): "Hurricane Sandy",
+    date(2018, 12, 5): "Bush National Day of Mourning",
+    date(2025, 1, 9): "Carter National Day of Mourning",
+}
+
+DayLike = Union[date, int]
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th ``weekday`` (Monday=0) of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    m = (32 + 2 * e + 2 * i - h - k) % 7
+    n = (a + 11 * h + 22 * m) // 451
+    month, day = divmod(h + m - 7 * n + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Weekend holidays move to Friday (Saturday) or Monday (Sunday)."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year: int) -> dict[date, str]:
+    """Full-day NYSE closures of a year, by observed date."""
+    holidays: dict[date, str] = {}
+    new_year = date(year, 1, 1)
+    # A Saturday New Year's Day is not observed on the preceding Friday
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+    if year >= 1998:
+        holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+    holidays[_nth_weekday(year, 2, 0, 3)] = "Washington's Birthday"
+    holidays[_easter(year) - timedelta(days=2)] = "Good Friday"
+    holidays[_nth_weekday(year, 5, 0, -1)] = "Memorial Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    holidays[_observed(date(year, 7, 4))] = "Independence Day"
+    holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    holidays[_nth_weekday(year, 11, 3, 4)] = "Thanksgiving Day"
+    holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+    holidays.update({d: name for d, name in SPECIAL_CLOSURES.items() if d.year == year})
+    return holidays
+
+
+def nyse_early_closes(year: int) -> set[date]:
+    """Days of a year on which the NYSE closes at 13:00."""
+    early = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1)}  # day after Thanksgiving
+    for day in (date(year, 7, 3), date(year, 12, 24)):
+        # Only when the eve falls Monday-Thursday; otherwise the holiday is observed
+        if day.weekday() < 4:
+            early.add(day)
+    return early
+
+
+def _minutes(clock: time) -> int:
+    return clock.hour * 60 + clock.minute
+
+
+def _open_offset_minutes(day: date, tz: ZoneInfo) -> int:
+    offset = datetime.combine(day, REGULAR_OPEN, tz).utcoffset()
+    if offset is None:
+        raise ValueError(f"Time zone {tz} has no UTC offset on {day}")
+    return offset // timedelta(minutes=1)
+
+
+class TradingCalendar:
+    """Sessions of an exchange for a span of years, as per-day arrays.
+
+    Attributes:
+        first_year: First year of the span
+        last_year: Last year of the span (inclusive)
+        open_ns: Regular open of each day (nominal for non-session days)
+        close_ns: Close of each day; equal to the open on non-session days
+        is_session: Whether each day is a trading session
+        utc_offset_minutes: Exchange UTC offset of each day (DST-aware)
+        session_days: Epoch days of all sessions, ascending
+    """
+
+    def __init__(
+        self,
+        first_year: int = DEFAULT_CALENDAR_YEARS[0],
+        last_year: int = DEFAULT_CALENDAR_YEARS[1],
+        tz: str = EXCHANGE_TIMEZONE,
+    ) -> None:
+        if last_year < first_year:
+            raise ValueError("last_year must not be before first_year")
+        self.first_year = first_year
+        self.last_year = last_year
+        self._tz = ZoneInfo(tz)
+        self._first_day = (date(first_year, 1, 1) - EPOCH).days
+        self._days = (date(last_year + 1, 1, 1) - EPOCH).days - self._first_day
+
+        holidays: dict[date, str] = {}
+        early: set[date] = set()
+        for year in range(first_year, last_year + 1):
+            holidays.update(nyse_holidays(year))
+            early |= nyse_early_closes(year)
+        self._holidays = holidays
+
+        epoch_days = np.arange(self._days, dtype=np.int64) + self._first_day
+        # Offsets are the only per-day Python work; everything else is array math
+        self.utc_offset_minutes = np.array(
+            [_open_offset_minutes(EPOCH + timedelta(days=int(d)), self._tz) for d in epoch_days],
+            dtype=np.int16,
+        )
+        local_midnight = (
+            epoch_days * NS_PER_DAY - self.utc_offset_minutes.astype(np.int64) * NS_PER_MINUTE
+        )
+        self.is_session = ((epoch_days + 3) % 7 < 5) & ~np.isin(
+            epoch_days, [(d - EPOCH).days for d in holidays]
+        )
+        self.is_early_close = self.is_session & np.isin(
+            epoch_days, [(d - EPOCH).days for d in early]
+        )
+        self.open_ns = local_midnight + _minutes(REGULAR_OPEN) * NS_PER_MINUTE
+        close_minutes = np.where(
+            self.is_early_close, _minutes(EARLY_CLOSE), _minutes(REGULAR_CLOSE)
+        )
+        self.close_ns = np.where(
+            self.is_session, local_midnight + close_minutes * NS_PER_MINUTE, self.open_ns
+        )
+        # session_rank[i]: sessions on or before day i; gives O(1) next/previous lookups
+        self.session_rank = np.cumsum(self.is_session)
+        self.session_days = np.flatnonzero(self.is_session).astype(np.int64) + self._first_day
+
+    # -- scalar lookups -------------------------------------------------
+
+    @property
+    def span(self) -> tuple[date, date]:
+        """First and last date covered."""
+        return date(self.first_year, 1, 1), date(self.last_year, 12, 31)
+
+    def _index(self, day: DayLike) -> int:
+        epoch_day = day if isinstance(day, int) else (day - EPOCH).days
+        i = epoch_day - self._first_day
+        if not 0 <= i < self._days:
+            first, last = self.span
+            raise ValueError(f"Date outside trading calendar span {first}..{last}")
+        return i
+
+    def is_trading_day(self, day: DayLike) -> bool:
+        """Whether a date (or epoch day) is a trading session."""
+        return bool(self.is_session[self._index(day)])
+
+    def holiday_name(self, day: date) -> Union[str, None]:
+        """Name of the holiday closing the exchange on ``day``, if any."""
+        self._index(day)
+        return self._holidays.get(day)
+
+    def session_bounds(self, day: DayLike) -> tuple[int, int]:
+        """Open and close of a day in ns since the epoch (equal on non-session days)."""
+        i = self._index(day)
+        return int(self.open_ns[i]), int(self.close_ns[i])
+
+    def utc_offset(self, day: DayLike) -> timedelta:
+        """Exchange UTC offset on a day."""
+        return timedelta(minutes=int(self.utc_offset_minutes[self._index(day)]))
+
+    def session_times(self, day: date) -> dict[str, datetime]:
+        """Pre-market open, regular open and close and post-market close in exchange time."""
+        i = self._index(day)
+        close = datetime.fromtimestamp(self.close_ns[i] / NS_PER_SECOND, self._tz)
+        regular_close = (
+            close if self.is_session[i] else datetime.combine(day, REGULAR_CLOSE, self._tz)
+        )
+        return {
+            "pre_market_open": datetime.combine(day, time(4, 0), self._tz),
+            "regular_open": datetime.fromtimestamp(self.open_ns[i] / NS_PER_SECOND, self._tz),
+            "regular_close": regular_close,
+            "post_market_close": regular_close + timedelta(hours=4),
+        }
+
+    def next_trading_day(self, day: date) -> date:
+        """First session after ``day``."""
+        rank = int(self.session_rank[self._index(day)])
+        if rank >= len(self.session_days):
+            raise ValueError(f"No session after {day} within the calendar span")
+        return EPOCH + timedelta(days=int(self.session_days[rank]))
+
+    def previous_trading_day(self, day: date) -> date:
+        """Last session before ``day``."""
+        i = self._index(day)
+        rank = int(self.session_rank[i]) - int(self.is_session[i])
+        if rank <= 0:
+            raise ValueError(f"No session before {day} within the calendar span")
+        return EPOCH + timedelta(days=int(self.session_days[rank - 1]))
+
+    def trading_days(self, start: date, end: date) -> list[date]:
+        """Sessions in ``[start, end]``."""
+        i, j = self._index(start), self._index(end)
+        days = np.flatnonzero(self.is_session[i : j + 1]) + self._first_day + i
+        return [EPOCH + timedelta(days=int(d)) for d in days]
+
+    # -- vectorized helpers ----------------------------------------------
+
+    def _day_indices(self, epoch_days: np.ndarray) -> np.ndarray:
+        indices = np.asarray(epoch_days, dtype=np.int64) - self._first_day
+        if len(indices) and (indices.min() < 0 or indices.max() >= self._days):
+            first, last = self.span
+            raise ValueError(f"Timestamps outside trading calendar span {first}..{last}")
+        return indices
+
+    def session_mask(self, ts_ns: Any) -> np.ndarray:
+        """Whether each timestamp falls inside its day's regular session.
+
+        A bar is in session when its start is in ``[open, close)``.
+        """
+        ts = np.asarray(ts_ns, dtype=np.int64)
+        i = self._day_indices(ts // NS_PER_DAY)
+        return np.asarray((ts >= self.open_ns[i]) & (ts < self.close_ns[i]), dtype=bool)
+
+    def session_opens(self, epoch_days: Any) -> np.ndarray:
+        """Regular open (nominal on non-session days) of each epoch day, in ns."""
+        return np.asarray(self.open_ns[self._day_indices(np.asarray(epoch_days))], dtype=np.int64)
+
+    def expected_bars(
+        self, days: Union[Iterable[DayLike], np.ndarray], frame_seconds: int = 60
+    ) -> np.ndarray:
+        """Number of ``frame_seconds`` bars in each day's regular session (0 when closed)."""
+        if frame_seconds <= 0:
+            raise ValueError("frame_seconds must be positive")
+        if not isinstance(days, np.ndarray):
+            days = np.array(
+                [d if isinstance(d, int) else (d - EPOCH).days for d in days], dtype=np.int64
+            )
+        i = self._day_indices(days)
+        frame_ns = frame_seconds * NS_PER_SECOND
+        return np.asarray(-((self.open_ns[i] - self.close_ns[i]) // frame_ns), dtype=np.int64)
+
+    def session_table(self, epoch_days: Any = None) -> dict[str, np.ndarray]:
+        """Days with their open and close, for joining in SQL.
+
+        Covers the whole span by default, else the given epoch days; days
+        outside the span are left out.
+        """
+        if epoch_days is None:
+            i = np.arange(self._days)
+        else:
+            i = np.unique(np.asarray(epoch_days, dtype=np.int64)) - self._first_day
+            i = i[(i >= 0) & (i < self._days)]
+        return {
+            "day": i + self._first_day,
+            "open_ns": self.open_ns[i],
+            "close_ns": self.close_ns[i],
+            "is_session": self.is_session[i],
+        }
+
+
+@lru_cache(maxsize=4)
+def _calendar(first_year: int, last_year: int) -> TradingCalendar:
+    return TradingCalendar(first_year, last_year)
+
+
+def default_calendar(years: Optional[tuple[int, int]] = None) -> TradingCalendar:
+    """The shared exchange calendar for ``years``, 2000-2040 when None."""
+    return _calendar(*(years or DEFAULT_CALENDAR_YEARS))
+
+
+__all__ = [
+    "DEFAULT_CALENDAR_YEARS",
+    "EPOCH",
+    "EXCHANGE_TIMEZONE",
+    "NS_PER_DAY",
+    "NS_PER_MINUTE",
+    "TradingCalendar",
+    "default_calendar",
+    "nyse_early_closes",
+    "nyse_holidays",
+]
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID, uuid4
 
-from .value_objects import Price, Symbol, Timestamp, Volume
+from .value_objects import Price, PriceLike, Symbol, Timestamp, Volume
 
 
 @dataclass(frozen=True)
@@ -82,13 +82,13 @@ class OHLCVBar(Entity):
         id: EntityId,
         symbol: Symbol,
         timestamp: Timestamp,
-        open_price: Price,
-        high_price: Price,
-        low_price: Price,
-        close_price: Price,
+        open_price: PriceLike,
+        high_price: PriceLike,
+        low_price: PriceLike,
+        close_price: PriceLike,
         volume: Volume,
         trade_count: Optional[int] = None,
-        vwap: Optional[Price] = None,
+        vwap: Optional[PriceLike] = None,
     ):
         super().__init__(id)
         self._symbol = symbol
@@ -141,22 +141,22 @@ class OHLCVBar(Entity):
         return self._timestamp.to_nanoseconds()
 
     @property
-    def open_price(self) -> Price:
+    def open_price(self) -> PriceLike:
         """Get the opening price."""
         return self._open_price
 
     @property
-    def high_price(self) -> Price:
+    def high_price(self) -> PriceLike:
         """Get the highest price."""
         return self._high_price
 
     @property
-    def low_price(self) -> Price:
+    def low_price(self) -> PriceLike:
         """Get the lowest price."""
         return self._low_price
 
     @property
-    def close_price(self) -> Price:
+    def close_price(self) -> PriceLike:
         """Get the closing price."""
         return self._close_price
 
@@ -171,7 +171,7 @@ class OHLCVBar(Entity):
         return self._trade_count
 
     @property
-    def vwap(self) -> Optional[Price]:
+    def vwap(self) -> Optional[PriceLike]:
         """Get the volume-weighted average price (if available)."""
         return self._vwap
 
@@ -234,7 +234,7 @@ class OHLCVBar(Entity):
         self._trade_count = trade_count
         self._increment_version()
 
-    def update_vwap(self, vwap: Price) -> None:
+    def update_vwap(self, vwap: PriceLike) -> None:
         """Update the volume-weighted average price.
 
         Args:
@@ -11,7 +11,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
-from typing import Any, Callable, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol
 from uuid import UUID, uuid4
 
 from .value_objects import Symbol, Timestamp
@@ -61,9 +61,20 @@ class DomainEvent(ABC):
         """Identifier of the aggregate that generated this event."""
         pass
 
-    # Note: Concrete event classes typically define fields for event_id, occurred_at,
-    # and version via dataclass declarations. We intentionally avoid declaring these
-    # as abstract properties here to permit simple dataclass-based subclasses.
+    # Concrete event classes define event_id and occurred_at as dataclass fields
+    # or as properties. They are declared for type checkers only: a property on
+    # this class would shadow the fields of dataclass-based subclasses.
+    if TYPE_CHECKING:
+
+        @property
+        def event_id(self) -> UUID:
+            """Unique identifier of this event."""
+            ...
+
+        @property
+        def occurred_at(self) -> datetime:
+            """When the event happened (UTC)."""
+            ...
 
     @abstractmethod
     def _get_event_data(self) -> dict[str, Any]:
@@ -9,13 +9,19 @@ across multiple domain objects or provide stateless business operations.
 from __future__ import annotations
 
 from collections.abc import Iterable
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from .aggregates import DailySummary
+from .calendar import TradingCalendar, default_calendar
 from .entities import OHLCVBar
-from .value_objects import Price, Timestamp, Volume
+from .value_objects import Price, Symbol, Timestamp, Volume
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .analytics import OHLCVColumns
 
 
 class DomainService:
@@ -28,18 +34,37 @@ class DomainService:
     pass
 
 
+def _columnar(data: Any) -> Optional[OHLCVColumns]:
+    """Columnar batch of ``data``, or None when it is an iterable of bars."""
+    from . import analytics
+
+    return analytics.OHLCVColumns.coerce(data) if analytics.is_columnar(data) else None
+
+
+def _optional_floats(values: np.ndarray) -> list[Optional[float]]:
+    """Float array as a list, with None where the array holds NaN."""
+    return [None if value != value else float(value) for value in values.tolist()]
+
+
 class OHLCVCalculationService(DomainService):
     """Service for performing OHLCV calculations and aggregations.
 
     This service provides business logic for calculating various
     financial metrics and aggregating OHLCV data across timeframes.
+
+    Every calculation also accepts columnar input (a DataFrame or Arrow
+    table in the storage schema, or an ``OHLCVColumns`` batch), which runs
+    the vectorized kernels of :mod:`marketpipe.domain.analytics` instead of
+    iterating over bar objects. Results keep their declared types; the
+    ``*_columns`` methods return the columnar results as they are, without
+    building bar objects or lists.
     """
 
     def vwap(self, bars: Iterable[OHLCVBar]) -> Decimal:
         """Calculate Volume Weighted Average Price (VWAP) for a series of bars.
 
         Args:
-            bars: Iterable of OHLCV bars
+            bars: Iterable of OHLCV bars, or columnar bars
 
         Returns:
             VWAP as Decimal
@@ -47,6 +72,17 @@ class OHLCVCalculationService(DomainService):
         Raises:
             ValueError: If no bars provided or no volume data
         """
+        columns = _columnar(bars)
+        if columns is not None:
+            from .analytics import batch_vwap
+
+            if not len(columns):
+                raise ValueError("Cannot calculate VWAP with no bars")
+            value = batch_vwap(columns)
+            if value is None:
+                raise ValueError("Cannot calculate VWAP: no volume data")
+            return Decimal(repr(value))
+
         bars_list = list(bars)
         if not bars_list:
             raise ValueError("Cannot calculate VWAP with no bars")
@@ -79,7 +115,7 @@ class OHLCVCalculationService(DomainService):
         """Calculate daily summary from intraday bars.
 
         Args:
-            bars: Iterable of OHLCV bars for a single trading day
+            bars: Iterable of OHLCV bars for a single trading day, or columnar bars
 
         Returns:
             DailySummary calculated from the bars
@@ -87,6 +123,24 @@ class OHLCVCalculationService(DomainService):
         Raises:
             ValueError: If no bars provided or bars span multiple days
         """
+        columns = _columnar(bars)
+        if columns is not None:
+            from .analytics import daily_summaries
+
+            summaries = daily_summaries(columns)
+            symbols, dates = summaries["symbol"], summaries["trading_date"]
+            if not len(symbols):
+                raise ValueError("Cannot calculate daily summary with no bars")
+            if symbols[-1] != symbols[0]:
+                raise ValueError(
+                    f"All bars must be for same symbol. Found {symbols[-1]}, expected {symbols[0]}"
+                )
+            if len(dates) > 1:
+                raise ValueError(
+                    f"All bars must be from same trading date. Found {dates[1]}, expected {dates[0]}"
+                )
+            return self._summary_from_columns(summaries, 0)
+
         bars_list = sorted(bars, key=lambda b: b.timestamp.value)
         if not bars_list:
             raise ValueError("Cannot calculate daily summary with no bars")
@@ -138,11 +192,63 @@ class OHLCVCalculationService(DomainService):
             last_bar_time=last_bar.timestamp,
         )
 
+    def daily_summaries(self, bars: Any) -> list[DailySummary]:
+        """Calculate the daily summary of every symbol and trading day at once.
+
+        Args:
+            bars: Bars of any number of symbols and days, columnar or objects
+
+        Returns:
+            Summaries ordered by symbol, then trading date
+        """
+        from .analytics import daily_summaries
+
+        summaries = daily_summaries(bars)
+        return [self._summary_from_columns(summaries, i) for i in range(len(summaries["symbol"]))]
+
+    def vwap_by_symbol(self, bars: Any) -> dict[str, Optional[Decimal]]:
+        """Calculate the VWAP of every symbol in one pass.
+
+        Args:
+            bars: Bars of any number of symbols, columnar or objects
+
+        Returns:
+            VWAP per symbol (None for symbols without volume)
+        """
+        from .analytics import vwap_by_symbol
+
+        return {
+            symbol: None if value is None else Decimal(repr(value))
+            for symbol, value in vwap_by_symbol(bars).items()
+        }
+
+    @staticmethod
+    def _summary_from_columns(summaries: dict[str, Any], i: int) -> DailySummary:
+        """DailySummary of row ``i`` of ``analytics.daily_summaries``."""
+        row = {name: values[i] for name, values in summaries.items()}
+        vwap = row["vwap"]
+        return DailySummary(
+            symbol=Symbol(row["symbol"]),
+            trading_date=row["trading_date"],
+            open_price=Price.from_float(float(row["open"])),
+            high_price=Price.from_float(float(row["high"])),
+            low_price=Price.from_float(float(row["low"])),
+            close_price=Price.from_float(float(row["close"])),
+            volume=Volume(int(row["volume"])),
+            vwap=None if vwap != vwap else Price.from_float(float(vwap)),
+            bar_count=int(row["bar_count"]),
+            first_bar_time=Timestamp.from_nanoseconds(int(row["first_ts_ns"])),
+            last_bar_time=Timestamp.from_nanoseconds(int(row["last_ts_ns"])),
+        )
+
     def resample(self, bars: Iterable[OHLCVBar], frame_seconds: int) -> list[OHLCVBar]:
         """Resample bars to a different timeframe.
 
+        Columnar input may hold several symbols; each is resampled on its own.
+        Use :meth:`resample_columns` to keep the result columnar.
+
         Args:
-            bars: Iterable of OHLCV bars (must be sorted by timestamp)
+            bars: Iterable of OHLCV bars (must be sorted by timestamp), or columnar bars
             frame_seconds: Target timeframe in seconds (300 for 5min, 900 for 15min, etc.)
 
         Returns:
@@ -154,6 +260,10 @@ class OHLCVCalculationService(DomainService):
         if frame_seconds <= 0:
             raise ValueError("frame_seconds must be positive")
 
+        columns = _columnar(bars)
+        if columns is not None:
+            return self.resample_columns(columns, frame_seconds).to_bars()
+
         bars_list = list(bars)
         if not bars_list:
             return []
@@ -189,7 +299,7 @@ class OHLCVCalculationService(DomainService):
             # If this is a new period, process the current group
             if current_period_start is not None and period_start != current_period_start:
                 if current_group:
-                    resampled_bar = self._resample_bar_group(current_group, period_start)
+                    resampled_bar = self._resample_bar_group(current_group, current_period_start)
                     resampled_bars.append(resampled_bar)
                 current_group = []
 
@@ -204,6 +314,23 @@ class OHLCVCalculationService(DomainService):
 
         return resampled_bars
 
+    def resample_columns(self, bars: Any, frame_seconds: int) -> OHLCVColumns:
+        """Resample columnar bars of any number of symbols to a different timeframe.
+
+        Args:
+            bars: Columnar bars or bar objects (sorted by timestamp per symbol)
+            frame_seconds: Target timeframe in seconds
+
+        Returns:
+            Resampled bars, grouped by symbol
+
+        Raises:
+            ValueError: If frame_seconds is invalid or bars are not sorted
+        """
+        from .analytics import resample
+
+        return resample(bars, frame_seconds)
+
     def _resample_bar_group(self, bars: list[OHLCVBar], period_start: datetime) -> OHLCVBar:
         """Resample a group of bars into a single bar.
 
@@ -287,7 +414,8 @@ class OHLCVCalculationService(DomainService):
         """Calculate Simple Moving Average for a series of bars.
 
         Args:
-            bars: List of OHLCV bars (must be sorted by timestamp)
+            bars: List of OHLCV bars (must be sorted by timestamp), or columnar
+                bars of any number of symbols
             period: Number of periods for the moving average
             price_type: Which price to use ('open', 'high', 'low', 'close')
 
@@ -300,6 +428,10 @@ class OHLCVCalculationService(DomainService):
         if price_type not in ["open", "high", "low", "close"]:
             raise ValueError("price_type must be one of: open, high, low, close")
 
+        columns = _columnar(bars)
+        if columns is not None:
+            return _optional_floats(self.calculate_sma_columns(columns, period, price_type))
+
         sma_values: list[Optional[float]] = []
         prices: list[float] = []
 
@@ -329,7 +461,8 @@ class OHLCVCalculationService(DomainService):
         """Calculate rolling volatility (standard deviation of returns).
 
         Args:
-            bars: List of OHLCV bars (must be sorted by timestamp)
+            bars: List of OHLCV bars (must be sorted by timestamp), or columnar
+                bars of any number of symbols
             period: Number of periods for volatility calculation
 
         Returns:
@@ -338,6 +471,10 @@ class OHLCVCalculationService(DomainService):
         if period <= 1:
             raise ValueError("Period must be greater than 1")
 
+        columns = _columnar(bars)
+        if columns is not None:
+            return _optional_floats(self.calculate_volatility_columns(columns, period))
+
         volatility_values: list[Optional[float]] = []
         returns: list[float] = []
 
@@ -370,6 +507,37 @@ class OHLCVCalculationService(DomainService):
 
         return volatility_values
 
+    def calculate_sma_columns(
+        self, bars: Any, period: int, price_type: str = "close"
+    ) -> np.ndarray:
+        """Calculate the Simple Moving Average of columnar bars of any number of symbols.
+
+        Args:
+            bars: Columnar bars or bar objects (sorted by timestamp per symbol)
+            period: Number of periods for the moving average
+            price_type: Which price to use ('open', 'high', 'low', 'close')
+
+        Returns:
+            SMA per input row (NaN for periods with insufficient data)
+        """
+        from .analytics import rolling_sma
+
+        return rolling_sma(bars, period, price_type)
+
+    def calculate_volatility_columns(self, bars: Any, period: int) -> np.ndarray:
+        """Calculate rolling volatility of columnar bars of any number of symbols.
+
+        Args:
+            bars: Columnar bars or bar objects (sorted by timestamp per symbol)
+            period: Number of periods for volatility calculation
+
+        Returns:
+            Volatility per input row (NaN for periods with insufficient data)
+        """
+        from .analytics import rolling_volatility
+
+        return rolling_volatility(bars, period)
+
 
 class MarketDataValidationService(DomainService):
     """Service for validating market data business rules.
@@ -499,32 +667,25 @@ class MarketDataValidationService(DomainService):
             List of validation errors
         """
         errors: list[str] = []
+        calendar = TradingCalendarService()
 
-        # Convert to UTC and check if within trading hours
-        # This is a simplified check - real implementation would need proper timezone handling
-        bar_time = bar.timestamp.value
-        bar_hour = bar_time.hour
-        bar_minute = bar_time.minute
-
-        # Convert times to minutes since midnight for easier comparison
-        bar_minutes = bar_hour * 60 + bar_minute
+        bar_time = bar.timestamp.value.astimezone(timezone.utc)
+        local_time = bar_time + calendar.utc_offset(bar_time.date())
+        bar_minutes_et = local_time.hour * 60 + local_time.minute
         start_minutes = start_hour * 60 + start_minute
         end_minutes = end_hour * 60 + end_minute
 
-        # Adjust for ET timezone (rough approximation - actual implementation would need proper timezone handling)
-        # Assuming bar timestamp is in UTC, ET is typically UTC-5 or UTC-4
-        et_offset = 5 * 60  # 5 hours in minutes
-        bar_minutes_et = (bar_minutes - et_offset) % (24 * 60)
-
         if not (start_minutes <= bar_minutes_et <= end_minutes):
             errors.append(
                 f"Bar timestamp appears to be outside regular trading hours "
                 f"({start_hour:02d}:{start_minute:02d}-{end_hour:02d}:{end_minute:02d} ET)"
             )
 
-        # Check if it's a weekend (simplified - real implementation would check trading calendar)
-        if bar_time.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            errors.append(f"Bar timestamp is on weekend (trading day: {bar_time.strftime('%A')})")
+        local_date = local_time.date()
+        if local_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
+            errors.append(f"Bar timestamp is on weekend (trading day: {local_date.strftime('%A')})")
+        elif not calendar.is_trading_day(local_date):
+            errors.append(f"Bar timestamp is on a market holiday ({local_date.isoformat()})")
 
         return errors
 
@@ -611,9 +772,19 @@ class TradingCalendarService(DomainService):
     """Service for trading calendar and market hours logic.
 
     This service provides business logic for determining market
-    open/close times, trading days, and holiday schedules.
+    open/close times, trading days, and holiday schedules. Lookups go to
+    a precomputed ``TradingCalendar``; dates outside its span fall back
+    to weekday-only rules with a fixed UTC-5 offset.
     """
 
+    def __init__(self, calendar: Optional[TradingCalendar] = None):
+        self._calendar = calendar or default_calendar()
+
+    @property
+    def calendar(self) -> TradingCalendar:
+        """The precomputed calendar backing this service."""
+        return self._calendar
+
     def is_trading_day(self, date: date) -> bool:
         """Check if a date is a trading day.
 
@@ -621,14 +792,19 @@ class TradingCalendarService(DomainService):
             date: Date to check
 
         Returns:
-            True if date is a trading day
-
-        Note:
-            This is a simplified implementation. Real implementation
-            would consult a proper trading calendar with holidays.
+            True if the exchange holds a session on date
         """
-        # Simplified: weekdays only
-        return date.weekday() < 5
+        try:
+            return self._calendar.is_trading_day(date)
+        except ValueError:
+            return date.weekday() < 5
+
+    def utc_offset(self, trading_date: date) -> timedelta:
+        """Exchange UTC offset on a date (DST-aware within the calendar span)."""
+        try:
+            return self._calendar.utc_offset(trading_date)
+        except ValueError:
+            return timedelta(hours=-5)
 
     def get_trading_session_times(self, trading_date: date) -> dict[str, datetime]:
         """Get trading session times for a specific date.
@@ -637,21 +813,19 @@ class TradingCalendarService(DomainService):
             trading_date: The trading date
 
         Returns:
-            Dictionary with session start/end times
+            Dictionary with session start/end times in exchange time; early
+            closes end both the regular and the post-market session early
         """
-        # Simplified US market hours (doesn't handle DST properly)
-        from datetime import time, timedelta, timezone
-
-        # Eastern Time approximation (UTC-5, doesn't handle DST)
-        et_offset = timedelta(hours=-5)
-        et_tz = timezone(et_offset)
-
-        return {
-            "pre_market_open": datetime.combine(trading_date, time(4, 0), et_tz),
-            "regular_open": datetime.combine(trading_date, time(9, 30), et_tz),
-            "regular_close": datetime.combine(trading_date, time(16, 0), et_tz),
-            "post_market_close": datetime.combine(trading_date, time(20, 0), et_tz),
-        }
+        try:
+            return self._calendar.session_times(trading_date)
+        except ValueError:
+            et_tz = timezone(timedelta(hours=-5))
+            return {
+                "pre_market_open": datetime.combine(trading_date, time(4, 0), et_tz),
+                "regular_open": datetime.combine(trading_date, time(9, 30), et_tz),
+                "regular_close": datetime.combine(trading_date, time(16, 0), et_tz),
+                "post_market_close": datetime.combine(trading_date, time(20, 0), et_tz),
+            }
 
     def get_next_trading_day(self, current_date: date) -> date:
         """Get the next trading day after the given date.
@@ -662,13 +836,13 @@ class TradingCalendarService(DomainService):
         Returns:
             Next trading day
         """
-        from datetime import timedelta
-
-        next_date = current_date + timedelta(days=1)
-        while not self.is_trading_day(next_date):
-            next_date += timedelta(days=1)
-
-        return next_date
+        try:
+            return self._calendar.next_trading_day(current_date)
+        except ValueError:
+            next_date = current_date + timedelta(days=1)
+            while not self.is_trading_day(next_date):
+                next_date += timedelta(days=1)
+            return next_date
 
     def get_previous_trading_day(self, current_date: date) -> date:
         """Get the previous trading day before the given date.
@@ -679,10 +853,10 @@ class TradingCalendarService(DomainService):
         Returns:
             Previous trading day
         """
-        from datetime import timedelta
-
-        prev_date = current_date - timedelta(days=1)
-        while not self.is_trading_day(prev_date):
-            prev_date -= timedelta(days=1)
-
-        return prev_date
+        try:
+            return self._calendar.previous_trading_day(current_date)
+        except ValueError:
+            prev_date = current_date - timedelta(days=1)
+            while not self.is_trading_day(prev_date):
+                prev_date -= timedelta(days=1)
+            return prev_date
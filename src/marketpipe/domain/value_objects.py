@@ -8,11 +8,18 @@ characterized by their attributes rather than a unique identity.
 
 from __future__ import annotations
 
+import operator
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Union
+from typing import Protocol, Union
+
+# Prices carry 4 decimal places: a price is an integer count of 1/10_000 units
+PRICE_SCALE = 10_000
+PRICE_DECIMALS = 4
+# Largest price that fits a Parquet DECIMAL(18, 4) / int64 unit count
+MAX_PRICE_UNITS = 10**18 - 1
 
 
 @dataclass(frozen=True)
@@ -57,6 +64,42 @@ class Symbol:
         return self.value
 
 
+class PriceLike(Protocol):
+    """What consumers of a bar's prices rely on; met by :class:`Price` and :class:`FixedPrice`.
+
+    Read prices through ``units`` (exact integer 1/10_000 units) or ``value``
+    (4-place Decimal) so that either backend can be stored in an entity.
+    """
+
+    @property
+    def units(self) -> int: ...
+
+    @property
+    def value(self) -> Decimal: ...
+
+    @classmethod
+    def from_float(cls, value: float) -> PriceLike: ...
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> PriceLike: ...
+
+    @classmethod
+    def from_string(cls, value: str) -> PriceLike: ...
+
+    @classmethod
+    def zero(cls) -> PriceLike: ...
+
+    def to_float(self) -> float: ...
+
+    def __lt__(self, other: PriceLike) -> bool: ...
+
+    def __le__(self, other: PriceLike) -> bool: ...
+
+    def __gt__(self, other: PriceLike) -> bool: ...
+
+    def __ge__(self, other: PriceLike) -> bool: ...
+
+
 @dataclass(frozen=True)
 class Price:
     """Monetary price value object with precision handling.
@@ -66,6 +109,8 @@ class Price:
     """
 
     value: Decimal
+    # Integer 1/10_000 units, derived from value in __post_init__
+    _units: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate and normalize price value."""
@@ -75,6 +120,12 @@ class Price:
         # Quantize to 4 decimal places for financial precision
         quantized = self.value.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
         object.__setattr__(self, "value", quantized)
+        object.__setattr__(self, "_units", int(quantized.scaleb(PRICE_DECIMALS)))
+
+    @property
+    def units(self) -> int:
+        """Price as an integer number of 1/10_000 units (e.g. 123.45 -> 1234500)."""
+        return self._units
 
     @classmethod
     def from_float(cls, value: float) -> Price:
@@ -88,6 +139,11 @@ class Price:
         """
         return cls(Decimal(str(value)))
 
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> Price:
+        """Create price from a Decimal, quantized half-up to 4 places."""
+        return cls(value)
+
     @classmethod
     def from_string(cls, value: str) -> Price:
         """Create price from string representation.
@@ -118,13 +174,13 @@ class Price:
 
     def __mul__(self, other: Union[Price, Decimal] | Union[int, float]) -> Price:
         """Multiply price by number or another price."""
-        if isinstance(other, Price):
+        if isinstance(other, (Price, FixedPrice)):
             return Price(self.value * other.value)
         return Price(self.value * Decimal(str(other)))
 
     def __truediv__(self, other: Union[Price, Decimal] | Union[int, float]) -> Price:
         """Divide price by number or another price."""
-        if isinstance(other, Price):
+        if isinstance(other, (Price, FixedPrice)):
             if other.value == 0:
                 raise ValueError("Cannot divide by zero price")
             return Price(self.value / other.value)
@@ -134,21 +190,21 @@ class Price:
             raise ValueError("Cannot divide by zero")
         return Price(self.value / divisor)
 
-    def __lt__(self, other: Price) -> bool:
+    def __lt__(self, other: PriceLike) -> bool:
         """Compare if this price is less than another."""
-        return self.value < other.value
+        return self._units < other.units
 
-    def __le__(self, other: Price) -> bool:
+    def __le__(self, other: PriceLike) -> bool:
         """Compare if this price is less than or equal to another."""
-        return self.value <= other.value
+        return self._units <= other.units
 
-    def __gt__(self, other: Price) -> bool:
+    def __gt__(self, other: PriceLike) -> bool:
         """Compare if this price is greater than another."""
-        return self.value > other.value
+        return self._units > other.units
 
-    def __ge__(self, other: Price) -> bool:
+    def __ge__(self, other: PriceLike) -> bool:
         """Compare if this price is greater than or equal to another."""
-        return self.value >= other.value
+        return self._units >= other.units
 
     def to_float(self) -> float:
         """Convert to float (use with caution due to precision loss)."""
@@ -163,6 +219,184 @@ class Price:
         return f"Price({self.value})"
 
 
+def _round_half_up_div(numerator: int, denominator: int) -> int:
+    """``numerator / denominator`` rounded half-up, for a positive denominator."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+@dataclass(frozen=True, eq=False)
+class FixedPrice:
+    """Fixed-point price: an int64 count of 1/10_000 units.
+
+    Drop-in alternative to :class:`Price` with the same 4-place, half-up
+    semantics. Arithmetic is exact integer math and comparisons are integer
+    comparisons, so validation and aggregation of large batches avoid
+    ``Decimal`` entirely. Prices compare and hash equal to the ``Price`` of
+    the same value.
+    """
+
+    units: int
+
+    def __post_init__(self):
+        """Validate the unit count."""
+        # Accept numpy integers, reject floats
+        object.__setattr__(self, "units", operator.index(self.units))
+        if self.units < 0:
+            raise ValueError(f"Price cannot be negative: {self.value}")
+        if self.units > MAX_PRICE_UNITS:
+            raise ValueError(f"Price out of range for 18 digits: {self.value}")
+
+    @classmethod
+    def from_float(cls, value: float) -> FixedPrice:
+        """Create price from float, rounding exactly like ``Price.from_float``.
+
+        Args:
+            value: Float price value
+
+        Returns:
+            FixedPrice of the float's shortest decimal representation
+        """
+        scaled = value * PRICE_SCALE
+        if 0 <= scaled < 2**52:
+            units = round(scaled)
+            # Away from a .5 tie, float rounding error cannot change the result
+            if abs(abs(scaled - units) - 0.5) > max(1e-6, scaled * 1e-15):
+                return cls(int(units))
+        return cls.from_decimal(Decimal(str(value)))
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> FixedPrice:
+        """Create price from a Decimal, quantized half-up to 4 places."""
+        if value < 0:
+            raise ValueError(f"Price cannot be negative: {value}")
+        return cls(int(value.scaleb(PRICE_DECIMALS).to_integral_value(rounding=ROUND_HALF_UP)))
+
+    @classmethod
+    def from_string(cls, value: str) -> FixedPrice:
+        """Create price from string representation.
+
+        Args:
+            value: String price value (e.g., "123.45")
+
+        Returns:
+            FixedPrice value object
+        """
+        try:
+            return cls.from_decimal(Decimal(value))
+        except (ArithmeticError, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid price format: {value}") from e
+
+    @classmethod
+    def from_price(cls, price: Price) -> FixedPrice:
+        """Convert a Decimal-backed price."""
+        return cls(price.units)
+
+    @classmethod
+    def zero(cls) -> FixedPrice:
+        """Create a zero price value."""
+        return cls(0)
+
+    @property
+    def value(self) -> Decimal:
+        """Price as a Decimal with 4 places (same as ``Price.value``)."""
+        return Decimal(self.units).scaleb(-PRICE_DECIMALS)
+
+    def to_price(self) -> Price:
+        """Convert to a Decimal-backed price."""
+        return Price(self.value)
+
+    def __add__(self, other: Union[Price, FixedPrice]) -> FixedPrice:
+        """Add two prices."""
+        return FixedPrice(self.units + other.units)
+
+    def __sub__(self, other: Union[Price, FixedPrice]) -> FixedPrice:
+        """Subtract two prices."""
+        return FixedPrice(self.units - other.units)
+
+    def __mul__(self, other: Union[Price, FixedPrice, Decimal, int, float]) -> FixedPrice:
+        """Multiply price by number or another price."""
+        if isinstance(other, (Price, FixedPrice)):
+            return FixedPrice(_round_half_up_div(self.units * other.units, PRICE_SCALE))
+        if isinstance(other, int):
+            return FixedPrice(self.units * other)
+        return FixedPrice.from_decimal(self.value * Decimal(str(other)))
+
+    def __truediv__(self, other: Union[Price, FixedPrice, Decimal, int, float]) -> FixedPrice:
+        """Divide price by number or another price."""
+        if isinstance(other, (Price, FixedPrice)):
+            if other.units == 0:
+                raise ValueError("Cannot divide by zero price")
+            return FixedPrice(_round_half_up_div(self.units * PRICE_SCALE, other.units))
+        if isinstance(other, int) and other > 0:
+            return FixedPrice(_round_half_up_div(self.units, other))
+
+        divisor = Decimal(str(other))
+        if divisor == 0:
+            raise ValueError("Cannot divide by zero")
+        return FixedPrice.from_decimal(self.value / divisor)
+
+    def __eq__(self, other: object) -> bool:
+        """Prices are equal when their unit counts are."""
+        if isinstance(other, (Price, FixedPrice)):
+            return self.units == other.units
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash like the equal ``Price``."""
+        return hash((self.value,))
+
+    def __lt__(self, other: PriceLike) -> bool:
+        """Compare if this price is less than another."""
+        return self.units < other.units
+
+    def __le__(self, other: PriceLike) -> bool:
+        """Compare if this price is less than or equal to another."""
+        return self.units <= other.units
+
+    def __gt__(self, other: PriceLike) -> bool:
+        """Compare if this price is greater than another."""
+        return self.units > other.units
+
+    def __ge__(self, other: PriceLike) -> bool:
+        """Compare if this price is greater than or equal to another."""
+        return self.units >= other.units
+
+    def to_float(self) -> float:
+        """Convert to float (correctly rounded, same as ``Price.to_float``)."""
+        return self.units / PRICE_SCALE
+
+    def __str__(self) -> str:
+        """String representation with dollar sign."""
+        return f"${self.value}"
+
+    def __repr__(self) -> str:
+        """Detailed representation for debugging."""
+        return f"FixedPrice({self.value})"
+
+
+PriceType = type[PriceLike]
+PRICE_BACKENDS: dict[str, PriceType] = {"decimal": Price, "fixed": FixedPrice}
+
+
+def price_type(backend: str = "decimal") -> PriceType:
+    """Price class of a backend.
+
+    ``decimal`` (the default) builds :class:`Price`, ``fixed`` builds
+    :class:`FixedPrice`. Which backend to use is configuration: see
+    ``marketpipe.config.prices``.
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    name = backend.strip().lower()
+    try:
+        return PRICE_BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown price backend: {name}. Valid backends: {sorted(PRICE_BACKENDS)}"
+        ) from None
+
+
 @dataclass(frozen=True)
 class Timestamp:
     """Timestamp value object with timezone awareness.
@@ -254,16 +488,21 @@ class Timestamp:
     def is_market_hours(self) -> bool:
         """Check if timestamp is during regular US market hours.
 
-        Note: This is a simplified implementation.
-        Real implementation would consider market holidays, etc.
+        Uses the exchange calendar, so holidays, early closes and DST are
+        honoured. Timestamps outside the calendar span are never in hours.
 
         Returns:
-            True if during regular trading hours (9:30 AM - 4:00 PM ET)
+            True if during the regular session (9:30 AM - 4:00 PM ET, or the early close)
         """
-        # Convert to Eastern Time (simplified - doesn't handle DST properly)
-        # Real implementation would use proper timezone handling
-        et_hour = (self.value.hour - 5) % 24  # Rough ET conversion
-        return 9 <= et_hour < 16
+        from .calendar import default_calendar
+
+        try:
+            open_ns, close_ns = default_calendar().session_bounds(
+                self.value.astimezone(timezone.utc).date()
+            )
+        except ValueError:
+            return False
+        return open_ns <= self.to_nanoseconds() < close_ns
 
     def is_same_minute(self, other: Timestamp) -> bool:
         """Check if this timestamp is in the same minute as another.
@@ -7,6 +7,6 @@ infrastructure, keeping these concerns separate from the domain layer.
 
 from __future__ import annotations
 
-__all__ = ["in_memory_bus"]
+__all__ = ["in_memory_bus", "outbox", "stage_executor"]
 
-from . import in_memory_bus
+from . import in_memory_bus, outbox, stage_executor
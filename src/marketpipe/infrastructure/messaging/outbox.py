@@ -0,0 +1,464 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Durable SQLite outbox for domain events.
+
+``InMemoryEventPublisher`` loses every event when the process dies, so a
+crash between ingestion and aggregation means the aggregation never runs.
+With the outbox, a repository writes the events raised by an aggregate in
+the same SQLite transaction as the aggregate's state, and one or more
+``OutboxDispatcher`` instances deliver them afterwards:
+
+    save(job) ──▶ BEGIN; upsert ingestion_jobs; insert event_outbox; COMMIT
+                                                      │
+              OutboxDispatcher("aggregation") ◀───────┤  each consumer tracks
+              OutboxDispatcher("validation")  ◀───────┘  its own deliveries
+
+Delivery is at-least-once: a dispatcher fetches a batch of due events,
+hands each to its ``deliver`` callable and records all outcomes in one
+transaction. Failed events are retried with exponential backoff until
+``max_attempts``, after which they stay in the table as dead letters (see
+``requeue_dead``). Because progress is stored per consumer, a dispatcher
+started after a crash resumes with every event it had not yet delivered.
+Run at most one dispatcher per consumer name.
+
+Events are stored as JSON. Values are encoded by type: primitives as-is,
+UUIDs, dates, datetimes, paths and enums as tagged strings, and MarketPipe
+objects (events and value objects) as their class path plus attribute state.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge
+
+from marketpipe.domain.events import DomainEvent
+
+OUTBOX_EVENTS = Counter(
+    "mp_outbox_events_total",
+    "Outbox events handled by dispatchers",
+    ["consumer", "outcome"],  # delivered, failed, dead
+)
+OUTBOX_PENDING = Gauge(
+    "mp_outbox_pending",
+    "Undelivered outbox events not yet dead-lettered",
+    ["consumer"],
+    multiprocess_mode="livemax",  # every process reads the same outbox
+)
+
+OUTBOX_ENV = "MARKETPIPE_EVENT_OUTBOX"
+
+# Only classes from these packages are re-created when decoding
+_TRUSTED_PREFIX = "marketpipe."
+
+OUTBOX_INSERT_SQL = """
+    INSERT OR IGNORE INTO event_outbox (event_id, event_type, aggregate_id, payload)
+    VALUES (?, ?, ?, ?)
+"""
+
+_FETCH_DUE_SQL = """
+    SELECT o.id, o.payload, COALESCE(d.attempts, 0)
+    FROM event_outbox o
+    LEFT JOIN event_outbox_deliveries d ON d.outbox_id = o.id AND d.consumer = ?
+    WHERE d.delivered_at IS NULL
+      AND COALESCE(d.next_attempt_at, 0) <= ?
+      AND COALESCE(d.attempts, 0) < ?
+    ORDER BY o.id
+    LIMIT ?
+"""
+
+_RECORD_SQL = """
+    INSERT INTO event_outbox_deliveries
+        (consumer, outbox_id, attempts, next_attempt_at, delivered_at, last_error)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (consumer, outbox_id) DO UPDATE SET
+        attempts = excluded.attempts,
+        next_attempt_at = excluded.next_attempt_at,
+        delivered_at = excluded.delivered_at,
+        last_error = excluded.last_error
+"""
+
+
+def outbox_enabled_from_env() -> bool:
+    """Whether ``$MARKETPIPE_EVENT_OUTBOX`` asks repositories to record events."""
+    return os.environ.get(OUTBOX_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+# ----- Event codec -----
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load_class(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(_TRUSTED_PREFIX):
+        raise ValueError(f"Refusing to load {path} from the event outbox")
+    target: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    if not isinstance(target, type):
+        raise ValueError(f"{path} in the event outbox is not a class")
+    return target
+
+
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, UUID):
+        return {"__uuid__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, Path):
+        return {"__path__": str(value)}
+    if isinstance(value, Enum):
+        return {"__enum__": _class_path(type(value)), "value": value.value}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {"__mapping__": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    state = getattr(value, "__dict__", None)
+    if state is not None and type(value).__module__.startswith(_TRUSTED_PREFIX):
+        return {
+            "__object__": _class_path(type(value)),
+            "state": {name: _encode(item) for name, item in state.items()},
+        }
+    raise TypeError(f"Cannot store {type(value).__name__} in the event outbox")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__uuid__" in value:
+        return UUID(value["__uuid__"])
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__date__" in value:
+        return date.fromisoformat(value["__date__"])
+    if "__path__" in value:
+        return Path(value["__path__"])
+    if "__enum__" in value:
+        return _load_class(value["__enum__"])(value["value"])
+    if "__mapping__" in value:
+        return {_decode(k): _decode(v) for k, v in value["__mapping__"]}
+    if "__object__" in value:
+        cls = _load_class(value["__object__"])
+        obj: Any = object.__new__(cls)
+        # Restore state directly: frozen dataclasses reject setattr
+        obj.__dict__.update({name: _decode(item) for name, item in value["state"].items()})
+        return obj
+    raise ValueError(f"Unknown value in event outbox payload: {sorted(value)}")
+
+
+def encode_event(event: DomainEvent) -> str:
+    """Serialize a domain event to the outbox JSON payload."""
+    return json.dumps(_encode(event), separators=(",", ":"))
+
+
+def decode_event(payload: str) -> DomainEvent:
+    """Re-create a domain event from its outbox JSON payload."""
+    event = _decode(json.loads(payload))
+    if not isinstance(event, DomainEvent):
+        raise ValueError(f"Event outbox payload holds a {type(event).__name__}, not an event")
+    return event
+
+
+def outbox_rows(events: Iterable[DomainEvent]) -> list[tuple[str, str, str, str]]:
+    """Parameter rows of ``OUTBOX_INSERT_SQL`` for a batch of events.
+
+    Repositories execute the insert on their own connection so the events
+    commit or roll back together with the aggregate state.
+    """
+    return [
+        (str(event.event_id), event.event_type, str(event.aggregate_id), encode_event(event))
+        for event in events
+    ]
+
+
+# ----- Storage -----
+
+
+@dataclass(frozen=True)
+class OutboxStats:
+    """Delivery state of one consumer."""
+
+    consumer: str
+    total: int
+    delivered: int
+    pending: int
+    dead: int
+
+
+class SqliteEventOutbox:
+    """Outbox table access (synchronous; safe to use from any thread)."""
+
+    def __init__(self, db_path: Union[Path, str], max_attempts: int = 10):
+        """Initialize outbox.
+
+        Args:
+            db_path: SQLite database holding the outbox (migrated on first use)
+            max_attempts: Deliveries attempted before an event is dead-lettered
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        from marketpipe.migrations import apply_pending
+
+        self._db_path = Path(db_path)
+        self.max_attempts = max_attempts
+        apply_pending(self._db_path)
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def append(self, events: Iterable[DomainEvent]) -> int:
+        """Store events outside of any aggregate transaction.
+
+        Returns:
+            Number of events newly stored (already stored event ids are skipped)
+        """
+        rows = outbox_rows(events)
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(OUTBOX_INSERT_SQL, rows)
+            return conn.total_changes - before
+
+    def fetch_due(
+        self, consumer: str, limit: int, now: Optional[float] = None
+    ) -> list[tuple[int, str, int]]:
+        """Events due for delivery to a consumer, oldest first.
+
+        Returns:
+            List of (outbox id, payload, attempts so far)
+        """
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            return conn.execute(
+                _FETCH_DUE_SQL, (consumer, now, self.max_attempts, limit)
+            ).fetchall()
+
+    def record(
+        self,
+        consumer: str,
+        delivered: Iterable[tuple[int, int]],
+        failed: Iterable[tuple[int, int, float, str]],
+    ) -> None:
+        """Record the outcome of a batch in one transaction.
+
+        Args:
+            consumer: Consumer name
+            delivered: (outbox id, attempts) of delivered events
+            failed: (outbox id, attempts, next attempt at, error) of failed events
+        """
+        delivered_at = datetime.now(timezone.utc).isoformat()
+        # (consumer, outbox id, attempts, next attempt at, delivered at, error)
+        rows: list[tuple[str, int, int, float, Optional[str], Optional[str]]] = [
+            (consumer, oid, attempts, 0.0, delivered_at, None) for oid, attempts in delivered
+        ]
+        rows += [
+            (consumer, oid, attempts, next_at, None, error[:1000])
+            for oid, attempts, next_at, error in failed
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(_RECORD_SQL, rows)
+
+    def requeue_dead(self, consumer: str) -> int:
+        """Give dead-lettered events of a consumer a fresh set of attempts."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE event_outbox_deliveries
+                SET attempts = 0, next_attempt_at = 0
+                WHERE consumer = ? AND delivered_at IS NULL AND attempts >= ?
+                """,
+                (consumer, self.max_attempts),
+            )
+            return cursor.rowcount
+
+    def stats(self, consumer: str) -> OutboxStats:
+        """Delivery counts of a consumer."""
+        with self._connect() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM event_outbox").fetchone()[0]
+            delivered, dead = conn.execute(
+                """
+                SELECT
+                    COALESCE(SUM(delivered_at IS NOT NULL), 0),
+                    COALESCE(SUM(delivered_at IS NULL AND attempts >= ?), 0)
+                FROM event_outbox_deliveries WHERE consumer = ?
+                """,
+                (self.max_attempts, consumer),
+            ).fetchone()
+        return OutboxStats(consumer, total, delivered, total - delivered - dead, dead)
+
+    def consumers(self) -> list[str]:
+        """Consumers that have attempted at least one delivery."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT consumer FROM event_outbox_deliveries ORDER BY consumer"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+# ----- Dispatch -----
+
+
+class OutboxDispatcher:
+    """Delivers outbox events to one consumer in batches with retry/backoff."""
+
+    def __init__(
+        self,
+        outbox: SqliteEventOutbox,
+        deliver: Callable[[DomainEvent], None],
+        consumer: str = "default",
+        batch_size: int = 100,
+        backoff_base: float = 1.0,
+        backoff_max: float = 300.0,
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            outbox: Outbox to read from
+            deliver: Called once per event; raising marks the delivery failed
+            consumer: Name under which deliveries are tracked
+            batch_size: Events fetched and recorded per transaction
+            backoff_base: Delay in seconds before the first retry, doubled per attempt
+            backoff_max: Upper bound of the retry delay
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._outbox = outbox
+        self._deliver = deliver
+        self.consumer = consumer
+        self.batch_size = batch_size
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def backoff(self, attempts: int) -> float:
+        """Delay before the next attempt after ``attempts`` failures."""
+        return float(min(self.backoff_max, self.backoff_base * 2 ** max(attempts - 1, 0)))
+
+    def dispatch_once(self) -> int:
+        """Deliver one batch of due events.
+
+        Returns:
+            Number of events delivered successfully
+        """
+        rows = self._outbox.fetch_due(self.consumer, self.batch_size)
+        delivered: list[tuple[int, int]] = []
+        failed: list[tuple[int, int, float, str]] = []
+        dead = 0
+        for outbox_id, payload, attempts in rows:
+            attempts += 1
+            try:
+                self._deliver(decode_event(payload))
+            except Exception as e:
+                failed.append((outbox_id, attempts, time.time() + self.backoff(attempts), repr(e)))
+                if attempts >= self._outbox.max_attempts:
+                    dead += 1
+                    self.log.error(
+                        f"Outbox event {outbox_id} dead-lettered for {self.consumer} "
+                        f"after {attempts} attempts: {e}"
+                    )
+                else:
+                    self.log.warning(
+                        f"Outbox event {outbox_id} failed for {self.consumer} "
+                        f"(attempt {attempts}): {e}"
+                    )
+            else:
+                delivered.append((outbox_id, attempts))
+
+        self._outbox.record(self.consumer, delivered, failed)
+        OUTBOX_EVENTS.labels(consumer=self.consumer, outcome="delivered").inc(len(delivered))
+        OUTBOX_EVENTS.labels(consumer=self.consumer, outcome="failed").inc(len(failed) - dead)
+        OUTBOX_EVENTS.labels(consumer=self.consumer, outcome="dead").inc(dead)
+        return len(delivered)
+
+    def drain(self) -> int:
+        """Deliver batches until no event is due.
+
+        Returns:
+            Number of events delivered successfully
+        """
+        total = 0
+        while True:
+            delivered = self.dispatch_once()
+            total += delivered
+            if delivered < self.batch_size:
+                # Short batch: everything due was fetched (failures wait for backoff)
+                self._update_pending()
+                return total
+
+    def run(self, poll_interval: float = 1.0) -> None:
+        """Dispatch until :meth:`stop` is called, polling when idle."""
+        self.log.info(f"Outbox dispatcher {self.consumer} started ({self._outbox.db_path})")
+        while not self._stop.is_set():
+            try:
+                self.drain()
+            except sqlite3.Error as e:
+                self.log.error(f"Outbox dispatcher {self.consumer} database error: {e}")
+            self._stop.wait(poll_interval)
+        self.log.info(f"Outbox dispatcher {self.consumer} stopped")
+
+    def start(self, poll_interval: float = 1.0) -> None:
+        """Run the dispatcher on a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run,
+            args=(poll_interval,),
+            name=f"outbox-{self.consumer}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop a running dispatcher after its current batch."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _update_pending(self) -> None:
+        OUTBOX_PENDING.labels(consumer=self.consumer).set(self._outbox.stats(self.consumer).pending)
+
+
+__all__ = [
+    "OUTBOX_ENV",
+    "OUTBOX_INSERT_SQL",
+    "OutboxDispatcher",
+    "OutboxStats",
+    "SqliteEventOutbox",
+    "decode_event",
+    "encode_event",
+    "outbox_enabled_from_env",
+    "outbox_rows",
+]
@@ -0,0 +1,402 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Bounded worker pools for post-ingestion pipeline stages.
+
+Aggregation and validation subscribe to ``IngestionJobCompleted``. Event
+buses call their subscribers inline, so without this module a multi-second
+DuckDB aggregation would run on the ingestion event loop and delay the next
+job. A ``StageExecutor`` is subscribed instead of the handler; it returns at
+once and runs the handler on its own pool:
+
+    publish(IngestionJobCompleted) ──▶ StageExecutor("aggregation") ──▶ thread/process pool
+                                   └─▶ StageExecutor("validation")  ──▶ thread/process pool
+
+Each stage is configured separately (see ``StageSettings.from_env``):
+
+    MARKETPIPE_<STAGE>_STAGE_MODE         inline, thread (default) or process
+    MARKETPIPE_<STAGE>_STAGE_WORKERS      pool size (default 1)
+    MARKETPIPE_<STAGE>_STAGE_MAX_PENDING  events queued or running before
+                                          publishers block (default 64)
+
+``submit`` blocks the calling thread while a stage is full, so it must not
+be called on an event loop: coroutines use ``submit_async``, which waits in a
+worker thread instead (or pass ``timeout`` to fail fast with ``TimeoutError``).
+
+The runner services subscribe their stages to the sync event bus at bootstrap
+and record them with ``register_stage``. Async publishers built later, such as
+the ingestion coordinator's ``InMemoryEventPublisher``, pick them up with
+``subscribe_registered_stages``; their handlers await ``submit_async``, so a
+publisher waits only for the event to be queued.
+
+An event whose job is already queued or running in the stage is dropped, so
+repeated completions of one job aggregate it once. Handlers run in
+``process`` mode must be picklable module-level functions; events they
+publish go to the worker process's own event bus.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Hashable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, Protocol, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from marketpipe.domain.events import DomainEvent
+from marketpipe.metrics_debug import watch
+
+STAGE_QUEUE_DEPTH = Gauge(
+    "mp_stage_queue_depth",
+    "Events queued or running in a pipeline stage",
+    ["stage"],
+    multiprocess_mode="livesum",
+)
+STAGE_LATENCY = Histogram(
+    "mp_stage_latency_seconds",
+    "Time from publishing an event to its stage handler finishing",
+    ["stage"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60, 300],
+)
+STAGE_EVENTS = Counter(
+    "mp_stage_events_total",
+    "Events handled by pipeline stages",
+    ["stage", "outcome"],  # completed, failed, deduplicated
+)
+
+STAGE_MODES = ("inline", "thread", "process")
+
+
+class StageItem(Protocol):
+    """What a stage handles: a ``DomainEvent`` or any item naming its type."""
+
+    @property
+    def event_type(self) -> str: ...
+
+
+ItemT = TypeVar("ItemT", bound=StageItem)
+
+StageHandler = Callable[[DomainEvent], None]
+
+# Maps a published event to the item a stage handles, or None to ignore it
+StageTranslator = Callable[[Any], Optional[Any]]
+
+
+class AsyncEventPublisher(Protocol):
+    """Publisher that awaits its handlers, e.g. ``InMemoryEventPublisher``."""
+
+    def register_handler(
+        self, event_type: str, handler: Callable[[Any], Awaitable[None]]
+    ) -> None: ...
+
+
+def job_key(event: StageItem) -> Hashable:
+    """Default de-duplication key: the event type and its job id."""
+    job_id = getattr(event, "job_id", None)
+    if job_id is None:
+        job_id = getattr(event, "event_id", id(event))
+    return (event.event_type, str(job_id))
+
+
+@dataclass(frozen=True)
+class StageSettings:
+    """Execution settings of one pipeline stage.
+
+    Attributes:
+        mode: "inline" (run in the publisher), "thread" or "process"
+        workers: Worker threads or processes
+        max_pending: Events queued or running before ``submit`` blocks
+    """
+
+    mode: str = "thread"
+    workers: int = 1
+    max_pending: int = 64
+
+    def __post_init__(self):
+        """Validate settings."""
+        if self.mode not in STAGE_MODES:
+            raise ValueError(f"Unknown stage mode: {self.mode}. Valid modes: {STAGE_MODES}")
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+    @classmethod
+    def from_env(cls, stage: str) -> StageSettings:
+        """Read ``MARKETPIPE_<STAGE>_STAGE_{MODE,WORKERS,MAX_PENDING}``."""
+        prefix = f"MARKETPIPE_{stage.upper()}_STAGE_"
+        defaults = cls()
+        return cls(
+            mode=os.environ.get(f"{prefix}MODE", defaults.mode).strip().lower(),
+            workers=int(os.environ.get(f"{prefix}WORKERS", defaults.workers)),
+            max_pending=int(os.environ.get(f"{prefix}MAX_PENDING", defaults.max_pending)),
+        )
+
+
+class StageExecutor(Generic[ItemT]):
+    """Runs one event handler on a bounded pool, off the publisher's thread.
+
+    Instances are callables taking an event, so they can be subscribed to an
+    event bus in place of the handler they wrap. Items are usually domain
+    events, but any ``StageItem`` can be handed to a stage.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[ItemT], None],
+        settings: Optional[StageSettings] = None,
+        key: Callable[[ItemT], Hashable] = job_key,
+    ):
+        """Initialize the stage.
+
+        Args:
+            name: Stage name used in metrics and logs
+            handler: Function handling one event
+            settings: Execution settings (default: from the environment)
+            key: Events with equal keys are de-duplicated while one is in flight
+        """
+        self.name = name
+        self.settings = settings or StageSettings.from_env(name)
+        self._handler = handler
+        self._key = key
+        self._slots = threading.BoundedSemaphore(self.settings.max_pending)
+        self._in_flight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+        self._closed = False
+        self.log = logging.getLogger(self.__class__.__name__)
+        watch(self)
+
+    def __call__(self, event: ItemT) -> None:
+        """Sync event bus subscriber entry point."""
+        self.submit(event)
+
+    def subscribe_async(
+        self,
+        publisher: AsyncEventPublisher,
+        event_type: str,
+        translate: Optional[StageTranslator] = None,
+    ) -> None:
+        """Subscribe to an async publisher through ``submit_async``.
+
+        The publisher awaits only the enqueue, never the handler.
+
+        Args:
+            publisher: Publisher to subscribe to
+            event_type: ``event_type`` of the events to handle
+            translate: Maps published events to stage items; events it maps
+                to None are ignored
+        """
+
+        async def enqueue(event: Any) -> None:
+            item = event if translate is None else translate(event)
+            if item is not None:
+                await self.submit_async(item)
+
+        publisher.register_handler(event_type, enqueue)
+
+    @property
+    def pending(self) -> int:
+        """Events queued or running."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def debug_state(self) -> dict[str, Any]:
+        """Queue state reported on the metrics server's ``/debug/state``."""
+        return {
+            "kind": "stage",
+            "name": self.name,
+            "mode": self.settings.mode,
+            "workers": self.settings.workers,
+            "pending": self.pending,
+            "max_pending": self.settings.max_pending,
+        }
+
+    def submit(self, event: ItemT, timeout: Optional[float] = None) -> Future:
+        """Schedule the handler for an event.
+
+        Blocks the calling thread while ``max_pending`` events are in flight,
+        so callers must not be on an event loop; use ``submit_async`` there.
+
+        Args:
+            event: Event to handle
+            timeout: Seconds to wait for a free slot (default: no limit; 0:
+                do not wait)
+
+        Returns:
+            Future of the handler run (the in-flight one for a duplicate)
+
+        Raises:
+            RuntimeError: If the stage has been shut down
+            TimeoutError: If no slot freed up within ``timeout``
+        """
+        if self._closed:
+            raise RuntimeError(f"Stage {self.name} is shut down")
+
+        started = time.monotonic()
+        key = self._key(event)
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            STAGE_EVENTS.labels(stage=self.name, outcome="deduplicated").inc()
+            self.log.debug(f"Dropped duplicate {event.event_type} for {key} in stage {self.name}")
+            return in_flight
+
+        if self.settings.mode == "inline":
+            return self._run_inline(key, event, started)
+
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(
+                f"Stage {self.name} has {self.settings.max_pending} events in flight"
+            )
+        with self._lock:
+            # Another publisher may have scheduled the same job meanwhile
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self._slots.release()
+                STAGE_EVENTS.labels(stage=self.name, outcome="deduplicated").inc()
+                return in_flight
+            try:
+                future = self._executor().submit(self._handler, event)
+            except BaseException:
+                self._slots.release()
+                raise
+            self._in_flight[key] = future
+            STAGE_QUEUE_DEPTH.labels(stage=self.name).set(len(self._in_flight))
+
+        future.add_done_callback(lambda f: self._finished(key, event, f, started))
+        return future
+
+    async def submit_async(self, event: ItemT, timeout: Optional[float] = None) -> Future:
+        """``submit`` for coroutines: waits for a free slot without blocking the loop.
+
+        A stage with room schedules the event at once; a full one is waited
+        for in a worker thread. In ``inline`` mode the handler still runs on
+        the caller's thread.
+
+        Raises:
+            RuntimeError: If the stage has been shut down
+            TimeoutError: If no slot freed up within ``timeout``
+        """
+        try:
+            return self.submit(event, timeout=0)
+        except TimeoutError:
+            if timeout == 0:
+                raise
+        return await asyncio.to_thread(self.submit, event, timeout)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every in-flight event has been handled.
+
+        Returns:
+            False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                futures = list(self._in_flight.values())
+            if not futures:
+                return True
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            _, not_done = wait(futures, timeout=remaining)
+            if not_done:
+                return False
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting events and release the pool."""
+        self._closed = True
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            prefix = f"stage-{self.name}"
+            if self.settings.mode == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.settings.workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.settings.workers, thread_name_prefix=prefix
+                )
+        return self._pool
+
+    def _run_inline(self, key: Hashable, event: ItemT, started: float) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._in_flight[key] = future
+        future.add_done_callback(lambda f: self._finished(key, event, f, started, release=False))
+        try:
+            self._handler(event)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        future.set_result(None)
+        return future
+
+    def _finished(
+        self,
+        key: Hashable,
+        event: ItemT,
+        future: Future,
+        started: float,
+        release: bool = True,
+    ) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+            STAGE_QUEUE_DEPTH.labels(stage=self.name).set(len(self._in_flight))
+        if release:
+            self._slots.release()
+
+        STAGE_LATENCY.labels(stage=self.name).observe(time.monotonic() - started)
+        error = None if future.cancelled() else future.exception()
+        if error is None:
+            STAGE_EVENTS.labels(stage=self.name, outcome="completed").inc()
+        else:
+            STAGE_EVENTS.labels(stage=self.name, outcome="failed").inc()
+            self.log.error(f"Stage {self.name} failed for {event.event_type} {key}: {error}")
+
+
+# Stages recorded by ``register_stage``: the event type each handles and how
+# published events translate to its items. Weak, so a stage no bus holds any
+# more is forgotten
+_registered: weakref.WeakKeyDictionary[StageExecutor, tuple[str, Optional[StageTranslator]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def register_stage(
+    stage: StageExecutor, event_type: str, translate: Optional[StageTranslator] = None
+) -> None:
+    """Record a stage for async publishers built later (see ``subscribe_registered_stages``)."""
+    _registered[stage] = (event_type, translate)
+
+
+def subscribe_registered_stages(publisher: AsyncEventPublisher) -> int:
+    """Subscribe every live registered stage to ``publisher``.
+
+    Returns:
+        Number of stages subscribed
+    """
+    stages = [(stage, entry) for stage, entry in list(_registered.items()) if not stage._closed]
+    for stage, (event_type, translate) in stages:
+        stage.subscribe_async(publisher, event_type, translate)
+    return len(stages)
+
+
+__all__ = [
+    "STAGE_MODES",
+    "AsyncEventPublisher",
+    "StageExecutor",
+    "StageItem",
+    "StageSettings",
+    "job_key",
+    "register_stage",
+    "subscribe_registered_stages",
+]
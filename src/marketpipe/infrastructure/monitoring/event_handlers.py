@@ -25,6 +25,7 @@ from marketpipe.metrics import (
     REQUESTS,
     VALIDATION_ERRORS,
     record_metric,
+    record_symbol_metric,
 )
 from marketpipe.validation.domain.events import ValidationCompleted
 
@@ -56,12 +57,7 @@ def _handle_ingestion_completed(event: IngestionJobCompleted) -> None:
             # Record per-symbol ingestion
             if hasattr(event, "symbol") and event.symbol:
                 INGEST_ROWS.labels(symbol=str(event.symbol)).inc(event.bars_processed)
-                record_metric(
-                    f"ingest_bars_{event.symbol}",
-                    event.bars_processed,
-                    provider=provider,
-                    feed=feed,
-                )
+                record_symbol_metric("ingest_bars", str(event.symbol), event.bars_processed)
         else:
             ERRORS.labels(source="ingestion", provider=provider, feed=feed, code="job_failed").inc()
             record_metric("ingest_failures", 1, provider=provider, feed=feed)
@@ -95,7 +91,7 @@ def _handle_validation_completed(event: ValidationCompleted) -> None:
         # Extract symbol from the validation result
         if hasattr(event, "result") and hasattr(event.result, "symbol"):
             symbol = event.result.symbol
-            record_metric(f"validation_completed_{symbol}", 1, provider=provider, feed=feed)
+            record_symbol_metric("validation_completed", symbol)
 
         logger.debug("Recorded metrics for validation completion")
 
@@ -115,7 +111,7 @@ def _handle_validation_failed(event: ValidationFailed) -> None:
 
         VALIDATION_ERRORS.labels(symbol=symbol, error_type=error_type).inc()
         record_metric("validation_errors", 1, provider=provider, feed=feed)
-        record_metric(f"validation_errors_{symbol}", 1, provider=provider, feed=feed)
+        record_symbol_metric("validation_errors", symbol)
 
         # Update Prometheus error counter
         ERRORS.labels(
@@ -1,6 +1,18 @@
 # SPDX-License-Identifier: Apache-2.0
 """Infrastructure storage module."""
 
-from .parquet_engine import ParquetStorageEngine
+from .parquet_engine import (
+    STORAGE_PROFILES,
+    ParquetStorageEngine,
+    StorageProfile,
+    get_storage_profile,
+)
+from .writer import ParquetBatchWriter
 
-__all__ = ["ParquetStorageEngine"]
+__all__ = [
+    "ParquetBatchWriter",
+    "ParquetStorageEngine",
+    "STORAGE_PROFILES",
+    "StorageProfile",
+    "get_storage_profile",
+]
@@ -0,0 +1,542 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Compaction of small Parquet partitions into per-symbol buckets.
+
+Every ingestion writes one file per symbol per day and every aggregation job
+adds one per frame, so a multi-year universe ends up as millions of tiny
+files. Query engines then spend most of their time opening files and reading
+footers. The compactor merges the day partitions of a symbol into one file per
+bucket (a month by default), sorted by ``ts_ns`` with large row groups:
+
+    frame=1m/symbol=AAPL/date=2024-01-02/AAPL_2024-01-02.parquet
+    frame=1m/symbol=AAPL/date=2024-01-03/AAPL_2024-01-03.parquet
+    ...
+        ->  frame=1m/symbol=AAPL/date=2024-01/AAPL_2024-01.compacted.parquet
+
+The bucket directory keeps the ``date=`` key with a coarser label, which
+``ParquetStorageEngine`` maps back to the days it spans. SQL readers take a
+bar's date from its ``ts_ns`` (see ``duckdb_views.bars_scan_sql``), and
+``list_jobs`` skips ``*.compacted.parquet`` files.
+
+Swap protocol:
+    1. Take the frame's compaction lock exclusively (see
+       ``ParquetStorageEngine.compaction_lock``).
+    2. Write the merged table to a hidden temp file in the bucket directory
+       (``*.tmp`` never matches ``*.parquet`` globs), fsync and rename it into place.
+    3. Delete the source files that were merged and any day directories
+       they leave empty.
+    4. Release the lock.
+
+Readers going through ``ParquetStorageEngine`` hold the lock shared, so they
+see either the day files or the bucket file, never both and never a partial
+file. Plain writes take no lock: a file committed after the sources were read
+is not deleted, and the writer releases its day from the new bucket (see
+``ParquetStorageEngine.write_table``).
+
+Only buckets that are closed (their last day is older than ``settle_days``),
+hold at least ``min_files`` files and contain no stale day are compacted.
+
+Clustered frames (see ``marketpipe.infrastructure.storage.layout``) are
+compacted per day regardless of granularity: the day's part files are folded
+into its ``clustered.parquet`` under the same lock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from prometheus_client import Counter
+
+from .layout import CLUSTERED_FILE, COMPACTED_SUFFIX, LAYOUT_CLUSTERED
+from .parquet_engine import (
+    ParquetStorageEngine,
+    StorageProfile,
+    decode_decimal_prices,
+    schema_for_columns,
+)
+
+COMPACTION_FILES_MERGED = Counter(
+    "mp_compaction_files_merged_total",
+    "Parquet files merged away by compaction",
+    ["frame"],
+)
+COMPACTION_BYTES_WRITTEN = Counter(
+    "mp_compaction_bytes_written_total",
+    "Bytes written by compaction",
+    ["frame"],
+)
+
+GRANULARITIES = ("day", "month", "year")
+
+# Symbol of tasks that compact a whole clustered day
+ALL_SYMBOLS = "*"
+
+
+@dataclass(frozen=True)
+class CompactionPolicy:
+    """Settings controlling which partitions are merged and how.
+
+    Attributes:
+        granularity: Bucket size: "day", "month" or "year"
+        min_files: Minimum number of files a bucket needs before it is rewritten
+        settle_days: Days after a bucket's last day before it is considered closed
+        row_group_size: Rows per row group in compacted files
+        max_bytes_per_second: IO budget for reads plus writes (None disables throttling)
+    """
+
+    granularity: str = "month"
+    min_files: int = 2
+    settle_days: int = 1
+    row_group_size: int = 128 * 1024
+    max_bytes_per_second: Optional[float] = None
+
+    def __post_init__(self):
+        """Validate policy values."""
+        if self.granularity not in GRANULARITIES:
+            raise ValueError(
+                f"Unknown granularity: {self.granularity}. Valid granularities: {GRANULARITIES}"
+            )
+        if self.min_files < 1:
+            raise ValueError("min_files must be at least 1")
+        if self.settle_days < 0:
+            raise ValueError("settle_days cannot be negative")
+        if self.row_group_size < 1:
+            raise ValueError("row_group_size must be positive")
+        if self.max_bytes_per_second is not None and self.max_bytes_per_second <= 0:
+            raise ValueError("max_bytes_per_second must be positive")
+
+    def bucket_label(self, trading_day: date) -> str:
+        """Return the ``date=`` label of the bucket holding ``trading_day``."""
+        if self.granularity == "day":
+            return trading_day.isoformat()
+        if self.granularity == "month":
+            return f"{trading_day:%Y-%m}"
+        return f"{trading_day:%Y}"
+
+
+@dataclass(frozen=True)
+class CompactionTask:
+    """One bucket of one frame/symbol scheduled for compaction."""
+
+    frame: str
+    symbol: str
+    label: str
+    source_files: tuple[Path, ...]
+
+    @property
+    def source_bytes(self) -> int:
+        return sum(f.stat().st_size for f in self.source_files if f.exists())
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    """Outcome of compacting one bucket."""
+
+    task: CompactionTask
+    output_path: Path
+    rows: int
+    bytes_read: int
+    bytes_written: int
+
+
+class IOThrottle:
+    """Sleep-based limiter keeping average IO below a byte rate."""
+
+    def __init__(self, bytes_per_second: Optional[float]):
+        self._rate = bytes_per_second
+        self._started = time.monotonic()
+        self._consumed = 0
+
+    def consume(self, nbytes: int) -> None:
+        """Account for ``nbytes`` of IO, sleeping if ahead of the budget."""
+        if not self._rate:
+            return
+        self._consumed += nbytes
+        ahead = self._consumed / self._rate - (time.monotonic() - self._started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+class ParquetCompactor:
+    """Merges small day partitions under a storage root into bucket files."""
+
+    def __init__(
+        self,
+        root: Union[Path, str],
+        policy: Optional[CompactionPolicy] = None,
+        compression: Optional[str] = None,
+        profile: Union[str, StorageProfile, None] = None,
+    ):
+        """Initialize compactor.
+
+        Args:
+            root: Storage root containing ``frame=*/symbol=*/date=*`` partitions
+            policy: Compaction policy (defaults to monthly buckets)
+            compression: Compression codec for compacted files (overrides the profile)
+            profile: Storage profile used to encode compacted files
+        """
+        self._engine = ParquetStorageEngine(root, compression=compression, profile=profile)
+        self._root = Path(root)
+        self.policy = policy or CompactionPolicy()
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    # ----- Planning -----
+
+    def plan(
+        self,
+        frames: Optional[Iterable[str]] = None,
+        symbols: Optional[Iterable[str]] = None,
+        today: Optional[date] = None,
+    ) -> list[CompactionTask]:
+        """List buckets that should be compacted.
+
+        Args:
+            frames: Restrict to these frames (default: all)
+            symbols: Restrict to these symbols (default: all)
+            today: Current UTC date (defaults to now)
+
+        Returns:
+            Compaction tasks ordered by frame, symbol and bucket
+        """
+        today = today or datetime.now(timezone.utc).date()
+        cutoff = today - timedelta(days=self.policy.settle_days)
+        frame_filter = set(frames) if frames else None
+        symbol_filter = {s.upper() for s in symbols} if symbols else None
+
+        tasks = []
+        for frame_dir in sorted(self._root.glob("frame=*")):
+            frame = frame_dir.name[len("frame=") :]
+            if frame_filter and frame not in frame_filter:
+                continue
+
+            if self._engine.frame_layout(frame) == LAYOUT_CLUSTERED:
+                # Day files hold every symbol, so they cannot be compacted per symbol
+                if not symbol_filter:
+                    tasks.extend(self._plan_clustered(frame, frame_dir, cutoff))
+                continue
+
+            for symbol_dir in sorted(frame_dir.glob("symbol=*")):
+                symbol = symbol_dir.name[len("symbol=") :]
+                if symbol_filter and symbol not in symbol_filter:
+                    continue
+                tasks.extend(self._plan_symbol(frame, symbol, symbol_dir, cutoff))
+
+        return tasks
+
+    def _plan_symbol(
+        self, frame: str, symbol: str, symbol_dir: Path, cutoff: date
+    ) -> list[CompactionTask]:
+        buckets: dict[str, list[Path]] = defaultdict(list)
+        blocked: set[str] = set()
+
+        for date_dir in sorted(symbol_dir.iterdir()):
+            if not date_dir.is_dir() or not date_dir.name.startswith("date="):
+                continue
+            span = self._engine.partition_span(date_dir.name[len("date=") :])
+            if span is None:
+                continue
+
+            first_day, last_day = span
+            label = self.policy.bucket_label(first_day)
+            if self.policy.bucket_label(last_day) != label:
+                # Partition is coarser than the policy bucket (e.g. a year
+                # bucket when compacting by month); leave it alone
+                continue
+            if (date_dir / ParquetStorageEngine.STALE_MARKER).exists():
+                blocked.add(label)
+                continue
+            buckets[label].extend(sorted(date_dir.glob("*.parquet")))
+
+        tasks = []
+        for label, files in sorted(buckets.items()):
+            _, bucket_last = self._label_span(label)
+            if label in blocked or bucket_last > cutoff:
+                continue
+            if len(files) < self.policy.min_files:
+                continue
+            tasks.append(CompactionTask(frame, symbol, label, tuple(files)))
+        return tasks
+
+    def _plan_clustered(self, frame: str, frame_dir: Path, cutoff: date) -> list[CompactionTask]:
+        tasks = []
+        for date_dir in sorted(frame_dir.glob("date=*")):
+            label = date_dir.name[len("date=") :]
+            span = self._engine.partition_span(label)
+            if span is None or span[1] > cutoff:
+                continue
+
+            parts = [f for f in date_dir.glob("*.parquet") if f.name != CLUSTERED_FILE]
+            if not parts:
+                continue
+            # Later writes win when de-duplicating, so keep write order
+            sources = sorted(parts, key=lambda f: (f.stat().st_mtime_ns, f.name))
+            clustered_path = date_dir / CLUSTERED_FILE
+            if clustered_path.exists():
+                sources.insert(0, clustered_path)
+            if len(sources) < self.policy.min_files:
+                continue
+            tasks.append(CompactionTask(frame, ALL_SYMBOLS, label, tuple(sources)))
+        return tasks
+
+    def _label_span(self, label: str) -> tuple[date, date]:
+        span = self._engine.partition_span(label)
+        assert span is not None
+        return span
+
+    # ----- Execution -----
+
+    def compact(
+        self, task: CompactionTask, throttle: Optional[IOThrottle] = None
+    ) -> CompactionResult:
+        """Merge one bucket and atomically swap it in.
+
+        Args:
+            task: Bucket to compact
+            throttle: Shared IO throttle (created from the policy if omitted)
+
+        Returns:
+            Result describing the written file
+        """
+        throttle = throttle or IOThrottle(self.policy.max_bytes_per_second)
+        if task.symbol == ALL_SYMBOLS:
+            return self._compact_clustered(task, throttle)
+
+        output_path = self.output_path(task)
+        bucket_dir = output_path.parent
+
+        with self._engine.compaction_lock(task.frame).write_lock():
+            # Re-check sources under the lock; a writer may have replaced some
+            sources, tables, bytes_read = self._read_sources(task, throttle)
+            if not tables:
+                return CompactionResult(task, output_path, 0, 0, 0)
+
+            merged = self._merge(tables)
+
+            bucket_dir.mkdir(parents=True, exist_ok=True)
+            self._engine.replace_file(
+                merged,
+                output_path,
+                row_group_size=self.policy.row_group_size,
+                sorting_columns=[pq.SortingColumn(merged.schema.get_field_index("ts_ns"))],
+                write_statistics=True,
+            )
+            bytes_written = output_path.stat().st_size
+            throttle.consume(bytes_written)
+
+            for source in sources:
+                if source != output_path:
+                    source.unlink(missing_ok=True)
+            for date_dir in {s.parent for s in sources}:
+                if date_dir != bucket_dir:
+                    self._remove_partition_dir(date_dir)
+
+        COMPACTION_FILES_MERGED.labels(frame=task.frame).inc(len(sources))
+        COMPACTION_BYTES_WRITTEN.labels(frame=task.frame).inc(bytes_written)
+        self.log.info(f"Compacted {len(sources)} files ({merged.num_rows} rows) into {output_path}")
+        return CompactionResult(task, output_path, merged.num_rows, bytes_read, bytes_written)
+
+    def _compact_clustered(self, task: CompactionTask, throttle: IOThrottle) -> CompactionResult:
+        """Fold a clustered day's part files into its day file."""
+        output_path = self.output_path(task)
+
+        with self._engine.compaction_lock(task.frame).write_lock():
+            sources, tables, bytes_read = self._read_sources(task, throttle)
+            if not tables:
+                return CompactionResult(task, output_path, 0, 0, 0)
+
+            merged = self._merge(tables, keys=("symbol", "ts_ns"))
+            self._engine.write_clustered_file(merged, output_path)
+            bytes_written = output_path.stat().st_size
+            throttle.consume(bytes_written)
+
+            for source in sources:
+                if source != output_path:
+                    source.unlink(missing_ok=True)
+
+        COMPACTION_FILES_MERGED.labels(frame=task.frame).inc(len(sources))
+        COMPACTION_BYTES_WRITTEN.labels(frame=task.frame).inc(bytes_written)
+        self.log.info(f"Compacted {len(sources)} files ({merged.num_rows} rows) into {output_path}")
+        return CompactionResult(task, output_path, merged.num_rows, bytes_read, bytes_written)
+
+    def output_path(self, task: CompactionTask) -> Path:
+        """File a task compacts into."""
+        frame_dir = self._root / f"frame={task.frame}"
+        if task.symbol == ALL_SYMBOLS:
+            return frame_dir / f"date={task.label}" / CLUSTERED_FILE
+        return (
+            frame_dir
+            / f"symbol={task.symbol}"
+            / f"date={task.label}"
+            / f"{task.symbol}_{task.label}{COMPACTED_SUFFIX}"
+        )
+
+    @staticmethod
+    def _read_sources(
+        task: CompactionTask, throttle: IOThrottle
+    ) -> tuple[list[Path], list[pa.Table], int]:
+        """Read the task's source files that still exist (lock held)."""
+        sources = [f for f in task.source_files if f.exists()]
+        tables = []
+        bytes_read = 0
+        for source in sources:
+            size = source.stat().st_size
+            tables.append(decode_decimal_prices(pq.read_table(source)))
+            bytes_read += size
+            throttle.consume(size)
+        return sources, tables, bytes_read
+
+    @staticmethod
+    def _merge(tables: list[pa.Table], keys: tuple[str, ...] = ("ts_ns",)) -> pa.Table:
+        """Concatenate, de-duplicate on ``keys`` (later files win) and sort."""
+        combined = pa.concat_tables(tables, promote_options="permissive")
+        # Last row of each key, by position in the concatenation
+        positions = combined.append_column("_row", pa.array(range(combined.num_rows), pa.int64()))
+        last = positions.group_by(list(keys), use_threads=False).aggregate([("_row", "max")])
+        merged = combined.take(last.column("_row_max")).sort_by([(k, "ascending") for k in keys])
+
+        schema = schema_for_columns(tuple(merged.column_names))
+        if schema is not None:
+            try:
+                return merged.cast(schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+        return merged
+
+    @staticmethod
+    def _remove_partition_dir(date_dir: Path) -> None:
+        """Delete a day directory left empty by compaction.
+
+        ``.lock`` files written beside partition files by older versions do
+        not keep it alive; files of a writer that started meanwhile do.
+        """
+        leftovers = list(date_dir.iterdir())
+        if any(not f.name.endswith(".lock") for f in leftovers):
+            return
+        for lock_file in leftovers:
+            lock_file.unlink(missing_ok=True)
+        try:
+            date_dir.rmdir()
+        except OSError:
+            # A writer added a file after the listing
+            pass
+
+    def run(
+        self,
+        frames: Optional[Iterable[str]] = None,
+        symbols: Optional[Iterable[str]] = None,
+        *,
+        dry_run: bool = False,
+        today: Optional[date] = None,
+    ) -> list[CompactionResult]:
+        """Plan and compact every eligible bucket.
+
+        Args:
+            frames: Restrict to these frames (default: all)
+            symbols: Restrict to these symbols (default: all)
+            dry_run: Only plan; results carry zero rows and bytes
+            today: Current UTC date (defaults to now)
+
+        Returns:
+            One result per compacted (or, in dry-run mode, planned) bucket
+        """
+        tasks = self.plan(frames, symbols, today=today)
+        if dry_run:
+            return [
+                CompactionResult(task, self.output_path(task), 0, task.source_bytes, 0)
+                for task in tasks
+            ]
+
+        throttle = IOThrottle(self.policy.max_bytes_per_second)
+        results = []
+        for task in tasks:
+            try:
+                results.append(self.compact(task, throttle))
+            except Exception as e:
+                self.log.error(f"Failed to compact {task.frame}/{task.symbol}/{task.label}: {e}")
+        return results
+
+
+class CompactionScheduler:
+    """Runs a compactor periodically as a background asyncio task.
+
+    Compaction itself is blocking file IO, so each pass runs in a worker
+    thread; the policy's IO throttle keeps it from starving ingestion.
+    """
+
+    def __init__(
+        self,
+        compactor: ParquetCompactor,
+        interval_seconds: float = 3600.0,
+        frames: Optional[Iterable[str]] = None,
+        symbols: Optional[Iterable[str]] = None,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            compactor: Compactor to run
+            interval_seconds: Pause between passes
+            frames: Restrict to these frames (default: all)
+            symbols: Restrict to these symbols (default: all)
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self._compactor = compactor
+        self._interval = interval_seconds
+        self._frames = list(frames) if frames else None
+        self._symbols = list(symbols) if symbols else None
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    async def run_once(self) -> list[CompactionResult]:
+        """Run a single compaction pass."""
+        return await asyncio.to_thread(self._compactor.run, self._frames, self._symbols)
+
+    async def run_forever(self) -> None:
+        """Run passes until ``stop()`` is called."""
+        while not self._stop.is_set():
+            try:
+                results = await self.run_once()
+                if results:
+                    self.log.info(f"Compaction pass merged {len(results)} buckets")
+            except Exception as e:
+                self.log.error(f"Compaction pass failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        """Start the background task."""
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Stop the background task after the current pass finishes."""
+        self._stop.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+
+__all__ = [
+    "COMPACTION_BYTES_WRITTEN",
+    "COMPACTION_FILES_MERGED",
+    "CompactionPolicy",
+    "CompactionResult",
+    "CompactionScheduler",
+    "CompactionTask",
+    "IOThrottle",
+    "ParquetCompactor",
+]
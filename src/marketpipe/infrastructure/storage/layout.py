@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+"""On-disk partition layouts.
+
+Two layouts are supported, chosen per frame:
+
+``symbol`` (default)
+    One directory per symbol, one file per job per day::
+
+        frame=1m/symbol=AAPL/date=2024-01-02/AAPL_2024-01-02.parquet
+
+``clustered``
+    One day file per day holding every symbol, sorted by (symbol, ts_ns) with
+    a row group per symbol block and a page index, so a cross-sectional scan
+    of a day opens one file and a single-symbol read skips to its row groups::
+
+        frame=1d/_LAYOUT                                  # "clustered"
+        frame=1d/date=2024-01-02/clustered.parquet
+        frame=1d/date=2024-01-02/AAPL__job-42.parquet     # not yet clustered
+
+    Ingestion does not write day files. Each write of one symbol lands in a
+    small ``<SYMBOL>__<job_id>.parquet`` part file next to the day file, so a
+    freshly ingested day is one part file per symbol. The one-file-per-day
+    layout exists only after ``marketpipe compact`` (or its ``--interval``
+    background task) has folded the parts into ``clustered.parquet``; until
+    then readers open the day file plus every part.
+
+A frame's layout is recorded in its ``_LAYOUT`` marker. Frames without a
+marker are ``symbol`` frames unless they are new and listed in
+``$MARKETPIPE_CLUSTERED_FRAMES`` (comma separated). ``marketpipe relayout``
+converts existing frames.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+LAYOUT_BY_SYMBOL = "symbol"
+LAYOUT_CLUSTERED = "clustered"
+LAYOUTS = (LAYOUT_BY_SYMBOL, LAYOUT_CLUSTERED)
+
+CLUSTERED_FRAMES_ENV = "MARKETPIPE_CLUSTERED_FRAMES"
+
+# Marker file in a frame directory naming its layout
+LAYOUT_MARKER = "_LAYOUT"
+
+# Day file of a clustered frame holding all symbols
+CLUSTERED_FILE = "clustered.parquet"
+
+# Row group size cap of clustered day files: small enough that reading one
+# symbol decodes little else, large enough to keep footers small for daily bars
+CLUSTERED_ROW_GROUP_SIZE = 8192
+
+# Separates symbol and job id in clustered part file names; symbols are
+# limited to [A-Z0-9.] so it never occurs inside one
+PART_SEPARATOR = "__"
+
+# Suffix of files written by compaction, which hold many jobs' rows and so
+# are not job files themselves
+COMPACTED_SUFFIX = ".compacted.parquet"
+
+
+def clustered_frames_from_env() -> frozenset[str]:
+    """Frames configured for the clustered layout via the environment."""
+    value = os.environ.get(CLUSTERED_FRAMES_ENV, "")
+    return frozenset(f.strip() for f in value.split(",") if f.strip())
+
+
+def read_layout_marker(frame_path: Path) -> Optional[str]:
+    """Layout recorded in a frame directory, or None if it has no marker."""
+    try:
+        layout = (frame_path / LAYOUT_MARKER).read_text().strip()
+    except FileNotFoundError:
+        return None
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout {layout!r} in {frame_path / LAYOUT_MARKER}")
+    return layout
+
+
+def write_layout_marker(frame_path: Path, layout: str) -> None:
+    """Atomically record ``layout`` as the layout of a frame directory."""
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}. Valid layouts: {LAYOUTS}")
+    frame_path.mkdir(parents=True, exist_ok=True)
+    tmp_path = frame_path / f".{LAYOUT_MARKER}.tmp"
+    tmp_path.write_text(f"{layout}\n")
+    os.replace(tmp_path, frame_path / LAYOUT_MARKER)
+
+
+def detect_layout(frame_path: Path, default: str = LAYOUT_BY_SYMBOL) -> str:
+    """Layout of an existing frame directory.
+
+    Args:
+        frame_path: ``<root>/frame=<frame>`` directory
+        default: Layout for frames holding no data yet
+
+    Returns:
+        The marker's layout; otherwise ``symbol`` if symbol directories
+        exist, ``clustered`` if day directories exist, else ``default``
+    """
+    layout = read_layout_marker(frame_path)
+    if layout is not None:
+        return layout
+    if not frame_path.is_dir():
+        return default
+    if any(frame_path.glob("symbol=*")):
+        return LAYOUT_BY_SYMBOL
+    if any(frame_path.glob("date=*")):
+        return LAYOUT_CLUSTERED
+    return default
+
+
+def part_name(symbol: str, job_id: str) -> str:
+    """File name of a clustered part file."""
+    return f"{symbol}{PART_SEPARATOR}{job_id}.parquet"
+
+
+def parse_part_name(name: str) -> Optional[tuple[str, str]]:
+    """Split a clustered part file name into (symbol, job_id)."""
+    if not name.endswith(".parquet") or PART_SEPARATOR not in name:
+        return None
+    symbol, job_id = name[: -len(".parquet")].split(PART_SEPARATOR, 1)
+    return symbol, job_id
@@ -1,16 +1,370 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import date
+import os
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import fasteners
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
 
+from .layout import (
+    CLUSTERED_FILE,
+    CLUSTERED_ROW_GROUP_SIZE,
+    COMPACTED_SUFFIX,
+    LAYOUT_BY_SYMBOL,
+    LAYOUT_CLUSTERED,
+    LAYOUT_MARKER,
+    PART_SEPARATOR,
+    clustered_frames_from_env,
+    detect_layout,
+    parse_part_name,
+    part_name,
+    write_layout_marker,
+)
+
+if TYPE_CHECKING:
+    from .writer import ParquetBatchWriter
+
+NS_PER_DAY = 86_400 * 1_000_000_000
+EPOCH = date(1970, 1, 1)
+
+PROFILE_ENV = "MARKETPIPE_PARQUET_PROFILE"
+
+# Reads memory-map files so decoding works straight from the page cache
+MMAP_FILESYSTEM = pafs.LocalFileSystem(use_mmap=True)
+
+# Canonical column types for OHLCV files. Declaring them up front avoids
+# per-write schema inference and keeps every file of a frame type-compatible.
+OHLCV_SCHEMA = pa.schema(
+    [
+        pa.field("ts_ns", pa.int64()),
+        pa.field("open", pa.float64()),
+        pa.field("high", pa.float64()),
+        pa.field("low", pa.float64()),
+        pa.field("close", pa.float64()),
+        pa.field("volume", pa.int64()),
+        pa.field("trade_count", pa.int64()),
+        pa.field("vwap", pa.float64()),
+        pa.field("symbol", pa.string()),
+    ]
+)
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+DELTA_COLUMNS = ("ts_ns", "volume", "trade_count")
+
+# Exact price storage: integer 1/10_000 units, i.e. Parquet DECIMAL(18, 4).
+# Where pyarrow supports it the decimal is physically an INT64 column with
+# the scale in its logical type; older writers fall back to fixed-length bytes.
+PRICE_DECIMAL_TYPE = pa.decimal128(18, 4)
+PRICE_ENCODINGS = ("float64", "decimal")
+
+
+@cache
+def _decimal_as_integer() -> bool:
+    """Whether this pyarrow's Parquet writer accepts ``store_decimal_as_integer``."""
+    schema = pa.schema([pa.field("price", PRICE_DECIMAL_TYPE)])
+    try:
+        pq.ParquetWriter(pa.BufferOutputStream(), schema, store_decimal_as_integer=True).close()
+    except TypeError:  # unknown keyword: older pyarrow
+        return False
+    return True
+
+
+def encode_decimal_prices(table: pa.Table, columns: Sequence[str] = PRICE_COLUMNS) -> pa.Table:
+    """Convert float64 price columns to exact DECIMAL(18, 4) unit counts.
+
+    Float prices written by the engine are ``units / 10_000``, so rounding
+    ``price * 10_000`` recovers the exact unit count.
+    """
+    for name in columns:
+        index = table.schema.get_field_index(name)
+        if index < 0 or not pa.types.is_floating(table.schema.field(index).type):
+            continue
+        column = table.column(index).combine_chunks()
+        values = column.to_numpy(zero_copy_only=False)
+        units = np.rint(np.nan_to_num(values) * 10_000).astype(np.int64)
+        # decimal128 is little-endian 128-bit: low word, then sign-extended high word
+        data = np.column_stack([units, units >> 63]).tobytes()
+        validity = pc.is_valid(column).buffers()[1] if column.null_count else None
+        encoded = pa.Array.from_buffers(
+            PRICE_DECIMAL_TYPE, len(units), [validity, pa.py_buffer(data)], column.null_count
+        )
+        table = table.set_column(index, pa.field(name, PRICE_DECIMAL_TYPE), encoded)
+    return table
+
+
+def _decimal_to_float64(array: pa.Array) -> pa.Array:
+    """Unit count of a decimal array divided by its scale (correctly rounded)."""
+    array_type = array.type
+    if array_type.precision > 18:
+        return pc.cast(array, pa.float64())
+    words = np.frombuffer(array.buffers()[1], dtype=np.int64)
+    units = words[2 * array.offset :: 2][: len(array)]
+    values = units / 10.0**array_type.scale
+    mask = pc.is_null(array).to_numpy(zero_copy_only=False) if array.null_count else None
+    return pa.array(values, pa.float64(), mask=mask)
+
+
+def decode_decimal_prices(table: pa.Table) -> pa.Table:
+    """Convert decimal columns back to the canonical float64 prices.
+
+    Readers always see float64 whatever profile wrote a file, so files of
+    both encodings concatenate and reach pandas as plain floats.
+    """
+    for index, field in enumerate(table.schema):
+        if not pa.types.is_decimal(field.type):
+            continue
+        chunks = [_decimal_to_float64(chunk) for chunk in table.column(index).chunks]
+        table = table.set_column(
+            index, pa.field(field.name, pa.float64()), pa.chunked_array(chunks, pa.float64())
+        )
+    return table
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """Parquet encoding settings used for every file the engine writes.
+
+    Attributes:
+        name: Profile identifier
+        compression: Compression codec
+        compression_level: Codec level (None uses the codec default)
+        row_group_size: Maximum rows per row group
+        dictionary_columns: Columns written with dictionary encoding
+        delta_columns: Integer columns written with DELTA_BINARY_PACKED
+        byte_stream_split_columns: Float columns written with BYTE_STREAM_SPLIT
+        write_statistics: Write column min/max statistics
+        write_page_index: Write column/offset indexes for page-level pruning
+        sort_by_ts: Sort rows by ``ts_ns`` and record it as the sorting column
+        price_encoding: ``float64`` or ``decimal`` (exact DECIMAL(18, 4) prices)
+    """
+
+    name: str
+    compression: str = "zstd"
+    compression_level: Optional[int] = None
+    row_group_size: int = 10000
+    dictionary_columns: tuple[str, ...] = ()
+    delta_columns: tuple[str, ...] = ()
+    byte_stream_split_columns: tuple[str, ...] = ()
+    write_statistics: bool = True
+    write_page_index: bool = False
+    sort_by_ts: bool = False
+    price_encoding: str = "float64"
+
+    def __post_init__(self):
+        """Validate the price encoding."""
+        if self.price_encoding not in PRICE_ENCODINGS:
+            raise ValueError(
+                f"Unknown price encoding: {self.price_encoding}. Valid: {list(PRICE_ENCODINGS)}"
+            )
+
+    def encode(self, table: pa.Table) -> pa.Table:
+        """Convert a canonical (float64 price) table to this profile's encoding."""
+        if self.price_encoding == "decimal":
+            return encode_decimal_prices(table, (*PRICE_COLUMNS, "vwap"))
+        return table
+
+    def write_options(self, schema: pa.Schema, compression: Optional[str] = None) -> dict[str, Any]:
+        """Build ``pyarrow.parquet.write_table`` keyword arguments for a schema.
+
+        Encodings are only requested for columns present with a compatible
+        type, so tables carrying extra or differently typed columns still write.
+
+        Args:
+            schema: Schema of the table about to be written
+            compression: Codec overriding the profile's (drops the level)
+
+        Returns:
+            Keyword arguments for ``pq.write_table``
+        """
+        names = set(schema.names)
+        encodings: dict[str, str] = {}
+        for column in self.delta_columns:
+            if column in names and pa.types.is_integer(schema.field(column).type):
+                encodings[column] = "DELTA_BINARY_PACKED"
+        for column in self.byte_stream_split_columns:
+            if column in names and pa.types.is_floating(schema.field(column).type):
+                encodings[column] = "BYTE_STREAM_SPLIT"
+
+        options: dict[str, Any] = {
+            "compression": compression or self.compression,
+            "row_group_size": self.row_group_size,
+            "use_dictionary": [
+                c for c in self.dictionary_columns if c in names and c not in encodings
+            ]
+            or False,
+            "write_statistics": self.write_statistics,
+        }
+        if compression in (None, self.compression) and self.compression_level is not None:
+            options["compression_level"] = self.compression_level
+        if encodings:
+            options["column_encoding"] = encodings
+        if self.write_page_index:
+            options["write_page_index"] = True
+        if self.sort_by_ts and "ts_ns" in names:
+            options["sorting_columns"] = [pq.SortingColumn(schema.get_field_index("ts_ns"))]
+        if any(pa.types.is_decimal(f.type) for f in schema) and _decimal_as_integer():
+            options["store_decimal_as_integer"] = True
+        return options
+
+
+# Exchange prices sit on a tick grid and repeat heavily within a day, so
+# dictionary encoding beats BYTE_STREAM_SPLIT for them (pyarrow falls back to
+# plain pages by itself when a dictionary grows too large). BYTE_STREAM_SPLIT
+# pays off for prices without a tick grid, e.g. split/dividend adjusted series.
+STORAGE_PROFILES: dict[str, StorageProfile] = {
+    # Settings used before profiles existed
+    "legacy": StorageProfile(name="legacy"),
+    # Default: typed encodings at a moderate zstd level
+    "balanced": StorageProfile(
+        name="balanced",
+        compression="zstd",
+        compression_level=3,
+        row_group_size=64 * 1024,
+        dictionary_columns=("symbol", *PRICE_COLUMNS),
+        delta_columns=DELTA_COLUMNS,
+        write_page_index=True,
+        sort_by_ts=True,
+    ),
+    # Archival: smallest files, slower writes
+    "compact": StorageProfile(
+        name="compact",
+        compression="zstd",
+        compression_level=12,
+        row_group_size=256 * 1024,
+        dictionary_columns=("symbol", *PRICE_COLUMNS),
+        delta_columns=DELTA_COLUMNS,
+        write_page_index=True,
+        sort_by_ts=True,
+    ),
+    # Hot data: cheapest codec to decode
+    "fast": StorageProfile(
+        name="fast",
+        compression="lz4",
+        row_group_size=64 * 1024,
+        dictionary_columns=("symbol", *PRICE_COLUMNS),
+        delta_columns=DELTA_COLUMNS,
+        write_page_index=True,
+        sort_by_ts=True,
+    ),
+    # Off-grid (adjusted) prices and vwap: byte-stream split floats
+    "adjusted": StorageProfile(
+        name="adjusted",
+        compression="zstd",
+        compression_level=3,
+        row_group_size=64 * 1024,
+        dictionary_columns=("symbol",),
+        delta_columns=DELTA_COLUMNS,
+        byte_stream_split_columns=(*PRICE_COLUMNS, "vwap"),
+        write_page_index=True,
+        sort_by_ts=True,
+    ),
+    # Exact prices: DECIMAL(18, 4) unit counts instead of binary floats
+    "exact": StorageProfile(
+        name="exact",
+        compression="zstd",
+        compression_level=3,
+        row_group_size=64 * 1024,
+        dictionary_columns=("symbol", *PRICE_COLUMNS),
+        delta_columns=DELTA_COLUMNS,
+        write_page_index=True,
+        sort_by_ts=True,
+        price_encoding="decimal",
+    ),
+}
+
+DEFAULT_PROFILE = "balanced"
+
+
+def get_storage_profile(profile: Union[str, StorageProfile, None] = None) -> StorageProfile:
+    """Resolve a profile by name, falling back to ``$MARKETPIPE_PARQUET_PROFILE``.
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if isinstance(profile, StorageProfile):
+        return profile
+    name = profile or os.environ.get(PROFILE_ENV) or DEFAULT_PROFILE
+    try:
+        return STORAGE_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage profile: {name}. Valid profiles: {sorted(STORAGE_PROFILES)}"
+        ) from None
+
+
+@lru_cache(maxsize=64)
+def schema_for_columns(columns: tuple[str, ...]) -> Optional[pa.Schema]:
+    """Return the OHLCV schema restricted to ``columns``, or None for unknown columns."""
+    known = set(OHLCV_SCHEMA.names)
+    if not set(columns) <= known:
+        return None
+    return pa.schema([OHLCV_SCHEMA.field(c) for c in columns])
+
+
+class CompactionLock:
+    """Reader/writer lock that excludes both other threads and other processes.
+
+    ``fasteners.InterProcessReaderWriterLock`` relies on POSIX record locks,
+    which never conflict within one process. A per-path thread-level lock is
+    therefore held alongside it, and the process-level read lock is shared by
+    all reader threads of this process (acquired by the first, released by
+    the last).
+    """
+
+    _registry: dict[str, tuple[fasteners.ReaderWriterLock, dict[str, Any]]] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path: Union[Path, str]):
+        self._path = str(path)
+        with self._registry_lock:
+            if self._path not in self._registry:
+                self._registry[self._path] = (
+                    fasteners.ReaderWriterLock(),
+                    {"readers": 0, "mutex": threading.Lock(), "lock": None},
+                )
+            self._thread_lock, self._shared = self._registry[self._path]
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        with self._thread_lock.read_lock():
+            with self._shared["mutex"]:
+                if self._shared["readers"] == 0:
+                    process_lock = fasteners.InterProcessReaderWriterLock(self._path)
+                    process_lock.acquire_read_lock()
+                    self._shared["lock"] = process_lock
+                self._shared["readers"] += 1
+            try:
+                yield
+            finally:
+                with self._shared["mutex"]:
+                    self._shared["readers"] -= 1
+                    if self._shared["readers"] == 0:
+                        self._shared["lock"].release_read_lock()
+                        self._shared["lock"] = None
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        with self._thread_lock.write_lock():
+            with fasteners.InterProcessReaderWriterLock(self._path).write_lock():
+                yield
+
 
 class ParquetStorageEngine:
     """
@@ -22,30 +376,106 @@ class ParquetStorageEngine:
                 symbol=<SYMBOL>/
                     date=<YYYY-MM-DD>/   # optional day partition
                         <job_id>.parquet
+                    date=<YYYY-MM>/      # month bucket written by compaction
+                        <SYMBOL>_<YYYY-MM>.parquet
+
+    Frames can instead use the clustered layout (one file per day holding all
+    symbols once compacted; writes add per-symbol part files); see
+    ``marketpipe.infrastructure.storage.layout``. Every public
+    read and write method handles both layouts.
+
+    Compacted buckets (``date=YYYY-MM`` or ``date=YYYY``) hold many trading days
+    in one file sorted by ``ts_ns``. Readers in this class treat them like the
+    day partitions they replaced; see ``marketpipe.infrastructure.storage.compaction``.
 
     Features:
-    - Thread-safe writes using file locking
+    - Atomic writes (temp file + rename) safe across threads and processes
+    - Non-blocking ``store_bars`` backed by a bounded background writer pool
     - Partitioned storage by frame/symbol/date
     - Compression support (zstd by default)
     - Concurrent read operations
     - Job-based file organization
     """
 
-    def __init__(self, root: Union[Path, str], compression: str = "zstd"):
+    # Marker file placed in a day partition whose data must be re-fetched
+    STALE_MARKER = "_STALE"
+
+    # Directory under the root holding one compaction lock per frame. It sits
+    # outside the frame=/symbol=/date= tree so dataset globs never see it
+    LOCK_DIR = ".locks"
+
+    def __init__(
+        self,
+        root: Union[Path, str],
+        compression: Optional[str] = None,
+        profile: Union[str, StorageProfile, None] = None,
+        read_workers: Optional[int] = None,
+        write_workers: int = 4,
+        max_pending_writes: int = 64,
+        clustered_frames: Optional[Iterable[str]] = None,
+    ):
         """Initialize storage engine.
 
         Args:
             root: Root directory for Parquet storage
-            compression: Compression algorithm (zstd, snappy, gzip, etc.)
+            compression: Compression algorithm (zstd, snappy, gzip, etc.);
+                overrides the profile's codec
+            profile: Storage profile name or instance (default:
+                ``$MARKETPIPE_PARQUET_PROFILE`` or "balanced")
+            read_workers: Threads used to read files concurrently (default:
+                same as ``ThreadPoolExecutor``; 1 reads sequentially)
+            write_workers: Background writer threads used by ``store_bars``
+            max_pending_writes: Queued background writes before ``store_bars``
+                waits for the writer to catch up
+            clustered_frames: Frames that get the clustered layout when first
+                written (default: ``$MARKETPIPE_CLUSTERED_FRAMES``); see
+                ``marketpipe.infrastructure.storage.layout``
         """
         self._root = Path(root)
-        self._compression = compression
+        self._profile = get_storage_profile(profile)
+        self._compression = compression or self._profile.compression
+        self._read_workers = read_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._write_workers = write_workers
+        self._max_pending_writes = max_pending_writes
+        self._writer: Optional[ParquetBatchWriter] = None
+        self._writer_lock = threading.Lock()
+        self._clustered_frames = (
+            frozenset(clustered_frames)
+            if clustered_frames is not None
+            else clustered_frames_from_env()
+        )
         self._root.mkdir(parents=True, exist_ok=True)
         self.log = logging.getLogger(self.__class__.__name__)
 
         # Validate compression algorithm
-        if compression not in {"zstd", "snappy", "gzip", "lz4", "brotli"}:
-            raise ValueError(f"Unsupported compression: {compression}")
+        if self._compression not in {"zstd", "snappy", "gzip", "lz4", "brotli"}:
+            raise ValueError(f"Unsupported compression: {self._compression}")
+
+    @property
+    def profile(self) -> StorageProfile:
+        return self._profile
+
+    def to_table(self, df: pd.DataFrame) -> pa.Table:
+        """Convert a DataFrame to Arrow using the canonical OHLCV column types.
+
+        Frames with columns outside the OHLCV schema, or values that do not fit
+        it (e.g. fractional volume), fall back to inferred types.
+        """
+        if self._profile.sort_by_ts and "ts_ns" in df.columns:
+            if not df["ts_ns"].is_monotonic_increasing:
+                df = df.sort_values("ts_ns", kind="stable")
+
+        schema = schema_for_columns(tuple(df.columns))
+        if schema is not None:
+            try:
+                return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    def write_options(self, schema: pa.Schema) -> dict[str, Any]:
+        """``pq.write_table`` options for a table with ``schema`` under this engine's profile."""
+        return self._profile.write_options(schema, self._compression)
 
     # ----- Write Operations -----
 
@@ -79,49 +509,190 @@ class ParquetStorageEngine:
         if df.empty:
             raise ValueError("Cannot write empty DataFrame")
 
+        return self.write_table(
+            self.to_table(df),
+            frame=frame,
+            symbol=symbol,
+            trading_day=trading_day,
+            job_id=job_id,
+            overwrite=overwrite,
+        )
+
+    def write_table(
+        self,
+        table: pa.Table,
+        *,
+        frame: str,
+        symbol: str,
+        trading_day: date,
+        job_id: str,
+        overwrite: bool = False,
+    ) -> Path:
+        """Write an Arrow table to its partition file.
+
+        The file is committed with a temp-file-plus-rename (see
+        :meth:`replace_file`): readers see the old file or the new one, and
+        with ``overwrite=False`` a hard link lets only one of several
+        concurrent writers of the same file win. Such plain writes take no
+        lock. Overwrites take the frame's compaction lock shared, so
+        compaction cannot delete the file they replace, and writes that must
+        rewrite a compacted bucket or a clustered day file take it exclusively.
+
+        Args:
+            table: Arrow table containing OHLCV data
+            frame: Timeframe (e.g., "1m", "5m", "1h", "1d")
+            symbol: Stock symbol (e.g., "AAPL")
+            trading_day: Trading date for partitioning
+            job_id: Unique job identifier for the file
+            overwrite: Whether to overwrite existing files
+
+        Returns:
+            Path to the written Parquet file
+
+        Raises:
+            FileExistsError: If file exists and overwrite=False
+            ValueError: If the table is empty or invalid
+        """
+        if table.num_rows == 0:
+            raise ValueError("Cannot write empty DataFrame")
+
         # Validate required columns
         required_cols = {"ts_ns", "open", "high", "low", "close", "volume"}
-        if not required_cols.issubset(df.columns):
-            missing = required_cols - set(df.columns)
+        if not required_cols.issubset(table.column_names):
+            missing = required_cols - set(table.column_names)
             raise ValueError(f"DataFrame missing required columns: {missing}")
 
-        # Create partition directory structure
-        partition_path = (
-            self._root / f"frame={frame}" / f"symbol={symbol}" / f"date={trading_day.isoformat()}"
-        )
-        partition_path.mkdir(parents=True, exist_ok=True)
+        if self.frame_layout(frame) == LAYOUT_BY_SYMBOL:
+            return self._write_symbol_partition(
+                table, frame, symbol, trading_day, job_id, overwrite
+            )
 
-        # Define output file path
+        with self._overwrite_lock(frame, overwrite):
+            path = self._write_clustered_part(
+                table, frame, symbol, trading_day, job_id, overwrite, exclusive=False
+            )
+            if path is not None:
+                return path
+
+        # The symbol's rows in the clustered day file must be dropped first
+        with self.compaction_lock(frame).write_lock():
+            path = self._write_clustered_part(
+                table, frame, symbol, trading_day, job_id, overwrite, exclusive=True
+            )
+            assert path is not None
+            return path
+
+    def _write_symbol_partition(
+        self,
+        table: pa.Table,
+        frame: str,
+        symbol: str,
+        trading_day: date,
+        job_id: str,
+        overwrite: bool,
+    ) -> Path:
+        """Write a job file into a ``symbol``-layout day partition."""
+        symbol_path = self._root / f"frame={frame}" / f"symbol={symbol}"
+        partition_path = symbol_path / f"date={trading_day.isoformat()}"
         file_path = partition_path / f"{job_id}.parquet"
 
-        # Use file locking for concurrency safety
-        lock_path = str(file_path) + ".lock"
-        with fasteners.InterProcessLock(lock_path):
+        if not self._in_bucket(symbol_path, trading_day):
+            with self._overwrite_lock(frame, overwrite):
+                path = self._commit_partition_file(table, file_path, overwrite)
+            if not self._in_bucket(symbol_path, trading_day):
+                return path
+            # Compaction published a bucket for the day while the file was
+            # written; unless it took the file, release the day as below
+            with self.compaction_lock(frame).write_lock():
+                if file_path.exists():
+                    self._release_compacted_day(frame, symbol, trading_day, drop=overwrite)
+            return path
+
+        with self.compaction_lock(frame).write_lock():
             if file_path.exists() and not overwrite:
                 raise FileExistsError(f"File already exists: {file_path}")
 
-            try:
-                # Convert to Arrow table with explicit schema to avoid type incompatibilities
-                table = pa.Table.from_pandas(df, preserve_index=False)
-
-                # Write with compression and consistent schema
-                pq.write_table(
-                    table,
-                    file_path,
-                    compression=self._compression,
-                    row_group_size=10000,  # Optimize for read performance
-                    use_dictionary=False,  # Disable dictionary encoding to avoid type conflicts
-                )
+            # A day that was compacted into a bucket is split back out so the
+            # new file does not duplicate (or, with overwrite, resurrect) it
+            self._release_compacted_day(frame, symbol, trading_day, drop=overwrite)
+            return self._commit_partition_file(table, file_path, overwrite)
 
-                self.log.info(f"Wrote {len(df)} rows to {file_path}")
+    def _overwrite_lock(self, frame: str, overwrite: bool) -> AbstractContextManager[None]:
+        """Shared compaction lock for an overwrite; plain writes take no lock."""
+        return self.compaction_lock(frame).read_lock() if overwrite else nullcontext()
 
-            except Exception as e:
-                # Clean up partial file on failure
-                if file_path.exists():
-                    file_path.unlink()
-                self.log.error(f"Failed to write {file_path}: {e}")
-                raise
+    def _in_bucket(self, symbol_path: Path, trading_day: date) -> bool:
+        """Whether a compacted bucket of the symbol covers ``trading_day``."""
+        return any(
+            (symbol_path / f"date={label}").exists() for label in self.bucket_labels(trading_day)
+        )
 
+    def _write_clustered_part(
+        self,
+        table: pa.Table,
+        frame: str,
+        symbol: str,
+        trading_day: date,
+        job_id: str,
+        overwrite: bool,
+        *,
+        exclusive: bool,
+    ) -> Optional[Path]:
+        """Write a part file into a clustered day.
+
+        The part stays next to the day file until compaction folds it in.
+
+        Returns None without writing when the day file holds rows of the
+        symbol that an overwrite must drop and the compaction lock is not
+        held exclusively.
+        """
+        frame_path = self.frame_path(frame)
+        day_path = frame_path / f"date={trading_day.isoformat()}"
+        file_path = day_path / part_name(symbol, job_id)
+        clustered_path = day_path / CLUSTERED_FILE
+
+        if overwrite and self._clustered_has_symbol(clustered_path, symbol):
+            if not exclusive:
+                return None
+            self._drop_clustered_symbol(clustered_path, symbol)
+
+        if "symbol" not in table.column_names:
+            # Day files mix symbols, so every part must carry its own
+            table = table.append_column("symbol", pa.repeat(symbol, table.num_rows))
+
+        if not (frame_path / LAYOUT_MARKER).exists():
+            write_layout_marker(frame_path, LAYOUT_CLUSTERED)
+        return self._commit_partition_file(
+            table, file_path, overwrite, day_path / self.stale_marker_name(LAYOUT_CLUSTERED, symbol)
+        )
+
+    def _commit_partition_file(
+        self,
+        table: pa.Table,
+        file_path: Path,
+        overwrite: bool,
+        stale_marker: Optional[Path] = None,
+    ) -> Path:
+        """Write a partition file and clear the day's stale marker."""
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                # Write with the profile's encodings, compression and layout
+                self.replace_file(table, file_path, overwrite=overwrite)
+            except FileNotFoundError:
+                # Compaction removed the emptied day directory under this write
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                self.replace_file(table, file_path, overwrite=overwrite)
+        except FileExistsError:
+            raise
+        except Exception as e:
+            self.log.error(f"Failed to write {file_path}: {e}")
+            raise
+
+        self.log.info(f"Wrote {table.num_rows} rows to {file_path}")
+
+        # Fresh data supersedes any earlier stale marking of this day
+        (stale_marker or file_path.parent / self.STALE_MARKER).unlink(missing_ok=True)
         return file_path
 
     def append_to_job(
@@ -155,7 +726,7 @@ class ParquetStorageEngine:
 
         if file_path.exists():
             # Load existing data and combine with new data
-            existing_df = pd.read_parquet(file_path)
+            existing_df = decode_decimal_prices(pq.read_table(file_path)).to_pandas()
             combined_df = pd.concat([existing_df, df], ignore_index=True)
 
             # Remove duplicates based on timestamp if present
@@ -181,10 +752,73 @@ class ParquetStorageEngine:
                 overwrite=False,
             )
 
+    @property
+    def writer(self) -> ParquetBatchWriter:
+        """Background writer used by :meth:`store_bars` (created on first use)."""
+        if self._writer is None:
+            from .writer import ParquetBatchWriter
+
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = ParquetBatchWriter(
+                        self, workers=self._write_workers, max_pending=self._max_pending_writes
+                    )
+        return self._writer
+
+    def close(self) -> None:
+        """Finish queued background writes and stop the writer threads.
+
+        Owners of an engine that ``store_bars`` call this on teardown (or use
+        the engine as a context manager); reads need no cleanup.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> ParquetStorageEngine:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def bars_to_table(bars) -> pa.Table:
+        """Convert domain bars to an Arrow table in one columnar pass."""
+        count = len(bars)
+        ts_ns = np.fromiter((bar.timestamp_ns for bar in bars), dtype=np.int64, count=count)
+        # Integer units of either price backend; units / 10_000 == float(Decimal)
+        columns = {
+            "ts_ns": ts_ns,
+            "open": np.fromiter((bar.open_price.units for bar in bars), np.int64, count) / 1e4,
+            "high": np.fromiter((bar.high_price.units for bar in bars), np.int64, count) / 1e4,
+            "low": np.fromiter((bar.low_price.units for bar in bars), np.int64, count) / 1e4,
+            "close": np.fromiter((bar.close_price.units for bar in bars), np.int64, count) / 1e4,
+            "volume": np.fromiter((bar.volume.value for bar in bars), np.int64, count),
+            "symbol": pa.array([bar.symbol.value for bar in bars], pa.string()),
+        }
+        table = pa.table(columns, schema=schema_for_columns(tuple(columns)))
+        if count > 1 and not (ts_ns[1:] >= ts_ns[:-1]).all():
+            table = table.take(np.argsort(ts_ns, kind="stable"))
+        return table
+
+    @staticmethod
+    def split_by_day(table: pa.Table) -> list[tuple[date, pa.Table]]:
+        """Split a ts_ns-sorted table into zero-copy slices per UTC trading day."""
+        days = table.column("ts_ns").to_numpy() // NS_PER_DAY
+        starts = np.flatnonzero(np.diff(days, prepend=days[0] - 1))
+        bounds = [*starts.tolist(), len(days)]
+        return [
+            (EPOCH + timedelta(days=int(days[start])), table.slice(start, stop - start))
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
     async def store_bars(self, bars, configuration):
         """Store OHLCV bars using the configured settings.
 
         This method provides compatibility with the coordinator service interface.
+        Bars are converted and split by day on the event loop (vectorized), and
+        the per-day files are written concurrently by the background
+        :attr:`writer`, so the loop never blocks on Parquet encoding or disk IO.
         """
         from datetime import datetime, timezone
 
@@ -201,145 +835,125 @@ class ParquetStorageEngine:
                 created_at=datetime.now(timezone.utc),
             )
 
-        # Group bars by trading day
-        from collections import defaultdict
-
-        import pandas as pd
-
-        bars_by_day = defaultdict(list)
-        for bar in bars:
-            trading_day = bar.timestamp.trading_date()
-            bars_by_day[trading_day].append(bar)
-
-        # Store bars for each trading day separately
-        partitions = []
-
-        for trading_day, day_bars in bars_by_day.items():
-            # Convert bars to DataFrame
-            data = []
-            for bar in day_bars:
-                data.append(
-                    {
-                        "ts_ns": bar.timestamp_ns,
-                        "open": float(bar.open_price.value),
-                        "high": float(bar.high_price.value),
-                        "low": float(bar.low_price.value),
-                        "close": float(bar.close_price.value),
-                        "volume": int(bar.volume.value),
-                        "symbol": bar.symbol.value,
-                    }
-                )
-
-            df = pd.DataFrame(data)
+        first_bar = bars[0]
+        symbol = first_bar.symbol.value
 
-            # Extract details from first bar of this day
-            first_bar = day_bars[0]
-            symbol = first_bar.symbol.value
+        # Get timeframe from configuration, default to 1m if not available
+        timeframe = getattr(configuration, "timeframe", "1m")
 
-            # Use semantic job ID that includes the trading day
-            job_id = f"{symbol}_{trading_day.isoformat()}"
+        day_tables = self.split_by_day(self.bars_to_table(bars))
 
-            # Get timeframe from configuration, default to 1m if not available
-            timeframe = getattr(configuration, "timeframe", "1m")
-
-            # Write to storage
-            file_path = self.write(
-                df,
-                frame=timeframe,  # Use configuration timeframe
-                symbol=symbol,
-                trading_day=trading_day,
-                job_id=job_id,
-                overwrite=True,
+        # Queue every day at once; semantic job IDs include the trading day
+        file_paths = await asyncio.gather(
+            *(
+                self.writer.write_async(
+                    day_table,
+                    frame=timeframe,
+                    symbol=symbol,
+                    trading_day=trading_day,
+                    job_id=f"{symbol}_{trading_day.isoformat()}",
+                    overwrite=True,
+                )
+                for trading_day, day_table in day_tables
             )
+        )
 
-            # Create partition info for this day
-            file_size = file_path.stat().st_size if file_path.exists() else 0
-            partition = IngestionPartition(
+        partitions = [
+            IngestionPartition(
                 symbol=first_bar.symbol,
                 file_path=file_path,
-                record_count=len(day_bars),
-                file_size_bytes=file_size,
+                record_count=day_table.num_rows,
+                file_size_bytes=file_path.stat().st_size if file_path.exists() else 0,
                 created_at=datetime.now(timezone.utc),
             )
-            partitions.append(partition)
+            for file_path, (_, day_table) in zip(file_paths, day_tables)
+        ]
 
-        # Return consistent partition metadata
-        if partitions:
-            if len(partitions) == 1:
-                # Single day: return the actual partition
-                return partitions[0]
-            else:
-                # Multiple days: return summary partition with consistent metadata
-                first_partition = partitions[0]
-                total_records = sum(p.record_count for p in partitions)
-                total_size = sum(p.file_size_bytes for p in partitions)
-
-                # Create a summary file path that represents the multi-day operation
-                summary_path = (
-                    self._root
-                    / f"summary_{first_partition.symbol.value}_{len(partitions)}_days.parquet"
-                )
+        if len(partitions) == 1:
+            # Single day: return the actual partition
+            return partitions[0]
 
-                return IngestionPartition(
-                    symbol=first_partition.symbol,
-                    file_path=summary_path,  # Summary path representing the entire operation
-                    record_count=total_records,
-                    file_size_bytes=total_size,
-                    created_at=first_partition.created_at,
-                )
-        else:
-            # Fallback for empty partitions (should not happen if bars is not empty)
-            return IngestionPartition(
-                symbol=bars[0].symbol if bars else Symbol.from_string("UNKNOWN"),
-                file_path=self._root / "empty.parquet",
-                record_count=0,
-                file_size_bytes=0,
-                created_at=datetime.now(timezone.utc),
-            )
+        # Multiple days: return summary partition with consistent metadata
+        first_partition = partitions[0]
+        total_records = sum(p.record_count for p in partitions)
+        total_size = sum(p.file_size_bytes for p in partitions)
+
+        # Create a summary file path that represents the multi-day operation
+        summary_path = (
+            self._root / f"summary_{first_partition.symbol.value}_{len(partitions)}_days.parquet"
+        )
+
+        return IngestionPartition(
+            symbol=first_partition.symbol,
+            file_path=summary_path,  # Summary path representing the entire operation
+            record_count=total_records,
+            file_size_bytes=total_size,
+            created_at=first_partition.created_at,
+        )
 
     # ----- Read Operations -----
 
-    def load_partition(self, frame: str, symbol: str, trading_day: date) -> pd.DataFrame:
+    def load_partition(
+        self,
+        frame: str,
+        symbol: str,
+        trading_day: date,
+        columns: Optional[Sequence[str]] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> pd.DataFrame:
         """Load all data for a specific partition (frame/symbol/date).
 
         Args:
             frame: Timeframe identifier
             symbol: Stock symbol
             trading_day: Trading date
+            columns: Optional columns to read (default: all)
+            start_ts: Optional first ts_ns to return (inclusive)
+            end_ts: Optional last ts_ns to return (inclusive)
 
         Returns:
             Combined DataFrame from all job files in the partition
         """
-        partition_path = (
-            self._root / f"frame={frame}" / f"symbol={symbol}" / f"date={trading_day.isoformat()}"
+        return self._to_pandas(
+            self.load_partition_table(frame, symbol, trading_day, columns, start_ts, end_ts)
         )
 
-        if not partition_path.exists():
-            self.log.debug(f"Partition not found: {partition_path}")
-            return pd.DataFrame()
+    def load_partition_table(
+        self,
+        frame: str,
+        symbol: str,
+        trading_day: date,
+        columns: Optional[Sequence[str]] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> pa.Table:
+        """Arrow variant of :meth:`load_partition`; no pandas conversion."""
+        if self.frame_layout(frame) == LAYOUT_CLUSTERED:
+            return self._load_clustered(
+                frame, symbol, trading_day, trading_day, columns, start_ts, end_ts
+            )
 
-        # Read all Parquet files in the partition
-        dataframes = []
-        for parquet_file in partition_path.glob("*.parquet"):
-            try:
-                # Read as DataFrame directly to avoid schema merge issues
-                df = pd.read_parquet(parquet_file)
-                dataframes.append(df)
-            except Exception as e:
-                self.log.warning(f"Could not read {parquet_file}: {e}")
-                continue
+        symbol_path = self._root / f"frame={frame}" / f"symbol={symbol}"
+        partition_path = symbol_path / f"date={trading_day.isoformat()}"
+        bucket_paths = [symbol_path / f"date={label}" for label in self.bucket_labels(trading_day)]
 
-        if not dataframes:
-            return pd.DataFrame()
+        if not partition_path.exists() and not any(p.exists() for p in bucket_paths):
+            self.log.debug(f"Partition not found: {partition_path}")
+            return pa.table({})
 
-        # Combine all DataFrames
-        combined_df = pd.concat(dataframes, ignore_index=True)
+        ts_filter = self._ts_filter(start_ts, end_ts)
+        bucket_filter = self._and(
+            ts_filter, self._ts_filter(*self._day_bounds(trading_day, trading_day))
+        )
 
-        # Sort by timestamp if available
-        if "ts_ns" in combined_df.columns:
-            combined_df = combined_df.sort_values("ts_ns")
+        with self.read_lock(frame):
+            reads = [(f, ts_filter) for f in partition_path.glob("*.parquet")]
+            for bucket_path in bucket_paths:
+                reads.extend((f, bucket_filter) for f in bucket_path.glob("*.parquet"))
+            tables = self._read_files(reads, columns)
 
-        return combined_df
+        return self._concat(tables, columns)
 
     def load_job_bars(self, job_id: str) -> dict[str, pd.DataFrame]:
         """Load all symbol DataFrames written by a specific job.
@@ -350,42 +964,39 @@ class ParquetStorageEngine:
         Returns:
             Dictionary mapping symbol names to their DataFrames
         """
-        symbol_dataframes: dict[str, list[pd.DataFrame]] = {}
+        return {
+            symbol: self._to_pandas(table) for symbol, table in self.load_job_tables(job_id).items()
+        }
+
+    def load_job_tables(self, job_id: str) -> dict[str, pa.Table]:
+        """Arrow variant of :meth:`load_job_bars`; no pandas conversion."""
+        symbol_files: dict[str, list[Path]] = {}
 
         # Search for all files with the job_id pattern
+        # Path format: .../frame={frame}/symbol={symbol}/date={date}/{job_id}.parquet
         for parquet_file in self._root.rglob(f"{job_id}.parquet"):
-            try:
-                # Extract symbol from path structure
-                # Path format: .../frame={frame}/symbol={symbol}/date={date}/{job_id}.parquet
-                symbol_part = parquet_file.parent.parent.name
-                if not symbol_part.startswith("symbol="):
-                    self.log.warning(f"Unexpected path structure: {parquet_file}")
-                    continue
-
-                symbol = symbol_part.split("symbol=")[1]
-
-                # Read the DataFrame
-                df = pd.read_parquet(parquet_file)
+            symbol_part = parquet_file.parent.parent.name
+            if not symbol_part.startswith("symbol="):
+                self.log.warning(f"Unexpected path structure: {parquet_file}")
+                continue
+            symbol_files.setdefault(symbol_part.split("symbol=")[1], []).append(parquet_file)
 
-                # Group by symbol
-                symbol_dataframes.setdefault(symbol, []).append(df)
+        # Clustered frames: .../frame={frame}/date={date}/{symbol}__{job_id}.parquet
+        for parquet_file in self._root.glob(f"frame=*/date=*/*{PART_SEPARATOR}{job_id}.parquet"):
+            parsed = parse_part_name(parquet_file.name)
+            if parsed is not None and parsed[1] == job_id:
+                symbol_files.setdefault(parsed[0], []).append(parquet_file)
 
-            except Exception as e:
-                self.log.error(f"Failed to read {parquet_file}: {e}")
-                continue
+        # Read every symbol's files in one parallel batch
+        reads = [(f, None) for files in symbol_files.values() for f in files]
+        tables = iter(self._read_files(reads, None, keep_empty=True))
 
-        # Combine DataFrames for each symbol
         result = {}
-        for symbol, dfs in symbol_dataframes.items():
-            if len(dfs) == 1:
-                result[symbol] = dfs[0]
-            else:
-                combined_df = pd.concat(dfs, ignore_index=True)
-                # Sort by timestamp if available
-                if "ts_ns" in combined_df.columns:
-                    combined_df = combined_df.sort_values("ts_ns")
-                result[symbol] = combined_df
-
+        for symbol, files in symbol_files.items():
+            symbol_tables = [t for t in (next(tables) for _ in files) if t is not None]
+            table = self._concat(symbol_tables, None)
+            if table.num_columns:
+                result[symbol] = table
         return result
 
     def load_symbol_data(
@@ -394,62 +1005,817 @@ class ParquetStorageEngine:
         frame: str,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        columns: Optional[Sequence[str]] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
     ) -> pd.DataFrame:
         """Load data for a symbol across multiple dates.
 
+        Filters are pushed down: partitions outside the window are never
+        opened, and row groups whose ts_ns statistics fall outside it are
+        skipped without decoding. Only ``columns`` (plus ts_ns, for ordering)
+        are read.
+
         Args:
             symbol: Stock symbol
             frame: Timeframe identifier
             start_date: Optional start date filter
             end_date: Optional end date filter
+            columns: Optional columns to read (default: all)
+            start_ts: Optional first ts_ns to return (inclusive)
+            end_ts: Optional last ts_ns to return (inclusive)
 
         Returns:
             Combined DataFrame for the symbol
         """
+        return self._to_pandas(
+            self.load_symbol_table(symbol, frame, start_date, end_date, columns, start_ts, end_ts)
+        )
+
+    def load_symbol_table(
+        self,
+        symbol: str,
+        frame: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        columns: Optional[Sequence[str]] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> pa.Table:
+        """Arrow variant of :meth:`load_symbol_data`; no pandas conversion."""
+        start_date, end_date = self._narrow_window(start_date, end_date, start_ts, end_ts)
+        if self.frame_layout(frame) == LAYOUT_CLUSTERED:
+            return self._load_clustered(
+                frame, symbol, start_date, end_date, columns, start_ts, end_ts
+            )
+
         symbol_path = self._root / f"frame={frame}" / f"symbol={symbol}"
 
         if not symbol_path.exists():
+            return pa.table({})
+
+        ts_filter = self._ts_filter(start_ts, end_ts)
+        bucket_filter = self._and(
+            ts_filter, self._ts_filter(*self._day_bounds(start_date, end_date))
+        )
+
+        with self.read_lock(frame):
+            reads: list[tuple[Path, Optional[ds.Expression]]] = []
+            for date_dir, first_day, last_day in self._iter_date_dirs(
+                symbol_path, start_date, end_date
+            ):
+                # Compacted buckets may extend past the requested window
+                trim = (start_date is not None and first_day < start_date) or (
+                    end_date is not None and last_day > end_date
+                )
+                row_filter = bucket_filter if trim else ts_filter
+                reads.extend((f, row_filter) for f in date_dir.glob("*.parquet"))
+            tables = self._read_files(reads, columns)
+
+        return self._concat(tables, columns)
+
+    def _load_clustered(
+        self,
+        frame: str,
+        symbol: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        columns: Optional[Sequence[str]],
+        start_ts: Optional[int],
+        end_ts: Optional[int],
+    ) -> pa.Table:
+        """Read one symbol from a clustered frame.
+
+        Only the symbol's part files are opened; in day files the symbol
+        predicate prunes every other symbol's row groups via their statistics.
+        """
+        frame_path = self.frame_path(frame)
+        if not frame_path.exists():
+            return pa.table({})
+
+        ts_filter = self._ts_filter(start_ts, end_ts)
+        symbol_filter = self._and(ds.field("symbol") == symbol, ts_filter)
+
+        with self.read_lock(frame):
+            reads: list[tuple[Path, Optional[ds.Expression]]] = []
+            for date_dir, _, _ in self._iter_date_dirs(frame_path, start_date, end_date):
+                clustered_path = date_dir / CLUSTERED_FILE
+                if clustered_path.exists():
+                    reads.append((clustered_path, symbol_filter))
+                reads.extend(
+                    (f, ts_filter) for f in date_dir.glob(f"{symbol}{PART_SEPARATOR}*.parquet")
+                )
+            tables = self._read_files(reads, columns)
+
+        return self._concat(tables, columns)
+
+    def load_cross_section(
+        self,
+        frame: str,
+        trading_day: date,
+        columns: Optional[Sequence[str]] = None,
+        symbols: Optional[Iterable[str]] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> pa.Table:
+        """Load every (or the given) symbol's rows of one day.
+
+        In a clustered frame this reads a single day file (plus pending part
+        files); in a ``symbol`` frame it opens one partition per symbol.
+
+        Args:
+            frame: Timeframe identifier
+            trading_day: Trading date
+            columns: Optional columns to read (default: all); ``symbol`` is always kept
+            symbols: Optional symbols to restrict to
+            start_ts: Optional first ts_ns to return (inclusive)
+            end_ts: Optional last ts_ns to return (inclusive)
+
+        Returns:
+            Arrow table sorted by (symbol, ts_ns)
+        """
+        wanted = sorted(set(symbols)) if symbols is not None else None
+        if columns is not None and "symbol" not in columns:
+            columns = ["symbol", *columns]
+
+        if self.frame_layout(frame) == LAYOUT_BY_SYMBOL:
+            frame_path = self.frame_path(frame)
+            if wanted is None:
+                wanted = sorted(
+                    d.name[len("symbol=") :] for d in frame_path.glob("symbol=*") if d.is_dir()
+                )
+            tables = [
+                self.load_partition_table(frame, symbol, trading_day, columns, start_ts, end_ts)
+                for symbol in wanted
+            ]
+            tables = [t for t in tables if t.num_rows]
+        else:
+            date_dir = self.frame_path(frame) / f"date={trading_day.isoformat()}"
+            row_filter = self._ts_filter(start_ts, end_ts)
+            if wanted is not None:
+                row_filter = self._and(ds.field("symbol").isin(wanted), row_filter)
+            with self.read_lock(frame):
+                files = sorted(date_dir.glob("*.parquet")) if date_dir.is_dir() else []
+                if wanted is not None:
+                    files = [
+                        f
+                        for f in files
+                        if f.name == CLUSTERED_FILE
+                        or (parse_part_name(f.name) or ("",))[0] in wanted
+                    ]
+                tables = self._read_files([(f, row_filter) for f in files], columns)
+
+        if not tables:
+            return pa.table({})
+        combined = pa.concat_tables(tables, promote_options="permissive")
+        sort_keys = [(c, "ascending") for c in ("symbol", "ts_ns") if c in combined.column_names]
+        if sort_keys:
+            combined = combined.sort_by(sort_keys)
+        if columns is not None:
+            combined = combined.select([c for c in columns if c in combined.column_names])
+        return combined
+
+    @staticmethod
+    def _narrow_window(
+        start_date: Optional[date],
+        end_date: Optional[date],
+        start_ts: Optional[int],
+        end_ts: Optional[int],
+    ) -> tuple[Optional[date], Optional[date]]:
+        """Narrow a date window to the days a ts_ns window touches."""
+        if start_ts is not None:
+            ts_day = EPOCH + timedelta(days=start_ts // NS_PER_DAY)
+            start_date = max(start_date, ts_day) if start_date else ts_day
+        if end_ts is not None:
+            ts_day = EPOCH + timedelta(days=end_ts // NS_PER_DAY)
+            end_date = min(end_date, ts_day) if end_date else ts_day
+        return start_date, end_date
+
+    def _read_files(
+        self,
+        reads: list[tuple[Path, Optional[ds.Expression]]],
+        columns: Optional[Sequence[str]],
+        keep_empty: bool = False,
+    ) -> list[Optional[pa.Table]]:
+        """Read (file, row filter) pairs concurrently on the read pool.
+
+        Arrow releases the GIL while decoding, so files are decoded in
+        parallel; results keep the order of ``reads``.
+
+        Args:
+            reads: Files to read, each with its row filter
+            columns: Optional projection
+            keep_empty: Keep one entry per file (None for unreadable files)
+                instead of dropping unreadable and empty results
+
+        Returns:
+            List of Arrow tables
+        """
+        if len(reads) <= 1 or self._read_workers <= 1:
+            tables = [self._read_file(path, columns, row_filter) for path, row_filter in reads]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self._read_workers, len(reads)),
+                thread_name_prefix="parquet-read",
+            ) as pool:
+                tables = list(
+                    pool.map(lambda read: self._read_file(read[0], columns, read[1]), reads)
+                )
+
+        if keep_empty:
+            return tables
+        return [t for t in tables if t is not None and t.num_rows]
+
+    def _read_file(
+        self,
+        parquet_file: Path,
+        columns: Optional[Sequence[str]],
+        row_filter: Optional[ds.Expression],
+    ) -> Optional[pa.Table]:
+        """Read the projected columns and matching rows of one memory-mapped file.
+
+        Files are scanned one at a time so files written with different
+        inferred types (older layouts) never have to share a schema.
+        """
+        try:
+            dataset = ds.dataset(str(parquet_file), format="parquet", filesystem=MMAP_FILESYSTEM)
+            projection = None
+            if columns is not None:
+                wanted = [*columns, "ts_ns"] if "ts_ns" not in columns else list(columns)
+                projection = [c for c in wanted if c in dataset.schema.names]
+            return decode_decimal_prices(dataset.to_table(columns=projection, filter=row_filter))
+        except Exception as e:
+            self.log.warning(f"Could not read {parquet_file}: {e}")
+            return None
+
+    @staticmethod
+    def _concat(tables: list[pa.Table], columns: Optional[Sequence[str]]) -> pa.Table:
+        """Concatenate per-file tables without copying and order them by ts_ns."""
+        if not tables:
+            return pa.table({})
+
+        # Chunks are kept as-is; only differing column types are promoted
+        combined = pa.concat_tables(tables, promote_options="permissive")
+
+        # Sort by timestamp if available (files are usually already in order)
+        if "ts_ns" in combined.column_names:
+            ts = combined.column("ts_ns")
+            if len(ts) > 1 and not pc.all(pc.less_equal(ts[:-1], ts[1:])).as_py():
+                combined = combined.sort_by("ts_ns")
+            if columns is not None and "ts_ns" not in columns:
+                combined = combined.drop_columns(["ts_ns"])
+
+        return combined
+
+    @staticmethod
+    def _to_pandas(table: pa.Table) -> pd.DataFrame:
+        """Convert a read result to pandas (empty results become an empty frame)."""
+        if table.num_rows == 0:
             return pd.DataFrame()
+        return table.to_pandas()
+
+    @staticmethod
+    def _ts_filter(start_ts: Optional[int], end_ts: Optional[int]) -> Optional[ds.Expression]:
+        """Dataset expression selecting ``start_ts <= ts_ns <= end_ts``."""
+        expression = None
+        if start_ts is not None:
+            expression = ds.field("ts_ns") >= start_ts
+        if end_ts is not None:
+            upper = ds.field("ts_ns") <= end_ts
+            expression = upper if expression is None else expression & upper
+        return expression
+
+    @staticmethod
+    def _and(
+        left: Optional[ds.Expression], right: Optional[ds.Expression]
+    ) -> Optional[ds.Expression]:
+        if left is None:
+            return right
+        if right is None:
+            return left
+        return left & right
+
+    @staticmethod
+    def _day_bounds(
+        start_date: Optional[date], end_date: Optional[date]
+    ) -> tuple[Optional[int], Optional[int]]:
+        """Inclusive ts_ns bounds of the UTC days from ``start_date`` to ``end_date``."""
+        start_ts = (start_date - EPOCH).days * NS_PER_DAY if start_date else None
+        end_ts = (end_date - EPOCH).days * NS_PER_DAY + NS_PER_DAY - 1 if end_date else None
+        return start_ts, end_ts
+
+    # ----- Coverage Operations -----
+
+    def partition_coverage(
+        self,
+        frame: str,
+        symbol: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ):
+        """Report stored coverage per trading day without decoding row data.
 
-        dfs = []
-        for date_dir in symbol_path.iterdir():
-            if not date_dir.is_dir() or not date_dir.name.startswith("date="):
+        Row counts and ts_ns min/max come from Parquet footers and column
+        statistics, so checking a year of partitions only reads metadata.
+
+        Args:
+            frame: Timeframe identifier
+            symbol: Stock symbol
+            start_date: Optional first day (inclusive)
+            end_date: Optional last day (inclusive)
+
+        Returns:
+            Dictionary mapping trading day to PartitionCoverage
+        """
+        from marketpipe.ingestion.domain.value_objects import PartitionCoverage
+
+        if self.frame_layout(frame) == LAYOUT_CLUSTERED:
+            return self._clustered_coverage(frame, symbol, start_date, end_date, PartitionCoverage)
+
+        symbol_path = self._root / f"frame={frame}" / f"symbol={symbol}"
+        coverage: dict[date, PartitionCoverage] = {}
+
+        if not symbol_path.exists():
+            return coverage
+
+        with self.read_lock(frame):
+            date_dirs = list(self._iter_date_dirs(symbol_path, start_date, end_date))
+
+            # Compacted buckets first so day partitions written later win
+            for date_dir, first_day, last_day in date_dirs:
+                if first_day != last_day:
+                    coverage.update(
+                        self._bucket_coverage(date_dir, start_date, end_date, PartitionCoverage)
+                    )
+
+            for date_dir, dir_date, last_day in date_dirs:
+                if dir_date != last_day:
+                    continue
+                day_coverage = self._day_coverage(date_dir, dir_date, PartitionCoverage)
+                if day_coverage is not None:
+                    coverage[dir_date] = day_coverage
+
+        return dict(sorted(coverage.items()))
+
+    def _clustered_coverage(
+        self,
+        frame: str,
+        symbol: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        coverage_cls,
+    ) -> dict:
+        """Per-day coverage of one symbol in a clustered frame."""
+        frame_path = self.frame_path(frame)
+        coverage: dict[date, Any] = {}
+        if not frame_path.exists():
+            return coverage
+
+        stale_name = self.stale_marker_name(LAYOUT_CLUSTERED, symbol)
+        with self.read_lock(frame):
+            for date_dir, day, _ in self._iter_date_dirs(frame_path, start_date, end_date):
+                stale = (date_dir / stale_name).exists()
+                ranges = []
+                clustered_path = date_dir / CLUSTERED_FILE
+                try:
+                    if self._clustered_has_symbol(clustered_path, symbol):
+                        ts = pq.read_table(
+                            clustered_path, columns=["ts_ns"], filters=ds.field("symbol") == symbol
+                        ).column("ts_ns")
+                        if len(ts):
+                            bounds = pc.min_max(ts).as_py()
+                            ranges.append((len(ts), bounds["min"], bounds["max"]))
+                    for part in date_dir.glob(f"{symbol}{PART_SEPARATOR}*.parquet"):
+                        ranges.append(self._file_ts_range(part))
+                except Exception as e:
+                    # Unreadable files do not count as coverage
+                    self.log.warning(f"Could not read {symbol} metadata in {date_dir}: {e}")
+                    stale = True
+
+                row_count = sum(rows for rows, _, _ in ranges)
+                if row_count == 0 and not stale:
+                    continue
+                mins = [lo for _, lo, _ in ranges if lo is not None]
+                maxs = [hi for _, _, hi in ranges if hi is not None]
+                coverage[day] = coverage_cls(
+                    trading_day=day,
+                    row_count=row_count,
+                    min_ts_ns=min(mins) if mins else None,
+                    max_ts_ns=max(maxs) if maxs else None,
+                    stale=stale,
+                )
+        return coverage
+
+    def _day_coverage(self, date_dir: Path, dir_date: date, coverage_cls):
+        """Coverage of a single day partition, or None if it holds nothing."""
+        stale = (date_dir / self.STALE_MARKER).exists()
+        row_count = 0
+        min_ts: Optional[int] = None
+        max_ts: Optional[int] = None
+
+        for parquet_file in date_dir.glob("*.parquet"):
+            try:
+                file_rows, file_min, file_max = self._file_ts_range(parquet_file)
+            except Exception as e:
+                # Unreadable files do not count as coverage
+                self.log.warning(f"Could not read metadata of {parquet_file}: {e}")
+                stale = True
                 continue
 
-            # Extract date from directory name
+            row_count += file_rows
+            if file_min is not None:
+                min_ts = file_min if min_ts is None else min(min_ts, file_min)
+            if file_max is not None:
+                max_ts = file_max if max_ts is None else max(max_ts, file_max)
+
+        if row_count == 0 and not stale:
+            return None
+
+        return coverage_cls(
+            trading_day=dir_date,
+            row_count=row_count,
+            min_ts_ns=min_ts,
+            max_ts_ns=max_ts,
+            stale=stale,
+        )
+
+    def _bucket_coverage(
+        self,
+        bucket_dir: Path,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        coverage_cls,
+    ) -> dict:
+        """Per-day coverage of a compacted bucket, derived from its ts_ns column."""
+        coverage = {}
+        for parquet_file in bucket_dir.glob("*.parquet"):
             try:
-                date_str = date_dir.name.split("date=")[1]
-                dir_date = date.fromisoformat(date_str)
-            except (ValueError, IndexError):
+                ts = pq.read_table(parquet_file, columns=["ts_ns"]).column("ts_ns")
+            except Exception as e:
+                self.log.warning(f"Could not read {parquet_file}: {e}")
+                continue
+
+            days = pc.divide(ts, NS_PER_DAY)
+            grouped = pa.table({"day": days, "ts_ns": ts}).group_by("day")
+            stats = grouped.aggregate([("ts_ns", "count"), ("ts_ns", "min"), ("ts_ns", "max")])
+            for epoch_day, count, min_ts, max_ts in zip(
+                stats.column("day").to_pylist(),
+                stats.column("ts_ns_count").to_pylist(),
+                stats.column("ts_ns_min").to_pylist(),
+                stats.column("ts_ns_max").to_pylist(),
+            ):
+                day = EPOCH + timedelta(days=epoch_day)
+                if (start_date and day < start_date) or (end_date and day > end_date):
+                    continue
+                coverage[day] = coverage_cls(
+                    trading_day=day, row_count=count, min_ts_ns=min_ts, max_ts_ns=max_ts
+                )
+        return coverage
+
+    @staticmethod
+    def _file_ts_range(parquet_file: Path) -> tuple[int, Optional[int], Optional[int]]:
+        """Return (rows, min ts_ns, max ts_ns) of a file from its footer."""
+        metadata = pq.read_metadata(parquet_file)
+        if metadata.num_rows == 0 or "ts_ns" not in metadata.schema.names:
+            return metadata.num_rows, None, None
+
+        column_index = metadata.schema.names.index("ts_ns")
+        min_ts: Optional[int] = None
+        max_ts: Optional[int] = None
+        for rg in range(metadata.num_row_groups):
+            stats = metadata.row_group(rg).column(column_index).statistics
+            if stats is None or not stats.has_min_max:
+                # Files written without statistics: fall back to the ts_ns column only
+                ts = pq.read_table(parquet_file, columns=["ts_ns"]).column("ts_ns")
+                bounds = pc.min_max(ts).as_py()
+                return metadata.num_rows, int(bounds["min"]), int(bounds["max"])
+            min_ts = stats.min if min_ts is None else min(min_ts, stats.min)
+            max_ts = stats.max if max_ts is None else max(max_ts, stats.max)
+
+        return metadata.num_rows, min_ts, max_ts
+
+    async def get_coverage(self, symbol: str, timeframe: str, start_date: date, end_date: date):
+        """Async coverage lookup used by the ingestion coordinator."""
+        return await asyncio.to_thread(
+            self.partition_coverage, timeframe, symbol, start_date, end_date
+        )
+
+    def mark_stale(self, frame: str, symbol: str, trading_day: date) -> bool:
+        """Mark a day partition so incremental ingestion re-fetches it.
+
+        Args:
+            frame: Timeframe identifier
+            symbol: Stock symbol
+            trading_day: Trading date
+
+        Returns:
+            True if the partition exists and was marked
+        """
+        if self.frame_layout(frame) == LAYOUT_CLUSTERED:
+            day_path = self.frame_path(frame) / f"date={trading_day.isoformat()}"
+            if trading_day not in self.partition_coverage(frame, symbol, trading_day, trading_day):
+                return False
+            (day_path / self.stale_marker_name(LAYOUT_CLUSTERED, symbol)).touch()
+            self.log.info(f"Marked {symbol} in {day_path} stale")
+            return True
+
+        symbol_path = self._root / f"frame={frame}" / f"symbol={symbol}"
+        partition_path = symbol_path / f"date={trading_day.isoformat()}"
+        if not partition_path.exists():
+            # A compacted day gets an otherwise empty day partition holding the marker
+            compacted = trading_day in self.partition_coverage(
+                frame, symbol, trading_day, trading_day
+            )
+            if not compacted:
+                return False
+            partition_path.mkdir(parents=True, exist_ok=True)
+
+        (partition_path / self.STALE_MARKER).touch()
+        self.log.info(f"Marked {partition_path} stale")
+        return True
+
+    # ----- Partition Layout -----
+
+    def frame_path(self, frame: str) -> Path:
+        """Directory holding a frame's partitions."""
+        return self._root / f"frame={frame}"
+
+    def frame_layout(self, frame: str) -> str:
+        """Layout of a frame (``symbol`` or ``clustered``).
+
+        Existing frames keep the layout they were written with; new frames
+        are clustered if listed in ``clustered_frames``.
+        """
+        default = LAYOUT_CLUSTERED if frame in self._clustered_frames else LAYOUT_BY_SYMBOL
+        return detect_layout(self.frame_path(frame), default)
+
+    def compaction_lock(self, frame: str) -> CompactionLock:
+        """Reader/writer lock coordinating a frame's readers with compaction.
+
+        Compaction, layout migrations and writes that rewrite a compacted
+        bucket or a clustered day file take the write side, so readers never
+        see such a swap half-applied. Readers and overwrites take the shared
+        side; plain writes take neither (see :meth:`write_table`). The lock
+        file lives in ``<root>/.locks``, outside the partition tree.
+        """
+        lock_dir = self._root / self.LOCK_DIR
+        lock_dir.mkdir(exist_ok=True)
+        return CompactionLock(lock_dir / f"{frame}.lock")
+
+    @contextmanager
+    def read_lock(self, frame: str) -> Iterator[None]:
+        """Shared compaction lock for a read of ``frame``.
+
+        A frame that does not exist has nothing to guard, so reads of absent
+        data leave the storage root untouched.
+        """
+        with ExitStack() as stack:
+            if self.frame_path(frame).is_dir():
+                stack.enter_context(self.compaction_lock(frame).read_lock())
+            yield
+
+    def stale_marker_name(self, layout: str, symbol: str) -> str:
+        """Name of a symbol's stale marker inside a day directory."""
+        if layout == LAYOUT_CLUSTERED:
+            return f"{self.STALE_MARKER}.{symbol}"
+        return self.STALE_MARKER
+
+    @staticmethod
+    def partition_span(label: str) -> Optional[tuple[date, date]]:
+        """Return the first and last day covered by a ``date=`` partition label.
+
+        Args:
+            label: ``YYYY-MM-DD`` (day), ``YYYY-MM`` (month bucket) or ``YYYY`` (year bucket)
+
+        Returns:
+            Tuple of (first day, last day), or None if the label is not recognised
+        """
+        try:
+            if len(label) == 10:
+                day = date.fromisoformat(label)
+                return day, day
+            if len(label) == 7 and label[4] == "-":
+                year, month = int(label[:4]), int(label[5:])
+                first = date(year, month, 1)
+                next_month = date(year + month // 12, month % 12 + 1, 1)
+                return first, next_month - timedelta(days=1)
+            if len(label) == 4 and label.isdigit():
+                year = int(label)
+                return date(year, 1, 1), date(year, 12, 31)
+        except ValueError:
+            return None
+        return None
+
+    @staticmethod
+    def bucket_labels(trading_day: date) -> list[str]:
+        """Labels of the compacted buckets that could hold ``trading_day``."""
+        return [f"{trading_day:%Y-%m}", f"{trading_day:%Y}"]
+
+    def _iter_date_dirs(
+        self,
+        symbol_path: Path,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[tuple[Path, date, date]]:
+        """Yield (directory, first day, last day) for partitions overlapping the window."""
+        for date_dir in sorted(symbol_path.iterdir()):
+            if not date_dir.is_dir() or not date_dir.name.startswith("date="):
+                continue
+
+            span = self.partition_span(date_dir.name[len("date=") :])
+            if span is None:
                 self.log.warning(f"Invalid date directory: {date_dir}")
                 continue
 
-            # Apply date filtering
-            if start_date and dir_date < start_date:
+            first_day, last_day = span
+            if start_date and last_day < start_date:
                 continue
-            if end_date and dir_date > end_date:
+            if end_date and first_day > end_date:
                 continue
 
-            # Load all Parquet files in this date directory
-            for parquet_file in date_dir.glob("*.parquet"):
-                try:
-                    df = pd.read_parquet(parquet_file)
-                    dfs.append(df)
-                except Exception as e:
-                    self.log.warning(f"Could not read {parquet_file}: {e}")
+            yield date_dir, first_day, last_day
+
+    def _release_compacted_day(
+        self, frame: str, symbol: str, trading_day: date, *, drop: bool
+    ) -> None:
+        """Remove a day's rows from any compacted bucket holding them.
+
+        Must be called with the frame's compaction lock held exclusively.
+
+        Args:
+            frame: Timeframe identifier
+            symbol: Stock symbol
+            trading_day: Day about to be written
+            drop: Discard the rows (overwrite) instead of restoring them to
+                the day partition as ``<SYMBOL>_<day>.compacted.parquet``
+        """
+        symbol_path = self._root / f"frame={frame}" / f"symbol={symbol}"
+        for label in self.bucket_labels(trading_day):
+            bucket_dir = symbol_path / f"date={label}"
+            for parquet_file in list(bucket_dir.glob("*.parquet")):
+                table = decode_decimal_prices(pq.read_table(parquet_file))
+                days = pc.divide(table.column("ts_ns"), NS_PER_DAY)
+                in_day = pc.equal(days, (trading_day - EPOCH).days)
+                day_rows = table.filter(in_day)
+                if day_rows.num_rows == 0:
                     continue
 
-        if not dfs:
-            return pd.DataFrame()
+                if not drop:
+                    restored = (
+                        symbol_path
+                        / f"date={trading_day.isoformat()}"
+                        / f"{symbol}_{trading_day.isoformat()}{COMPACTED_SUFFIX}"
+                    )
+                    restored.parent.mkdir(parents=True, exist_ok=True)
+                    self.replace_file(day_rows, restored)
+
+                remaining = table.filter(pc.invert(in_day))
+                if remaining.num_rows:
+                    self.replace_file(remaining, parquet_file)
+                else:
+                    parquet_file.unlink()
+                self.log.info(
+                    f"Released {day_rows.num_rows} rows of {trading_day} from {parquet_file}"
+                )
 
-        # Combine all DataFrames
-        combined_df = pd.concat(dfs, ignore_index=True)
+    def replace_file(
+        self,
+        table: pa.Table,
+        path: Path,
+        *,
+        overwrite: bool = True,
+        row_group_by: Optional[str] = None,
+        **write_options: Any,
+    ) -> Path:
+        """Atomically write ``table`` to ``path``.
+
+        The data is written to a hidden temporary file in the same directory,
+        flushed to disk and renamed over ``path``, so readers see either the
+        old file or the complete new one.
+
+        Args:
+            table: Arrow table to write
+            path: Destination file
+            overwrite: Replace an existing file; otherwise the temp file is
+                hard-linked into place, which fails atomically if ``path`` exists
+            row_group_by: Sorted column whose runs are never split across row
+                groups unless longer than ``row_group_size``
+            **write_options: Extra ``pyarrow.parquet.write_table`` options
+
+        Returns:
+            The destination path
+
+        Raises:
+            FileExistsError: If ``path`` exists and overwrite=False
+        """
+        table = self._profile.encode(table)
+        options = self.write_options(table.schema)
+        options.update(write_options)
+        # Unique per writer so concurrent writers of one path never share a temp file
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as fh:
+                if row_group_by is None:
+                    pq.write_table(table, fh, **options)
+                else:
+                    max_rows = options.pop("row_group_size")
+                    with pq.ParquetWriter(fh, table.schema, **options) as writer:
+                        for row_group in self._row_groups(table, row_group_by, max_rows):
+                            writer.write_table(row_group, row_group_size=max_rows)
+                fh.flush()
+                os.fsync(fh.fileno())
+            if overwrite:
+                os.replace(tmp_path, path)
+            else:
+                self._link_new(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return path
 
-        # Sort by timestamp if available
-        if "ts_ns" in combined_df.columns:
-            combined_df = combined_df.sort_values("ts_ns")
+    def write_clustered_file(self, table: pa.Table, path: Path) -> Path:
+        """Atomically write a clustered day file.
 
-        return combined_df
+        Rows are sorted by (symbol, ts_ns) and packed into row groups of whole
+        symbols, so the symbol column statistics let a single-symbol read skip
+        every other row group.
+        """
+        table = table.sort_by([("symbol", "ascending"), ("ts_ns", "ascending")])
+        sorting_columns = [
+            pq.SortingColumn(table.schema.get_field_index("symbol")),
+            pq.SortingColumn(table.schema.get_field_index("ts_ns")),
+        ]
+        return self.replace_file(
+            table,
+            path,
+            sorting_columns=sorting_columns,
+            row_group_size=min(self._profile.row_group_size, CLUSTERED_ROW_GROUP_SIZE),
+            row_group_by="symbol",
+        )
+
+    @staticmethod
+    def _row_groups(table: pa.Table, column: str, max_rows: int) -> Iterator[pa.Table]:
+        """Split a table sorted by ``column`` into row groups of whole runs.
+
+        Runs longer than ``max_rows`` are split; shorter ones are packed
+        together up to ``max_rows`` rows.
+        """
+        values = table.column(column).combine_chunks()
+        if pa.types.is_dictionary(values.type):
+            values = values.dictionary_decode()
+        run_ends = pc.run_end_encode(values).run_ends.to_pylist()
+
+        start = 0
+        previous_end = 0
+        for run_end in run_ends:
+            if run_end - start > max_rows and previous_end > start:
+                yield table.slice(start, previous_end - start)
+                start = previous_end
+            while run_end - start > max_rows:
+                yield table.slice(start, max_rows)
+                start += max_rows
+            previous_end = run_end
+        if previous_end > start:
+            yield table.slice(start, previous_end - start)
+
+    def _clustered_has_symbol(self, path: Path, symbol: str) -> bool:
+        """Whether a clustered day file may hold rows of ``symbol`` (footer only)."""
+        if not path.exists():
+            return False
+        metadata = pq.read_metadata(path)
+        if "symbol" not in metadata.schema.names:
+            return False
+        column_index = metadata.schema.names.index("symbol")
+        for rg in range(metadata.num_row_groups):
+            stats = metadata.row_group(rg).column(column_index).statistics
+            if stats is None or not stats.has_min_max or stats.min <= symbol <= stats.max:
+                return True
+        return False
+
+    def _drop_clustered_symbol(self, path: Path, symbol: str) -> None:
+        """Remove a symbol's rows from a clustered day file (compaction lock held exclusively)."""
+        table = decode_decimal_prices(pq.read_table(path))
+        keep = pc.not_equal(table.column("symbol"), symbol)
+        remaining = table.filter(keep)
+        if remaining.num_rows == table.num_rows:
+            return
+        if remaining.num_rows:
+            self.write_clustered_file(remaining, path)
+        else:
+            path.unlink()
+        self.log.info(f"Dropped {table.num_rows - remaining.num_rows} {symbol} rows from {path}")
+
+    @staticmethod
+    def _link_new(tmp_path: Path, path: Path) -> None:
+        """Move ``tmp_path`` to ``path`` unless ``path`` already exists."""
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            raise FileExistsError(f"File already exists: {path}") from None
+        except OSError:
+            # Filesystems without hard links: best-effort check then rename
+            if path.exists():
+                raise FileExistsError(f"File already exists: {path}") from None
+            os.replace(tmp_path, path)
 
     # ----- Utility Operations -----
 
@@ -464,7 +1830,9 @@ class ParquetStorageEngine:
         """
         removed_count = 0
 
-        for parquet_file in self._root.rglob(f"{job_id}.parquet"):
+        job_files = list(self._root.rglob(f"{job_id}.parquet"))
+        job_files.extend(self._root.glob(f"frame=*/date=*/*{PART_SEPARATOR}{job_id}.parquet"))
+        for parquet_file in job_files:
             try:
                 parquet_file.unlink(missing_ok=True)
                 removed_count += 1
@@ -485,6 +1853,11 @@ class ParquetStorageEngine:
         Returns:
             List of job IDs found
         """
+        if self.frame_layout(frame) == LAYOUT_CLUSTERED:
+            parts = self.frame_path(frame).glob(f"date=*/{symbol}{PART_SEPARATOR}*.parquet")
+            parsed = (parse_part_name(p.name) for p in parts)
+            return sorted({name[1] for name in parsed if name is not None})
+
         symbol_path = self._root / f"frame={frame}" / f"symbol={symbol}"
 
         if not symbol_path.exists():
@@ -492,6 +1865,8 @@ class ParquetStorageEngine:
 
         job_ids = set()
         for parquet_file in symbol_path.rglob("*.parquet"):
+            if parquet_file.name.endswith(COMPACTED_SUFFIX):
+                continue
             job_id = parquet_file.stem  # filename without extension
             job_ids.add(job_id)
 
@@ -521,6 +1896,12 @@ class ParquetStorageEngine:
                     elif part.startswith("symbol="):
                         symbols.add(part.split("=")[1])
 
+                # Clustered part files carry the symbol in their name
+                if parquet_file.parent.parent.name.startswith("frame="):
+                    parsed = parse_part_name(parquet_file.name)
+                    if parsed is not None:
+                        symbols.add(parsed[0])
+
             except Exception as e:
                 self.log.warning(f"Could not stat {parquet_file}: {e}")
 
@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Migration of frames between partition layouts.
+
+Converts a frame between the ``symbol`` and ``clustered`` layouts (see
+``marketpipe.infrastructure.storage.layout``) in place:
+
+    symbol -> clustered:
+        1. For each trading day, read every symbol's rows of that day (day
+           partitions and compacted buckets) and write ``date=D/clustered.parquet``.
+        2. Carry stale markers over as ``date=D/_STALE.<SYMBOL>``.
+        3. Flip the ``_LAYOUT`` marker, then delete the ``symbol=`` directories.
+
+    clustered -> symbol:
+        1. Split each day file into ``symbol=S/date=D/S_D.parquet`` and move
+           part files to ``symbol=S/date=D/<job_id>.parquet``.
+        2. Carry stale markers over as ``symbol=S/date=D/_STALE``.
+        3. Flip the ``_LAYOUT`` marker, then delete the ``date=`` directories.
+
+The frame's compaction lock is held exclusively throughout, so engine readers
+wait for the migration. Writes do not take that lock, so stop ingestion into
+the frame while migrating it. Until the marker flips readers see the old layout; if the
+process dies before that, re-running rewrites the new files, and if it dies
+after, re-running only removes the leftovers of the old layout.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .layout import (
+    CLUSTERED_FILE,
+    LAYOUT_BY_SYMBOL,
+    LAYOUT_CLUSTERED,
+    LAYOUTS,
+    parse_part_name,
+    read_layout_marker,
+    write_layout_marker,
+)
+from .parquet_engine import (
+    EPOCH,
+    NS_PER_DAY,
+    ParquetStorageEngine,
+    StorageProfile,
+    decode_decimal_prices,
+)
+
+
+@dataclass(frozen=True)
+class RelayoutResult:
+    """Outcome of migrating one frame."""
+
+    frame: str
+    source_layout: str
+    target_layout: str
+    days: int
+    files_read: int
+    files_written: int
+    rows: int
+    dry_run: bool = False
+
+
+class LayoutMigrator:
+    """Rewrites frames under a storage root into another partition layout."""
+
+    def __init__(
+        self,
+        root: Union[Path, str],
+        compression: Optional[str] = None,
+        profile: Union[str, StorageProfile, None] = None,
+    ):
+        """Initialize migrator.
+
+        Args:
+            root: Storage root containing ``frame=*`` directories
+            compression: Compression codec for rewritten files (overrides the profile)
+            profile: Storage profile used to encode rewritten files
+        """
+        self._engine = ParquetStorageEngine(root, compression=compression, profile=profile)
+        self._root = Path(root)
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def frames(self) -> list[str]:
+        """Frames stored under the root."""
+        return sorted(d.name[len("frame=") :] for d in self._root.glob("frame=*") if d.is_dir())
+
+    def migrate(self, frame: str, target: str, *, dry_run: bool = False) -> RelayoutResult:
+        """Convert a frame to ``target`` layout.
+
+        Args:
+            frame: Frame to migrate
+            target: ``symbol`` or ``clustered``
+            dry_run: Only count what would be rewritten
+
+        Returns:
+            Result describing the migration (zero counts if already migrated)
+
+        Raises:
+            ValueError: If the target layout is unknown
+            FileNotFoundError: If the frame does not exist
+        """
+        if target not in LAYOUTS:
+            raise ValueError(f"Unknown layout: {target}. Valid layouts: {LAYOUTS}")
+        frame_path = self._engine.frame_path(frame)
+        if not frame_path.is_dir():
+            raise FileNotFoundError(f"Frame does not exist: {frame_path}")
+
+        with self._engine.compaction_lock(frame).write_lock():
+            source = self._engine.frame_layout(frame)
+            if source == target:
+                if not dry_run:
+                    self._remove_leftovers(frame_path, target)
+                return RelayoutResult(frame, source, target, 0, 0, 0, 0, dry_run)
+
+            if target == LAYOUT_CLUSTERED:
+                result = self._to_clustered(frame, frame_path, dry_run)
+            else:
+                result = self._to_symbol(frame, frame_path, dry_run)
+
+            if not dry_run:
+                write_layout_marker(frame_path, target)
+                self._remove_leftovers(frame_path, target)
+
+        verb = "Would migrate" if dry_run else "Migrated"
+        self.log.info(
+            f"{verb} frame={frame} {source} -> {target}: {result.days} days, "
+            f"{result.files_read} files, {result.rows} rows"
+        )
+        return result
+
+    # ----- symbol -> clustered -----
+
+    def _to_clustered(self, frame: str, frame_path: Path, dry_run: bool) -> RelayoutResult:
+        # day -> [(symbol, file, trim to the day?)], plus stale (day, symbol) pairs
+        sources: dict[date, list[tuple[str, Path, bool]]] = defaultdict(list)
+        stale: list[tuple[date, str]] = []
+
+        for symbol_dir in sorted(frame_path.glob("symbol=*")):
+            symbol = symbol_dir.name[len("symbol=") :]
+            for date_dir, first_day, last_day in self._engine._iter_date_dirs(symbol_dir):
+                if first_day == last_day:
+                    if (date_dir / ParquetStorageEngine.STALE_MARKER).exists():
+                        stale.append((first_day, symbol))
+                    for parquet_file in sorted(date_dir.glob("*.parquet")):
+                        sources[first_day].append((symbol, parquet_file, False))
+                    continue
+                # Compacted bucket: contributes to each day it holds rows of
+                for parquet_file in sorted(date_dir.glob("*.parquet")):
+                    for day in self._days_in_file(parquet_file, first_day, last_day):
+                        sources[day].append((symbol, parquet_file, True))
+
+        files_read = len({f for files in sources.values() for _, f, _ in files})
+        if dry_run:
+            days = set(sources) | {day for day, _ in stale}
+            return RelayoutResult(
+                frame, LAYOUT_BY_SYMBOL, LAYOUT_CLUSTERED, len(days), files_read, 0, 0, True
+            )
+
+        rows = 0
+        files_written = 0
+        for day, files in sorted(sources.items()):
+            tables = []
+            for symbol, parquet_file, trim in files:
+                row_filter = self._day_filter(day) if trim else None
+                table = decode_decimal_prices(pq.read_table(parquet_file, filters=row_filter))
+                if "symbol" not in table.column_names:
+                    table = table.append_column("symbol", pa.repeat(symbol, table.num_rows))
+                tables.append(table)
+            table = pa.concat_tables(tables, promote_options="permissive")
+            if table.num_rows == 0:
+                continue
+
+            day_dir = frame_path / f"date={day.isoformat()}"
+            day_dir.mkdir(parents=True, exist_ok=True)
+            self._engine.write_clustered_file(table, day_dir / CLUSTERED_FILE)
+            rows += table.num_rows
+            files_written += 1
+
+        for day, symbol in stale:
+            day_dir = frame_path / f"date={day.isoformat()}"
+            day_dir.mkdir(parents=True, exist_ok=True)
+            (day_dir / self._engine.stale_marker_name(LAYOUT_CLUSTERED, symbol)).touch()
+
+        days = set(sources) | {day for day, _ in stale}
+        return RelayoutResult(
+            frame, LAYOUT_BY_SYMBOL, LAYOUT_CLUSTERED, len(days), files_read, files_written, rows
+        )
+
+    @staticmethod
+    def _days_in_file(parquet_file: Path, first_day: date, last_day: date) -> list[date]:
+        """Trading days a compacted bucket file holds rows of."""
+        ts = pq.read_table(parquet_file, columns=["ts_ns"]).column("ts_ns")
+        epoch_days = pc.unique(pc.divide(ts, NS_PER_DAY)).to_pylist()
+        days = (EPOCH + timedelta(days=d) for d in epoch_days)
+        return sorted(d for d in days if first_day <= d <= last_day)
+
+    @staticmethod
+    def _day_filter(day: date) -> ds.Expression:
+        start = (day - EPOCH).days * NS_PER_DAY
+        return (ds.field("ts_ns") >= start) & (ds.field("ts_ns") < start + NS_PER_DAY)
+
+    # ----- clustered -> symbol -----
+
+    def _to_symbol(self, frame: str, frame_path: Path, dry_run: bool) -> RelayoutResult:
+        rows = 0
+        files_read = 0
+        files_written = 0
+        days = 0
+        stale_prefix = f"{ParquetStorageEngine.STALE_MARKER}."
+
+        for date_dir, day, last_day in self._engine._iter_date_dirs(frame_path):
+            if day != last_day:
+                self.log.warning(f"Skipping unexpected bucket in clustered frame: {date_dir}")
+                continue
+            days += 1
+            clustered_path = date_dir / CLUSTERED_FILE
+            parts = [f for f in sorted(date_dir.glob("*.parquet")) if f != clustered_path]
+            files_read += len(parts) + clustered_path.exists()
+            if dry_run:
+                continue
+
+            if clustered_path.exists():
+                table = decode_decimal_prices(pq.read_table(clustered_path))
+                for symbol in pc.unique(table.column("symbol")).to_pylist():
+                    symbol_rows = table.filter(pc.equal(table.column("symbol"), symbol))
+                    target = self._symbol_day_dir(frame_path, symbol, day)
+                    self._engine.replace_file(
+                        symbol_rows, target / f"{symbol}_{day.isoformat()}.parquet"
+                    )
+                    rows += symbol_rows.num_rows
+                    files_written += 1
+
+            for part in parts:
+                parsed = parse_part_name(part.name)
+                if parsed is None:
+                    self.log.warning(f"Skipping unexpected file in clustered frame: {part}")
+                    continue
+                symbol, job_id = parsed
+                target = self._symbol_day_dir(frame_path, symbol, day)
+                rows += pq.read_metadata(part).num_rows
+                os.replace(part, target / f"{job_id}.parquet")
+                files_written += 1
+
+            for marker in date_dir.glob(f"{stale_prefix}*"):
+                symbol = marker.name[len(stale_prefix) :]
+                target = self._symbol_day_dir(frame_path, symbol, day)
+                (target / ParquetStorageEngine.STALE_MARKER).touch()
+
+        return RelayoutResult(
+            frame,
+            LAYOUT_CLUSTERED,
+            LAYOUT_BY_SYMBOL,
+            days,
+            files_read,
+            files_written,
+            rows,
+            dry_run,
+        )
+
+    @staticmethod
+    def _symbol_day_dir(frame_path: Path, symbol: str, day: date) -> Path:
+        target = frame_path / f"symbol={symbol}" / f"date={day.isoformat()}"
+        target.mkdir(parents=True, exist_ok=True)
+        return target
+
+    # ----- cleanup -----
+
+    def _remove_leftovers(self, frame_path: Path, layout: str) -> None:
+        """Delete directories of the layout a frame no longer uses."""
+        if read_layout_marker(frame_path) != layout:
+            return
+        stale_pattern = "date=*" if layout == LAYOUT_BY_SYMBOL else "symbol=*"
+        for leftover in frame_path.glob(stale_pattern):
+            if leftover.is_dir():
+                shutil.rmtree(leftover)
+                self.log.debug(f"Removed {leftover}")
@@ -0,0 +1,227 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Background writer for Parquet partitions.
+
+Encoding and writing a Parquet file is CPU and disk bound and blocks for
+milliseconds to seconds. ``ParquetStorageEngine.store_bars`` runs on the
+ingestion event loop, so it hands finished Arrow tables to this writer instead
+of writing them inline:
+
+    store_bars ──submit()──▶ bounded queue ──▶ N writer threads ──▶ write_table()
+        ▲                                                               │
+        └──────────────── awaitable future (Path) ◀─────────────────────┘
+
+The queue is bounded: once ``max_pending`` writes are waiting, ``write_async``
+waits (off the event loop) for space, so a slow disk slows fetching down
+instead of buffering unbounded data in memory. Arrow releases the GIL while
+encoding, so writer threads run in parallel with each other and with the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+import pyarrow as pa
+from prometheus_client import Gauge
+
+from marketpipe.metrics_debug import watch
+
+if TYPE_CHECKING:
+    from .parquet_engine import ParquetStorageEngine
+
+WRITE_QUEUE_DEPTH = Gauge(
+    "mp_storage_write_queue_depth",
+    "Parquet writes waiting for a writer thread",
+    multiprocess_mode="livesum",
+)
+
+
+@dataclass(frozen=True)
+class WriteRequest:
+    """One partition file to write."""
+
+    table: pa.Table
+    frame: str
+    symbol: str
+    trading_day: date
+    job_id: str
+    overwrite: bool = False
+    future: Future = field(default_factory=Future, compare=False)
+
+
+class ParquetBatchWriter:
+    """Bounded queue of partition writes drained by a pool of writer threads."""
+
+    def __init__(
+        self,
+        engine: ParquetStorageEngine,
+        workers: int = 4,
+        max_pending: int = 64,
+    ):
+        """Initialize the writer.
+
+        Args:
+            engine: Storage engine performing the writes
+            workers: Number of writer threads
+            max_pending: Maximum queued writes before submitters wait
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self._engine = engine
+        self._queue: queue.Queue[Optional[WriteRequest]] = queue.Queue(maxsize=max_pending)
+        self._threads: list[threading.Thread] = []
+        self._workers = workers
+        self._start_lock = threading.Lock()
+        self._closed = False
+        watch(self)
+
+    @property
+    def pending(self) -> int:
+        """Number of writes waiting in the queue."""
+        return self._queue.qsize()
+
+    def debug_state(self) -> dict[str, Any]:
+        """Queue state reported on the metrics server's ``/debug/state``."""
+        return {
+            "kind": "parquet_writer",
+            "workers": self._workers,
+            "threads_started": len(self._threads),
+            "pending": self.pending,
+            "max_pending": self._queue.maxsize,
+        }
+
+    def submit(
+        self,
+        table: pa.Table,
+        *,
+        frame: str,
+        symbol: str,
+        trading_day: date,
+        job_id: str,
+        overwrite: bool = False,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Queue a write and return a future resolving to the written path.
+
+        Args:
+            table: Arrow table to write
+            frame: Timeframe identifier
+            symbol: Stock symbol
+            trading_day: Trading date for partitioning
+            job_id: Job identifier (file name)
+            overwrite: Whether to replace an existing file
+            block: Wait for queue space instead of raising ``queue.Full``
+            timeout: Maximum seconds to wait for queue space
+
+        Returns:
+            ``concurrent.futures.Future`` resolving to the file path, or
+            raising the write error
+
+        Raises:
+            RuntimeError: If the writer has been closed
+            queue.Full: If the queue is full and ``block`` is False (or the
+                timeout expired)
+        """
+        if self._closed:
+            raise RuntimeError("ParquetBatchWriter is closed")
+        self._ensure_started()
+
+        request = WriteRequest(table, frame, symbol, trading_day, job_id, overwrite)
+        self._queue.put(request, block=block, timeout=timeout)
+        WRITE_QUEUE_DEPTH.set(self._queue.qsize())
+        return request.future
+
+    async def write_async(
+        self,
+        table: pa.Table,
+        *,
+        frame: str,
+        symbol: str,
+        trading_day: date,
+        job_id: str,
+        overwrite: bool = False,
+    ) -> Path:
+        """Queue a write and await its completion without blocking the event loop.
+
+        Returns:
+            Path to the written Parquet file
+        """
+        submit = functools.partial(
+            self.submit,
+            table,
+            frame=frame,
+            symbol=symbol,
+            trading_day=trading_day,
+            job_id=job_id,
+            overwrite=overwrite,
+        )
+        try:
+            future = submit(block=False)
+        except queue.Full:
+            # Backpressure: wait for space on a helper thread, not on the loop
+            future = await asyncio.to_thread(submit, block=True)
+        return await asyncio.wrap_future(future)
+
+    def flush(self) -> None:
+        """Block until every queued write has finished."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Finish queued writes and stop the writer threads."""
+        with self._start_lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads, self._threads = self._threads, []
+
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            for i in range(self._workers):
+                thread = threading.Thread(target=self._run, name=f"parquet-writer-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self) -> None:
+        while True:
+            request = self._queue.get()
+            try:
+                if request is None:
+                    return
+                WRITE_QUEUE_DEPTH.set(self._queue.qsize())
+                if not request.future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    path = self._engine.write_table(
+                        request.table,
+                        frame=request.frame,
+                        symbol=request.symbol,
+                        trading_day=request.trading_day,
+                        job_id=request.job_id,
+                        overwrite=request.overwrite,
+                    )
+                except BaseException as e:
+                    request.future.set_exception(e)
+                else:
+                    request.future.set_result(path)
+            finally:
+                self._queue.task_done()
@@ -4,13 +4,15 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 from marketpipe.domain.events import IEventPublisher
-from marketpipe.domain.value_objects import Symbol
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp
+from marketpipe.tracing import span
 
-from ..domain.entities import IngestionJob, IngestionJobId
+from ..domain.entities import IngestionJob, IngestionJobId, ProcessingState
 from ..domain.repositories import (
     IIngestionCheckpointRepository,
     IIngestionJobRepository,
@@ -262,6 +264,9 @@ class IngestionCoordinatorService:
         data_validator,  # From validation context
         data_storage: IDataStorage,  # From storage context
         event_publisher: IEventPublisher,
+        symbol_pipeline=None,  # Optional per-symbol validation/aggregation hand-off
+        symbol_executor=None,  # Optional process pool running symbols outside this process
+        memory_budget=None,  # Optional MemoryBudget bounding the bars in flight
     ):
         self._job_service = job_service
         self._job_repository = job_repository
@@ -271,6 +276,19 @@ class IngestionCoordinatorService:
         self._data_validator = data_validator
         self._data_storage = data_storage
         self._event_publisher = event_publisher
+        self._symbol_pipeline = symbol_pipeline
+        self._symbol_executor = symbol_executor
+        self._memory_budget = memory_budget
+        self._domain_service = IngestionDomainService()
+
+    def close(self) -> None:
+        """Release the data storage's background resources (its writer threads).
+
+        Called by whoever built the coordinator once it has no more jobs to run.
+        """
+        close = getattr(self._data_storage, "close", None)
+        if callable(close):
+            close()
 
     async def execute_job(self, job_id: IngestionJobId) -> dict[str, Any]:
         """
@@ -282,14 +300,26 @@ class IngestionCoordinatorService:
         3. Handle checkpointing and recovery
         4. Collect metrics
         5. Complete or fail the job
+
+        With a symbol pipeline attached, each symbol is validated and
+        aggregated as soon as it is stored, and this waits for those stages
+        before returning. With a symbol executor (``SymbolProcessPool``) the
+        symbols are ingested in worker processes and recorded here as each
+        one finishes. With a memory budget, symbols wait for room in it
+        before fetching, so a large job holds a bounded amount of bars.
+
+        Jobs already IN_PROGRESS (claimed by a worker through
+        ``fetch_and_lock``, or reclaimed after another worker's lease
+        expired) are executed without being started again.
         """
         # Get the job
         job = await self._job_repository.get_by_id(job_id)
         if not job:
             raise IngestionJobNotFoundError(job_id)
 
-        # Start the job
-        await self._job_service.start_job(StartJobCommand(job_id))
+        # Start the job unless a worker already claimed it
+        if job.state != ProcessingState.IN_PROGRESS:
+            await self._job_service.start_job(StartJobCommand(job_id))
 
         # Reload the job to get the updated state
         job = await self._job_repository.get_by_id(job_id)
@@ -310,138 +340,182 @@ class IngestionCoordinatorService:
             feed = getattr(self._market_data_provider, "_feed_type", feed)
             provider = "alpaca"  # Most common case
 
-        start_time = datetime.now(timezone.utc)
-        processed_symbols = 0
-        failed_symbols = 0
-        total_bars = 0
-
-        try:
-            # Process symbols in parallel using asyncio.gather
-            symbols_list = list(job.symbols)
-            tasks = [self._process_symbol(job, symbol) for symbol in symbols_list]
-
-            # Execute all tasks concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            for i, result in enumerate(results):
-                symbol = symbols_list[i]
-
-                if isinstance(result, Exception):
-                    # Log error and continue with other symbols
-                    failed_symbols += 1
-                    print(f"Failed to process symbol {symbol}: {result}")
-                    # Record symbol-level failure metrics
-                    from marketpipe.metrics import record_metric
-
-                    record_metric("ingest_symbol_failures", 1, provider=provider, feed=feed)
-                    record_metric(
-                        f"ingest_failures_{symbol.value}", 1, provider=provider, feed=feed
-                    )
-                else:
-                    try:
-                        from typing import cast
-
-                        bars_count, partition = cast(tuple[int, IngestionPartition], result)
-
-                        # Mark symbol as processed in the job
-                        job = await self._job_repository.get_by_id(job_id)  # Refresh job state
-                        if job is None:
-                            raise IngestionJobNotFoundError(job_id)
-                        job.mark_symbol_processed(symbol, bars_count, partition)
-                        await self._job_repository.save(job)
-
-                        # Update metrics
-                        processed_symbols += 1
-                        total_bars += bars_count
-
-                        # Record success metrics
-                        from marketpipe.metrics import record_metric
+        # Metric handles of the per-symbol loop, resolved once per job
+        from marketpipe.metrics import metric_handle, symbol_summary
 
-                        record_metric("ingest_symbols_success", 1, provider=provider, feed=feed)
-                        record_metric(
-                            "ingest_rows_processed", bars_count, provider=provider, feed=feed
-                        )
-                        record_metric(
-                            f"ingest_success_{symbol.value}", 1, provider=provider, feed=feed
-                        )
-
-                        # Publish events
-                        for event in job.domain_events:
-                            await self._event_publisher.publish(event)
+        symbol_failures = metric_handle("ingest_symbol_failures", provider=provider, feed=feed)
+        symbols_success = metric_handle("ingest_symbols_success", provider=provider, feed=feed)
+        rows_processed = metric_handle("ingest_rows_processed", provider=provider, feed=feed)
+        failures_by_symbol = symbol_summary("ingest_failures")
+        success_by_symbol = symbol_summary("ingest_success")
 
-                        # Clear events after publishing
-                        job.clear_domain_events()
+        with span("job", job_id=str(job_id), provider=provider):
+            start_time = datetime.now(timezone.utc)
+            processed_symbols = 0
+            failed_symbols = 0
+            total_bars = 0
 
-                    except Exception as e:
-                        # Log error
+            try:
+                # Process results as symbols finish
+                async for symbol, result in self._symbol_results(job):
+                    if isinstance(result, Exception):
+                        # Log error and continue with other symbols
                         failed_symbols += 1
-                        print(f"Failed to process result for symbol {symbol}: {e}")
-                        # Record metrics
-                        from marketpipe.metrics import record_metric
-
-                        record_metric("ingest_symbol_failures", 1, provider=provider, feed=feed)
-
-            # Job should auto-complete when all symbols are processed
-            # Calculate and save final metrics
-            end_time = datetime.now(timezone.utc)
-            processing_time = (end_time - start_time).total_seconds()
+                        print(f"Failed to process symbol {symbol}: {result}")
+                        # Record symbol-level failure metrics
+                        symbol_failures.record(1)
+                        failures_by_symbol.record(symbol.value)
+                    else:
+                        try:
+                            from typing import cast
+
+                            bars_count, partition = cast(
+                                tuple[int, Optional[IngestionPartition]], result
+                            )
+
+                            # Mark symbol as processed in the job
+                            with span("bookkeeping", symbol=symbol.value):
+                                job = await self._job_repository.get_by_id(job_id)
+                                if job is None:
+                                    raise IngestionJobNotFoundError(job_id)
+                                job.mark_symbol_processed(symbol, bars_count, partition)
+                                await self._job_repository.save(job)
+
+                            # Update metrics
+                            processed_symbols += 1
+                            total_bars += bars_count
+
+                            # Record success metrics
+                            symbols_success.record(1)
+                            rows_processed.record(bars_count)
+                            success_by_symbol.record(symbol.value)
+
+                            # Publish events
+                            for event in job.domain_events:
+                                await self._event_publisher.publish(event)
+
+                            # Clear events after publishing
+                            job.clear_domain_events()
+
+                        except Exception as e:
+                            # Log error
+                            failed_symbols += 1
+                            print(f"Failed to process result for symbol {symbol}: {e}")
+                            # Record metrics
+                            symbol_failures.record(1)
+
+                # Wait for the pipelined stages so aggregates are queryable on return
+                pipeline_summary = None
+                if self._symbol_pipeline is not None:
+                    with span("pipeline_drain"):
+                        pipeline_summary = await asyncio.to_thread(
+                            self._symbol_pipeline.finish, str(job_id)
+                        )
 
-            # Record job-level metrics
-            from marketpipe.metrics import record_metric
+                # Job should auto-complete when all symbols are processed
+                # Calculate and save final metrics
+                end_time = datetime.now(timezone.utc)
+                processing_time = (end_time - start_time).total_seconds()
 
-            record_metric(
-                "ingest_job_duration_seconds", processing_time, provider=provider, feed=feed
-            )
-            record_metric("ingest_job_total_bars", total_bars, provider=provider, feed=feed)
+                # Record job-level metrics
+                from marketpipe.metrics import record_metric
 
-            # Record success/failure metrics
-            if failed_symbols == 0:
-                record_metric("ingest_job_success", 1, provider=provider, feed=feed)
-            else:
-                # Partial success - record mixed results
-                record_metric("ingest_job_partial_success", 1, provider=provider, feed=feed)
                 record_metric(
-                    "ingest_job_failed_symbols", failed_symbols, provider=provider, feed=feed
+                    "ingest_job_duration_seconds", processing_time, provider=provider, feed=feed
                 )
+                record_metric("ingest_job_total_bars", total_bars, provider=provider, feed=feed)
 
-            return {
-                "job_id": str(job_id),
-                "symbols_processed": processed_symbols,
-                "symbols_failed": failed_symbols,
-                "total_bars": total_bars,
-                "processing_time_seconds": processing_time,
-                "status": "completed" if failed_symbols == 0 else "partial_success",
-            }
-
-        except Exception as e:
-            # Only fail the job if it's still in progress
-            # If it's already completed, don't try to fail it
-            try:
-                job = await self._job_repository.get_by_id(job_id)
-                if job and job.can_fail:
-                    await self._job_service.fail_job(FailJobCommand(job_id, str(e)))
+                # Record success/failure metrics
+                if failed_symbols == 0:
+                    record_metric("ingest_job_success", 1, provider=provider, feed=feed)
                 else:
-                    # Job is already completed/failed, just log the error
-                    print(f"Warning: Error occurred after job completion: {e}")
-            except Exception as inner_e:
-                print(f"Warning: Could not update job status after error: {inner_e}")
-
-            # Record failure metrics
-            from marketpipe.metrics import record_metric
-
-            record_metric("ingest_job_failures", 1, provider=provider, feed=feed)
-            if job and job.symbols:
-                for symbol in job.symbols:
+                    # Partial success - record mixed results
+                    record_metric("ingest_job_partial_success", 1, provider=provider, feed=feed)
                     record_metric(
-                        f"ingest_failures_{symbol.value}", 1, provider=provider, feed=feed
+                        "ingest_job_failed_symbols", failed_symbols, provider=provider, feed=feed
                     )
 
-            raise
+                summary = {
+                    "job_id": str(job_id),
+                    "symbols_processed": processed_symbols,
+                    "symbols_failed": failed_symbols,
+                    "total_bars": total_bars,
+                    "processing_time_seconds": processing_time,
+                    "status": "completed" if failed_symbols == 0 else "partial_success",
+                }
+                if pipeline_summary is not None:
+                    summary["pipeline"] = pipeline_summary
+                return summary
+
+            except Exception as e:
+                # Only fail the job if it's still in progress
+                # If it's already completed, don't try to fail it
+                try:
+                    job = await self._job_repository.get_by_id(job_id)
+                    if job and job.can_fail:
+                        await self._job_service.fail_job(FailJobCommand(job_id, str(e)))
+                    else:
+                        # Job is already completed/failed, just log the error
+                        print(f"Warning: Error occurred after job completion: {e}")
+                except Exception as inner_e:
+                    print(f"Warning: Could not update job status after error: {inner_e}")
+
+                # Record failure metrics
+                from marketpipe.metrics import record_metric
+
+                record_metric("ingest_job_failures", 1, provider=provider, feed=feed)
+                if job and job.symbols:
+                    for symbol in job.symbols:
+                        failures_by_symbol.record(symbol.value)
+
+                raise
+
+    async def _symbol_results(self, job: IngestionJob) -> AsyncIterator[tuple[Symbol, Any]]:
+        """Yield ``(symbol, result or exception)`` for every symbol of a job."""
+        symbols_list = list(job.symbols)
+        if self._symbol_executor is not None:
+            async for item in self._symbol_executor.process(job, symbols_list):
+                yield item
+            return
+
+        # Process symbols in parallel using asyncio.gather
+        tasks = [self._process_symbol_within_budget(job, symbol) for symbol in symbols_list]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for symbol, result in zip(symbols_list, results):
+            yield symbol, result
+
+    async def process_symbol(
+        self, job: IngestionJob, symbol: Symbol
+    ) -> tuple[int, Optional[IngestionPartition]]:
+        """Fetch, validate and store one symbol of a job without recording it on the job.
 
-    async def _process_symbol(
+        Used by ``SymbolProcessPool`` worker processes; the coordinator of the
+        parent process records the result.
+        """
+        return await self._process_symbol_within_budget(job, symbol)
+
+    async def _process_symbol_within_budget(
         self, job: IngestionJob, symbol: Symbol
-    ) -> tuple[int, IngestionPartition]:
+    ) -> tuple[int, Optional[IngestionPartition]]:
+        """``_process_symbol`` once the memory budget has room for the symbol's bars."""
+        if self._memory_budget is None:
+            return await self._process_symbol(job, symbol)
+
+        estimate = self._memory_budget.estimate_bytes(
+            int(job.time_range.start.value.timestamp() * 1_000_000_000),
+            int(job.time_range.end.value.timestamp() * 1_000_000_000),
+            job.configuration.timeframe,
+        )
+        with span("memory_budget_wait", symbol=symbol.value):
+            reservation = await self._memory_budget.reserve(estimate)
+        try:
+            return await self._process_symbol(job, symbol, reservation)
+        finally:
+            reservation.release()
+
+    async def _process_symbol(
+        self, job: IngestionJob, symbol: Symbol, reservation=None
+    ) -> tuple[int, Optional[IngestionPartition]]:
         """
         Process a single symbol.
 
@@ -467,88 +541,165 @@ class IngestionCoordinatorService:
             feed = getattr(self._market_data_provider, "_feed_type", feed)
             provider = "alpaca"  # Most common case
 
-        # Check for existing checkpoint
-        checkpoint = await self._checkpoint_repository.get_checkpoint(job.job_id, symbol)
-
-        # Determine start point for data fetching
-        # Use checkpoint if available AND valid, otherwise use job's time range start
-        job_start_ns = int(job.time_range.start.value.timestamp() * 1_000_000_000)
-        job_end_ns = int(job.time_range.end.value.timestamp() * 1_000_000_000)
-
-        if checkpoint:
-            # Validate checkpoint is within the job's time range
-            if checkpoint.last_processed_timestamp < job_start_ns:
-                # Checkpoint is before job start - ignore it (stale from old job)
-                start_timestamp = job_start_ns
-            elif checkpoint.last_processed_timestamp >= job_end_ns:
-                # Checkpoint is at or after job end - ignore it (already complete or invalid)
-                start_timestamp = job_start_ns
+        with span("symbol", symbol=symbol.value):
+            # Check for existing checkpoint
+            with span("checkpoint"):
+                checkpoint = await self._checkpoint_repository.get_checkpoint(job.job_id, symbol)
+
+            # Determine start point for data fetching
+            # Use checkpoint if available AND valid, otherwise use job's time range start
+            job_start_ns = int(job.time_range.start.value.timestamp() * 1_000_000_000)
+            job_end_ns = int(job.time_range.end.value.timestamp() * 1_000_000_000)
+
+            if checkpoint:
+                # Validate checkpoint is within the job's time range
+                if checkpoint.last_processed_timestamp < job_start_ns:
+                    # Checkpoint is before job start - ignore it (stale from old job)
+                    start_timestamp = job_start_ns
+                elif checkpoint.last_processed_timestamp >= job_end_ns:
+                    # Checkpoint is at or after job end - ignore it (already complete or invalid)
+                    start_timestamp = job_start_ns
+                else:
+                    # Valid checkpoint - resume from where we left off
+                    start_timestamp = checkpoint.last_processed_timestamp
             else:
-                # Valid checkpoint - resume from where we left off
-                start_timestamp = checkpoint.last_processed_timestamp
-        else:
-            # No checkpoint - start from beginning
-            start_timestamp = job_start_ns
-
-        # Fetch data from market data provider (anti-corruption layer)
-        bars = await self._market_data_provider.fetch_bars(
-            symbol=symbol,
-            start_timestamp=start_timestamp,
-            end_timestamp=job_end_ns,
-            batch_size=job.configuration.batch_size,
-            timeframe=job.configuration.timeframe,
-        )
+                # No checkpoint - start from beginning
+                start_timestamp = job_start_ns
 
-        if not bars:
-            # No data to process
-            return 0, IngestionPartition(
-                symbol=symbol,
-                file_path=job.configuration.output_path / f"{symbol.value}_empty.parquet",
-                record_count=0,
-                file_size_bytes=0,
-                created_at=datetime.now(timezone.utc),
-            )
+            # In incremental mode only fetch the days storage does not already hold
+            fetch_ranges = [(start_timestamp, job_end_ns)]
+            if getattr(job.configuration, "incremental", False):
+                fetch_ranges = await self._plan_incremental_fetch(
+                    job, symbol, start_timestamp, job_end_ns
+                )
+                if not fetch_ranges:
+                    # Already stored: nothing written, so no partition
+                    return 0, None
+
+            # Fetch data from market data provider (anti-corruption layer)
+            bars = []
+            with span("fetch", ranges=len(fetch_ranges)):
+                for range_start, range_end in fetch_ranges:
+                    bars.extend(
+                        await self._market_data_provider.fetch_bars(
+                            symbol=symbol,
+                            start_timestamp=range_start,
+                            end_timestamp=range_end,
+                            batch_size=job.configuration.batch_size,
+                            timeframe=job.configuration.timeframe,
+                        )
+                    )
+            if reservation is not None:
+                # Account for what was fetched rather than the estimate
+                reservation.resize(self._memory_budget.bars_bytes(bars))
+
+            if not bars:
+                # No data to process
+                return 0, IngestionPartition(
+                    symbol=symbol,
+                    file_path=job.configuration.output_path / f"{symbol.value}_empty.parquet",
+                    record_count=0,
+                    file_size_bytes=0,
+                    created_at=datetime.now(timezone.utc),
+                )
 
-        # Validate data using validation context
-        validation_result = await self._data_validator.validate_bars(bars)
-        if not validation_result.is_valid:
-            # Record validation failure metrics but continue with valid data
-            from marketpipe.metrics import record_metric
+            # Validate data using validation context
+            with span("validate", bars=len(bars)):
+                validation_result = await self._data_validator.validate_bars(bars)
+            if not validation_result.is_valid:
+                # Record validation failure metrics but continue with valid data
+                from marketpipe.metrics import record_metric, record_symbol_metric
 
-            record_metric(
-                "validation_failures", len(validation_result.errors), provider=provider, feed=feed
-            )
-            record_metric(
-                f"validation_failures_{symbol.value}",
-                len(validation_result.errors),
-                provider=provider,
-                feed=feed,
-            )
+                record_metric(
+                    "validation_failures",
+                    len(validation_result.errors),
+                    provider=provider,
+                    feed=feed,
+                )
+                record_symbol_metric(
+                    "validation_failures", symbol.value, len(validation_result.errors)
+                )
 
-            # Use only valid bars if any exist
-            bars = validation_result.valid_bars
+                # Use only valid bars if any exist
+                bars = validation_result.valid_bars
+
+            if not bars:
+                # No valid bars after validation
+                return 0, IngestionPartition(
+                    symbol=symbol,
+                    file_path=job.configuration.output_path
+                    / f"{symbol.value}_no_valid_data.parquet",
+                    record_count=0,
+                    file_size_bytes=0,
+                    created_at=datetime.now(timezone.utc),
+                )
+
+            # Store data using storage context
+            with span("store", bars=len(bars)):
+                partition = await self._data_storage.store_bars(bars, job.configuration)
 
-        if not bars:
-            # No valid bars after validation
-            return 0, IngestionPartition(
+            # Update checkpoint
+            latest_timestamp = max(bar.timestamp_ns for bar in bars)
+            new_checkpoint = IngestionCheckpoint(
                 symbol=symbol,
-                file_path=job.configuration.output_path / f"{symbol.value}_no_valid_data.parquet",
-                record_count=0,
-                file_size_bytes=0,
-                created_at=datetime.now(timezone.utc),
+                last_processed_timestamp=latest_timestamp,
+                records_processed=len(bars),
+                updated_at=datetime.now(timezone.utc),
             )
+            with span("checkpoint"):
+                await self._checkpoint_repository.save_checkpoint(job.job_id, new_checkpoint)
+
+            # Hand the stored bars straight to per-symbol validation and aggregation
+            if self._symbol_pipeline is not None:
+                try:
+                    await self._symbol_pipeline.submit_async(str(job.job_id), symbol.value, bars)
+                except Exception as e:
+                    # The bars are stored; `aggregate-ohlcv` can still catch up
+                    print(f"Failed to pipeline symbol {symbol}: {e}")
+
+            return len(bars), partition
+
+    async def _plan_incremental_fetch(
+        self, job: IngestionJob, symbol: Symbol, start_ns: int, end_ns: int
+    ) -> list[tuple[int, int]]:
+        """
+        Compute the nanosecond ranges still missing from storage for a symbol.
 
-        # Store data using storage context
-        partition = await self._data_storage.store_bars(bars, job.configuration)
+        Falls back to the full range when the storage backend cannot report
+        coverage.
+        """
+        if not hasattr(self._data_storage, "get_coverage"):
+            return [(start_ns, end_ns)]
 
-        # Update checkpoint
-        latest_timestamp = max(bar.timestamp_ns for bar in bars)
-        new_checkpoint = IngestionCheckpoint(
-            symbol=symbol,
-            last_processed_timestamp=latest_timestamp,
-            records_processed=len(bars),
-            updated_at=datetime.now(timezone.utc),
+        time_range = TimeRange(
+            Timestamp(datetime.fromtimestamp(start_ns / 1_000_000_000, tz=timezone.utc)),
+            Timestamp(datetime.fromtimestamp(end_ns / 1_000_000_000, tz=timezone.utc)),
         )
-        await self._checkpoint_repository.save_checkpoint(job.job_id, new_checkpoint)
+        coverage = await self._data_storage.get_coverage(
+            symbol.value,
+            job.configuration.timeframe,
+            time_range.start.value.date(),
+            time_range.end.value.date(),
+        )
+        frame_seconds = job.configuration.frame_seconds
+        ranges = self._domain_service.plan_incremental_ranges(
+            time_range, coverage, frame_seconds=frame_seconds
+        )
+
+        fetch_ranges = [
+            (
+                max(start_ns, int(r.start.value.timestamp() * 1_000_000_000)),
+                min(end_ns, int(r.end.value.timestamp() * 1_000_000_000)),
+            )
+            for r in ranges
+        ]
+
+        skipped_days = len(
+            self._domain_service.covered_days(time_range, coverage, frame_seconds=frame_seconds)
+        )
+        if skipped_days:
+            from marketpipe.metrics import INCREMENTAL_SKIPPED_DAYS
+
+            INCREMENTAL_SKIPPED_DAYS.inc(skipped_days)
 
-        return len(bars), partition
+        return fetch_ranges
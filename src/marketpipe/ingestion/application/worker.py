@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Lease-based ingestion job worker.
+
+Any number of workers, on one or many hosts, can share a job store. Each
+worker claims PENDING jobs through the repository's ``fetch_and_lock``
+(``FOR UPDATE SKIP LOCKED`` on PostgreSQL, a ``BEGIN IMMEDIATE`` transaction
+on SQLite), which marks them IN_PROGRESS under a lease owned by the worker:
+
+    claim ──▶ run job ──────────────────────────▶ release lease
+      │          ▲ heartbeat: renew every lease/3
+      │          └ lease lost (reclaimed elsewhere) ─▶ cancel job
+      └ also claims IN_PROGRESS jobs whose lease expired (crashed workers)
+
+At most ``concurrency`` jobs run at once per worker. On shutdown, jobs still
+running are cancelled and returned to PENDING so other workers pick them up
+immediately instead of waiting for the lease to expire; ingestion
+checkpoints make the re-run skip what was already stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from prometheus_client import Counter, Gauge
+
+from ..domain.entities import IngestionJob, IngestionJobId, ProcessingState
+
+WORKER_JOBS = Counter(
+    "mp_worker_jobs_total",
+    "Ingestion jobs finished by workers",
+    ["outcome"],  # completed, failed, lost, requeued
+)
+WORKER_ACTIVE_JOBS = Gauge(
+    "mp_worker_active_jobs", "Ingestion jobs running in this worker", multiprocess_mode="livesum"
+)
+
+
+def default_worker_id() -> str:
+    """Identifier unique to this worker process: ``<host>:<pid>:<random>``."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+@dataclass(frozen=True)
+class WorkerSettings:
+    """Settings of an ingestion worker.
+
+    Attributes:
+        concurrency: Jobs run at the same time
+        lease_seconds: Lease taken on a claimed job; renewed every third of it
+        poll_interval: Seconds between claims while the queue is empty
+        worker_id: Lease owner name (default: host, pid and a random suffix)
+    """
+
+    concurrency: int = 1
+    lease_seconds: float = 60.0
+    poll_interval: float = 5.0
+    worker_id: str = field(default_factory=default_worker_id)
+
+    def __post_init__(self):
+        """Validate settings."""
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if self.lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        if self.poll_interval <= 0:
+            raise ValueError("poll_interval must be positive")
+
+    @property
+    def heartbeat_interval(self) -> float:
+        """Seconds between lease renewals."""
+        return self.lease_seconds / 3
+
+    @classmethod
+    def from_env(cls) -> WorkerSettings:
+        """Read ``MARKETPIPE_WORKER_{CONCURRENCY,LEASE_SECONDS,POLL_SECONDS}``."""
+        defaults = cls(worker_id="")
+        return cls(
+            concurrency=int(os.environ.get("MARKETPIPE_WORKER_CONCURRENCY", defaults.concurrency)),
+            lease_seconds=float(
+                os.environ.get("MARKETPIPE_WORKER_LEASE_SECONDS", defaults.lease_seconds)
+            ),
+            poll_interval=float(
+                os.environ.get("MARKETPIPE_WORKER_POLL_SECONDS", defaults.poll_interval)
+            ),
+        )
+
+
+JobRunner = Callable[[IngestionJob], Coroutine[Any, Any, Any]]
+
+
+class IngestionWorker:
+    """Claims ingestion jobs from a shared store and runs them under a lease."""
+
+    def __init__(self, repository, run_job: JobRunner, settings: Optional[WorkerSettings] = None):
+        """Initialize the worker.
+
+        Args:
+            repository: Job repository with ``fetch_and_lock``, ``renew_leases``
+                and ``release_leases``
+            run_job: Coroutine function executing one claimed job, e.g.
+                ``lambda job: coordinator.execute_job(job.job_id)``
+            settings: Worker settings (default: ``$MARKETPIPE_WORKER_*``)
+        """
+        self._repository = repository
+        self._run_job = run_job
+        self.settings = settings or WorkerSettings.from_env()
+        self._active: dict[IngestionJobId, asyncio.Task] = {}
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def worker_id(self) -> str:
+        return self.settings.worker_id
+
+    @property
+    def active_jobs(self) -> list[IngestionJobId]:
+        """Jobs currently running in this worker."""
+        return list(self._active)
+
+    async def run(self, stop: Optional[asyncio.Event] = None, until_idle: bool = False) -> int:
+        """Claim and run jobs until stopped.
+
+        Args:
+            stop: Event ending the loop once set (default: run forever)
+            until_idle: Return once no job is running and none can be claimed
+
+        Returns:
+            Number of jobs that completed
+        """
+        stop = stop or asyncio.Event()
+        completed = 0
+        heartbeat = asyncio.create_task(self._heartbeat(stop))
+        self.log.info(
+            f"Worker {self.worker_id} started (concurrency {self.settings.concurrency}, "
+            f"lease {self.settings.lease_seconds:g}s)"
+        )
+        try:
+            while not stop.is_set():
+                claimed = await self._claim()
+                if not claimed and not self._active and until_idle:
+                    break
+
+                # Sleep until a job finishes, the poll interval passes or we are stopped
+                stopped = asyncio.create_task(stop.wait())
+                await asyncio.wait(
+                    [stopped, *self._active.values()],
+                    timeout=self.settings.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                stopped.cancel()
+                completed += await self._reap()
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            await self._requeue_active()
+            self.log.info(f"Worker {self.worker_id} stopped after {completed} completed jobs")
+        return completed
+
+    async def _claim(self) -> int:
+        free = self.settings.concurrency - len(self._active)
+        if free <= 0:
+            return 0
+        jobs = await self._repository.fetch_and_lock(
+            ProcessingState.PENDING,
+            free,
+            worker_id=self.worker_id,
+            lease_seconds=self.settings.lease_seconds,
+        )
+        claimed = 0
+        for job in jobs:
+            if job.job_id in self._active:
+                # Our own lease expired (late heartbeat) and we reclaimed the job: keep running it
+                continue
+            self.log.info(f"Worker {self.worker_id} claimed job {job.job_id}")
+            self._active[job.job_id] = asyncio.create_task(
+                self._run_job(job), name=f"ingest-{job.job_id}"
+            )
+            claimed += 1
+        WORKER_ACTIVE_JOBS.set(len(self._active))
+        return claimed
+
+    async def _reap(self) -> int:
+        """Collect finished jobs; returns how many completed successfully."""
+        completed = 0
+        finished = [job_id for job_id, task in self._active.items() if task.done()]
+        for job_id in finished:
+            task = self._active.pop(job_id)
+            if task.cancelled():
+                outcome = "lost"
+            elif task.exception() is not None:
+                outcome = "failed"
+                self.log.error(f"Job {job_id} failed: {task.exception()}")
+            else:
+                outcome = "completed"
+                completed += 1
+            WORKER_JOBS.labels(outcome=outcome).inc()
+        WORKER_ACTIVE_JOBS.set(len(self._active))
+        if finished:
+            # Finished jobs no longer need a lease (their state is final or reclaimed)
+            await self._release(finished, requeue=False)
+        return completed
+
+    async def _heartbeat(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            await asyncio.sleep(self.settings.heartbeat_interval)
+            running = [job_id for job_id, task in self._active.items() if not task.done()]
+            if not running:
+                continue
+            try:
+                renewed = set(
+                    await self._repository.renew_leases(
+                        self.worker_id, running, self.settings.lease_seconds
+                    )
+                )
+            except Exception as e:
+                # Keep running: the lease outlives a few missed heartbeats
+                self.log.warning(f"Worker {self.worker_id} could not renew leases: {e}")
+                continue
+            for job_id in running:
+                if job_id not in renewed and job_id in self._active:
+                    self.log.warning(f"Lease on job {job_id} lost; cancelling it")
+                    self._active[job_id].cancel()
+
+    async def _release(self, job_ids: list[IngestionJobId], requeue: bool) -> None:
+        try:
+            await self._repository.release_leases(self.worker_id, job_ids, requeue=requeue)
+        except Exception as e:
+            self.log.warning(f"Worker {self.worker_id} could not release leases: {e}")
+
+    async def _requeue_active(self) -> None:
+        if not self._active:
+            return
+        job_ids = list(self._active)
+        for task in self._active.values():
+            task.cancel()
+        await asyncio.gather(*self._active.values(), return_exceptions=True)
+        self._active.clear()
+        WORKER_ACTIVE_JOBS.set(0)
+        WORKER_JOBS.labels(outcome="requeued").inc(len(job_ids))
+        await self._release(job_ids, requeue=True)
+        self.log.info(f"Worker {self.worker_id} returned {len(job_ids)} running jobs to the queue")
+
+
+__all__ = ["IngestionWorker", "WorkerSettings", "default_worker_id"]
@@ -7,8 +7,14 @@ from .entities import IngestionJob, IngestionJobId, ProcessingState
 from .events import IngestionBatchProcessed, IngestionJobCompleted, IngestionJobStarted
 from .repositories import IIngestionCheckpointRepository, IIngestionJobRepository
 from .services import IngestionDomainService
+from .sharding import ConsistentHashRing, ShardSpec
 from .storage import IDataStorage
-from .value_objects import BatchConfiguration, IngestionConfiguration, IngestionPartition
+from .value_objects import (
+    BatchConfiguration,
+    IngestionConfiguration,
+    IngestionPartition,
+    PartitionCoverage,
+)
 
 __all__ = [
     # Entities
@@ -19,6 +25,7 @@ __all__ = [
     "IngestionConfiguration",
     "IngestionPartition",
     "BatchConfiguration",
+    "PartitionCoverage",
     "IDataStorage",
     # Events
     "IngestionJobStarted",
@@ -29,4 +36,7 @@ __all__ = [
     "IIngestionCheckpointRepository",
     # Services
     "IngestionDomainService",
+    # Sharding
+    "ConsistentHashRing",
+    "ShardSpec",
 ]
@@ -347,9 +347,13 @@ class IngestionJob(Entity):
         self._add_domain_event(event)
 
     def mark_symbol_processed(
-        self, symbol: Symbol, bars_count: int, partition: IngestionPartition
+        self, symbol: Symbol, bars_count: int, partition: Optional[IngestionPartition]
     ) -> None:
-        """Mark a symbol as processed with its results."""
+        """Mark a symbol as processed with its results.
+
+        ``partition`` is None when nothing was written, e.g. when incremental
+        ingestion found the symbol already stored; no batch event is raised then.
+        """
         if self._state != ProcessingState.IN_PROGRESS:
             raise ValueError(f"Cannot process symbol when job is in state {self._state}")
 
@@ -360,20 +364,22 @@ class IngestionJob(Entity):
             raise ValueError(f"Symbol {symbol} already processed")
 
         self._processed_symbols.add(symbol)
-        self._completed_partitions.append(partition)
         self._total_bars_processed += bars_count
 
-        # Raise domain event
-        from .events import IngestionBatchProcessed
+        if partition is not None:
+            self._completed_partitions.append(partition)
 
-        event = IngestionBatchProcessed(
-            job_id=self._job_id,
-            symbol=symbol,
-            bars_processed=bars_count,
-            partition=partition,
-            processed_at=datetime.now(timezone.utc),
-        )
-        self._add_domain_event(event)
+            # Raise domain event
+            from .events import IngestionBatchProcessed
+
+            event = IngestionBatchProcessed(
+                job_id=self._job_id,
+                symbol=symbol,
+                bars_processed=bars_count,
+                partition=partition,
+                processed_at=datetime.now(timezone.utc),
+            )
+            self._add_domain_event(event)
 
         # Auto-complete if all symbols processed
         if self.can_complete:
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from typing import Optional
 from uuid import UUID, uuid4
 
+from marketpipe.domain import events as domain_events
 from marketpipe.domain.events import DomainEvent
 from marketpipe.domain.value_objects import Symbol, TimeRange
 
@@ -220,3 +222,28 @@ class IngestionRateLimited(DomainEvent):
             "delay_seconds": self.delay_seconds,
             "reason": self.reason,
         }
+
+
+def as_job_completed(event: DomainEvent) -> Optional[domain_events.IngestionJobCompleted]:
+    """Translate a completion event for the post-processing handlers.
+
+    Aggregation and validation act on ``marketpipe.domain.events.IngestionJobCompleted``;
+    the ingestion context raises its own :class:`IngestionJobCompleted`.
+
+    Returns:
+        The shared-kernel completion event, or None for events the handlers
+        do not act on
+    """
+    if isinstance(event, domain_events.IngestionJobCompleted):
+        return event
+    if not isinstance(event, IngestionJobCompleted):
+        return None
+    symbol = getattr(event.job_id, "symbol", None)
+    day = getattr(event.job_id, "day", None)
+    return domain_events.IngestionJobCompleted(
+        job_id=str(event.job_id),
+        symbol=symbol if isinstance(symbol, Symbol) else Symbol("MANUAL"),
+        trading_date=date.fromisoformat(day) if day else event.completed_at.date(),
+        bars_processed=event.total_bars_processed,
+        success=True,
+    )
@@ -4,14 +4,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
-from marketpipe.domain.services import DomainService
-from marketpipe.domain.value_objects import Symbol, TimeRange
+from marketpipe.domain.services import DomainService, TradingCalendarService
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp
 
 from .entities import IngestionJob, IngestionJobId, ProcessingState
-from .value_objects import BatchConfiguration, IngestionConfiguration, ProcessingMetrics
+from .value_objects import (
+    BatchConfiguration,
+    IngestionConfiguration,
+    PartitionCoverage,
+    ProcessingMetrics,
+)
 
 
 @dataclass
@@ -218,6 +223,126 @@ class IngestionDomainService(DomainService):
         else:
             return True, "Standard retry with backoff"
 
+    def covered_days(
+        self,
+        time_range: TimeRange,
+        coverage: dict[date, PartitionCoverage],
+        today: Optional[date] = None,
+        frame_seconds: int = 60,
+    ) -> set[date]:
+        """
+        Trading days of a time range that storage already holds in full.
+
+        A day counts as held when its stored bars span the part of the
+        trading session inside ``time_range`` and the partition holds enough
+        of the session's expected bars (``PartitionCoverage.covers``). Days
+        that are stale, only partly fetched, or the current (still open) day
+        are not held. Days outside the trading calendar's span fall back to
+        ``PartitionCoverage.is_complete``.
+
+        Args:
+            time_range: Requested ingestion window
+            coverage: Stored coverage per trading day
+            today: Current UTC date (defaults to now)
+            frame_seconds: Bar length of the ingested timeframe
+
+        Returns:
+            Days that need no fetching
+        """
+        today = today or datetime.now(timezone.utc).date()
+        calendar = TradingCalendarService()
+        frame_ns = frame_seconds * 1_000_000_000
+        range_start_ns = int(time_range.start.value.timestamp() * 1_000_000_000)
+        range_end_ns = int(time_range.end.value.timestamp() * 1_000_000_000)
+
+        held = set()
+        for day, day_coverage in coverage.items():
+            if day >= today or not calendar.is_trading_day(day):
+                continue
+            try:
+                open_ns, close_ns = calendar.calendar.session_bounds(day)
+                expected = int(calendar.calendar.expected_bars([day], frame_seconds)[0])
+            except ValueError:
+                # Outside the precomputed calendar: no session bounds to compare with
+                if day_coverage.is_complete:
+                    held.add(day)
+                continue
+            start_ns, end_ns = max(open_ns, range_start_ns), min(close_ns, range_end_ns)
+            if end_ns <= start_ns:
+                # The request does not reach into the session
+                if day_coverage.is_complete:
+                    held.add(day)
+                continue
+            expected = expected * (end_ns - start_ns) // (close_ns - open_ns)
+            if day_coverage.covers(start_ns, end_ns, frame_ns, expected):
+                held.add(day)
+        return held
+
+    def plan_incremental_ranges(
+        self,
+        time_range: TimeRange,
+        coverage: dict[date, PartitionCoverage],
+        today: Optional[date] = None,
+        frame_seconds: int = 60,
+    ) -> list[TimeRange]:
+        """
+        Determine which parts of a time range still need to be fetched.
+
+        A trading day needs fetching unless storage holds it in full (see
+        ``covered_days``). Consecutive days that need fetching are merged
+        into one range so a run of missing days costs one paginated request
+        sequence.
+
+        Args:
+            time_range: Requested ingestion window
+            coverage: Stored coverage per trading day
+            today: Current UTC date (defaults to now)
+            frame_seconds: Bar length of the ingested timeframe
+
+        Returns:
+            Sub-ranges of ``time_range`` to fetch, in chronological order
+        """
+        calendar = TradingCalendarService()
+        held = self.covered_days(time_range, coverage, today, frame_seconds)
+
+        first_day = time_range.start.value.astimezone(timezone.utc).date()
+        # The end bound is exclusive, so a midnight end does not include that day
+        last_day = (
+            time_range.end.value.astimezone(timezone.utc) - timedelta(microseconds=1)
+        ).date()
+
+        runs: list[tuple[date, date]] = []
+        run_start: Optional[date] = None
+        run_end: Optional[date] = None
+
+        day = first_day
+        while day <= last_day:
+            if calendar.is_trading_day(day):
+                if day not in held:
+                    run_start = run_start or day
+                    run_end = day
+                elif run_start is not None and run_end is not None:
+                    runs.append((run_start, run_end))
+                    run_start = run_end = None
+            day += timedelta(days=1)
+
+        if run_start is not None and run_end is not None:
+            runs.append((run_start, run_end))
+
+        ranges = []
+        for start_day, end_day in runs:
+            range_start = max(
+                time_range.start.value,
+                datetime.combine(start_day, datetime.min.time(), timezone.utc),
+            )
+            range_end = min(
+                time_range.end.value,
+                datetime.combine(end_day + timedelta(days=1), datetime.min.time(), timezone.utc),
+            )
+            ranges.append(TimeRange(Timestamp(range_start), Timestamp(range_end)))
+
+        return ranges
+
     def _validate_symbols(self, symbols: list[Symbol]) -> None:
         """Validate symbols list for business rules."""
         if not symbols:
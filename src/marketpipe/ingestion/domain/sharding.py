@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Consistent-hash sharding of the symbol universe across ingestion nodes.
+
+Every node runs ingest with the full universe and its own shard index; the
+ring decides which symbols the node keeps, so hosts split the work without
+hand-crafted symbol lists and without talking to each other:
+
+    ring: shard-0#0 ─ shard-2#5 ─ shard-1#3 ─ shard-0#7 ─ ...  (vnodes per shard)
+    AAPL ─hash─▶ next point clockwise ─▶ shard 2
+
+Each shard owns ``vnodes`` points on the ring, which evens out the load and
+keeps reassignment small: going from N to N+1 shards moves only the symbols
+the new shard's points capture, about 1/(N+1) of the universe, and none
+between the old shards. Hashes use BLAKE2b, so every node, Python version
+and process computes the same assignment.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Callable
+
+DEFAULT_VNODES = 128
+
+
+def stable_hash(key: str) -> int:
+    """64-bit hash of a string that is identical across processes and hosts."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """The shard one ingestion node is responsible for.
+
+    Attributes:
+        index: Zero-based shard of this node
+        count: Total number of shards (1: no sharding)
+    """
+
+    index: int = 0
+    count: int = 1
+
+    def __post_init__(self):
+        """Validate the shard."""
+        if self.count < 1:
+            raise ValueError("shard count must be at least 1")
+        if not 0 <= self.index < self.count:
+            raise ValueError(f"shard index must be between 0 and {self.count - 1}")
+
+    @property
+    def is_sharded(self) -> bool:
+        return self.count > 1
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+class ConsistentHashRing:
+    """Maps symbols to shards with consistent hashing."""
+
+    def __init__(self, shard_count: int, vnodes: int = DEFAULT_VNODES):
+        """Build the ring.
+
+        Args:
+            shard_count: Number of shards
+            vnodes: Points each shard owns on the ring
+
+        Raises:
+            ValueError: If shard_count or vnodes is less than 1
+        """
+        if shard_count < 1:
+            raise ValueError("shard count must be at least 1")
+        if vnodes < 1:
+            raise ValueError("vnodes must be at least 1")
+        self.shard_count = shard_count
+        self.vnodes = vnodes
+        points = sorted(
+            (stable_hash(f"shard-{shard}#{vnode}"), shard)
+            for shard in range(shard_count)
+            for vnode in range(vnodes)
+        )
+        self._hashes = [h for h, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for(self, symbol: str) -> int:
+        """Shard responsible for a symbol."""
+        position = bisect.bisect(self._hashes, stable_hash(symbol.strip().upper()))
+        return self._shards[position % len(self._shards)]
+
+    def assign(self, symbols: Iterable[str]) -> dict[int, list[str]]:
+        """Split symbols into shards.
+
+        Returns:
+            Symbols of every shard (including empty ones), in input order
+        """
+        assignment: dict[int, list[str]] = {shard: [] for shard in range(self.shard_count)}
+        for symbol in symbols:
+            assignment[self.shard_for(symbol)].append(symbol)
+        return assignment
+
+    def select(self, symbols: Iterable[str], shard: ShardSpec) -> list[str]:
+        """Symbols belonging to one shard, in input order.
+
+        Raises:
+            ValueError: If the shard was built for another shard count
+        """
+        if shard.count != self.shard_count:
+            raise ValueError(f"shard {shard} does not belong to a {self.shard_count}-shard ring")
+        return [symbol for symbol in symbols if self.shard_for(symbol) == shard.index]
+
+
+def select_shard(symbols: Iterable[str], shard: ShardSpec) -> list[str]:
+    """Symbols of ``symbols`` that ``shard`` ingests."""
+    symbols = list(symbols)
+    if not shard.is_sharded:
+        return symbols
+    return ConsistentHashRing(shard.count).select(symbols, shard)
+
+
+@dataclass(frozen=True)
+class ShardCoverage:
+    """Which of a shard's symbols were stored for a day."""
+
+    index: int
+    symbols: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+    @property
+    def covered(self) -> int:
+        return len(self.symbols) - len(self.missing)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.missing
+
+
+def verify_shard_coverage(
+    symbols: Iterable[str], shard_count: int, is_covered: Callable[[str], bool]
+) -> list[ShardCoverage]:
+    """Check that the shards together stored the whole universe.
+
+    Each symbol belongs to exactly one shard of the ring, so the shards
+    cannot overlap; a symbol without data is a gap of the shard that owns it.
+
+    Args:
+        symbols: Symbol universe every shard was given
+        shard_count: Number of shards the universe was split into
+        is_covered: Whether storage holds a symbol for the day being checked
+
+    Returns:
+        Coverage of every shard, by shard index
+    """
+    assignment = ConsistentHashRing(shard_count).assign(dict.fromkeys(symbols))
+    return [
+        ShardCoverage(
+            index=shard,
+            symbols=owned,
+            missing=[symbol for symbol in owned if not is_covered(symbol)],
+        )
+        for shard, owned in assignment.items()
+    ]
+
+
+__all__ = [
+    "DEFAULT_VNODES",
+    "ConsistentHashRing",
+    "ShardCoverage",
+    "ShardSpec",
+    "select_shard",
+    "stable_hash",
+    "verify_shard_coverage",
+]
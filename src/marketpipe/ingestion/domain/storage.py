@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import date
 
 from marketpipe.domain.entities import OHLCVBar
 
-from .value_objects import IngestionConfiguration, IngestionPartition
+from .value_objects import IngestionConfiguration, IngestionPartition, PartitionCoverage
 
 
 class IDataStorage(ABC):
@@ -17,3 +18,13 @@ class IDataStorage(ABC):
     ) -> IngestionPartition:
         """Persist bars and return information about the created partition."""
         pass
+
+    async def get_coverage(
+        self, symbol: str, timeframe: str, start_date: date, end_date: date
+    ) -> dict[date, PartitionCoverage]:
+        """Return stored coverage per trading day in ``[start_date, end_date]``.
+
+        Storage backends that cannot report coverage return an empty mapping,
+        which makes incremental ingestion fall back to fetching everything.
+        """
+        return {}
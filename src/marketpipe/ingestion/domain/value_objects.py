@@ -4,12 +4,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Optional
 
 from marketpipe.domain.value_objects import Symbol
 
+# Bar length of each supported ingestion timeframe
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+# A stored day may start or end this far inside the requested session window
+# and still count as covered: thinly traded symbols have no bar in quiet minutes
+COVERAGE_EDGE_TOLERANCE_NS = 30 * 60 * 1_000_000_000
+# Share of the session's expected bars a covered day must hold
+MIN_COVERAGE_FILL = 0.25
+
 
 @dataclass(frozen=True)
 class IngestionConfiguration:
@@ -22,6 +39,7 @@ class IngestionConfiguration:
     rate_limit_per_minute: Optional[int]
     feed_type: str
     timeframe: str = "1m"
+    incremental: bool = False  # Fetch only days missing from (or stale in) storage
 
     def __post_init__(self):
         """Validate configuration values."""
@@ -41,10 +59,15 @@ class IngestionConfiguration:
             raise ValueError(f"Unsupported feed type: {self.feed_type}")
 
         # Validate timeframe format
-        valid_timeframes = ["1m", "5m", "15m", "30m", "1h", "4h", "1d"]
+        valid_timeframes = list(TIMEFRAME_SECONDS)
         if self.timeframe not in valid_timeframes:
             raise ValueError(f"Unsupported timeframe: {self.timeframe}. Valid: {valid_timeframes}")
 
+    @property
+    def frame_seconds(self) -> int:
+        """Bar length of the configured timeframe in seconds."""
+        return TIMEFRAME_SECONDS[self.timeframe]
+
     @classmethod
     def from_dict(cls, config_dict: dict[str, Any]) -> IngestionConfiguration:
         """Create configuration from dictionary."""
@@ -56,6 +79,7 @@ class IngestionConfiguration:
             rate_limit_per_minute=config_dict.get("rate_limit_per_min"),
             feed_type=config_dict.get("feed", "iex"),
             timeframe=config_dict.get("timeframe", "1m"),
+            incremental=config_dict.get("incremental", False),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -68,6 +92,7 @@ class IngestionConfiguration:
             "rate_limit_per_min": self.rate_limit_per_minute,
             "feed": self.feed_type,
             "timeframe": self.timeframe,
+            "incremental": self.incremental,
         }
 
 
@@ -152,6 +177,58 @@ class IngestionPartition:
         }
 
 
+@dataclass(frozen=True)
+class PartitionCoverage:
+    """Stored coverage of one symbol-day partition, read from Parquet metadata."""
+
+    trading_day: date
+    row_count: int
+    min_ts_ns: Optional[int]
+    max_ts_ns: Optional[int]
+    stale: bool = False
+
+    def __post_init__(self):
+        """Validate coverage data."""
+        if self.row_count < 0:
+            raise ValueError("row_count must be non-negative")
+
+        if (
+            self.min_ts_ns is not None
+            and self.max_ts_ns is not None
+            and self.min_ts_ns > self.max_ts_ns
+        ):
+            raise ValueError("min_ts_ns must not be after max_ts_ns")
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the partition holds data and has not been marked stale."""
+        return self.row_count > 0 and not self.stale
+
+    def covers(self, start_ns: int, end_ns: int, frame_ns: int, expected_rows: int = 0) -> bool:
+        """
+        Whether the partition holds the bars of the window ``[start_ns, end_ns)``.
+
+        Bars are stamped with their start, so the last bar of the window
+        starts one frame before ``end_ns``. A day whose first or last bar is
+        more than ``COVERAGE_EDGE_TOLERANCE_NS`` inside the window, or that
+        holds fewer than ``MIN_COVERAGE_FILL`` of ``expected_rows``, was only
+        partly fetched (e.g. by a run that died mid-session).
+
+        Args:
+            start_ns: Window start (e.g. the session open), ns since the epoch
+            end_ns: Window end, exclusive
+            frame_ns: Bar length
+            expected_rows: Bars a full window holds (0: not checked)
+        """
+        if not self.is_complete or self.min_ts_ns is None or self.max_ts_ns is None:
+            return False
+        if self.min_ts_ns > start_ns + COVERAGE_EDGE_TOLERANCE_NS:
+            return False
+        if self.max_ts_ns < end_ns - frame_ns - COVERAGE_EDGE_TOLERANCE_NS:
+            return False
+        return self.row_count >= expected_rows * MIN_COVERAGE_FILL
+
+
 @dataclass(frozen=True)
 class ProcessingMetrics:
     """Metrics collected during ingestion processing."""
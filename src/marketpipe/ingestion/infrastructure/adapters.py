@@ -8,10 +8,12 @@ from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from typing import Any, Optional
 
+from marketpipe.config.prices import configured_price_type
 from marketpipe.domain.entities import EntityId, OHLCVBar
 from marketpipe.domain.market_data import IMarketDataProvider, ProviderMetadata
-from marketpipe.domain.value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp, Volume
 from marketpipe.security.mask import safe_for_log
+from marketpipe.tracing import span
 
 from .alpaca_client import AlpacaClient
 from .auth import HeaderTokenAuth
@@ -36,8 +38,10 @@ class AlpacaMarketDataAdapter(IMarketDataProvider):
         base_url: str,
         feed_type: str = "iex",
         rate_limit_per_min: Optional[int] = None,
+        price_backend: Optional[str] = None,
     ):
         self._api_key = api_key
+        self._price_type = configured_price_type(price_backend)
         self._api_secret = api_secret
         self._base_url = base_url
         self._feed_type = feed_type
@@ -75,6 +79,7 @@ class AlpacaMarketDataAdapter(IMarketDataProvider):
                 - base_url: Alpaca API base URL
                 - feed_type: Data feed type (optional, default: "iex")
                 - rate_limit_per_min: Rate limit (optional)
+                - price_backend: "decimal" or "fixed" (optional, default: $MARKETPIPE_PRICE_BACKEND)
         """
         return cls(
             api_key=config["api_key"],
@@ -82,6 +87,7 @@ class AlpacaMarketDataAdapter(IMarketDataProvider):
             base_url=config["base_url"],
             feed_type=config.get("feed_type", "iex"),
             rate_limit_per_min=config.get("rate_limit_per_min"),
+            price_backend=config.get("price_backend"),
         )
 
     async def fetch_bars_for_symbol(
@@ -116,17 +122,20 @@ class AlpacaMarketDataAdapter(IMarketDataProvider):
 
         # Translate raw data to domain models
         domain_bars = []
-        for raw_bar in raw_bars:
-            try:
-                domain_bar = self._translate_alpaca_bar_to_domain(raw_bar, symbol)
-                domain_bars.append(domain_bar)
-            except Exception as e:
-                # Log translation errors but continue processing other bars
-                safe_msg = safe_for_log(
-                    f"Failed to translate bar for {symbol}: {e}", self._api_key, self._api_secret
-                )
-                self._logger.warning(safe_msg)
-                continue
+        with span("translate", bars=len(raw_bars)):
+            for raw_bar in raw_bars:
+                try:
+                    domain_bar = self._translate_alpaca_bar_to_domain(raw_bar, symbol)
+                    domain_bars.append(domain_bar)
+                except Exception as e:
+                    # Log translation errors but continue processing other bars
+                    safe_msg = safe_for_log(
+                        f"Failed to translate bar for {symbol}: {e}",
+                        self._api_key,
+                        self._api_secret,
+                    )
+                    self._logger.warning(safe_msg)
+                    continue
 
         return domain_bars
 
@@ -218,10 +227,11 @@ class AlpacaMarketDataAdapter(IMarketDataProvider):
 
             # Create domain value objects
             domain_timestamp = Timestamp(timestamp_dt)
-            domain_open = Price(open_price)
-            domain_high = Price(high_price)
-            domain_low = Price(low_price)
-            domain_close = Price(close_price)
+            price = self._price_type
+            domain_open = price.from_decimal(open_price)
+            domain_high = price.from_decimal(high_price)
+            domain_low = price.from_decimal(low_price)
+            domain_close = price.from_decimal(close_price)
             domain_volume = Volume(volume_value)
 
             # Create domain entity
@@ -10,6 +10,7 @@ from collections.abc import Mapping
 from typing import Any, Optional
 
 from marketpipe.security.mask import safe_for_log
+from marketpipe.tracing import span
 
 from .base_api_client import BaseApiClient
 
@@ -59,13 +60,28 @@ class AlpacaClient(BaseApiClient):
     def next_cursor(self, raw_json: dict[str, Any]) -> Optional[str]:
         return raw_json.get("next_page_token")
 
+    # ---------- response cache ----------
+    def cache_provider_name(self) -> str:
+        return "alpaca"
+
+    def cache_data_end(self, params: Mapping[str, str]) -> Optional[dt.datetime]:
+        end = params.get("end")
+        if not end:
+            return None
+        return dt.datetime.strptime(end, ISO_FMT).replace(tzinfo=dt.timezone.utc)
+
     # ---------- sync request ----------
     def _request(self, params: Mapping[str, str]) -> dict[str, Any]:
         # Local import to avoid circular dependency
         from marketpipe.metrics import ERRORS, LATENCY, REQUESTS
 
+        cached = self._cache_lookup(params)
+        if cached is not None:
+            return cached
+
         if self.rate_limiter:
-            self.rate_limiter.acquire()
+            with span("rate_limit_wait"):
+                self.rate_limiter.acquire()
 
         url = f"{self.config.base_url}{self._PATH_TEMPLATE}"  # v2 API doesn't need symbol in URL
         headers = {"Accept": "application/json", "User-Agent": self.config.user_agent}
@@ -75,12 +91,13 @@ class AlpacaClient(BaseApiClient):
         while True:
             start = time.perf_counter()
             assert self.http_client is not None
-            r = self.http_client.get(
-                url,
-                params=dict(params),  # Include all params including symbols
-                headers=headers,
-                timeout=self.config.timeout,
-            )
+            with span("http"):
+                r = self.http_client.get(
+                    url,
+                    params=dict(params),  # Include all params including symbols
+                    headers=headers,
+                    timeout=self.config.timeout,
+                )
             duration = time.perf_counter() - start
             LATENCY.labels(source="alpaca", provider="alpaca", feed=self.feed).observe(duration)
             REQUESTS.labels(source="alpaca", provider="alpaca", feed=self.feed).inc()
@@ -91,7 +108,8 @@ class AlpacaClient(BaseApiClient):
 
             # Handle JSON parsing safely
             try:
-                response_json = r.json()
+                with span("parse_json"):
+                    response_json = r.json()
             except (json.JSONDecodeError, ValueError) as e:
                 # If JSON parsing fails, check if we should retry based on status code only
                 safe_msg = safe_for_log(
@@ -118,6 +136,8 @@ class AlpacaClient(BaseApiClient):
                     raise RuntimeError(safe_error_msg) from e
 
             if not self.should_retry(r.status_code, response_json):
+                if r.status_code < 400:
+                    self._cache_store(params, response_json)
                 return response_json
 
             # Handle Retry-After header for 429 responses
@@ -147,8 +167,13 @@ class AlpacaClient(BaseApiClient):
         # Local import to avoid circular dependency
         from marketpipe.metrics import ERRORS, LATENCY, REQUESTS
 
+        cached = self._cache_lookup(params)
+        if cached is not None:
+            return cached
+
         if self.rate_limiter:
-            await self.rate_limiter.async_acquire()
+            with span("rate_limit_wait"):
+                await self.rate_limiter.async_acquire()
 
         url = f"{self.config.base_url}{self._PATH_TEMPLATE}"  # v2 API doesn't need symbol in URL
         headers = {"Accept": "application/json", "User-Agent": self.config.user_agent}
@@ -158,12 +183,13 @@ class AlpacaClient(BaseApiClient):
         while True:
             start = time.perf_counter()
             assert self.async_http_client is not None
-            r = await self.async_http_client.get(
-                url,
-                params=dict(params),  # Include all params including symbols
-                headers=headers,
-                timeout=self.config.timeout,
-            )
+            with span("http"):
+                r = await self.async_http_client.get(
+                    url,
+                    params=dict(params),  # Include all params including symbols
+                    headers=headers,
+                    timeout=self.config.timeout,
+                )
             duration = time.perf_counter() - start
             LATENCY.labels(source="alpaca", provider="alpaca", feed=self.feed).observe(duration)
             REQUESTS.labels(source="alpaca", provider="alpaca", feed=self.feed).inc()
@@ -174,7 +200,8 @@ class AlpacaClient(BaseApiClient):
 
             # Handle JSON parsing safely
             try:
-                response_json = r.json()
+                with span("parse_json"):
+                    response_json = r.json()
             except (json.JSONDecodeError, ValueError) as e:
                 # If JSON parsing fails, check if we should retry based on status code only
                 safe_msg = safe_for_log(
@@ -201,6 +228,8 @@ class AlpacaClient(BaseApiClient):
                     raise RuntimeError(safe_error_msg) from e
 
             if not self.should_retry(r.status_code, response_json):
+                if r.status_code < 400:
+                    self._cache_store(params, response_json)
                 return response_json
 
             # Handle Retry-After header for 429 responses
@@ -5,15 +5,19 @@ import abc
 import logging
 from abc import abstractmethod
 from collections.abc import Iterable, Mapping
+from datetime import datetime
 from typing import Any, Callable, Optional, Union
 
+from marketpipe.tracing import span
+
 from .auth import AuthStrategy
 from .http_client_protocol import AsyncHttpClientProtocol, HttpClientProtocol
 from .models import ClientConfig
 from .rate_limit import RateLimiter
+from .response_cache import ResponseCache, ResponseCacheMixin, get_default_response_cache
 
 
-class BaseApiClient(abc.ABC):
+class BaseApiClient(ResponseCacheMixin, abc.ABC):
     """Abstract, vendor-agnostic API client.
 
     Usage:
@@ -32,6 +36,7 @@ class BaseApiClient(abc.ABC):
         logger: Optional[logging.Logger] = None,
         http_client: Optional[HttpClientProtocol] = None,
         async_http_client: Optional[AsyncHttpClientProtocol] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         self.config = config
         self.auth = auth
@@ -55,6 +60,11 @@ class BaseApiClient(abc.ABC):
 
             self.async_http_client = get_default_async_http_client()
 
+        # On-disk response cache (data/http_cache or $MARKETPIPE_HTTP_CACHE_DIR when not injected)
+        self.response_cache = (
+            response_cache if response_cache is not None else get_default_response_cache()
+        )
+
     # ---------- URL / request helpers ----------
     @abc.abstractmethod
     def build_request_params(
@@ -89,9 +99,12 @@ class BaseApiClient(abc.ABC):
             Raw JSON pages from the vendor API.
         """
         cursor: Optional[str] = None
+        page = 0
         while True:
+            page += 1
             params = self.build_request_params(symbol, start_ts, end_ts, cursor)
-            raw_json = self._request(params)
+            with span("page", page=page):
+                raw_json = self._request(params)
             yield raw_json
             cursor = self.next_cursor(raw_json)
             if not cursor:
@@ -122,7 +135,8 @@ class BaseApiClient(abc.ABC):
         """High-level helper returning a list of normalized OHLCV rows."""
         rows: list[dict[str, Any]] = []
         for page in self.paginate(symbol, start_ts, end_ts):
-            rows.extend(self.parse_response(page))
+            with span("normalize"):
+                rows.extend(self.parse_response(page))
         return rows
 
     async def async_fetch_batch(
@@ -133,7 +147,8 @@ class BaseApiClient(abc.ABC):
     ) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
         async for page in self.async_paginate(symbol, start_ts, end_ts):
-            rows.extend(self.parse_response(page))
+            with span("normalize"):
+                rows.extend(self.parse_response(page))
         return rows
 
     async def async_paginate(
@@ -145,14 +160,32 @@ class BaseApiClient(abc.ABC):
     ):
         """Async generator version of :meth:`paginate`."""
         cursor: Optional[str] = None
+        page = 0
         while True:
+            page += 1
             params = self.build_request_params(symbol, start_ts, end_ts, cursor)
-            raw_json = await self._async_request(params)
+            with span("page", page=page):
+                raw_json = await self._async_request(params)
             yield raw_json
             cursor = self.next_cursor(raw_json)
             if not cursor:
                 break
 
+    # ---------- Response cache ----------
+    def cache_data_end(self, params: Mapping[str, str]) -> Optional[datetime]:
+        """Return the end of the data window covered by ``params``.
+
+        Responses are only cached when this returns a value; the default
+        disables caching for clients that do not know their data window.
+        """
+        return None
+
+    def _cache_lookup(self, params: Mapping[str, str]) -> Optional[dict[str, Any]]:
+        return self._cached_response(self.endpoint_path(), params, self.cache_data_end(params))
+
+    def _cache_store(self, params: Mapping[str, str], body: dict[str, Any]) -> None:
+        self._store_response(self.endpoint_path(), params, body, self.cache_data_end(params))
+
     # ---------- Response handling ----------
     @abc.abstractmethod
     def parse_response(self, raw_json: dict[str, Any]) -> list[dict[str, Any]]:
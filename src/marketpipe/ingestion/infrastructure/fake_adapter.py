@@ -1,13 +1,19 @@
 # SPDX-License-Identifier: Apache-2.0
-"""Fake market data adapter for testing and development."""
+"""Fake market data adapter for testing and development.
+
+Bars come from ``SyntheticBarGenerator``: vectorized, reproducible for a
+given ``seed`` across processes and request boundaries, and optionally
+salted with gaps, duplicates, out-of-order bars or request faults.
+"""
 
 from __future__ import annotations
 
+import logging
 import random
-from datetime import datetime, timedelta, timezone
-from decimal import Decimal
 from typing import Any, Optional
 
+from marketpipe.config.prices import configured_price_type
+from marketpipe.domain.analytics import OHLCVColumns
 from marketpipe.domain.entities import EntityId, OHLCVBar
 from marketpipe.domain.market_data import (
     IMarketDataProvider,
@@ -15,9 +21,11 @@ from marketpipe.domain.market_data import (
     MarketDataUnavailableError,
     ProviderMetadata,
 )
-from marketpipe.domain.value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp, Volume
+from marketpipe.tracing import span
 
 from .provider_registry import provider
+from .synthetic import FaultRates, SyntheticBarGenerator
 
 
 @provider("fake")
@@ -31,11 +39,16 @@ class FakeMarketDataAdapter(IMarketDataProvider):
     def __init__(
         self,
         base_price: float = 100.0,
-        volatility: float = 0.02,
+        volatility: float = 0.001,
         fail_probability: float = 0.0,
         supported_symbols: Optional[list[str]] = None,
+        seed: int = 0,
+        sessions: str = "all",
+        faults: Optional[FaultRates] = None,
+        price_backend: Optional[str] = None,
     ):
         self._base_price = base_price
+        self._price_type = configured_price_type(price_backend)
         self._volatility = volatility
         self._fail_probability = fail_probability
         self._supported_symbols = supported_symbols or [
@@ -49,6 +62,16 @@ class FakeMarketDataAdapter(IMarketDataProvider):
             "FAKE2",
             "TEST",
         ]
+        self._generator = SyntheticBarGenerator(
+            seed=seed,
+            base_price=base_price,
+            volatility=volatility,
+            sessions=sessions,
+            faults=faults,
+        )
+        self._random = random.Random(seed)
+        self._attempts: dict[str, int] = {}
+        self.log = logging.getLogger(self.__class__.__name__)
 
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> FakeMarketDataAdapter:
@@ -57,18 +80,31 @@ class FakeMarketDataAdapter(IMarketDataProvider):
 
         Args:
             config: Configuration dictionary with keys:
-                - base_price: Starting price for fake data (optional, default: 100.0)
-                - volatility: Price volatility factor (optional, default: 0.02)
+                - base_price: Typical price of fake data (optional, default: 100.0)
+                - volatility: Standard deviation of a bar's log return (optional, default: 0.001)
                 - fail_probability: Probability of simulated failures (optional, default: 0.0)
                 - supported_symbols: List of symbols to support (optional)
+                - seed: Seed of the generated bars and faults (optional, default: 0)
+                - sessions: "all" (around the clock) or "regular" exchange sessions
+                  (optional, default: "all")
+                - faults: Fault rates as a mapping or "gaps=0.01,rate_limited=0.05" (optional)
+                - price_backend: "decimal" or "fixed" (optional, default: $MARKETPIPE_PRICE_BACKEND)
         """
         return cls(
             base_price=config.get("base_price", 100.0),
-            volatility=config.get("volatility", 0.02),
+            volatility=config.get("volatility", 0.001),
             fail_probability=config.get("fail_probability", 0.0),
             supported_symbols=config.get("supported_symbols"),
+            seed=config.get("seed", 0),
+            sessions=config.get("sessions", "all"),
+            faults=FaultRates.from_config(config.get("faults")),
+            price_backend=config.get("price_backend"),
         )
 
+    @property
+    def generator(self) -> SyntheticBarGenerator:
+        return self._generator
+
     async def fetch_bars_for_symbol(
         self,
         symbol: Symbol,
@@ -79,56 +115,85 @@ class FakeMarketDataAdapter(IMarketDataProvider):
         """
         Generate fake OHLCV bars for the given symbol and time range.
 
+        The whole range is returned regardless of ``max_bars``. Bars with
+        injected OHLC violations cannot be represented as ``OHLCVBar`` and
+        are dropped, as the HTTP adapters drop rows they cannot parse.
+
         Args:
             symbol: Stock symbol
             time_range: Time range for data retrieval
             max_bars: Maximum number of bars to fetch
             timeframe: Bar timeframe (e.g., "1m", "5m", "15m", "1h", "1d")
+
+        Raises:
+            MarketDataUnavailableError: On simulated failures and rate limits
+            TimeoutError: On simulated timeouts
         """
         # Simulate random failures if configured
-        if random.random() < self._fail_probability:
+        if self._random.random() < self._fail_probability:
             raise MarketDataUnavailableError("Simulated provider failure")
 
         # Check if symbol is supported
         if symbol.value not in self._supported_symbols:
             raise InvalidSymbolError(f"Symbol {symbol.value} not supported by fake provider")
 
-        # Parse timeframe to minutes
-        timeframe_minutes = self._parse_timeframe_to_minutes(timeframe)
-
-        # Calculate expected number of bars for the time range
-        start_time = time_range.start.value
-        end_time = time_range.end.value
-        time_diff = end_time - start_time
-        expected_bars = int(time_diff.total_seconds() / (timeframe_minutes * 60))
-
-        # Use a more generous max_bars limit to ensure we cover the full range
-        # Allow up to 10,000 bars or the expected number, whichever is higher
-        effective_max_bars = max(max_bars, expected_bars, 10000)
-
-        # Generate bars for the time range
-        bars = []
-        current_time = start_time
-
-        # Use symbol name to seed price variation
-        symbol_seed = hash(symbol.value) % 1000
-        current_price = self._base_price + (symbol_seed / 10)
-
-        bar_count = 0
-        while current_time < end_time and bar_count < effective_max_bars:
-            # Generate OHLCV for this timeframe
-            bar = self._generate_bar(symbol, current_time, current_price)
-            bars.append(bar)
-
-            # Update price for next bar (random walk)
-            price_change = random.gauss(0, self._volatility * current_price)
-            current_price = max(0.01, current_price + price_change)
-
-            # Move to next timeframe interval
-            current_time += timedelta(minutes=timeframe_minutes)
-            bar_count += 1
-
-        return bars
+        attempt = self._attempts.get(symbol.value, 0)
+        self._attempts[symbol.value] = attempt + 1
+        fault = self._generator.request_fault(symbol.value, attempt)
+        if fault == "rate_limited":
+            raise MarketDataUnavailableError("Simulated rate limit (HTTP 429)")
+        if fault == "timeout":
+            raise TimeoutError("Simulated provider timeout")
+
+        with span("generate"):
+            columns = self._generator.generate(
+                symbol.value,
+                time_range.start.to_nanoseconds(),
+                time_range.end.to_nanoseconds(),
+                frame_seconds=self._parse_timeframe_to_minutes(timeframe) * 60,
+            )
+        with span("translate", bars=len(columns)):
+            return self._to_bars(symbol, columns)
+
+    def _to_bars(self, symbol: Symbol, columns: OHLCVColumns) -> list[OHLCVBar]:
+        """Columns as bar entities, skipping rows with inconsistent OHLC."""
+        price = self._price_type
+        consistent = (
+            (columns.high >= columns.low)
+            & (columns.high >= columns.open)
+            & (columns.high >= columns.close)
+            & (columns.low <= columns.open)
+            & (columns.low <= columns.close)
+        )
+        if not consistent.all():
+            self.log.warning(
+                f"Dropped {int((~consistent).sum())} {symbol.value} bars with inconsistent OHLC"
+            )
+        rows = zip(
+            columns.ts_ns[consistent].tolist(),
+            columns.open[consistent].tolist(),
+            columns.high[consistent].tolist(),
+            columns.low[consistent].tolist(),
+            columns.close[consistent].tolist(),
+            columns.volume[consistent].tolist(),
+            columns.trade_count[consistent].tolist(),
+            columns.vwap[consistent].tolist(),
+        )
+        return [
+            OHLCVBar(
+                id=EntityId.generate(),
+                symbol=symbol,
+                timestamp=Timestamp.from_nanoseconds(ts),
+                open_price=price.from_float(open_),
+                high_price=price.from_float(high),
+                low_price=price.from_float(low),
+                close_price=price.from_float(close),
+                volume=Volume(volume),
+                trade_count=int(trades),
+                vwap=price.from_float(vwap),
+            )
+            for ts, open_, high, low, close, volume, trades, vwap in rows
+        ]
 
     def _parse_timeframe_to_minutes(self, timeframe: str) -> int:
         """Parse timeframe string to minutes."""
@@ -145,46 +210,13 @@ class FakeMarketDataAdapter(IMarketDataProvider):
             raise ValueError(f"Unsupported timeframe: {timeframe}")
         return timeframe_map[timeframe]
 
-    def _generate_bar(self, symbol: Symbol, timestamp: datetime, base_price: float) -> OHLCVBar:
-        """Generate a single OHLCV bar."""
-        # Generate intrabar price movement
-        volatility = self._volatility * base_price
-
-        # Open price (with small random variation from base)
-        open_price = base_price + random.gauss(0, volatility * 0.5)
-
-        # Generate high and low around open
-        high_price = open_price + abs(random.gauss(0, volatility))
-        low_price = open_price - abs(random.gauss(0, volatility))
-
-        # Close price (mean reversion towards open)
-        close_price = open_price + random.gauss(0, volatility * 0.7)
-
-        # Ensure OHLC consistency
-        high_price = max(high_price, open_price, close_price)
-        low_price = min(low_price, open_price, close_price)
-
-        # Generate volume (log-normal distribution)
-        volume = int(random.lognormvariate(8, 1.5))  # Mean around 3000, realistic variance
-
-        return OHLCVBar(
-            id=EntityId.generate(),
-            symbol=symbol,
-            timestamp=Timestamp(timestamp.replace(tzinfo=timezone.utc)),
-            open_price=Price(Decimal(f"{open_price:.2f}")),
-            high_price=Price(Decimal(f"{high_price:.2f}")),
-            low_price=Price(Decimal(f"{low_price:.2f}")),
-            close_price=Price(Decimal(f"{close_price:.2f}")),
-            volume=Volume(volume),
-        )
-
     async def get_supported_symbols(self) -> list[Symbol]:
         """Get list of supported symbols."""
         return [Symbol.from_string(s) for s in self._supported_symbols]
 
     async def is_available(self) -> bool:
         """Fake provider is always available (unless configured to fail)."""
-        return random.random() >= self._fail_probability
+        return self._random.random() >= self._fail_probability
 
     def get_provider_metadata(self) -> ProviderMetadata:
         """Get fake provider metadata."""
@@ -3,23 +3,24 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import httpx
 
+from marketpipe.config.prices import configured_price_type
 from marketpipe.domain.entities import EntityId, OHLCVBar
 from marketpipe.domain.market_data import IMarketDataProvider, ProviderMetadata
-from marketpipe.domain.value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp, Volume
 
+from .http_adapter import JsonHttpAdapter
 from .provider_registry import provider
+from .rate_limit import create_rate_limiter_from_config
+from .response_cache import ResponseCache, get_default_response_cache
 
 
 @provider("finnhub")
-class FinnhubMarketDataAdapter(IMarketDataProvider):
+class FinnhubMarketDataAdapter(JsonHttpAdapter, IMarketDataProvider):
     """
     Anti-corruption layer for Finnhub API integration.
 
@@ -29,6 +30,8 @@ class FinnhubMarketDataAdapter(IMarketDataProvider):
     API Documentation: https://finnhub.io/docs/api/stock-candles
     """
 
+    api_name = "Finnhub"
+
     def __init__(
         self,
         api_key: str,
@@ -37,17 +40,23 @@ class FinnhubMarketDataAdapter(IMarketDataProvider):
         timeout: float = 30.0,
         max_retries: int = 3,
         logger: Optional[logging.Logger] = None,
+        response_cache: Optional[ResponseCache] = None,
+        price_backend: Optional[str] = None,
     ):
         self.api_key = api_key
+        self._price_type = configured_price_type(price_backend)
         self.base_url = base_url.rstrip("/")
         self.rate_limit_per_minute = rate_limit_per_minute
         self.timeout = timeout
         self.max_retries = max_retries
         self.log = logger or logging.getLogger(self.__class__.__name__)
+        self.response_cache = (
+            response_cache if response_cache is not None else get_default_response_cache()
+        )
 
-        # Rate limiting state
-        self._request_times: list[float] = []
-        self._rate_limit_lock = asyncio.Lock()
+        self._rate_limiter = create_rate_limiter_from_config(
+            rate_limit_per_min=rate_limit_per_minute, provider_name="finnhub"
+        )
 
         self.log.info(
             f"Finnhub adapter initialized with {rate_limit_per_minute} requests/min limit"
@@ -83,9 +92,6 @@ class FinnhubMarketDataAdapter(IMarketDataProvider):
         from_timestamp = int(time_range.start.value.timestamp())
         to_timestamp = int(time_range.end.value.timestamp())
 
-        # Apply rate limiting
-        await self._apply_rate_limit()
-
         # Build request URL and parameters
         url = f"{self.base_url}/stock/candle"
         params = {
@@ -97,8 +103,10 @@ class FinnhubMarketDataAdapter(IMarketDataProvider):
         }
 
         try:
-            # Make HTTP request
-            response_data = await self._make_request(url, params)
+            # Make HTTP request (rate limited unless served from the response cache)
+            response_data = await self._make_request(
+                url, params, data_end=time_range.end.value, rate_limit=True
+            )
 
             # Parse response
             if response_data.get("s") == "ok" and "c" in response_data:
@@ -183,89 +191,8 @@ class FinnhubMarketDataAdapter(IMarketDataProvider):
             maximum_history_days=365,  # Finnhub historical data availability
         )
 
-    async def _apply_rate_limit(self) -> None:
-        """Apply rate limiting based on free tier limits."""
-        async with self._rate_limit_lock:
-            now = time.time()
-
-            # Remove requests older than 1 minute
-            cutoff = now - 60.0
-            self._request_times = [t for t in self._request_times if t > cutoff]
-
-            # Check if we need to wait
-            if len(self._request_times) >= self.rate_limit_per_minute:
-                # Calculate wait time
-                oldest_request = min(self._request_times)
-                wait_time = 60.0 - (now - oldest_request)
-
-                if wait_time > 0:
-                    self.log.info(f"Rate limit reached, waiting {wait_time:.1f} seconds")
-                    await asyncio.sleep(wait_time)
-
-            # Record this request
-            self._request_times.append(now)
-
-    async def _make_request(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make HTTP request with retry logic."""
-        headers = {
-            "User-Agent": "MarketPipe/1.0 (Finnhub.io Adapter)",
-            "Accept": "application/json",
-        }
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url, params=params, headers=headers)
-
-                    # Handle rate limiting
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        self.log.warning(f"Rate limited, waiting {retry_after} seconds")
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    # Handle authentication errors
-                    if response.status_code == 401:
-                        raise ValueError("Invalid Finnhub API key")
-
-                    # Handle forbidden
-                    if response.status_code == 403:
-                        raise ValueError("Finnhub API access forbidden - check subscription")
-
-                    # Handle other client errors
-                    if response.status_code >= 400:
-                        error_text = response.text
-                        self.log.error(f"Finnhub API error {response.status_code}: {error_text}")
-                        response.raise_for_status()
-
-                    # Parse JSON response
-                    from typing import cast
-
-                    data = cast(dict[str, Any], response.json())
-                    return data
-
-            except httpx.TimeoutException:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt  # Exponential backoff
-                    self.log.warning(
-                        f"Request timeout, retrying in {wait_time}s (attempt {attempt + 1})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    raise
-            except httpx.RequestError as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    self.log.warning(
-                        f"Request error: {e}, retrying in {wait_time}s (attempt {attempt + 1})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    raise
-
-        raise RuntimeError(f"Failed to complete request after {self.max_retries + 1} attempts")
+    def cache_provider_name(self) -> str:
+        return "finnhub"
 
     def _parse_timeframe(self, timeframe: str) -> str:
         """Parse timeframe into Finnhub resolution format."""
@@ -317,6 +244,7 @@ class FinnhubMarketDataAdapter(IMarketDataProvider):
                 len(closes), len(highs), len(lows), len(opens), len(timestamps), len(volumes)
             )
 
+            price = self._price_type
             for i in range(min_length):
                 try:
                     # Convert Unix timestamp to datetime
@@ -326,10 +254,10 @@ class FinnhubMarketDataAdapter(IMarketDataProvider):
                         id=EntityId.generate(),
                         symbol=symbol,
                         timestamp=Timestamp(timestamp_dt),
-                        open_price=Price.from_float(float(opens[i])),
-                        high_price=Price.from_float(float(highs[i])),
-                        low_price=Price.from_float(float(lows[i])),
-                        close_price=Price.from_float(float(closes[i])),
+                        open_price=price.from_float(float(opens[i])),
+                        high_price=price.from_float(float(highs[i])),
+                        low_price=price.from_float(float(lows[i])),
+                        close_price=price.from_float(float(closes[i])),
                         volume=Volume(int(volumes[i])),
                         trade_count=None,  # Finnhub doesn't provide trade count
                         vwap=None,  # Finnhub doesn't provide VWAP
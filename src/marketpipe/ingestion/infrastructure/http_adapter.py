@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Shared request path of the JSON-over-HTTP provider adapters.
+
+Polygon and Finnhub fetch pages the same way: wait for request budget,
+serve fixed data windows from the response cache, and GET with retries on
+timeouts, transport errors and HTTP 429. Adapters subclass
+:class:`JsonHttpAdapter` and supply only their name and response checks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Optional, cast
+
+import httpx
+
+from marketpipe.tracing import span
+
+from .rate_limit import RateLimiter
+from .response_cache import ResponseCacheMixin
+
+
+class JsonHttpAdapter(ResponseCacheMixin):
+    """Rate-limited, cached, retrying JSON GETs for provider adapters.
+
+    Subclasses set ``api_name`` (used in the User-Agent and error messages)
+    and may override :meth:`check_response` to reject error payloads that
+    arrive with HTTP 200.
+    """
+
+    api_name: str
+    timeout: float
+    max_retries: int
+    log: logging.Logger
+    _rate_limiter: Optional[RateLimiter]
+
+    def check_response(self, data: dict[str, Any]) -> None:
+        """Raise if a decoded response body reports an API error."""
+
+    async def _apply_rate_limit(self) -> None:
+        """Wait for request budget under the per-minute limit."""
+        if self._rate_limiter is None:
+            return
+        # Waiting for a token is waiting for request budget too
+        with span("rate_limit_wait"):
+            await self._rate_limiter.acquire_async()
+
+    async def _make_request(
+        self,
+        url: str,
+        params: dict[str, Any],
+        data_end: Optional[datetime] = None,
+        rate_limit: bool = False,
+    ) -> dict[str, Any]:
+        """Make HTTP request with retry logic.
+
+        When ``data_end`` is given the response describes a fixed data window
+        and is served from / stored in the response cache if one is configured.
+        With ``rate_limit`` the per-minute limit is applied here, so cache hits
+        do not consume request budget.
+        """
+        cached = self._cached_response(url, params, data_end)
+        if cached is not None:
+            return cached
+
+        if rate_limit:
+            await self._apply_rate_limit()
+        data = await self._fetch_json(url, params)
+        self._store_response(url, params, data, data_end)
+        return data
+
+    async def _fetch_json(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Perform the HTTP GET with retries and return the decoded JSON body."""
+        headers = {
+            "User-Agent": f"MarketPipe/1.0 ({self.api_name} Adapter)",
+            "Accept": "application/json",
+        }
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    with span("http"):
+                        response = await client.get(url, params=params, headers=headers)
+
+                    # Handle rate limiting
+                    if response.status_code == 429:
+                        retry_after = int(response.headers.get("Retry-After", 60))
+                        self.log.info(
+                            f"⏳ HTTP 429: Rate limited by server, waiting {retry_after}s..."
+                        )
+                        with span("rate_limit_wait", retry_after=retry_after):
+                            await asyncio.sleep(retry_after)
+                        continue
+
+                    # Handle authentication errors
+                    if response.status_code == 401:
+                        raise ValueError(f"Invalid {self.api_name} API key")
+
+                    # Handle forbidden
+                    if response.status_code == 403:
+                        raise ValueError(
+                            f"{self.api_name} API access forbidden - check subscription"
+                        )
+
+                    # Handle other client errors
+                    if response.status_code >= 400:
+                        error_text = response.text
+                        self.log.error(
+                            f"{self.api_name} API error {response.status_code}: {error_text}"
+                        )
+                        response.raise_for_status()
+
+                    with span("parse_json"):
+                        data = cast(dict[str, Any], response.json())
+                    self.check_response(data)
+                    return data
+
+            except httpx.TimeoutException:
+                if attempt < self.max_retries:
+                    wait_time = 2**attempt  # Exponential backoff
+                    self.log.warning(
+                        f"Request timeout, retrying in {wait_time}s (attempt {attempt + 1})"
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    raise
+            except httpx.RequestError as e:
+                if attempt < self.max_retries:
+                    wait_time = 2**attempt
+                    self.log.warning(
+                        f"Request error: {e}, retrying in {wait_time}s (attempt {attempt + 1})"
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                else:
+                    raise
+
+        raise RuntimeError(f"Failed to complete request after {self.max_retries + 1} attempts")
+
+
+__all__ = ["JsonHttpAdapter"]
@@ -10,6 +10,7 @@ from typing import Any, Optional
 
 import httpx
 
+from marketpipe.config.prices import configured_price_type
 from marketpipe.domain.entities import EntityId, OHLCVBar
 from marketpipe.domain.market_data import (
     IMarketDataProvider,
@@ -17,15 +18,17 @@ from marketpipe.domain.market_data import (
     MarketDataUnavailableError,
     ProviderMetadata,
 )
-from marketpipe.domain.value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp, Volume
 
 from .provider_registry import provider
+from .rate_limit import create_rate_limiter_from_config
+from .response_cache import ResponseCache, ResponseCacheMixin, get_default_response_cache
 
 logger = logging.getLogger(__name__)
 
 
 @provider("iex")
-class IEXMarketDataAdapter(IMarketDataProvider):
+class IEXMarketDataAdapter(ResponseCacheMixin, IMarketDataProvider):
     """
     IEX Cloud market data provider adapter.
 
@@ -39,10 +42,18 @@ class IEXMarketDataAdapter(IMarketDataProvider):
         is_sandbox: bool = False,
         base_url: Optional[str] = None,
         timeout: float = 30.0,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limit_per_min: Optional[int] = None,
+        price_backend: Optional[str] = None,
     ):
         self._api_token = api_token
+        self._price_type = configured_price_type(price_backend)
         self._is_sandbox = is_sandbox
         self._timeout = timeout
+        self._rate_limit_per_min = rate_limit_per_min or (100 if is_sandbox else 500)
+        self._rate_limiter = create_rate_limiter_from_config(
+            rate_limit_per_min=self._rate_limit_per_min, provider_name="iex"
+        )
 
         if base_url:
             self._base_url = base_url
@@ -54,6 +65,10 @@ class IEXMarketDataAdapter(IMarketDataProvider):
             )
 
         self._client: Optional[httpx.AsyncClient] = None
+        self.response_cache = (
+            response_cache if response_cache is not None else get_default_response_cache()
+        )
+        self.log = logger
         logger.info(f"Initialized IEX adapter (sandbox={is_sandbox})")
 
     @classmethod
@@ -67,12 +82,16 @@ class IEXMarketDataAdapter(IMarketDataProvider):
                 - is_sandbox: Whether to use sandbox (optional, default: False)
                 - base_url: Override base URL (optional)
                 - timeout: Request timeout (optional, default: 30.0)
+                - rate_limit_per_min: Rate limit (optional, default: 100 sandbox, 500 production)
+                - price_backend: "decimal" or "fixed" (optional, default: $MARKETPIPE_PRICE_BACKEND)
         """
         return cls(
             api_token=config["api_token"],
             is_sandbox=config.get("is_sandbox", False),
             base_url=config.get("base_url"),
             timeout=config.get("timeout", 30.0),
+            rate_limit_per_min=config.get("rate_limit_per_min"),
+            price_backend=config.get("price_backend"),
         )
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -126,10 +145,19 @@ class IEXMarketDataAdapter(IMarketDataProvider):
 
             logger.debug(f"Fetching IEX data for {symbol.value}: {url}")
 
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+            # Sandbox requests are not pinned to a date, so only production
+            # responses describe a fixed data window worth caching.
+            data_end = None if self._is_sandbox else time_range.end.value
+            raw_data: Any = self._cached_response(url, params, data_end)
+
+            if raw_data is None:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire_async()
+                response = await client.get(url, params=params)
+                response.raise_for_status()
 
-            raw_data = response.json()
+                raw_data = response.json()
+                self._store_response(url, params, raw_data, data_end)
 
             # Handle empty response
             if not raw_data:
@@ -198,14 +226,15 @@ class IEXMarketDataAdapter(IMarketDataProvider):
             volume_value = int(iex_bar["volume"])
 
             # Create domain objects
+            price = self._price_type
             return OHLCVBar(
                 id=EntityId.generate(),
                 symbol=symbol,
                 timestamp=Timestamp(dt),
-                open_price=Price(open_price),
-                high_price=Price(high_price),
-                low_price=Price(low_price),
-                close_price=Price(close_price),
+                open_price=price.from_decimal(open_price),
+                high_price=price.from_decimal(high_price),
+                low_price=price.from_decimal(low_price),
+                close_price=price.from_decimal(close_price),
                 volume=Volume(volume_value),
             )
 
@@ -257,6 +286,8 @@ class IEXMarketDataAdapter(IMarketDataProvider):
             url = f"{self._base_url}/stock/AAPL/quote"
             params = {"token": self._api_token}
 
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
             response = await client.get(url, params=params)
             response.raise_for_status()
 
@@ -267,13 +298,16 @@ class IEXMarketDataAdapter(IMarketDataProvider):
             logger.warning(f"IEX API connection test failed: {e}")
             return False
 
+    def cache_provider_name(self) -> str:
+        return "iex"
+
     def get_provider_metadata(self) -> ProviderMetadata:
         """Get IEX Cloud provider metadata."""
         return ProviderMetadata(
             provider_name="iex",
             supports_real_time=not self._is_sandbox,  # Real-time only in production
             supports_historical=True,
-            rate_limit_per_minute=(100 if self._is_sandbox else 500),  # Approximate limits
+            rate_limit_per_minute=self._rate_limit_per_min,
             minimum_time_resolution="1m",
             maximum_history_days=(30 if self._is_sandbox else 365),  # Sandbox has limited history
         )
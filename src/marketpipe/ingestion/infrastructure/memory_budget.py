@@ -0,0 +1,307 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Process-wide memory budget for bars in flight.
+
+``execute_job`` starts every symbol of a job at once, and each holds its
+fetched bars (about 1.5 KB per bar as domain objects) until they are
+stored. A large job can hold far more than the machine has. With a
+``MemoryBudget`` each symbol first reserves the bytes its bars are
+estimated to take, and waits while the reservations of the process would
+exceed the budget:
+
+    symbol ─▶ reserve(estimate) ──wait while in flight + estimate > budget
+                  │                        or RSS > rss_limit
+                  ▼
+             fetch ─▶ resize(actual) ─▶ validate ─▶ store ─▶ release
+                                                      │
+                                           pipeline table (spilled to an
+                                           Arrow IPC file when tight)
+
+A symbol is always admitted when nothing else is in flight, so a single
+symbol larger than the budget still completes. Tables handed to the
+pipelined stages count against the budget until both stages are done with
+them; when the budget is tight they are written to Arrow IPC files under
+``spill_dir`` and memory-mapped back by the stages instead.
+
+Configured per process with ``MARKETPIPE_MEMORY_BUDGET_MB`` (unset: no
+budget), ``MARKETPIPE_MEMORY_RSS_LIMIT_MB`` and ``MARKETPIPE_SPILL_DIR``.
+Usage is exported as ``mp_memory_budget_bytes{kind=...}`` (summed over
+worker processes) and the per-process limit and peak as
+``mp_memory_budget_process_bytes{kind=...}`` (largest over processes).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import uuid
+import weakref
+from pathlib import Path
+from typing import Any, Optional
+
+import pyarrow as pa
+from prometheus_client import Counter, Gauge
+
+from marketpipe.metrics_debug import watch
+
+logger = logging.getLogger(__name__)
+
+# Measured footprint of one OHLCVBar with its value objects
+BAR_BYTES = 1536
+# Minutes of a trading day with bars (US pre-market to after-hours)
+SESSION_MINUTES = 960
+_TIMEFRAME_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60, "4h": 240, "1d": 1440}
+# Usage share of the budget above which pipeline tables are spilled
+SPILL_THRESHOLD = 0.8
+
+MEMORY_BUDGET_BYTES = Gauge(
+    "mp_memory_budget_bytes",
+    "Bytes of bars in flight and process RSS, summed over live processes",
+    ["kind"],  # in_flight, rss
+    multiprocess_mode="livesum",
+)
+# Limit and peak are per process: summing them over workers means nothing
+MEMORY_BUDGET_PROCESS_BYTES = Gauge(
+    "mp_memory_budget_process_bytes",
+    "Per-process memory budget limit and peak bytes in flight, largest over processes",
+    ["kind"],  # limit, peak
+    multiprocess_mode="max",
+)
+MEMORY_BUDGET_WAITS = Counter(
+    "mp_memory_budget_waits_total", "Symbol fetches that waited for room in the memory budget"
+)
+MEMORY_SPILLED_BYTES = Counter(
+    "mp_memory_spilled_bytes_total", "Bytes of pipeline tables spilled to Arrow IPC files"
+)
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, or None when unknown."""
+    try:
+        import psutil
+
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class SpilledTable:
+    """An Arrow table moved to an IPC file; the file goes with the last reference."""
+
+    def __init__(self, table: pa.Table, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"spill-{os.getpid()}-{uuid.uuid4().hex}.arrow"
+        with pa.OSFile(str(self.path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        self.num_rows = table.num_rows
+        self.nbytes = table.nbytes
+        self._finalizer = weakref.finalize(self, _remove, self.path)
+
+    def load(self) -> pa.Table:
+        """The table, memory-mapped from the file (pages are read on access)."""
+        return pa.ipc.open_file(pa.memory_map(str(self.path))).read_all()
+
+
+def _remove(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:  # already gone, or still mapped on Windows
+        pass
+
+
+class Reservation:
+    """Bytes reserved in a ``MemoryBudget`` by one symbol."""
+
+    def __init__(self, budget: MemoryBudget, nbytes: int):
+        self._budget = budget
+        self.nbytes = nbytes
+
+    def resize(self, nbytes: int) -> None:
+        """Replace the estimate with the measured size (may exceed the budget)."""
+        self._budget._adjust(nbytes - self.nbytes)
+        self.nbytes = nbytes
+
+    def release(self) -> None:
+        self._budget._adjust(-self.nbytes)
+        self.nbytes = 0
+
+
+class MemoryBudget:
+    """Limits the bytes of bars in flight in this process."""
+
+    def __init__(
+        self,
+        limit_bytes: int,
+        rss_limit_bytes: Optional[int] = None,
+        spill_dir: Optional[Path] = None,
+        poll_interval: float = 0.05,
+    ):
+        """Initialize the budget.
+
+        Args:
+            limit_bytes: Bytes of bars allowed in flight
+            rss_limit_bytes: No symbol is admitted while the process RSS is
+                above this, or None to only count reservations
+            spill_dir: Directory of spilled pipeline tables (default: the
+                system temporary directory)
+            poll_interval: Seconds between admission checks of waiting symbols
+
+        Raises:
+            ValueError: If limit_bytes is not positive
+        """
+        if limit_bytes <= 0:
+            raise ValueError("limit_bytes must be positive")
+        self.limit_bytes = limit_bytes
+        self.rss_limit_bytes = rss_limit_bytes
+        self.spill_dir = spill_dir or Path(tempfile.gettempdir()) / "marketpipe-spill"
+        self.poll_interval = poll_interval
+        self.in_flight = 0
+        self.peak = 0
+        self.waiting = 0
+        self._lock = threading.Lock()
+        MEMORY_BUDGET_PROCESS_BYTES.labels(kind="limit").set(limit_bytes)
+        watch(self)
+
+    @classmethod
+    def from_env(cls) -> Optional[MemoryBudget]:
+        """Budget from ``$MARKETPIPE_MEMORY_BUDGET_MB``; None when unset or 0."""
+        limit_mb = _mb_from_env("MARKETPIPE_MEMORY_BUDGET_MB")
+        if not limit_mb:
+            return None
+        rss_mb = _mb_from_env("MARKETPIPE_MEMORY_RSS_LIMIT_MB")
+        spill_dir = os.getenv("MARKETPIPE_SPILL_DIR")
+        return cls(
+            limit_bytes=limit_mb * 2**20,
+            rss_limit_bytes=rss_mb * 2**20 if rss_mb else None,
+            spill_dir=Path(spill_dir) if spill_dir else None,
+        )
+
+    @staticmethod
+    def estimate_bytes(start_ns: int, end_ns: int, timeframe: str = "1m") -> int:
+        """Estimated bytes of the bars of one symbol between two timestamps."""
+        trading_days = max(0, end_ns - start_ns) / 86_400e9 * 5 / 7
+        per_day = max(1, SESSION_MINUTES // _TIMEFRAME_MINUTES.get(timeframe, 1))
+        return int(max(1.0, trading_days * per_day) * BAR_BYTES)
+
+    @staticmethod
+    def bars_bytes(bars: Any) -> int:
+        """Bytes of a list of domain bars."""
+        return len(bars) * BAR_BYTES
+
+    @property
+    def tight(self) -> bool:
+        """Whether usage is near the limit, so buffered tables should be spilled."""
+        if self.in_flight >= SPILL_THRESHOLD * self.limit_bytes:
+            return True
+        if self.rss_limit_bytes is not None:
+            rss = current_rss()
+            return rss is not None and rss >= SPILL_THRESHOLD * self.rss_limit_bytes
+        return False
+
+    async def reserve(self, nbytes: int) -> Reservation:
+        """Reserve ``nbytes``, waiting while the budget has no room for them."""
+        if not self._try_reserve(nbytes):
+            MEMORY_BUDGET_WAITS.inc()
+            self.waiting += 1
+            try:
+                while not self._try_reserve(nbytes):
+                    await asyncio.sleep(self.poll_interval)
+            finally:
+                self.waiting -= 1
+        return Reservation(self, nbytes)
+
+    def track(self, owner: Any, nbytes: int) -> None:
+        """Count ``nbytes`` against the budget for as long as ``owner`` is alive."""
+        self._adjust(nbytes)
+        weakref.finalize(owner, self._adjust, -nbytes)
+
+    def spill(self, table: pa.Table) -> SpilledTable:
+        """Write a table to an Arrow IPC file of ``spill_dir``."""
+        spilled = SpilledTable(table, self.spill_dir)
+        MEMORY_SPILLED_BYTES.inc(spilled.nbytes)
+        logger.debug(f"Spilled {spilled.num_rows} rows to {spilled.path}")
+        return spilled
+
+    def debug_state(self) -> dict[str, Any]:
+        return {
+            "kind": "memory_budget",
+            "limit_bytes": self.limit_bytes,
+            "in_flight_bytes": self.in_flight,
+            "peak_bytes": self.peak,
+            "rss_bytes": current_rss(),
+            "rss_limit_bytes": self.rss_limit_bytes,
+            "waiting": self.waiting,
+        }
+
+    def _try_reserve(self, nbytes: int) -> bool:
+        with self._lock:
+            if self.in_flight > 0:
+                if self.in_flight + nbytes > self.limit_bytes:
+                    return False
+                if self.rss_limit_bytes is not None:
+                    rss = current_rss()
+                    MEMORY_BUDGET_BYTES.labels(kind="rss").set(rss or 0)
+                    if rss is not None and rss > self.rss_limit_bytes:
+                        return False
+            self._adjust_locked(nbytes)
+            return True
+
+    def _adjust(self, delta: int) -> None:
+        with self._lock:
+            self._adjust_locked(delta)
+
+    def _adjust_locked(self, delta: int) -> None:
+        self.in_flight = max(0, self.in_flight + delta)
+        self.peak = max(self.peak, self.in_flight)
+        MEMORY_BUDGET_BYTES.labels(kind="in_flight").set(self.in_flight)
+        MEMORY_BUDGET_PROCESS_BYTES.labels(kind="peak").set(self.peak)
+
+
+def _mb_from_env(name: str) -> int:
+    try:
+        return max(0, int(os.getenv(name, "0")))
+    except ValueError:
+        logger.warning(f"Ignoring {name}={os.getenv(name)!r}: not a number of megabytes")
+        return 0
+
+
+# Budget of this process, created from the environment on first use
+_budget: Optional[MemoryBudget] = None
+_budget_loaded = False
+
+
+def get_memory_budget() -> Optional[MemoryBudget]:
+    """The process-wide memory budget, or None when no budget is configured."""
+    global _budget, _budget_loaded
+    if not _budget_loaded:
+        _budget, _budget_loaded = MemoryBudget.from_env(), True
+    return _budget
+
+
+def install_memory_budget(budget: Optional[MemoryBudget]) -> None:
+    """Replace the process-wide memory budget (None removes it)."""
+    global _budget, _budget_loaded
+    _budget, _budget_loaded = budget, True
+
+
+__all__ = [
+    "BAR_BYTES",
+    "MEMORY_BUDGET_BYTES",
+    "MEMORY_BUDGET_PROCESS_BYTES",
+    "MEMORY_BUDGET_WAITS",
+    "MEMORY_SPILLED_BYTES",
+    "MemoryBudget",
+    "Reservation",
+    "SpilledTable",
+    "current_rss",
+    "get_memory_budget",
+    "install_memory_budget",
+]
@@ -4,23 +4,29 @@
 from __future__ import annotations
 
 import logging
+from datetime import date
 from pathlib import Path
-from typing import Union, cast
+from typing import Optional, Union, cast
 
 from marketpipe.domain.entities import OHLCVBar
 
 # Re-export the production storage engine to maintain backward compatibility
-from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine, StorageProfile
 
 from ..domain.storage import IDataStorage
-from ..domain.value_objects import IngestionConfiguration, IngestionPartition
+from ..domain.value_objects import IngestionConfiguration, IngestionPartition, PartitionCoverage
 
 
 class ParquetDataStorageAdapter(IDataStorage):
     """Adapter that implements IDataStorage using ParquetStorageEngine."""
 
-    def __init__(self, root: Union[Path, str], compression: str = "snappy"):
-        self._engine = ParquetStorageEngine(root, compression)
+    def __init__(
+        self,
+        root: Union[Path, str],
+        compression: Optional[str] = None,
+        profile: Union[str, StorageProfile, None] = None,
+    ):
+        self._engine = ParquetStorageEngine(root, compression, profile=profile)
         self.log = logging.getLogger(self.__class__.__name__)
 
     async def store_bars(
@@ -33,6 +39,19 @@ class ParquetDataStorageAdapter(IDataStorage):
         # Use the engine's store_bars method which properly handles multi-day data
         return cast(IngestionPartition, await self._engine.store_bars(bars, config))
 
+    async def get_coverage(
+        self, symbol: str, timeframe: str, start_date: date, end_date: date
+    ) -> dict[date, PartitionCoverage]:
+        """Return stored coverage per trading day."""
+        return cast(
+            dict[date, PartitionCoverage],
+            await self._engine.get_coverage(symbol, timeframe, start_date, end_date),
+        )
+
+    def close(self) -> None:
+        """Stop the engine's background writer threads."""
+        self._engine.close()
+
 
 # Use the adapter as ParquetDataStorage for backward compatibility
 ParquetDataStorage = ParquetDataStorageAdapter
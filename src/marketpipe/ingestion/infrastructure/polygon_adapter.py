@@ -3,23 +3,25 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import httpx
 
+from marketpipe.config.prices import configured_price_type
 from marketpipe.domain.entities import EntityId, OHLCVBar
 from marketpipe.domain.market_data import IMarketDataProvider, ProviderMetadata
-from marketpipe.domain.value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp, Volume
+from marketpipe.tracing import span
 
+from .http_adapter import JsonHttpAdapter
 from .provider_registry import provider
+from .rate_limit import create_rate_limiter_from_config
+from .response_cache import ResponseCache, get_default_response_cache
 
 
 @provider("polygon")
-class PolygonMarketDataAdapter(IMarketDataProvider):
+class PolygonMarketDataAdapter(JsonHttpAdapter, IMarketDataProvider):
     """
     Anti-corruption layer for Polygon.io API integration.
 
@@ -29,6 +31,8 @@ class PolygonMarketDataAdapter(IMarketDataProvider):
     API Documentation: https://polygon.io/docs/rest/stocks/aggregates/custom-bars
     """
 
+    api_name = "Polygon.io"
+
     def __init__(
         self,
         api_key: str,
@@ -37,17 +41,23 @@ class PolygonMarketDataAdapter(IMarketDataProvider):
         timeout: float = 30.0,
         max_retries: int = 3,
         logger: Optional[logging.Logger] = None,
+        response_cache: Optional[ResponseCache] = None,
+        price_backend: Optional[str] = None,
     ):
         self.api_key = api_key
+        self._price_type = configured_price_type(price_backend)
         self.base_url = base_url.rstrip("/")
         self.rate_limit_per_minute = rate_limit_per_minute
         self.timeout = timeout
         self.max_retries = max_retries
         self.log = logger or logging.getLogger(self.__class__.__name__)
+        self.response_cache = (
+            response_cache if response_cache is not None else get_default_response_cache()
+        )
 
-        # Rate limiting state
-        self._request_times: list[float] = []
-        self._rate_limit_lock = asyncio.Lock()
+        self._rate_limiter = create_rate_limiter_from_config(
+            rate_limit_per_min=rate_limit_per_minute, provider_name="polygon"
+        )
 
         self.log.info(
             f"Polygon adapter initialized with {rate_limit_per_minute} requests/min limit"
@@ -95,9 +105,6 @@ class PolygonMarketDataAdapter(IMarketDataProvider):
             page_count += 1
             self.log.info(f"📥 Fetching page {page_count} for {symbol.value}...")
 
-            # Apply rate limiting
-            await self._apply_rate_limit()
-
             # Build request URL
             url = f"{self.base_url}/v2/aggs/ticker/{symbol.value}/range/{multiplier}/{timespan}/{from_date}/{to_date}"
 
@@ -114,61 +121,65 @@ class PolygonMarketDataAdapter(IMarketDataProvider):
 
             self.log.debug(f"Requesting: {url} with params: {params}")
 
-            try:
-                # Make HTTP request
-                response_data = await self._make_request(url, params)
-
-                # Parse response
-                if "results" in response_data and response_data["results"]:
-                    page_bars = self._parse_polygon_response(response_data, symbol)
-
-                    # Filter bars to only include those within the requested time range
-                    # This prevents pagination from downloading data outside the requested range
-                    filtered_bars = []
-                    for bar in page_bars:
-                        bar_ts = int(bar.timestamp.value.timestamp() * 1000)
-                        if start_ts <= bar_ts <= end_ts:
-                            filtered_bars.append(bar)
-                        elif bar_ts > end_ts:
-                            # Bar is after our end date - stop pagination
-                            self.log.info(
-                                f"⏹️  Reached end of requested date range at bar {bar.timestamp.value}"
-                            )
-                            cursor = None  # Force stop pagination
+            with span("page", page=page_count):
+                try:
+                    # Make HTTP request (rate limited unless served from the response cache)
+                    response_data = await self._make_request(
+                        url, params, data_end=time_range.end.value, rate_limit=True
+                    )
+
+                    # Parse response
+                    if "results" in response_data and response_data["results"]:
+                        with span("translate"):
+                            page_bars = self._parse_polygon_response(response_data, symbol)
+
+                        # Filter bars to only include those within the requested time range
+                        # This prevents pagination from downloading data outside the requested range
+                        filtered_bars = []
+                        reached_end = False
+                        for bar in page_bars:
+                            bar_ts = int(bar.timestamp.value.timestamp() * 1000)
+                            if start_ts <= bar_ts <= end_ts:
+                                filtered_bars.append(bar)
+                            elif bar_ts > end_ts:
+                                # Bar is after our end date - stop pagination
+                                self.log.info(
+                                    f"⏹️  Reached end of requested date range at bar {bar.timestamp.value}"
+                                )
+                                reached_end = True  # Force stop pagination
+                                break
+
+                        bars.extend(filtered_bars)
+                        self.log.info(
+                            f"✅ Page {page_count}: Downloaded {len(page_bars)} bars, "
+                            f"kept {len(filtered_bars)} within range (Total: {len(bars)} bars)"
+                        )
+
+                        if reached_end:
                             break
+                    else:
+                        self.log.warning(f"No results in response for {symbol.value}")
+                        break
 
-                    bars.extend(filtered_bars)
-                    self.log.info(
-                        f"✅ Page {page_count}: Downloaded {len(page_bars)} bars, "
-                        f"kept {len(filtered_bars)} within range (Total: {len(bars)} bars)"
-                    )
+                    # Check for pagination
+                    cursor = response_data.get("next_url")
+                    if not cursor:
+                        break
 
-                    # If cursor was cleared due to reaching end date, break
-                    if cursor is None:
+                    # Extract cursor from next_url if present
+                    if cursor and "cursor=" in cursor:
+                        cursor = cursor.split("cursor=")[1].split("&")[0]
+                    else:
+                        cursor = None
+
+                except Exception as e:
+                    self.log.error(f"Failed to fetch page {page_count} for {symbol.value}: {e}")
+                    if page_count == 1:
+                        # If first page fails, re-raise
+                        raise
+                    else:
+                        # If subsequent pages fail, return what we have
                         break
-                else:
-                    self.log.warning(f"No results in response for {symbol.value}")
-                    break
-
-                # Check for pagination
-                cursor = response_data.get("next_url")
-                if not cursor:
-                    break
-
-                # Extract cursor from next_url if present
-                if cursor and "cursor=" in cursor:
-                    cursor = cursor.split("cursor=")[1].split("&")[0]
-                else:
-                    cursor = None
-
-            except Exception as e:
-                self.log.error(f"Failed to fetch page {page_count} for {symbol.value}: {e}")
-                if page_count == 1:
-                    # If first page fails, re-raise
-                    raise
-                else:
-                    # If subsequent pages fail, return what we have
-                    break
 
         if bars:
             self.log.info(
@@ -274,100 +285,13 @@ class PolygonMarketDataAdapter(IMarketDataProvider):
         # Delegate to the interface method
         return await self.fetch_bars_for_symbol(symbol, time_range, batch_size, timeframe)
 
-    async def _apply_rate_limit(self) -> None:
-        """Apply rate limiting based on free tier limits."""
-        async with self._rate_limit_lock:
-            now = time.time()
-
-            # Remove requests older than 1 minute
-            cutoff = now - 60.0
-            self._request_times = [t for t in self._request_times if t > cutoff]
-
-            # Check if we need to wait
-            if len(self._request_times) >= self.rate_limit_per_minute:
-                # Calculate wait time
-                oldest_request = min(self._request_times)
-                wait_time = 60.0 - (now - oldest_request)
-
-                if wait_time > 0:
-                    self.log.info(
-                        f"⏳ Rate limit ({self.rate_limit_per_minute}/min) reached, "
-                        f"waiting {wait_time:.1f}s..."
-                    )
-                    await asyncio.sleep(wait_time)
-
-            # Record this request
-            self._request_times.append(now)
-
-    async def _make_request(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make HTTP request with retry logic."""
-        headers = {
-            "User-Agent": "MarketPipe/1.0 (Polygon.io Adapter)",
-            "Accept": "application/json",
-        }
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url, params=params, headers=headers)
-
-                    # Handle rate limiting
-                    if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 60))
-                        self.log.info(
-                            f"⏳ HTTP 429: Rate limited by server, waiting {retry_after}s..."
-                        )
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    # Handle authentication errors
-                    if response.status_code == 401:
-                        raise ValueError("Invalid Polygon.io API key")
-
-                    # Handle forbidden
-                    if response.status_code == 403:
-                        raise ValueError("Polygon.io API access forbidden - check subscription")
-
-                    # Handle other client errors
-                    if response.status_code >= 400:
-                        error_text = response.text
-                        self.log.error(f"Polygon API error {response.status_code}: {error_text}")
-                        response.raise_for_status()
-
-                    # Parse JSON response
-                    from typing import cast
-
-                    data = cast(dict[str, Any], response.json())
-
-                    # Check API status
-                    if data.get("status") == "ERROR":
-                        error_msg = data.get("error", "Unknown API error")
-                        raise ValueError(f"Polygon API error: {error_msg}")
-
-                    return data
-
-            except httpx.TimeoutException:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt  # Exponential backoff
-                    self.log.warning(
-                        f"Request timeout, retrying in {wait_time}s (attempt {attempt + 1})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    raise
-            except httpx.RequestError as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    self.log.warning(
-                        f"Request error: {e}, retrying in {wait_time}s (attempt {attempt + 1})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    raise
+    def cache_provider_name(self) -> str:
+        return "polygon"
 
-        raise RuntimeError(f"Failed to complete request after {self.max_retries + 1} attempts")
+    def check_response(self, data: dict[str, Any]) -> None:
+        if data.get("status") == "ERROR":
+            error_msg = data.get("error", "Unknown API error")
+            raise ValueError(f"Polygon API error: {error_msg}")
 
     def _parse_timeframe(self, timeframe: str) -> tuple[int, str]:
         """Parse timeframe into multiplier and timespan for Polygon API."""
@@ -393,6 +317,7 @@ class PolygonMarketDataAdapter(IMarketDataProvider):
     ) -> list[OHLCVBar]:
         """Parse Polygon.io API response into OHLCVBar objects."""
         bars = []
+        price = self._price_type
 
         for result in response_data.get("results", []):
             try:
@@ -416,13 +341,13 @@ class PolygonMarketDataAdapter(IMarketDataProvider):
                     id=EntityId.generate(),
                     symbol=symbol,
                     timestamp=Timestamp(timestamp_dt),
-                    open_price=Price.from_float(float(result["o"])),
-                    high_price=Price.from_float(float(result["h"])),
-                    low_price=Price.from_float(float(result["l"])),
-                    close_price=Price.from_float(float(result["c"])),
+                    open_price=price.from_float(float(result["o"])),
+                    high_price=price.from_float(float(result["h"])),
+                    low_price=price.from_float(float(result["l"])),
+                    close_price=price.from_float(float(result["c"])),
                     volume=Volume(int(result["v"])),
                     trade_count=result.get("n"),
-                    vwap=Price.from_float(float(result["vw"])) if result.get("vw") else None,
+                    vwap=price.from_float(float(result["vw"])) if result.get("vw") else None,
                 )
 
                 bars.append(bar)
@@ -272,10 +272,19 @@ class PostgresIngestionJobRepository(IIngestionJobRepository):
                 logger.error(f"Failed to count jobs by state: {e}")
                 raise IngestionRepositoryError(f"Failed to count jobs by state: {e}") from e
 
-    async def fetch_and_lock(self, state: ProcessingState, limit: int) -> list[IngestionJob]:
+    async def fetch_and_lock(
+        self,
+        state: ProcessingState,
+        limit: int,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> list[IngestionJob]:
         """
         Fetch jobs in specified state and lock them for processing.
         Uses PostgreSQL SELECT FOR UPDATE SKIP LOCKED for high concurrency.
+
+        With a ``worker_id`` the claimed jobs are leased to that worker, and
+        IN_PROGRESS jobs whose lease expired are reclaimed as well.
         """
         with REPO_LATENCY.labels("fetch_and_lock", "postgres").time():
             REPO_QUERIES.labels("fetch_and_lock", "postgres").inc()
@@ -290,12 +299,15 @@ class PostgresIngestionJobRepository(IIngestionJobRepository):
                             """
                             SELECT id, payload FROM ingestion_jobs
                             WHERE state = $1
+                               OR ($3 AND state = $4 AND lease_expires_at < now())
                             ORDER BY updated_at ASC
                             LIMIT $2
                             FOR UPDATE SKIP LOCKED
                             """,
                             state.value,
                             limit,
+                            worker_id is not None,
+                            ProcessingState.IN_PROGRESS.value,
                         )
 
                         if not rows:
@@ -306,12 +318,15 @@ class PostgresIngestionJobRepository(IIngestionJobRepository):
                         await conn.execute(
                             """
                             UPDATE ingestion_jobs
-                            SET state = $1, updated_at = $2
+                            SET state = $1, updated_at = $2, lease_owner = $4,
+                                lease_expires_at = now() + make_interval(secs => $5)
                             WHERE id = ANY($3::int[])
                             """,
                             ProcessingState.IN_PROGRESS.value,
                             datetime.now(),
                             job_ids,
+                            worker_id,
+                            lease_seconds if worker_id and lease_seconds else None,
                         )
 
                         # Deserialize and update jobs
@@ -330,6 +345,74 @@ class PostgresIngestionJobRepository(IIngestionJobRepository):
                 logger.error(f"Failed to fetch and lock jobs: {e}")
                 raise IngestionRepositoryError(f"Failed to fetch and lock jobs: {e}") from e
 
+    async def renew_leases(
+        self, worker_id: str, job_ids: list[IngestionJobId], lease_seconds: float
+    ) -> list[IngestionJobId]:
+        """Extend the leases a worker still holds.
+
+        Returns:
+            Jobs whose lease was renewed; the others were reclaimed or finished
+        """
+        with REPO_LATENCY.labels("renew_leases", "postgres").time():
+            REPO_QUERIES.labels("renew_leases", "postgres").inc()
+
+            try:
+                pool = await self._get_pool()
+
+                async with pool.acquire() as conn:
+                    rows = await conn.fetch(
+                        """
+                        UPDATE ingestion_jobs
+                        SET lease_expires_at = now() + make_interval(secs => $3)
+                        WHERE lease_owner = $1 AND state = $4
+                          AND payload->>'job_id' = ANY($2::text[])
+                        RETURNING payload->>'job_id' AS job_id
+                        """,
+                        worker_id,
+                        [str(job_id) for job_id in job_ids],
+                        lease_seconds,
+                        ProcessingState.IN_PROGRESS.value,
+                    )
+
+                renewed = {row["job_id"] for row in rows}
+                return [job_id for job_id in job_ids if str(job_id) in renewed]
+
+            except asyncpg.PostgresError as e:
+                logger.error(f"Failed to renew leases: {e}")
+                raise IngestionRepositoryError(f"Failed to renew leases: {e}") from e
+
+    async def release_leases(
+        self, worker_id: str, job_ids: list[IngestionJobId], requeue: bool = False
+    ) -> int:
+        """Drop a worker's leases, optionally returning running jobs to PENDING."""
+        with REPO_LATENCY.labels("release_leases", "postgres").time():
+            REPO_QUERIES.labels("release_leases", "postgres").inc()
+
+            try:
+                pool = await self._get_pool()
+
+                async with pool.acquire() as conn:
+                    result = await conn.execute(
+                        """
+                        UPDATE ingestion_jobs
+                        SET lease_owner = NULL, lease_expires_at = NULL,
+                            state = CASE WHEN $3 AND state = $4 THEN $5 ELSE state END
+                        WHERE lease_owner = $1 AND payload->>'job_id' = ANY($2::text[])
+                        """,
+                        worker_id,
+                        [str(job_id) for job_id in job_ids],
+                        requeue,
+                        ProcessingState.IN_PROGRESS.value,
+                        ProcessingState.PENDING.value,
+                    )
+
+                # asyncpg returns the command tag, e.g. "UPDATE 2"
+                return int(result.split()[-1])
+
+            except asyncpg.PostgresError as e:
+                logger.error(f"Failed to release leases: {e}")
+                raise IngestionRepositoryError(f"Failed to release leases: {e}") from e
+
     async def count_old_jobs(self, cutoff_date: str) -> int:
         """Count jobs older than cutoff date."""
         with REPO_LATENCY.labels("count_old_jobs", "postgres").time():
@@ -404,6 +487,8 @@ class PostgresIngestionJobRepository(IIngestionJobRepository):
                 "batch_size": job.configuration.batch_size,
                 "rate_limit_per_minute": job.configuration.rate_limit_per_minute,
                 "feed_type": job.configuration.feed_type,
+                "timeframe": job.configuration.timeframe,
+                "incremental": job.configuration.incremental,
             },
             "state": job.state.value,
             "created_at": job.created_at.isoformat(),
@@ -462,6 +547,8 @@ class PostgresIngestionJobRepository(IIngestionJobRepository):
             batch_size=config_data.get("batch_size", 1000),
             rate_limit_per_minute=config_data.get("rate_limit_per_minute", 200),
             feed_type=config_data.get("feed_type", "iex"),
+            timeframe=config_data.get("timeframe", "1m"),
+            incremental=config_data.get("incremental", False),
         )
 
         # Reconstruct time range
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Process-pool execution of an ingestion job's symbols.
+
+Fetching is I/O bound, but decoding provider responses, building bar
+entities, validating them and encoding Parquet all hold the GIL, so a single
+process saturates one core long before the provider quota. A
+``SymbolProcessPool`` attached to the ingestion coordinator spreads a job's
+symbols over worker processes instead:
+
+    parent: execute_job ─┬─▶ process 1: loop + provider ─ fetch/validate/store AAPL, NVDA
+                         ├─▶ process 2: loop + provider ─ fetch/validate/store MSFT, AMZN
+                         └─▶ ...
+            ◀── (symbol, bars, partition) as each symbol finishes ── job bookkeeping
+
+Each process builds its own services once (event loop, provider client,
+storage, checkpoint store) and keeps them for every symbol it is given. All
+processes draw on one ``SharedRateLimiter``, so the provider quota is
+respected as a whole. The parent keeps the job: it marks symbols processed,
+saves progress and publishes events as results stream back.
+
+With ``PROMETHEUS_MULTIPROC_DIR`` set, worker metrics are written to that
+directory and served, summed, by the parent's metrics server; ``shutdown``
+archives the files of the stopped workers (``marketpipe.metrics_multiprocess``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.util
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from prometheus_client import Counter
+
+from ..domain.entities import IngestionJob
+from .rate_limit import SharedRateLimiter, install_shared_rate_limiter
+
+PROCESS_POOL_SYMBOLS = Counter(
+    "mp_ingest_process_pool_symbols_total",
+    "Symbols ingested by worker processes",
+    ["outcome"],  # success, failure
+)
+
+# State of a worker process, set up once by ``_init_worker``
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_coordinator: Any = None
+
+
+def _init_worker(
+    build_coordinator: Callable[[], Any], rate_limiter: Optional[SharedRateLimiter]
+) -> None:
+    """Build the services of a worker process (runs once per process)."""
+    global _worker_loop, _worker_coordinator
+    # Installed first so the provider built below uses the shared quota
+    install_shared_rate_limiter(rate_limiter)
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_coordinator = build_coordinator()
+    # Run when the pool stops the process: stops the storage writer threads
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker() -> None:
+    if _worker_coordinator is not None and hasattr(_worker_coordinator, "close"):
+        _worker_coordinator.close()
+
+
+def _ingest_symbol(job: IngestionJob, symbol) -> tuple:
+    """Fetch, validate and store one symbol in a worker process."""
+    assert _worker_loop is not None, "worker process was not initialized"
+    try:
+        return _worker_loop.run_until_complete(_worker_coordinator.process_symbol(job, symbol))
+    except Exception as e:
+        # Provider exceptions may not pickle; the parent only needs the message
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
+
+
+class SymbolProcessPool:
+    """Runs the symbols of ingestion jobs on a pool of worker processes."""
+
+    def __init__(
+        self,
+        build_coordinator: Callable[[], Any],
+        workers: int,
+        *,
+        rate_limit_per_min: Optional[int],
+        burst_size: Optional[int] = None,
+    ):
+        """Initialize the pool; processes start with the first job.
+
+        Args:
+            build_coordinator: Picklable module-level callable (or ``partial``)
+                returning the ``IngestionCoordinatorService`` of a worker process
+            workers: Worker processes
+            rate_limit_per_min: Provider quota shared by all processes. Required
+                so that a provider with a quota is never run with one limiter
+                per process; pass None only for providers without a quota
+            burst_size: Shared bucket capacity (default: ``rate_limit_per_min``)
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._build_coordinator = build_coordinator
+        self.workers = workers
+        self._context = multiprocessing.get_context("spawn")
+        self._rate_limiter: Optional[SharedRateLimiter] = None
+        if rate_limit_per_min:
+            self._rate_limiter = SharedRateLimiter(
+                capacity=burst_size or rate_limit_per_min,
+                refill_rate=rate_limit_per_min / 60.0,
+                context=self._context,
+            )
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def rate_limiter(self) -> Optional[SharedRateLimiter]:
+        """Limiter shared by the worker processes."""
+        return self._rate_limiter
+
+    async def process(self, job: IngestionJob, symbols: list) -> AsyncIterator[tuple[Any, Any]]:
+        """Ingest symbols of a job in the worker processes.
+
+        Args:
+            job: Job being executed (sent to the workers for its configuration)
+            symbols: Symbols to ingest
+
+        Yields:
+            ``(symbol, (bars_count, partition))`` or ``(symbol, exception)``,
+            in completion order
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._executor()
+        self.log.info(
+            f"Ingesting {len(symbols)} symbols of job {job.job_id} on {self.workers} processes"
+        )
+
+        async def run(symbol):
+            try:
+                result = await loop.run_in_executor(pool, _ingest_symbol, job, symbol)
+            except Exception as e:
+                PROCESS_POOL_SYMBOLS.labels(outcome="failure").inc()
+                return symbol, e
+            PROCESS_POOL_SYMBOLS.labels(outcome="success").inc()
+            return symbol, result
+
+        for finished in asyncio.as_completed([run(symbol) for symbol in symbols]):
+            yield await finished
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+            if wait:
+                from marketpipe.metrics_multiprocess import cleanup_dead_processes
+
+                cleanup_dead_processes()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            from marketpipe.metrics_multiprocess import multiprocess_dir, multiprocess_enabled
+
+            if multiprocess_dir() and not multiprocess_enabled():
+                self.log.warning(
+                    "PROMETHEUS_MULTIPROC_DIR was set after metrics were created; "
+                    "this process's metrics are missing from the aggregated /metrics"
+                )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._build_coordinator, self._rate_limiter),
+            )
+        return self._pool
+
+
+__all__ = ["PROCESS_POOL_SYMBOLS", "SymbolProcessPool"]
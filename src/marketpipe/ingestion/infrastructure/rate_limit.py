@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
 import threading
 import time
-from typing import Optional
+from typing import Any, Optional
 
 from prometheus_client import Counter
 
+from marketpipe.metrics_debug import watch
+
 # Metrics for rate limiter waits
 RATE_LIMITER_WAITS = Counter(
     "mp_rate_limiter_waits_total", "Number of times rate limiter caused wait", ["provider", "mode"]
@@ -53,6 +56,8 @@ class RateLimiter:
         # Retry-After state
         self._retry_after_until: Optional[float] = None
 
+        watch(self)
+
     def set_provider_name(self, provider_name: str) -> None:
         """Set provider name for metrics labeling."""
         self._provider_name = provider_name
@@ -235,6 +240,23 @@ class RateLimiter:
         """Get refill rate in tokens per second."""
         return self._refill_rate
 
+    def debug_state(self) -> dict[str, Any]:
+        """Bucket state reported on the metrics server's ``/debug/state``."""
+        return {
+            "kind": "rate_limiter",
+            "type": type(self).__name__,
+            "provider": self._provider_name,
+            "tokens": round(self.get_available_tokens(), 3),
+            "capacity": self._capacity,
+            "refill_per_second": self._refill_rate,
+            "retry_after_seconds": round(self._retry_after_remaining(), 3),
+        }
+
+    def _retry_after_remaining(self) -> float:
+        if self._retry_after_until is None:
+            return 0.0
+        return max(0.0, self._retry_after_until - time.monotonic())
+
     def reset(self) -> None:
         """Reset the rate limiter to initial state (for testing)."""
         with self._sync_condition:
@@ -244,6 +266,138 @@ class RateLimiter:
             self._sync_condition.notify_all()
 
 
+class SharedRateLimiter(RateLimiter):
+    """Token bucket shared by several processes.
+
+    The bucket lives in shared memory guarded by a process lock, so worker
+    processes started from the same pool draw on one provider quota instead
+    of one quota each. Pass the limiter to the processes when they start
+    (e.g. as a pool ``initializer`` argument); clocks use wall time because
+    monotonic clocks are not comparable across processes on every platform.
+
+    Args:
+        capacity: Maximum number of tokens in the bucket (burst size)
+        refill_rate: Tokens added per second
+        context: Multiprocessing context of the processes sharing the bucket
+    """
+
+    def __init__(self, capacity: int, refill_rate: float, context: Any = None):
+        """Initialize the shared bucket, full.
+
+        Args:
+            capacity: Maximum tokens in bucket (allows burst up to this amount)
+            refill_rate: Rate of token refill in tokens per second
+            context: Multiprocessing context (default: ``spawn``)
+        """
+        super().__init__(capacity, refill_rate)
+        context = context or multiprocessing.get_context("spawn")
+        self._lock = context.Lock()
+        # tokens, last refill, retry-after deadline (0: none)
+        self._state = context.Array("d", [float(capacity), time.time(), 0.0], lock=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "capacity": self._capacity,
+            "refill_rate": self._refill_rate,
+            "provider_name": self._provider_name,
+            "lock": self._lock,
+            "state": self._state,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        RateLimiter.__init__(self, state["capacity"], state["refill_rate"])
+        self._provider_name = state["provider_name"]
+        self._lock = state["lock"]
+        self._state = state["state"]
+
+    def _take(self, tokens: int) -> float:
+        """Take tokens if available; returns 0 or the seconds to wait first."""
+        with self._lock:
+            now = time.time()
+            if now < self._state[2]:
+                return float(self._state[2] - now)
+            elapsed = max(0.0, now - self._state[1])
+            self._state[0] = min(self._capacity, self._state[0] + elapsed * self._refill_rate)
+            self._state[1] = now
+            if self._state[0] >= tokens:
+                self._state[0] -= tokens
+                return 0.0
+            return float((tokens - self._state[0]) / self._refill_rate)
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Acquire tokens from the shared bucket (blocking sync version)."""
+        if tokens > self._capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens, capacity is {self._capacity}")
+        while True:
+            wait_time = self._take(tokens)
+            if wait_time <= 0:
+                return
+            RATE_LIMITER_WAITS.labels(provider=self._provider_name, mode="sync").inc()
+            time.sleep(wait_time)
+
+    async def acquire_async(self, tokens: int = 1) -> None:
+        """Acquire tokens from the shared bucket (async version)."""
+        if tokens > self._capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens, capacity is {self._capacity}")
+        while True:
+            wait_time = self._take(tokens)
+            if wait_time <= 0:
+                return
+            RATE_LIMITER_WAITS.labels(provider=self._provider_name, mode="async").inc()
+            await asyncio.sleep(wait_time)
+
+    def _start_retry_after(self, seconds: int) -> None:
+        """Empty the bucket and hold every process until the period ends."""
+        with self._lock:
+            now = time.time()
+            self._state[0] = 0.0
+            self._state[1] = now + seconds
+            self._state[2] = max(self._state[2], now + seconds)
+        RATE_LIMITER_WAITS.labels(provider=self._provider_name, mode="retry_after").inc()
+
+    def notify_retry_after(self, seconds: int) -> None:
+        """Handle Retry-After header for all processes (sync version)."""
+        self._start_retry_after(seconds)
+        time.sleep(seconds)
+
+    async def notify_retry_after_async(self, seconds: int) -> None:
+        """Handle Retry-After header for all processes (async version)."""
+        self._start_retry_after(seconds)
+        await asyncio.sleep(seconds)
+
+    def get_available_tokens(self) -> float:
+        """Get current number of available tokens (for testing/debugging)."""
+        with self._lock:
+            elapsed = max(0.0, time.time() - self._state[1])
+            return float(min(self._capacity, self._state[0] + elapsed * self._refill_rate))
+
+    def _retry_after_remaining(self) -> float:
+        with self._lock:
+            return float(max(0.0, self._state[2] - time.time()))
+
+    def reset(self) -> None:
+        """Reset the rate limiter to initial state (for testing)."""
+        with self._lock:
+            self._state[0] = float(self._capacity)
+            self._state[1] = time.time()
+            self._state[2] = 0.0
+
+
+# Limiter handed to every adapter built in this process (see ``install_shared_rate_limiter``)
+_shared_limiter: Optional[RateLimiter] = None
+
+
+def install_shared_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Make ``create_rate_limiter_from_config`` return ``limiter`` in this process.
+
+    Ingestion worker processes install the pool's ``SharedRateLimiter`` before
+    building their provider, so all of them respect one quota. ``None``
+    restores per-adapter limiters.
+    """
+    global _shared_limiter
+    _shared_limiter = limiter
+
+
 def create_rate_limiter_from_config(
     rate_limit_per_min: Optional[int] = None,
     burst_size: Optional[int] = None,
@@ -257,8 +411,17 @@ def create_rate_limiter_from_config(
         provider_name: Provider name for metrics
 
     Returns:
-        RateLimiter instance or None if rate limiting is disabled
+        RateLimiter instance or None if rate limiting is disabled. In a process
+        with a shared limiter installed, that limiter.
+
+    Provider adapters build their token bucket here, so in ingestion worker
+    processes (see ``install_shared_rate_limiter``) every adapter draws from
+    the pool's shared bucket instead of a bucket of its own.
     """
+    if _shared_limiter is not None:
+        _shared_limiter.set_provider_name(provider_name)
+        return _shared_limiter
+
     if rate_limit_per_min is None or rate_limit_per_min <= 0:
         return None
 
@@ -274,4 +437,10 @@ def create_rate_limiter_from_config(
     return limiter
 
 
-__all__ = ["RateLimiter", "create_rate_limiter_from_config", "RATE_LIMITER_WAITS"]
+__all__ = [
+    "RateLimiter",
+    "SharedRateLimiter",
+    "create_rate_limiter_from_config",
+    "install_shared_rate_limiter",
+    "RATE_LIMITER_WAITS",
+]
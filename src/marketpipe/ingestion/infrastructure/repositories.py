@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -12,6 +13,11 @@ import aiosqlite
 from prometheus_client import Counter, Histogram
 
 from marketpipe.domain.value_objects import Symbol
+from marketpipe.infrastructure.messaging.outbox import (
+    OUTBOX_INSERT_SQL,
+    outbox_enabled_from_env,
+    outbox_rows,
+)
 from marketpipe.infrastructure.sqlite_async_mixin import SqliteAsyncMixin
 
 from ..domain.entities import IngestionJob, IngestionJobId, ProcessingState
@@ -36,9 +42,17 @@ REPO_LATENCY = Histogram(
 class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
     """SQLite implementation of ingestion job repository."""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, outbox: Optional[bool] = None):
+        """Initialize repository.
+
+        Args:
+            db_path: SQLite database file
+            outbox: Record uncommitted job events in the event outbox on save
+                (default: ``$MARKETPIPE_EVENT_OUTBOX``)
+        """
         self._db_path = db_path or Path("ingestion_jobs.db")
         self.db_path = str(self._db_path)  # For SqliteAsyncMixin
+        self._outbox = outbox_enabled_from_env() if outbox is None else outbox
         self._init_database()
 
     def _init_database(self) -> None:
@@ -65,11 +79,17 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
             now = datetime.now()
 
             async with self._conn() as db:
+                # Upsert rather than replace so a worker's lease survives saves
                 await db.execute(
                     """
-                    INSERT OR REPLACE INTO ingestion_jobs
+                    INSERT INTO ingestion_jobs
                     (symbol, day, state, payload, created_at, updated_at)
                     VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(symbol, day) DO UPDATE SET
+                        state = excluded.state,
+                        payload = excluded.payload,
+                        created_at = excluded.created_at,
+                        updated_at = excluded.updated_at
                 """,
                     (
                         str(job.job_id.symbol),
@@ -80,6 +100,11 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
                         now,
                     ),
                 )
+                if self._outbox:
+                    # Same transaction as the job row: the events survive exactly when the state does
+                    await db.executemany(
+                        OUTBOX_INSERT_SQL, outbox_rows(job.get_uncommitted_events())
+                    )
                 await db.commit()
 
         except aiosqlite.Error as e:
@@ -217,8 +242,29 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
         except aiosqlite.Error as e:
             raise IngestionRepositoryError(f"Failed to count jobs by state: {e}") from e
 
-    async def fetch_and_lock(self, limit: int = 1) -> list[IngestionJob]:
-        """Fetch and lock pending jobs for processing (SQLite version)."""
+    async def fetch_and_lock(
+        self,
+        state: ProcessingState = ProcessingState.PENDING,
+        limit: int = 1,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> list[IngestionJob]:
+        """Fetch jobs in a state and lock them for processing (SQLite version).
+
+        SQLite has no SELECT ... FOR UPDATE SKIP LOCKED; ``BEGIN IMMEDIATE``
+        takes the database write lock instead, so concurrent workers claim
+        disjoint jobs.
+
+        Args:
+            state: State of the jobs to claim
+            limit: Maximum number of jobs to claim
+            worker_id: Lease owner; with a lease, IN_PROGRESS jobs whose lease
+                expired are reclaimed as well
+            lease_seconds: Lease duration (requires ``worker_id``)
+        """
+        in_progress = self._domain_state_to_db_state(ProcessingState.IN_PROGRESS)
+        now = time.time()
+        lease_expires_at = now + lease_seconds if worker_id and lease_seconds else None
         try:
             async with self._conn() as db:
                 db.row_factory = aiosqlite.Row
@@ -230,10 +276,17 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
                     """
                     SELECT * FROM ingestion_jobs
                     WHERE state = ?
+                       OR (? AND state = ? AND lease_expires_at < ?)
                     ORDER BY created_at
                     LIMIT ?
                     """,
-                    (self._domain_state_to_db_state(ProcessingState.PENDING), limit),
+                    (
+                        self._domain_state_to_db_state(state),
+                        worker_id is not None,
+                        in_progress,
+                        now,
+                        limit,
+                    ),
                 )
                 rows = await cursor.fetchall()
 
@@ -241,18 +294,25 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
                     await db.rollback()
                     return []
 
-                # Mark jobs as IN_PROGRESS
-                job_ids = [(row["symbol"], row["day"]) for row in rows]
-                for symbol, day in job_ids:
-                    await db.execute(
-                        "UPDATE ingestion_jobs SET state = ?, updated_at = ? WHERE symbol = ? AND day = ?",
+                # Mark jobs as IN_PROGRESS under this worker's lease
+                await db.executemany(
+                    """
+                    UPDATE ingestion_jobs
+                    SET state = ?, updated_at = ?, lease_owner = ?, lease_expires_at = ?
+                    WHERE symbol = ? AND day = ?
+                    """,
+                    [
                         (
-                            self._domain_state_to_db_state(ProcessingState.IN_PROGRESS),
+                            in_progress,
                             datetime.now(),
-                            symbol,
-                            day,
-                        ),
-                    )
+                            worker_id,
+                            lease_expires_at,
+                            row["symbol"],
+                            row["day"],
+                        )
+                        for row in rows
+                    ],
+                )
 
                 await db.commit()
 
@@ -268,6 +328,74 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
         except aiosqlite.Error as e:
             raise IngestionRepositoryError(f"Failed to fetch and lock jobs: {e}") from e
 
+    async def renew_leases(
+        self, worker_id: str, job_ids: list[IngestionJobId], lease_seconds: float
+    ) -> list[IngestionJobId]:
+        """Extend the leases a worker still holds.
+
+        Returns:
+            Jobs whose lease was renewed; the others were reclaimed or finished
+        """
+        renewed = []
+        try:
+            async with self._conn() as db:
+                for job_id in job_ids:
+                    cursor = await db.execute(
+                        """
+                        UPDATE ingestion_jobs SET lease_expires_at = ?
+                        WHERE symbol = ? AND day = ? AND lease_owner = ? AND state = ?
+                        """,
+                        (
+                            time.time() + lease_seconds,
+                            str(job_id.symbol),
+                            job_id.day,
+                            worker_id,
+                            self._domain_state_to_db_state(ProcessingState.IN_PROGRESS),
+                        ),
+                    )
+                    if cursor.rowcount:
+                        renewed.append(job_id)
+                await db.commit()
+            return renewed
+
+        except aiosqlite.Error as e:
+            raise IngestionRepositoryError(f"Failed to renew leases: {e}") from e
+
+    async def release_leases(
+        self, worker_id: str, job_ids: list[IngestionJobId], requeue: bool = False
+    ) -> int:
+        """Drop a worker's leases.
+
+        Args:
+            worker_id: Lease owner
+            job_ids: Jobs to release
+            requeue: Also return jobs still IN_PROGRESS to PENDING (worker shutdown)
+
+        Returns:
+            Number of leases released
+        """
+        in_progress = self._domain_state_to_db_state(ProcessingState.IN_PROGRESS)
+        pending = self._domain_state_to_db_state(ProcessingState.PENDING)
+        released = 0
+        try:
+            async with self._conn() as db:
+                for job_id in job_ids:
+                    cursor = await db.execute(
+                        """
+                        UPDATE ingestion_jobs
+                        SET lease_owner = NULL, lease_expires_at = NULL,
+                            state = CASE WHEN ? AND state = ? THEN ? ELSE state END
+                        WHERE symbol = ? AND day = ? AND lease_owner = ?
+                        """,
+                        (requeue, in_progress, pending, str(job_id.symbol), job_id.day, worker_id),
+                    )
+                    released += cursor.rowcount
+                await db.commit()
+            return released
+
+        except aiosqlite.Error as e:
+            raise IngestionRepositoryError(f"Failed to release leases: {e}") from e
+
     async def count_old_jobs(self, cutoff_date: str) -> int:
         """Count jobs older than cutoff date."""
         try:
@@ -310,6 +438,7 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
             "provider": getattr(job.configuration, "provider", "unknown"),
             "feed": getattr(job.configuration, "feed_type", "unknown"),
             "timeframe": getattr(job.configuration, "timeframe", "1m"),
+            "incremental": getattr(job.configuration, "incremental", False),
             "state": job.state.value,
             "created_at": job.created_at.isoformat(),
             "started_at": job.started_at.isoformat() if job.started_at else None,
@@ -354,6 +483,7 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
             rate_limit_per_minute=200,
             feed_type=payload.get("feed", "iex"),
             timeframe=payload.get("timeframe", "1m"),
+            incremental=payload.get("incremental", False),
         )
 
         # Create job
@@ -392,6 +522,7 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
             "provider": getattr(job.configuration, "provider", "unknown"),
             "feed": getattr(job.configuration, "feed_type", "unknown"),
             "timeframe": getattr(job.configuration, "timeframe", "1m"),
+            "incremental": getattr(job.configuration, "incremental", False),
             "state": job.state.value,
             "created_at": job.created_at.isoformat(),
             "started_at": job.started_at.isoformat() if job.started_at else None,
@@ -436,6 +567,7 @@ class SqliteIngestionJobRepository(SqliteAsyncMixin, IIngestionJobRepository):
             rate_limit_per_minute=200,
             feed_type=job_dict.get("feed", "iex"),
             timeframe=job_dict.get("timeframe", "1m"),
+            incremental=job_dict.get("incremental", False),
         )
 
         # Create job
@@ -0,0 +1,307 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Content-addressed on-disk cache for provider HTTP responses.
+
+Re-running an ingestion (after a crash, or to re-process history after a
+validation rule change) would otherwise fetch every page from the provider
+again and charge it against the quota. Responses are stored gzip-compressed
+under the data root (``data/http_cache``), keyed on provider, endpoint and
+normalized request parameters, so a cache directory doubles as a
+deterministic replay source. ``MARKETPIPE_HTTP_CACHE_DIR`` moves the cache
+elsewhere, or turns it off when set to ``off``.
+
+Layout:
+    <root>/
+        <provider>/
+            <key[:2]>/
+                <key>.json.gz
+
+TTL policy:
+    - Requests whose data window ends before the current UTC day are
+      historical and never expire.
+    - Requests touching the current day expire after ``current_day_ttl``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union, cast
+
+from prometheus_client import Counter
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "mp_response_cache_requests_total",
+    "Provider response cache lookups",
+    ["provider", "result"],  # result: hit, miss, expired
+)
+
+# Query parameters that carry credentials and must never influence the key
+# (or be written to disk).
+SECRET_PARAM_NAMES = frozenset({"apikey", "api_key", "token", "apiKey"})
+
+CACHE_DIR_ENV = "MARKETPIPE_HTTP_CACHE_DIR"
+CACHE_TTL_ENV = "MARKETPIPE_HTTP_CACHE_TTL"
+DEFAULT_CACHE_DIR = Path("data/http_cache")
+# MARKETPIPE_HTTP_CACHE_DIR values that disable the cache
+CACHE_DISABLED_VALUES = frozenset({"off", "none", "false", "0"})
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """TTL policy for cached responses.
+
+    Attributes:
+        current_day_ttl: Seconds a response covering today's session stays valid
+        historical_ttl: Seconds a fully historical response stays valid
+            (None means immutable)
+    """
+
+    current_day_ttl: float = 300.0
+    historical_ttl: Optional[float] = None
+
+    def ttl_for(self, data_end: datetime, *, today: Optional[date] = None) -> Optional[float]:
+        """Return the TTL for a response whose data window ends at ``data_end``."""
+        today = today or datetime.now(timezone.utc).date()
+        if data_end.tzinfo is None:
+            data_end = data_end.replace(tzinfo=timezone.utc)
+        if data_end.astimezone(timezone.utc).date() < today:
+            return self.historical_ttl
+        return self.current_day_ttl
+
+
+class ResponseCache:
+    """Gzip-compressed, content-addressed store of decoded JSON responses."""
+
+    def __init__(self, root: Union[Path, str], policy: Optional[CachePolicy] = None):
+        """Initialize response cache.
+
+        Args:
+            root: Directory holding cached responses
+            policy: TTL policy (defaults to immutable history, 5 minute current day)
+        """
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self.policy = policy or CachePolicy()
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @classmethod
+    def from_env(cls) -> Optional[ResponseCache]:
+        """Create the cache at ``MARKETPIPE_HTTP_CACHE_DIR``, else ``data/http_cache``.
+
+        Returns None when the variable is ``off`` (or ``none``, ``false``, ``0``).
+        """
+        cache_dir = os.environ.get(CACHE_DIR_ENV, "").strip()
+        if cache_dir.lower() in CACHE_DISABLED_VALUES:
+            return None
+        ttl_env = os.environ.get(CACHE_TTL_ENV)
+        policy = CachePolicy(current_day_ttl=float(ttl_env)) if ttl_env else CachePolicy()
+        return cls(cache_dir or DEFAULT_CACHE_DIR, policy)
+
+    # ----- Keys -----
+
+    @staticmethod
+    def normalize_params(params: Optional[Mapping[str, Any]]) -> dict[str, str]:
+        """Drop credentials and stringify values so equal requests share a key."""
+        if not params:
+            return {}
+        return {
+            str(k): str(v)
+            for k, v in sorted(params.items())
+            if k not in SECRET_PARAM_NAMES and v is not None
+        }
+
+    @classmethod
+    def make_key(cls, provider: str, endpoint: str, params: Optional[Mapping[str, Any]]) -> str:
+        """Return the content address for a request."""
+        payload = json.dumps(
+            {"provider": provider, "endpoint": endpoint, "params": cls.normalize_params(params)},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path_for(self, provider: str, key: str) -> Path:
+        return self._root / provider / key[:2] / f"{key}.json.gz"
+
+    # ----- Lookup / store -----
+
+    def get(
+        self, provider: str, endpoint: str, params: Optional[Mapping[str, Any]] = None
+    ) -> Optional[Any]:
+        """Return the cached response body, or None on a miss or expiry."""
+        path = self._path_for(provider, self.make_key(provider, endpoint, params))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except FileNotFoundError:
+            RESPONSE_CACHE_REQUESTS.labels(provider=provider, result="miss").inc()
+            return None
+        except (OSError, ValueError) as e:
+            self.log.warning(f"Discarding unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            RESPONSE_CACHE_REQUESTS.labels(provider=provider, result="miss").inc()
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and time.time() >= expires_at:
+            RESPONSE_CACHE_REQUESTS.labels(provider=provider, result="expired").inc()
+            return None
+
+        RESPONSE_CACHE_REQUESTS.labels(provider=provider, result="hit").inc()
+        return entry["body"]
+
+    def put(
+        self,
+        provider: str,
+        endpoint: str,
+        params: Optional[Mapping[str, Any]],
+        body: Any,
+        *,
+        data_end: datetime,
+    ) -> Path:
+        """Store a decoded JSON response body.
+
+        Args:
+            provider: Provider name (e.g. "alpaca", "polygon")
+            endpoint: Endpoint URL or path
+            params: Request query parameters
+            body: Decoded JSON response
+            data_end: End of the data window the request covers (drives the TTL)
+
+        Returns:
+            Path of the cache entry
+        """
+        key = self.make_key(provider, endpoint, params)
+        path = self._path_for(provider, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        now = time.time()
+        ttl = self.policy.ttl_for(data_end)
+        entry = {
+            "provider": provider,
+            "endpoint": endpoint,
+            "params": self.normalize_params(params),
+            "created_at": now,
+            "expires_at": now + ttl if ttl is not None else None,
+            "body": body,
+        }
+
+        # Write to a temp file in the same directory and rename so concurrent
+        # readers never observe a partially written entry.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as fh:
+                fh.write(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    # ----- Maintenance -----
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        removed = 0
+        now = time.time()
+        for path in self._root.rglob("*.json.gz"):
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as fh:
+                    expires_at = json.load(fh).get("expires_at")
+            except (OSError, ValueError):
+                expires_at = now
+            if expires_at is not None and now >= expires_at:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self, provider: Optional[str] = None) -> int:
+        """Delete all entries (optionally for one provider only)."""
+        base = self._root / provider if provider else self._root
+        removed = 0
+        for path in base.rglob("*.json.gz"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+class ResponseCacheMixin:
+    """Serves and stores a client's responses through its response cache.
+
+    Only responses that describe a fixed data window (``data_end`` given)
+    are cached, and a failed cache write never fails the request.
+
+    Usage:
+        class MyAdapter(ResponseCacheMixin):
+            def __init__(self):
+                self.response_cache = get_default_response_cache()
+                self.log = logging.getLogger(self.__class__.__name__)
+
+            async def _make_request(self, url, params, data_end):
+                cached = self._cached_response(url, params, data_end)
+                if cached is not None:
+                    return cached
+                body = await self._fetch_json(url, params)
+                self._store_response(url, params, body, data_end)
+                return body
+    """
+
+    response_cache: Optional[ResponseCache]
+    log: logging.Logger
+
+    def cache_provider_name(self) -> str:
+        """Provider name used to namespace cached responses."""
+        return self.__class__.__name__.lower()
+
+    def _cached_response(
+        self, endpoint: str, params: Mapping[str, Any], data_end: Optional[datetime]
+    ) -> Optional[dict[str, Any]]:
+        if self.response_cache is None or data_end is None:
+            return None
+        cached = self.response_cache.get(self.cache_provider_name(), endpoint, dict(params))
+        if cached is not None:
+            self.log.debug("Serving %s from response cache", endpoint)
+        return cast(Optional[dict[str, Any]], cached)
+
+    def _store_response(
+        self, endpoint: str, params: Mapping[str, Any], body: Any, data_end: Optional[datetime]
+    ) -> None:
+        if self.response_cache is None or data_end is None:
+            return
+        try:
+            self.response_cache.put(
+                self.cache_provider_name(), endpoint, dict(params), body, data_end=data_end
+            )
+        except OSError as e:
+            # A cache write failure must never fail the fetch itself
+            self.log.warning(f"Could not write response cache entry: {e}")
+
+
+def get_default_response_cache() -> Optional[ResponseCache]:
+    """Return the environment-configured response cache, if any."""
+    return ResponseCache.from_env()
+
+
+__all__ = [
+    "CACHE_DIR_ENV",
+    "CACHE_TTL_ENV",
+    "DEFAULT_CACHE_DIR",
+    "CachePolicy",
+    "ResponseCache",
+    "ResponseCacheMixin",
+    "RESPONSE_CACHE_REQUESTS",
+    "get_default_response_cache",
+]
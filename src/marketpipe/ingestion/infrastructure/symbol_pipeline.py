@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Per-symbol pipelining of validation and aggregation behind ingestion.
+
+Without pipelining, validation and aggregation wait for the whole job and
+then reload every symbol from Parquet. A ``SymbolPipeline`` attached to the
+ingestion coordinator instead receives each symbol's bars as soon as they
+are stored and hands them, as an in-memory Arrow table, to a validation and
+an aggregation stage:
+
+    fetch(AAPL) ─▶ store ─▶ submit ─┬─▶ stage "pipeline_validation"  ─▶ CSV report
+    fetch(MSFT) ─▶ store ─▶ submit  └─▶ stage "pipeline_aggregation" ─▶ frame=5m,15m,1h,1d
+    ...
+
+Stages overlap with fetching the remaining symbols, so a job's aggregates
+are queryable shortly after its slowest symbol is stored. Both stages are
+``StageExecutor`` thread pools configured with
+``$MARKETPIPE_PIPELINE_STAGE_{MODE,WORKERS,MAX_PENDING}``; ``process`` mode
+is rejected because tables are handed over in memory. Once
+``max_pending`` symbols are queued, submitting waits, which throttles the
+fetchers instead of buffering a whole job's bars. The ingestion coordinator
+uses ``submit_async``, which converts the bars in a worker thread and waits
+for a stage slot without blocking its event loop. With a ``MemoryBudget``
+queued tables count against it, and are spilled to Arrow IPC files while it
+is tight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import uuid
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+import pyarrow as pa
+
+from marketpipe.infrastructure.messaging.stage_executor import StageExecutor, StageSettings
+from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+from marketpipe.tracing import span
+
+from .memory_budget import MemoryBudget, SpilledTable, get_memory_budget
+
+
+@dataclass(frozen=True)
+class SymbolBars:
+    """One symbol's stored bars travelling through the pipeline stages."""
+
+    job_id: str
+    symbol: str
+    table: Union[pa.Table, SpilledTable]
+    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    @property
+    def event_type(self) -> str:
+        return "symbol_bars_stored"
+
+    def load(self) -> pa.Table:
+        """The bars, read back from the spill file if they were spilled."""
+        return self.table.load() if isinstance(self.table, SpilledTable) else self.table
+
+
+def symbol_key(item: SymbolBars) -> Hashable:
+    """De-duplication key: a symbol is in flight at most once per job."""
+    return (item.job_id, item.symbol)
+
+
+class SymbolPipeline:
+    """Validates and aggregates each symbol of a job as soon as it is stored."""
+
+    def __init__(
+        self,
+        aggregation,
+        validation=None,
+        settings: Optional[StageSettings] = None,
+        memory_budget: Optional[MemoryBudget] = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            aggregation: Service with ``aggregate_symbol(job_id, symbol, table)``
+            validation: Service with ``validate_symbol(job_id, symbol, table)``,
+                or None to only aggregate
+            settings: Settings of both stages (default: ``$MARKETPIPE_PIPELINE_STAGE_*``)
+            memory_budget: Budget queued tables count against, or None
+
+        Raises:
+            ValueError: If the settings ask for process mode
+        """
+        settings = settings or StageSettings.from_env("pipeline")
+        if settings.mode == "process":
+            raise ValueError("Pipelined stages hand tables over in memory; use thread or inline")
+
+        self._aggregation = aggregation
+        self._validation = validation
+        self._memory_budget = memory_budget
+        self._frames_written: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._aggregate_stage = StageExecutor(
+            "pipeline_aggregation", self._aggregate, settings, key=symbol_key
+        )
+        self._validate_stage = (
+            StageExecutor("pipeline_validation", self._validate, settings, key=symbol_key)
+            if validation is not None
+            else None
+        )
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def stages(self) -> list[StageExecutor[SymbolBars]]:
+        """Stage executors in hand-off order."""
+        stages = [self._aggregate_stage]
+        if self._validate_stage is not None:
+            stages.insert(0, self._validate_stage)
+        return stages
+
+    def submit(self, job_id: str, symbol: str, bars) -> None:
+        """Hand a symbol's stored bars to the stages.
+
+        Blocks while the stages are full; coroutines use ``submit_async``.
+
+        Args:
+            job_id: Ingestion job identifier
+            symbol: Symbol the bars belong to
+            bars: Domain bars as passed to storage, or an Arrow table
+        """
+        item = self._item(job_id, symbol, bars)
+        if item is None:
+            return
+        for stage in self.stages:
+            stage.submit(item)
+
+    async def submit_async(self, job_id: str, symbol: str, bars) -> None:
+        """``submit`` for coroutines: never blocks the event loop.
+
+        The bars are converted (and spilled when the budget is tight) in a
+        worker thread, and full stages are waited for with
+        ``StageExecutor.submit_async``.
+        """
+        item = await asyncio.to_thread(self._item, job_id, symbol, bars)
+        if item is None:
+            return
+        for stage in self.stages:
+            await stage.submit_async(item)
+
+    def _item(self, job_id: str, symbol: str, bars) -> Optional[SymbolBars]:
+        """The stages' item for the bars, spilled or tracked by the memory budget."""
+        table = bars if isinstance(bars, pa.Table) else ParquetStorageEngine.bars_to_table(bars)
+        if table.num_rows == 0:
+            return None
+        budget = self._memory_budget
+        if budget is not None and budget.tight:
+            return SymbolBars(job_id=str(job_id), symbol=symbol, table=budget.spill(table))
+        item = SymbolBars(job_id=str(job_id), symbol=symbol, table=table)
+        if budget is not None:
+            # Held until both stages are done with the item
+            budget.track(item, table.nbytes)
+        return item
+
+    def finish(self, job_id: str, timeout: Optional[float] = None) -> dict[str, Any]:
+        """Wait for the stages to process everything submitted so far.
+
+        Refreshes the aggregate views and publishes ``AggregationCompleted``
+        for the job once its symbols are aggregated.
+
+        Args:
+            job_id: Ingestion job identifier
+            timeout: Seconds to wait for each stage (None waits indefinitely)
+
+        Returns:
+            Summary with the frames written and whether the stages drained
+        """
+        drained = all(stage.drain(timeout) for stage in self.stages)
+        with self._lock:
+            frames_written = self._frames_written.pop(str(job_id), 0)
+        if not drained:
+            self.log.warning(f"Pipelined stages still busy for job {job_id}")
+        elif frames_written:
+            from marketpipe.aggregation.domain.events import AggregationCompleted
+            from marketpipe.aggregation.infrastructure.duckdb_views import refresh_views
+            from marketpipe.bootstrap import get_event_bus
+
+            refresh_views()
+            get_event_bus().publish(AggregationCompleted(str(job_id), frames_written))
+        return {"drained": drained, "frames_written": frames_written}
+
+    def shutdown(self) -> None:
+        """Release the stage pools."""
+        for stage in self.stages:
+            stage.shutdown()
+
+    def _aggregate(self, item: SymbolBars) -> None:
+        with span("pipeline_aggregation", symbol=item.symbol):
+            frames = self._aggregation.aggregate_symbol(item.job_id, item.symbol, item.load())
+        with self._lock:
+            self._frames_written[item.job_id] = self._frames_written.get(item.job_id, 0) + frames
+
+    def _validate(self, item: SymbolBars) -> None:
+        with span("pipeline_validation", symbol=item.symbol):
+            self._validation.validate_symbol(item.job_id, item.symbol, item.load())
+
+    @classmethod
+    def build_default(cls, settings: Optional[StageSettings] = None) -> SymbolPipeline:
+        """Pipeline over the default aggregation and validation services."""
+        from marketpipe.aggregation.application.services import AggregationRunnerService
+        from marketpipe.validation.application.services import ValidationRunnerService
+
+        return cls(
+            aggregation=AggregationRunnerService.build_default(),
+            validation=ValidationRunnerService.build_default(),
+            settings=settings,
+            memory_budget=get_memory_budget(),
+        )
+
+
+__all__ = ["SymbolBars", "SymbolPipeline", "symbol_key"]
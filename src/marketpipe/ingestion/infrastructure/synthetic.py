@@ -0,0 +1,327 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Vectorized, deterministic synthetic bars with fault injection.
+
+Every random draw is a hash of ``(seed, symbol, bar slot, stream)`` rather
+than the next value of a stateful generator, so a bar's values do not
+depend on which range it was requested in, how the range was paginated or
+which process generated it. A year of 1-minute bars for a symbol is a
+handful of NumPy passes:
+
+    days ─▶ session slots (all day, or the exchange calendar's sessions)
+         ─▶ counter = ts_ns // frame_ns
+         ─▶ splitmix64(counter * φ + hash(seed, symbol, stream)) ─▶ uniforms ─▶ normals
+         ─▶ per-day log-price walk ─▶ OHLC, volume, trade count, VWAP
+         ─▶ clip to [start, end) ─▶ faults: gaps, OHLC violations, duplicates, swaps
+
+Each session opens near the symbol's base price and walks from there, so
+any two requests agree on every bar they share. Request-level faults (HTTP
+429, timeouts) are drawn per attempt; the fake provider raises them and the
+benchmark stub server answers with them.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, fields
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from marketpipe.domain.analytics import OHLCVColumns
+from marketpipe.domain.calendar import NS_PER_DAY, NS_PER_SECOND, TradingCalendar
+
+SESSIONS = ("all", "regular")
+REQUEST_FAULTS = ("rate_limited", "timeout")
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_STREAM_MULTIPLIER = 0xD1B54A32D192ED03
+# Independent streams of draws per bar slot
+_SYMBOL, _ANCHOR, _WALK_A, _WALK_B, _HIGH, _LOW = range(6)
+_GAP, _DUPLICATE, _SWAP, _VIOLATION, _REQUEST = range(6, 11)
+# Sessions open within a few percent of the symbol's base price
+_ANCHOR_SIGMA = 0.02
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer over a uint64 array (wrapping arithmetic)."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return np.asarray(x ^ (x >> np.uint64(31)), dtype=np.uint64)
+
+
+def _mix_int(x: int) -> int:
+    return int(_mix(np.array([x & _MASK], dtype=np.uint64))[0])
+
+
+@dataclass(frozen=True)
+class FaultRates:
+    """Rates at which synthetic data misbehaves.
+
+    Bar faults are fractions of bars; request faults are fractions of
+    requests (fetch calls, or HTTP requests to the stub server).
+
+    Attributes:
+        gaps: Bars left out
+        duplicates: Bars repeated right after themselves
+        out_of_order: Bars swapped with their successor
+        ohlc_violations: Bars whose high is below their open and close
+        rate_limited: Requests answered with HTTP 429
+        timeouts: Requests that stall until the client times out
+    """
+
+    gaps: float = 0.0
+    duplicates: float = 0.0
+    out_of_order: float = 0.0
+    ohlc_violations: float = 0.0
+    rate_limited: float = 0.0
+    timeouts: float = 0.0
+
+    def __post_init__(self) -> None:
+        for field in fields(self):
+            rate = getattr(self, field.name)
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Fault rate {field.name} must be between 0 and 1, got {rate}")
+        if self.rate_limited + self.timeouts > 1.0:
+            raise ValueError("rate_limited and timeouts must add up to at most 1")
+
+    @classmethod
+    def parse(cls, spec: str) -> FaultRates:
+        """Rates from ``"gaps=0.01,rate_limited=0.05"`` (empty for none).
+
+        Raises:
+            ValueError: On unknown fault names or malformed rates
+        """
+        rates: dict[str, float] = {}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            name, sep, value = item.partition("=")
+            try:
+                rates[name.strip()] = float(value) if sep else float("nan")
+            except ValueError:
+                raise ValueError(f"Invalid fault rate {item!r}") from None
+        return cls.from_config(rates)
+
+    @classmethod
+    def from_config(cls, config: Union[Mapping[str, Any], str, None]) -> FaultRates:
+        """Rates from a mapping (or a ``parse`` spec); None means no faults.
+
+        Raises:
+            ValueError: On unknown fault names or rates outside [0, 1]
+        """
+        if config is None:
+            return cls()
+        if isinstance(config, str):
+            return cls.parse(config)
+        known = {field.name for field in fields(cls)}
+        unknown = set(config) - known
+        if unknown:
+            raise ValueError(
+                f"Unknown fault(s) {', '.join(sorted(unknown))}; "
+                f"expected: {', '.join(f.name for f in fields(cls))}"
+            )
+        return cls(**{name: float(rate) for name, rate in config.items()})
+
+    @property
+    def corrupts_bars(self) -> bool:
+        return any((self.gaps, self.duplicates, self.out_of_order, self.ohlc_violations))
+
+
+class SyntheticBarGenerator:
+    """Generates reproducible OHLCV batches for any symbol and range."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        base_price: float = 100.0,
+        volatility: float = 0.001,
+        sessions: str = "all",
+        faults: Optional[FaultRates] = None,
+        calendar: Optional[TradingCalendar] = None,
+    ):
+        """Initialize the generator.
+
+        Args:
+            seed: Seed shared by all symbols; same seed, same bars
+            base_price: Typical price; each symbol trades at 0.5x to 2x of it
+            volatility: Standard deviation of a bar's log return
+            sessions: ``all`` for bars around the clock, ``regular`` for
+                exchange sessions only (holidays and early closes included)
+            faults: Fault rates (default: none)
+            calendar: Calendar for ``regular`` sessions (default: the
+                process-wide calendar)
+
+        Raises:
+            ValueError: On an unknown session mode or non-positive prices
+        """
+        if sessions not in SESSIONS:
+            raise ValueError(f"sessions must be one of: {', '.join(SESSIONS)}")
+        if base_price <= 0 or volatility < 0:
+            raise ValueError("base_price must be positive and volatility non-negative")
+        self.seed = seed
+        self.base_price = base_price
+        self.volatility = volatility
+        self.sessions = sessions
+        self.faults = faults or FaultRates()
+        self._calendar = calendar
+
+    @property
+    def calendar(self) -> TradingCalendar:
+        if self._calendar is None:
+            from marketpipe.config.calendar import configured_calendar
+
+            self._calendar = configured_calendar()
+        return self._calendar
+
+    def _key(self, symbol: str) -> int:
+        return _mix_int(self.seed * _GOLDEN + zlib.crc32(symbol.encode()))
+
+    @staticmethod
+    def _uniform(key: int, counter: np.ndarray, stream: int) -> np.ndarray:
+        """Uniforms in (0, 1), one per counter value."""
+        # Hashing the stream into the offset keeps streams from being shifted copies
+        offset = np.uint64(_mix_int(key + (stream + 1) * _STREAM_MULTIPLIER))
+        bits = _mix(counter.astype(np.uint64) * np.uint64(_GOLDEN) + offset)
+        return np.asarray(((bits >> np.uint64(11)).astype(np.float64) + 0.5) * 2.0**-53)
+
+    def _normals(self, key: int, counter: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Two independent standard normals per counter value (Box-Muller)."""
+        radius = np.sqrt(-2.0 * np.log(self._uniform(key, counter, _WALK_A)))
+        angle = 2.0 * np.pi * self._uniform(key, counter, _WALK_B)
+        return radius * np.cos(angle), radius * np.sin(angle)
+
+    def _slots(self, start_ns: int, end_ns: int, frame_ns: int) -> tuple[np.ndarray, ...]:
+        """Bar starts of every session overlapping the range, with session bounds."""
+        days = np.arange(start_ns // NS_PER_DAY, (end_ns - 1) // NS_PER_DAY + 1, dtype=np.int64)
+        if self.sessions == "regular":
+            table = self.calendar.session_table(days)
+            open_session = table["is_session"]
+            days = table["day"][open_session]
+            opens = table["open_ns"][open_session]
+            closes = table["close_ns"][open_session]
+        else:
+            opens = days * NS_PER_DAY
+            closes = opens + NS_PER_DAY
+        counts = -(-(closes - opens) // frame_ns)
+        firsts = np.cumsum(counts) - counts
+        ts = np.repeat(opens, counts) + (
+            np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(firsts, counts)
+        ) * np.int64(frame_ns)
+        return ts, days, counts, firsts
+
+    def generate(
+        self, symbol: str, start_ns: int, end_ns: int, frame_seconds: int = 60
+    ) -> OHLCVColumns:
+        """Bars of ``symbol`` starting in ``[start_ns, end_ns)``, with faults applied.
+
+        Args:
+            symbol: Symbol to generate
+            start_ns: Range start, nanoseconds since the epoch (UTC)
+            end_ns: Exclusive range end
+            frame_seconds: Bar length in seconds
+
+        Returns:
+            Batch sorted by timestamp unless out-of-order faults are set
+        """
+        if frame_seconds <= 0:
+            raise ValueError("frame_seconds must be positive")
+        if end_ns <= start_ns:
+            return OHLCVColumns.from_arrays(
+                symbol=symbol, ts_ns=[], open=[], high=[], low=[], close=[], volume=[]
+            )
+        frame_ns = frame_seconds * NS_PER_SECOND
+        key = self._key(symbol)
+        ts, days, counts, firsts = self._slots(start_ns, end_ns, frame_ns)
+        counter = ts // frame_ns
+
+        # Per-session log-price walk, opening near the symbol's base price
+        symbol_scale = 0.5 + 1.5 * self._uniform(key, np.zeros(1, np.int64), _SYMBOL)[0]
+        anchors = np.log(self.base_price * symbol_scale) + _ANCHOR_SIGMA * (
+            self._uniform(key, days, _ANCHOR) * 2.0 - 1.0
+        )
+        step, shock = self._normals(key, counter)
+        returns = step * self.volatility
+        walk = np.cumsum(returns)
+        session_base = np.repeat(anchors - (walk[firsts] - returns[firsts]), counts)
+        log_close = session_base + walk
+        close = np.round(np.exp(log_close), 2)
+        open_ = np.round(np.exp(log_close - returns), 2)
+
+        spread = self.volatility * 0.5
+        high = np.round(
+            np.ceil(
+                np.maximum(open_, close) * (1 + spread * self._uniform(key, counter, _HIGH)) * 100
+            )
+            / 100,
+            2,
+        )
+        low = np.round(
+            np.floor(
+                np.minimum(open_, close) * (1 - spread * self._uniform(key, counter, _LOW)) * 100
+            )
+            / 100,
+            2,
+        )
+        low = np.maximum(low, 0.01)
+        volume = np.maximum(np.exp(7.5 + shock), 1.0).astype(np.int64)
+
+        in_range = (ts >= start_ns) & (ts < end_ns)
+        columns = OHLCVColumns.from_arrays(
+            symbol=symbol,
+            ts_ns=ts[in_range],
+            open=open_[in_range],
+            high=high[in_range],
+            low=low[in_range],
+            close=close[in_range],
+            volume=volume[in_range],
+            trade_count=volume[in_range] // 40 + 1,
+            vwap=np.round((high + low + close)[in_range] / 3, 4),
+        )
+        if self.faults.corrupts_bars:
+            columns = self._corrupt(columns, key, counter[in_range])
+        return columns
+
+    def _corrupt(self, columns: OHLCVColumns, key: int, counter: np.ndarray) -> OHLCVColumns:
+        faults = self.faults
+        keep = self._uniform(key, counter, _GAP) >= faults.gaps
+        columns, counter = columns.take(np.flatnonzero(keep)), counter[keep]
+
+        violated = self._uniform(key, counter, _VIOLATION) < faults.ohlc_violations
+        if violated.any():
+            high = columns.high.copy()
+            floor = np.minimum(columns.open, columns.close)
+            high[violated] = np.round(np.maximum(floor[violated] - 0.01, 0.0), 2)
+            columns = OHLCVColumns(**{**columns.to_dict(), "high": high})
+
+        repeats = 1 + (self._uniform(key, counter, _DUPLICATE) < faults.duplicates)
+        order = np.repeat(np.arange(len(counter)), repeats)
+
+        swap = np.flatnonzero(self._uniform(key, counter[order[:-1]], _SWAP) < faults.out_of_order)
+        if len(swap):
+            # Skip swaps that would touch a row already swapped
+            swap = swap[np.concatenate([[True], np.diff(swap) > 1])]
+            order[swap], order[swap + 1] = order[swap + 1], order[swap].copy()
+        return columns.take(order)
+
+    def iter_batches(
+        self, symbols: Iterable[str], start_ns: int, end_ns: int, frame_seconds: int = 60
+    ) -> Iterator[OHLCVColumns]:
+        """One batch per symbol over the same range, e.g. to load-test a universe."""
+        for symbol in symbols:
+            yield self.generate(symbol, start_ns, end_ns, frame_seconds)
+
+    def request_fault(self, symbol: str, attempt: int) -> Optional[str]:
+        """Fault of a symbol's ``attempt``-th request: ``rate_limited``, ``timeout`` or None."""
+        if not (self.faults.rate_limited or self.faults.timeouts):
+            return None
+        draw = self._uniform(self._key(symbol), np.array([attempt], np.int64), _REQUEST)[0]
+        if draw < self.faults.rate_limited:
+            return "rate_limited"
+        if draw < self.faults.rate_limited + self.faults.timeouts:
+            return "timeout"
+        return None
+
+
+__all__ = ["REQUEST_FAULTS", "SESSIONS", "FaultRates", "SyntheticBarGenerator"]
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import datetime as dt
 from pathlib import Path
+from typing import Optional
+
+from marketpipe.domain.calendar import TradingCalendar
 
 
 class GapDetectorService:  # pylint: disable=too-few-public-methods
@@ -14,18 +17,25 @@ class GapDetectorService:  # pylint: disable=too-few-public-methods
 
     It returns the list of *trading dates* (UTC) that have **no** corresponding
     Parquet file on disk.  In V1 we treat an entire day as missing – partial-day
-    gaps are ignored.
+    gaps are ignored.  Without a *calendar* every day counts as a trading day;
+    with one, weekends and exchange holidays are never reported.
 
     The implementation avoids expensive DuckDB scans and merely relies on
     `Path.glob` which is sufficiently fast for a directory tree of a few
     thousand files.
     """
 
-    def __init__(self, parquet_root: Path, timeframe: str = "1m") -> None:
+    def __init__(
+        self,
+        parquet_root: Path,
+        timeframe: str = "1m",
+        calendar: Optional[TradingCalendar] = None,
+    ) -> None:
         self._root = Path(parquet_root)
         # Time-frame folder not yet used by the writer, but we keep the argument
         # so that V2 can introduce it without breaking the interface.
         self._timeframe = timeframe
+        self._calendar = calendar
 
     # ---------------------------------------------------------------------
     # Public helpers
@@ -38,9 +48,10 @@ class GapDetectorService:  # pylint: disable=too-few-public-methods
     ) -> list[dt.date]:
         """Return all trading days in *[start, end]* with **no** parquet file."""
         existing = self._existing_days(symbol, start, end)
-        expected: set[dt.date] = {
-            start + dt.timedelta(days=i) for i in range((end - start).days + 1)
-        }
+        if self._calendar is not None:
+            expected = set(self._calendar.trading_days(start, end))
+        else:
+            expected = {start + dt.timedelta(days=i) for i in range((end - start).days + 1)}
         return sorted(expected - existing)
 
     async def find_missing_days_async(
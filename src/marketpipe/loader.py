@@ -11,6 +11,8 @@ from typing import Any, Optional, Union
 import duckdb
 import pandas as pd
 
+from marketpipe.infrastructure.storage.layout import LAYOUT_CLUSTERED, detect_layout
+
 pl: Any
 try:
     import polars as pl
@@ -155,23 +157,31 @@ def _load_symbol_data(
 ) -> pd.DataFrame:
     """Load data for a single symbol using DuckDB."""
 
-    # Try multiple possible paths for data
-    possible_paths = [
+    # Try multiple possible frame directories for data
+    frame_dirs = [
         # Check aggregated data first for non-1m timeframes
-        root / "agg" / f"frame={timeframe}" / f"symbol={symbol}" / "**" / "*.parquet",
+        root / "agg" / f"frame={timeframe}",
         # Check raw data for 1m timeframes
-        root / "raw" / f"frame={timeframe}" / f"symbol={symbol}" / "**" / "*.parquet",
+        root / "raw" / f"frame={timeframe}",
         # Legacy structure
-        root / f"frame={timeframe}" / f"symbol={symbol}" / "**" / "*.parquet",
+        root / f"frame={timeframe}",
     ]
 
     # Find existing data path
     data_path = None
-    for path_pattern in possible_paths:
-        # Check if any files exist matching this pattern
-        search_path = Path(str(path_pattern).replace("**/*.parquet", ""))
+    clustered = False
+    for frame_dir in frame_dirs:
+        if detect_layout(frame_dir) == LAYOUT_CLUSTERED:
+            # One file per day holding all symbols; filter rows by symbol
+            if any(frame_dir.glob("date=*/*.parquet")):
+                data_path = str(frame_dir / "date=*" / "*.parquet")
+                clustered = True
+                break
+            continue
+
+        search_path = frame_dir / f"symbol={symbol}"
         if search_path.exists() and any(search_path.rglob("*.parquet")):
-            data_path = str(path_pattern)
+            data_path = str(search_path / "**" / "*.parquet")
             break
 
     if not data_path:
@@ -181,15 +191,17 @@ def _load_symbol_data(
     logger.debug(f"Loading {symbol} data from {data_path}")
 
     # Build DuckDB query
-    query = """
+    symbol_filter = "AND symbol = ?" if clustered else ""
+    query = f"""
     SELECT symbol, ts_ns, open, high, low, close, volume
-    FROM parquet_scan(?, hive_partitioning=true)
-    WHERE ts_ns BETWEEN ? AND ?
+    FROM parquet_scan(?, hive_partitioning=true, union_by_name=true)
+    WHERE ts_ns BETWEEN ? AND ? {symbol_filter}
     ORDER BY ts_ns
     """
+    params = [data_path, start_ns, end_ns] + ([symbol] if clustered else [])
 
     try:
-        result_df = con.execute(query, [data_path, start_ns, end_ns]).df()
+        result_df = con.execute(query, params).df()
 
         if result_df.empty:
             logger.debug(f"No data in time range for {symbol}")
@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
+import logging
 import os
+import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +24,18 @@ from marketpipe.ingestion.infrastructure.rate_limit import RATE_LIMITER_WAITS
 from marketpipe.metrics_server import EVENT_LOOP_LAG
 from marketpipe.migrations import apply_pending
 
+# Bounded per-symbol summaries (imported from symbol_metrics module)
+from marketpipe.symbol_metrics import SYMBOL_METRICS, record_symbol_metric, symbol_summary
+
+# Per-stage span durations (imported from tracing module)
+from marketpipe.tracing import STAGE_DURATION
+
+logger = logging.getLogger(__name__)
+
+# Metric rows a process buffers before writing them to SQLite in one transaction
+FLUSH_ROWS = int(os.getenv("MP_METRICS_FLUSH_ROWS", "256"))
+FLUSH_SECONDS = float(os.getenv("MP_METRICS_FLUSH_SECONDS", "1.0"))
+
 # Core metrics with full label set: source, provider, feed
 REQUESTS = Counter("mp_requests_total", "API requests", ["source", "provider", "feed"])
 ERRORS = Counter("mp_errors_total", "Errors", ["source", "provider", "feed", "code"])
@@ -29,7 +46,7 @@ LEGACY_REQUESTS = Counter("mp_requests_legacy_total", "API requests (legacy)", [
 LEGACY_ERRORS = Counter("mp_errors_legacy_total", "Errors (legacy)", ["source", "code"])
 LEGACY_LATENCY = Histogram("mp_request_legacy_latency_seconds", "Latency (legacy)", ["source"])
 
-BACKLOG = Gauge("mp_backlog_jobs", "Coordinator queue size")
+BACKLOG = Gauge("mp_backlog_jobs", "Coordinator queue size", multiprocess_mode="livemax")
 
 # New metrics for ingestion/validation/aggregation
 INGEST_ROWS = Counter("mp_ingest_rows_total", "Rows ingested", ["symbol"])
@@ -37,6 +54,10 @@ VALIDATION_ERRORS = Counter(
     "mp_validation_errors_total", "Validation errors", ["symbol", "error_type"]
 )
 AGG_ROWS = Counter("mp_aggregation_rows_total", "Rows aggregated", ["frame", "symbol"])
+INCREMENTAL_SKIPPED_DAYS = Counter(
+    "mp_ingest_incremental_skipped_days_total",
+    "Trading days skipped by incremental ingestion because storage already held them",
+)
 
 # Summary metrics for tracking operational data
 PROCESSING_TIME = Summary("mp_processing_time_seconds", "Processing time", ["operation"])
@@ -51,7 +72,10 @@ SYMBOLS_SNAPSHOT_RECORDS = Counter(
 )
 
 SYMBOLS_NULL_RATIO = Gauge(
-    "mp_symbols_null_ratio", "Share of NULLs per column in v_symbol_latest", ["column"]
+    "mp_symbols_null_ratio",
+    "Share of NULLs per column in v_symbol_latest",
+    ["column"],
+    multiprocess_mode="livemax",
 )
 
 # Backfill metrics
@@ -88,9 +112,11 @@ __all__ = [
     "INGEST_ROWS",
     "VALIDATION_ERRORS",
     "AGG_ROWS",
+    "INCREMENTAL_SKIPPED_DAYS",
     "PROCESSING_TIME",
     "RATE_LIMITER_WAITS",
     "EVENT_LOOP_LAG",
+    "STAGE_DURATION",
     "BACKFILL_GAPS_FOUND_TOTAL",
     "BACKFILL_GAP_LATENCY_SECONDS",
     "DATA_PRUNED_BYTES_TOTAL",
@@ -99,11 +125,19 @@ __all__ = [
     "SYMBOLS_ROWS",
     "SYMBOLS_SNAPSHOT_RECORDS",
     "SYMBOLS_NULL_RATIO",
+    # Bounded per-symbol summaries
+    "SYMBOL_METRICS",
+    "record_symbol_metric",
+    "symbol_summary",
     # Repository and utilities
     "record_metric",
+    "flush_metrics",
+    "metric_handle",
+    "MetricHandle",
     "MetricPoint",
     "TrendPoint",
     "SqliteMetricsRepository",
+    "MetricsBatch",
 ]
 
 
@@ -128,6 +162,118 @@ class TrendPoint:
     sample_count: int
 
 
+class MetricsBatch:
+    """Metric rows of this process waiting to be written to one database.
+
+    ``record_metric`` adds rows here instead of opening a connection and
+    committing per value. A background thread writes them with one
+    ``executemany`` transaction every ``flush_seconds``, or as soon as
+    ``flush_rows`` are waiting; what is left is written at exit. Each
+    process (e.g. every ``SymbolProcessPool`` worker) has its own batches.
+    """
+
+    def __init__(
+        self, db_path: str, flush_rows: int = FLUSH_ROWS, flush_seconds: float = FLUSH_SECONDS
+    ):
+        self.db_path = db_path
+        self.flush_rows = max(1, flush_rows)
+        self.flush_seconds = flush_seconds
+        self._rows: list[tuple] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, value: float, provider: str, feed: str) -> None:
+        row = (int(datetime.now().timestamp()), name, value, provider, feed)
+        with self._lock:
+            self._rows.append(row)
+            pending = len(self._rows)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="metrics-sqlite-flush", daemon=True
+                )
+                self._thread.start()
+        if pending >= self.flush_rows:
+            self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._rows)
+
+    def flush(self) -> int:
+        """Write the waiting rows in one transaction; returns how many were written."""
+        with self._write_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return 0
+            if not os.path.exists(self.db_path):
+                if not os.path.isdir(os.path.dirname(self.db_path)):
+                    # Whole directory removed (e.g. a test's temporary directory)
+                    logger.warning(
+                        f"Dropped {len(rows)} metric rows: {self.db_path} no longer exists"
+                    )
+                    return 0
+                # Database file removed meanwhile: recreate its schema
+                apply_pending(Path(self.db_path))
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO metrics (ts, name, value, provider, feed) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            finally:
+                conn.close()
+            return len(rows)
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Dropped metric rows not written to {self.db_path}: {e}")
+
+
+# Batches of this process, by resolved database path
+_batches: dict[str, MetricsBatch] = {}
+_batches_lock = threading.Lock()
+
+
+def metrics_batch(db_path: str) -> MetricsBatch:
+    """This process's batch of metric rows for a database."""
+    batch = _batches.get(db_path)
+    if batch is None:
+        with _batches_lock:
+            batch = _batches.setdefault(db_path, MetricsBatch(db_path))
+    return batch
+
+
+def flush_metrics() -> None:
+    """Write every metric row this process still buffers."""
+    for batch in list(_batches.values()):
+        try:
+            batch.flush()
+        except Exception as e:
+            logger.warning(f"Dropped metric rows not written to {batch.db_path}: {e}")
+
+
+def _reset_batches_after_fork() -> None:
+    # The parent writes the rows it buffered; the child starts empty
+    global _batches_lock
+    _batches.clear()
+    _batches_lock = threading.Lock()
+
+
+atexit.register(flush_metrics)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_batches_after_fork)
+
+
 class SqliteMetricsRepository(SqliteAsyncMixin):
     """SQLite-based repository for storing and querying metric history."""
 
@@ -141,6 +287,7 @@ class SqliteMetricsRepository(SqliteAsyncMixin):
         self.db_path = str(self._db_path)  # For async connection helper
         # Apply migrations on first use
         apply_pending(self._db_path)
+        self._batch = metrics_batch(str(self._db_path.resolve()))
 
     async def record(
         self, name: str, value: float, provider: str = "unknown", feed: str = "unknown"
@@ -155,10 +302,26 @@ class SqliteMetricsRepository(SqliteAsyncMixin):
             )
             await db.commit()
 
+    def enqueue(
+        self, name: str, value: float, provider: str = "unknown", feed: str = "unknown"
+    ) -> None:
+        """Buffer a metric data point; it is written with this process's next batch."""
+        self._batch.add(name, value, provider, feed)
+
+    async def flush(self) -> int:
+        """Write the data points this process buffered for the database.
+
+        Always goes through the batch's write lock, even with nothing pending,
+        so rows the background thread has taken but not yet committed are
+        visible once this returns.
+        """
+        return await asyncio.to_thread(self._batch.flush)
+
     async def get_metrics_history(
         self, metric: str, *, since: Optional[datetime] = None
     ) -> list[MetricPoint]:
         """Get metric history, optionally filtered by time."""
+        await self.flush()  # include this process's buffered points
         async with self._conn() as db:
             if since:
                 since_ts = int(since.timestamp())
@@ -200,6 +363,7 @@ class SqliteMetricsRepository(SqliteAsyncMixin):
 
     async def get_average_metrics(self, metric: str, *, window_minutes: int) -> float:
         """Get average metric value over a time window."""
+        await self.flush()
         since = datetime.now().timestamp() - (window_minutes * 60)
 
         async with self._conn() as db:
@@ -217,6 +381,7 @@ class SqliteMetricsRepository(SqliteAsyncMixin):
 
     async def get_performance_trends(self, metric: str, *, buckets: int = 24) -> list[TrendPoint]:
         """Get performance trends over time divided into buckets."""
+        await self.flush()
         now = datetime.now()
         bucket_size_minutes = (24 * 60) // buckets  # Distribute 24 hours across buckets
         trends = []
@@ -249,6 +414,7 @@ class SqliteMetricsRepository(SqliteAsyncMixin):
 
     async def list_metric_names(self) -> list[str]:
         """List all available metric names."""
+        await self.flush()
         async with self._conn() as db:
             cursor = await db.execute("SELECT DISTINCT name FROM metrics ORDER BY name")
             rows = await cursor.fetchall()
@@ -286,6 +452,77 @@ def get_metrics_repository() -> SqliteMetricsRepository:
     return _metrics_repo
 
 
+class MetricHandle:
+    """A metric name resolved to the Prometheus series it updates.
+
+    ``record_metric`` picks those series from substrings of the name
+    ("request", "error", "latency", "ingest", ...). A handle does that, and
+    resolves the label children, once; ``record`` then only updates them and
+    persists the value. Get handles from ``metric_handle``.
+    """
+
+    __slots__ = ("name", "provider", "feed", "_counters", "_observers")
+
+    def __init__(
+        self, name: str, provider: str = "unknown", feed: str = "unknown", source: str = "unknown"
+    ):
+        self.name = name
+        self.provider = provider
+        self.feed = feed
+        counters: list = []
+        observers: list = []
+
+        lowered = name.lower()
+        if "request" in lowered:
+            counters.append(REQUESTS.labels(source=source, provider=provider, feed=feed))
+            # Also update legacy metric for backward compatibility
+            counters.append(LEGACY_REQUESTS.labels(source=source))
+        elif "error" in lowered:
+            error_code = "unknown"
+            # Try to extract error code from metric name
+            if "_" in name:
+                parts = name.split("_")
+                error_code = parts[-1] if parts[-1] not in ["total", "count"] else "unknown"
+            counters.append(
+                ERRORS.labels(source=source, provider=provider, feed=feed, code=error_code)
+            )
+            counters.append(LEGACY_ERRORS.labels(source=source, code=error_code))
+        elif "latency" in lowered or "duration" in lowered:
+            observers.append(LATENCY.labels(source=source, provider=provider, feed=feed))
+            observers.append(LEGACY_LATENCY.labels(source=source))
+
+        # Operation-specific metrics
+        if "ingest" in lowered:
+            observers.append(PROCESSING_TIME.labels(operation="ingestion"))
+        elif "validation" in lowered:
+            observers.append(PROCESSING_TIME.labels(operation="validation"))
+        elif "aggregation" in lowered:
+            observers.append(PROCESSING_TIME.labels(operation="aggregation"))
+
+        self._counters = tuple(counters)
+        self._observers = tuple(observers)
+
+    def record(self, value: float) -> None:
+        """Update the metric's Prometheus series and persist the value to SQLite."""
+        for counter in self._counters:
+            counter.inc(value)
+        for observer in self._observers:
+            observer.observe(value)
+        _persist_metric(self.name, value, self.provider, self.feed)
+
+
+@functools.lru_cache(maxsize=1024)
+def metric_handle(
+    name: str, *, provider: str = "unknown", feed: str = "unknown", source: str = "unknown"
+) -> MetricHandle:
+    """The cached ``MetricHandle`` of a metric name and label set.
+
+    Names are expected to be bounded; per-symbol values belong in
+    ``record_symbol_metric`` rather than in metric names.
+    """
+    return MetricHandle(name, provider, feed, source)
+
+
 def record_metric(
     name: str,
     value: float,
@@ -297,7 +534,8 @@ def record_metric(
     """Record a metric to both Prometheus and SQLite persistence.
 
     This function updates Prometheus counters/summaries and persists
-    the data to SQLite for historical analysis.
+    the data to SQLite for historical analysis, in per-process batches
+    (see ``MetricsBatch``). Hot paths can keep the ``metric_handle`` instead.
 
     Args:
         name: The metric name
@@ -306,49 +544,18 @@ def record_metric(
         feed: The data feed type (e.g., "iex", "sip")
         source: The source component (for backward compatibility)
     """
-    # Update Prometheus metrics with full label set
-    if "request" in name.lower():
-        REQUESTS.labels(source=source, provider=provider, feed=feed).inc(value)
-        # Also update legacy metric for backward compatibility
-        LEGACY_REQUESTS.labels(source=source).inc(value)
-    elif "error" in name.lower():
-        error_code = "unknown"
-        # Try to extract error code from metric name
-        if "_" in name:
-            parts = name.split("_")
-            error_code = parts[-1] if parts[-1] not in ["total", "count"] else "unknown"
-        ERRORS.labels(source=source, provider=provider, feed=feed, code=error_code).inc(value)
-        LEGACY_ERRORS.labels(source=source, code=error_code).inc(value)
-    elif "latency" in name.lower() or "duration" in name.lower():
-        LATENCY.labels(source=source, provider=provider, feed=feed).observe(value)
-        LEGACY_LATENCY.labels(source=source).observe(value)
-
-    # Update operation-specific metrics
-    if "ingest" in name.lower():
-        PROCESSING_TIME.labels(operation="ingestion").observe(value)
-    elif "validation" in name.lower():
-        PROCESSING_TIME.labels(operation="validation").observe(value)
-    elif "aggregation" in name.lower():
-        PROCESSING_TIME.labels(operation="aggregation").observe(value)
+    metric_handle(name, provider=provider, feed=feed, source=source).record(value)
 
+
+def _persist_metric(name: str, value: float, provider: str, feed: str) -> None:
     # Check environment variable for SQLite persistence
     if os.environ.get("MP_DISABLE_SQLITE_METRICS", "").lower() in ("1", "true", "yes"):
         # SQLite metrics disabled via environment variable
         return
 
-    # Persist to SQLite - handle event loop contexts carefully
-    repo = get_metrics_repository()
-
     try:
-        # Try to determine if we're in an async context
-        loop = asyncio.get_running_loop()
-        # We're in an async context, schedule the task
-        loop.create_task(repo.record(name, value, provider, feed))
-        # Don't wait for completion to avoid blocking
-    except RuntimeError:
-        # No running event loop; perform a synchronous write using a temporary loop
-        try:
-            asyncio.run(repo.record(name, value, provider, feed))
-        except Exception:
-            # Swallow persistence errors in non-critical contexts (e.g., CLI/help runs)
-            pass
+        # Buffered and written in batches by a background thread; never blocks
+        get_metrics_repository().enqueue(name, value, provider, feed)
+    except Exception:
+        # Swallow persistence errors in non-critical contexts (e.g., CLI/help runs)
+        pass
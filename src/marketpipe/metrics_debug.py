@@ -0,0 +1,258 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Runtime introspection endpoints of the async metrics server.
+
+Enabled with ``METRICS_DEBUG_ENDPOINTS=1`` (or ``--debug-endpoints``), the
+metrics server also answers:
+
+    /debug/profile?seconds=10   sampling CPU profile of the process (folded
+                                stacks; ``format=top`` for the hottest functions)
+    /debug/tasks                stack of every asyncio task and thread
+    /debug/memory               top allocations; tracemalloc starts on the
+                                first request, ``diff=1`` compares with the
+                                previous request, ``stop=1`` stops tracing
+    /debug/state                JSON: rate limiters, stage and writer queues,
+                                backlog, event loop lag, task and thread counts
+
+Long-lived components (rate limiters, stage executors, Parquet writers)
+``watch()`` themselves when created and report through ``debug_state()``
+only when ``/debug/state`` is requested. While the endpoints are disabled
+they cost a weak reference per component: no profiler thread runs,
+tracemalloc stays off and debug paths get the usual 404.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import os
+import sys
+import threading
+import traceback
+import weakref
+from typing import Any, Optional
+from urllib.parse import parse_qs
+
+DEBUG_ENDPOINTS_ENV = "METRICS_DEBUG_ENDPOINTS"
+MAX_PROFILE_SECONDS = 60.0
+DEFAULT_PROFILE_SECONDS = 10.0
+DEFAULT_MEMORY_LIMIT = 25
+
+DEBUG_PATHS = ("/debug/profile", "/debug/tasks", "/debug/memory", "/debug/state")
+
+# Components reporting on /debug/state; see ``watch``
+_watched: weakref.WeakSet = weakref.WeakSet()
+
+
+def debug_endpoints_enabled() -> bool:
+    """Whether ``METRICS_DEBUG_ENDPOINTS`` turns the debug endpoints on."""
+    return os.getenv(DEBUG_ENDPOINTS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def watch(component: Any) -> None:
+    """Report ``component.debug_state()`` on ``/debug/state`` while it is alive."""
+    _watched.add(component)
+
+
+def watched_states() -> list[dict[str, Any]]:
+    """``debug_state()`` of every live watched component."""
+    states = []
+    for component in list(_watched):
+        try:
+            states.append(component.debug_state())
+        except Exception as e:  # a broken component must not break the endpoint
+            states.append({"kind": type(component).__name__, "error": str(e)})
+    return states
+
+
+class DebugError(Exception):
+    """Invalid debug request; the message is returned with a 4xx status."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+# status, body, content type
+DebugResponse = tuple[int, bytes, str]
+
+
+class DebugEndpoints:
+    """Handlers of the ``/debug/*`` paths for one metrics server."""
+
+    def __init__(self) -> None:
+        self._profiling = False
+        self._memory_snapshot: Any = None
+
+    async def handle(self, path: str, query: str) -> Optional[DebugResponse]:
+        """Answer a debug request; None for paths that are not debug endpoints."""
+        params = {key: values[-1] for key, values in parse_qs(query).items()}
+        try:
+            if path == "/debug/profile":
+                return await self._profile(params)
+            if path == "/debug/tasks":
+                return _text(dump_stacks())
+            if path == "/debug/memory":
+                return await self._memory(params)
+            if path == "/debug/state":
+                body = json.dumps(runtime_state(), indent=2, default=str)
+                return 200, body.encode(), "application/json"
+        except DebugError as e:
+            return e.status, str(e).encode(), "text/plain"
+        return None
+
+    async def _profile(self, params: dict[str, str]) -> DebugResponse:
+        from marketpipe.profiling import DEFAULT_INTERVAL, SamplingProfiler
+
+        seconds = _float_param(params, "seconds", DEFAULT_PROFILE_SECONDS)
+        interval = _float_param(params, "interval", DEFAULT_INTERVAL)
+        output = params.get("format", "folded")
+        if not 0 < seconds <= MAX_PROFILE_SECONDS:
+            raise DebugError(f"seconds must be in (0, {MAX_PROFILE_SECONDS:g}]")
+        if output not in ("folded", "top"):
+            raise DebugError("format must be folded or top")
+        if self._profiling:
+            raise DebugError("A profile is already being recorded", status=409)
+
+        try:
+            profiler = SamplingProfiler(interval=interval)
+        except ValueError as e:
+            raise DebugError(str(e)) from e
+        self._profiling = True
+        try:
+            # The sampler runs on its own thread; the loop stays free meanwhile
+            profiler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.stop()
+        finally:
+            self._profiling = False
+
+        if output == "top":
+            lines = [f"{profiler.samples} samples in {profiler.seconds:.1f}s"]
+            lines += [f"{count:>8}  {function}" for function, count in profiler.top(50)]
+        else:
+            lines = [f"{stack} {count}" for stack, count in profiler.stacks.most_common()]
+        return _text("\n".join(lines) + "\n")
+
+    async def _memory(self, params: dict[str, str]) -> DebugResponse:
+        import tracemalloc
+
+        if params.get("stop") in ("1", "true"):
+            tracemalloc.stop()
+            self._memory_snapshot = None
+            return _text("tracemalloc stopped\n")
+        if not tracemalloc.is_tracing():
+            frames = int(_float_param(params, "frames", 1))
+            if frames < 1:
+                raise DebugError("frames must be at least 1")
+            tracemalloc.start(frames)
+            self._memory_snapshot = None
+            return _text(
+                f"tracemalloc started ({frames} frame(s) per allocation); "
+                "request again for the top allocations\n"
+            )
+
+        group = params.get("group", "lineno")
+        if group not in ("lineno", "filename", "traceback"):
+            raise DebugError("group must be lineno, filename or traceback")
+        limit = int(_float_param(params, "limit", DEFAULT_MEMORY_LIMIT))
+        diff = params.get("diff") in ("1", "true")
+        # Snapshots of large heaps take a while; keep the loop responsive
+        snapshot, stats = await asyncio.to_thread(
+            _memory_statistics, self._memory_snapshot if diff else None, group
+        )
+        had_baseline = self._memory_snapshot is not None
+        self._memory_snapshot = snapshot
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"traced: {current / 2**20:.1f} MiB current, {peak / 2**20:.1f} MiB peak"]
+        if diff and not had_baseline:
+            lines.append("no earlier snapshot to compare with; showing totals")
+        for stat in stats[:limit]:
+            lines.append(str(stat))
+            if group == "traceback":
+                lines.extend(f"    {line}" for line in stat.traceback.format())
+        return _text("\n".join(lines) + "\n")
+
+
+def _memory_statistics(baseline: Any, group: str) -> tuple[Any, list[Any]]:
+    import tracemalloc
+
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+    )
+    if baseline is not None:
+        return snapshot, snapshot.compare_to(baseline, group)
+    return snapshot, snapshot.statistics(group)
+
+
+def dump_stacks() -> str:
+    """Stacks of the running loop's asyncio tasks, then of every thread."""
+    out = io.StringIO()
+    try:
+        tasks = sorted(asyncio.all_tasks(), key=lambda t: t.get_name())
+    except RuntimeError:  # no running loop
+        tasks = []
+    out.write(f"=== {len(tasks)} asyncio tasks ===\n")
+    for task in tasks:
+        out.write("\n")
+        task.print_stack(file=out)
+
+    names = {t.ident: t.name for t in threading.enumerate()}
+    frames = sys._current_frames()
+    out.write(f"\n=== {len(frames)} threads ===\n")
+    for ident, frame in frames.items():
+        out.write(f"\nThread {names.get(ident, ident)} ({ident}):\n")
+        out.write("".join(traceback.format_stack(frame)))
+    return out.getvalue()
+
+
+def runtime_state() -> dict[str, Any]:
+    """Queue depths, rate limiter buckets and loop health of this process."""
+    from prometheus_client import REGISTRY
+
+    try:
+        tasks: Optional[int] = len(asyncio.all_tasks())
+    except RuntimeError:
+        tasks = None
+    return {
+        "pid": os.getpid(),
+        "asyncio_tasks": tasks,
+        "threads": threading.active_count(),
+        "event_loop_lag_seconds": REGISTRY.get_sample_value("marketpipe_event_loop_lag_seconds"),
+        "backlog_jobs": REGISTRY.get_sample_value("mp_backlog_jobs"),
+        "components": watched_states(),
+    }
+
+
+def _float_param(params: dict[str, str], name: str, default: float) -> float:
+    if name not in params:
+        return default
+    try:
+        return float(params[name])
+    except ValueError:
+        raise DebugError(f"{name} must be a number") from None
+
+
+def _text(body: str) -> DebugResponse:
+    return 200, body.encode(), "text/plain; charset=utf-8"
+
+
+__all__ = [
+    "DEBUG_ENDPOINTS_ENV",
+    "DEBUG_PATHS",
+    "MAX_PROFILE_SECONDS",
+    "DebugEndpoints",
+    "DebugError",
+    "debug_endpoints_enabled",
+    "dump_stacks",
+    "runtime_state",
+    "watch",
+    "watched_states",
+]
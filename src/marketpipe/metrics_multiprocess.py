@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Prometheus metrics shared by worker processes.
+
+With ``PROMETHEUS_MULTIPROC_DIR`` set before MarketPipe starts, every
+process (the CLI, ``SymbolProcessPool`` workers, ``worker`` instances)
+keeps its metric values in mmap-backed files of that directory instead of
+in memory, and ``AsyncMetricsServer`` aggregates the files on each scrape:
+
+    process 1 ─▶ counter_4711.db  histogram_4711.db  gauge_livesum_4711.db
+    process 2 ─▶ counter_4712.db  histogram_4712.db  gauge_livesum_4712.db
+                        │
+                        ▼  scrape: cleanup_dead_processes() + MultiProcessCollector
+    counter_archive.db  ◀── totals of exited processes
+                        (their live gauge files are removed)
+
+Counters, histograms and summaries of exited processes are folded into one
+``{type}_archive.db`` per type, so totals survive worker restarts while the
+directory holds one file per live process instead of one per process ever
+started. Gauges declare how processes combine (``multiprocess_mode``):
+``livesum``/``livemax`` for queue depths and lag, whose values of exited
+processes are dropped.
+
+Reading and compacting the files is serialized by ``collect_lock``, a file
+lock in the directory, so a standalone ``marketpipe metrics`` server and the
+ingesting process (``SymbolProcessPool.shutdown``) never archive the same
+exited process twice or read files while the other removes them.
+
+The directory must exist and be emptied before the first process starts;
+the mode is fixed when ``prometheus_client`` is imported.
+"""
+
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import sys
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Optional
+
+import fasteners
+
+logger = logging.getLogger(__name__)
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+ARCHIVE_ID = "archive"
+# File types whose values add up across processes
+ACCUMULATED_TYPES = ("counter", "histogram", "summary")
+
+# Lock file of ``collect_lock``; not ``*.db``, so collectors skip it
+COLLECT_LOCK_FILE = "collect.lock"
+# POSIX record locks never conflict within one process, so threads of this
+# process also take a thread lock
+_collect_thread_lock = threading.Lock()
+
+
+def multiprocess_dir() -> Optional[str]:
+    """The ``PROMETHEUS_MULTIPROC_DIR`` directory, or None when unset."""
+    return os.environ.get(MULTIPROC_DIR_ENV) or os.environ.get("prometheus_multiproc_dir")
+
+
+def multiprocess_enabled() -> bool:
+    """Whether this process's metrics are written to the multiprocess directory.
+
+    False when the variable was set only after ``prometheus_client`` was
+    imported: values then stay in memory and other processes never see them.
+    """
+    from prometheus_client import values
+
+    return multiprocess_dir() is not None and values.ValueClass is not values.MutexValue
+
+
+@contextmanager
+def collect_lock(path: Optional[str] = None) -> Iterator[None]:
+    """Hold while metric files are read or compacted, across processes.
+
+    The collector fails on files removed under it, and two processes
+    archiving the same exited pid would count its totals twice.
+
+    Args:
+        path: Multiprocess directory (default: ``PROMETHEUS_MULTIPROC_DIR``)
+    """
+    path = path or multiprocess_dir()
+    with _collect_thread_lock:
+        if not path or not os.path.isdir(path):
+            yield
+            return
+        with fasteners.InterProcessLock(os.path.join(path, COLLECT_LOCK_FILE)):
+            yield
+
+
+def _pid_of(path: str) -> Optional[int]:
+    stem = os.path.basename(path)[: -len(".db")]
+    pid = stem.rsplit("_", 1)[-1]
+    return int(pid) if pid.isdigit() else None
+
+
+def pid_alive(pid: int) -> bool:
+    """Whether a process with ``pid`` is running (assumed so when unknown)."""
+    if sys.platform == "win32":
+        try:
+            import psutil
+        except ImportError:
+            return True
+        return psutil.pid_exists(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # running under another user
+        return True
+    return True
+
+
+def cleanup_dead_processes(
+    path: Optional[str] = None, pids: Optional[Iterable[int]] = None
+) -> list[int]:
+    """Fold the metric files of exited processes into the archive files.
+
+    Args:
+        path: Multiprocess directory (default: ``PROMETHEUS_MULTIPROC_DIR``)
+        pids: Processes known to have exited; by default every process with
+            files in the directory that is no longer running
+
+    Returns:
+        The pids whose files were cleaned up
+    """
+    from prometheus_client.multiprocess import mark_process_dead
+
+    path = path or multiprocess_dir()
+    if not path or not os.path.isdir(path):
+        return []
+
+    with collect_lock(path):
+        files: dict[int, list[str]] = defaultdict(list)
+        for f in glob.glob(os.path.join(path, "*.db")):
+            pid = _pid_of(f)
+            if pid is not None:
+                files[pid].append(f)
+        if pids is None:
+            own = os.getpid()
+            dead = [pid for pid in files if pid != own and not pid_alive(pid)]
+        else:
+            dead = [pid for pid in pids if pid in files]
+
+        for pid in dead:
+            mark_process_dead(pid, path)  # live gauges
+            by_type: dict[str, list[str]] = defaultdict(list)
+            for f in files[pid]:
+                typ = os.path.basename(f).split("_", 1)[0]
+                if typ in ACCUMULATED_TYPES:
+                    by_type[typ].append(f)
+                elif os.path.basename(f).startswith("gauge_all_"):
+                    # Per-pid series of a process that is gone
+                    _remove(f)
+            for typ, typ_files in by_type.items():
+                _archive(os.path.join(path, f"{typ}_{ARCHIVE_ID}.db"), typ_files)
+        if dead:
+            logger.debug(f"Archived Prometheus metric files of exited processes {sorted(dead)}")
+        return sorted(dead)
+
+
+def _archive(archive_path: str, files: list[str]) -> None:
+    """Add the values of ``files`` to the archive file, then remove them."""
+    from prometheus_client.mmap_dict import MmapedDict
+
+    totals: dict[str, float] = defaultdict(float)
+    for f in files:
+        for key, value, *_ in MmapedDict.read_all_values_from_file(f):
+            totals[key] += value
+
+    archive = MmapedDict(archive_path)
+    try:
+        for key, value in totals.items():
+            current, timestamp = archive.read_value(key)
+            archive.write_value(key, current + value, timestamp)
+    finally:
+        archive.close()
+    for f in files:
+        _remove(f)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+__all__ = [
+    "COLLECT_LOCK_FILE",
+    "MULTIPROC_DIR_ENV",
+    "cleanup_dead_processes",
+    "collect_lock",
+    "multiprocess_dir",
+    "multiprocess_enabled",
+    "pid_alive",
+]
@@ -6,6 +6,7 @@ import logging
 import os
 import time
 from contextlib import asynccontextmanager
+from http import HTTPStatus
 from typing import Optional
 from wsgiref.simple_server import make_server
 
@@ -18,38 +19,72 @@ from prometheus_client import (
 )
 from prometheus_client.multiprocess import MultiProcessCollector
 
+from marketpipe.metrics_debug import DebugEndpoints, debug_endpoints_enabled
+from marketpipe.metrics_multiprocess import cleanup_dead_processes, collect_lock
+from marketpipe.symbol_metrics import SYMBOL_METRICS
+
 # Event loop lag gauge for monitoring blocking operations
 EVENT_LOOP_LAG = Gauge(
     "marketpipe_event_loop_lag_seconds",
     "Time difference between expected and actual event loop execution",
+    multiprocess_mode="livemax",
 )
 
 # Connection and request limits for production use
 MAX_CONNECTIONS = int(os.getenv("METRICS_MAX_CONNECTIONS", "100"))
 MAX_HEADER_SIZE = int(os.getenv("METRICS_MAX_HEADER_SIZE", "16384"))  # 16 KiB
 
+# Seconds a generated /metrics payload is served to further scrapes (0: never cached)
+CACHE_TTL = float(os.getenv("METRICS_CACHE_TTL", "1.0"))
+
 logger = logging.getLogger(__name__)
 
 
 class AsyncMetricsServer:
-    """Asynchronous Prometheus metrics server using asyncio.start_server."""
+    """Asynchronous Prometheus metrics server using asyncio.start_server.
+
+    The ``/metrics`` payload is generated off the event loop and reused for
+    ``cache_ttl`` seconds; scrapes arriving while it is being generated wait
+    for that one generation instead of starting their own.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set it serves the metrics of every
+    process writing to that directory, archiving the files of exited ones
+    first (see ``marketpipe.metrics_multiprocess``).
+
+    With ``debug`` (default: the ``METRICS_DEBUG_ENDPOINTS`` environment
+    variable) it also serves the ``/debug/*`` introspection endpoints of
+    ``marketpipe.metrics_debug``.
+    """
 
     def __init__(
         self,
         port: int = 8000,
         host: str = "localhost",
         max_connections: int = MAX_CONNECTIONS,
+        debug: Optional[bool] = None,
+        cache_ttl: float = CACHE_TTL,
     ):
         self.port = port
         self.host = host
         self.max_connections = max_connections
+        self.cache_ttl = cache_ttl
         self.server: Optional[asyncio.Server] = None
         self._lag_monitor_task: Optional[asyncio.Task] = None
         self._registry = CollectorRegistry()
+        self._payload: Optional[bytes] = None
+        self._payload_expires = 0.0
+        self._generating: Optional[asyncio.Future[bytes]] = None
+        self._debug: Optional[DebugEndpoints] = None
+        self._multiprocess_dir: Optional[str] = None
+        if debug if debug is not None else debug_endpoints_enabled():
+            self._debug = DebugEndpoints()
 
         # Setup multiprocess collector if available
         if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
             MultiProcessCollector(self._registry)
+            # Per-symbol summaries are process-local; serve this process's
+            self._registry.register(SYMBOL_METRICS)
+            self._multiprocess_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
         else:
             # For single process, use the default registry
             from prometheus_client import REGISTRY
@@ -74,6 +109,8 @@ class AsyncMetricsServer:
         )
         print(f"📊 Metrics server started on http://{self.host}:{self.port}/metrics")
         print("   Serving Prometheus format metrics data for monitoring systems")
+        if self._debug is not None:
+            print(f"   Debug endpoints enabled under http://{self.host}:{self.port}/debug/")
 
     async def stop(self) -> None:
         """Stop the async metrics server gracefully."""
@@ -137,6 +174,21 @@ class AsyncMetricsServer:
                 await self._send_response(writer, 405, "Method Not Allowed", b"Method not allowed")
                 return
 
+            # Debug endpoints, when enabled, take the query string
+            if self._debug is not None and path.startswith("/debug/"):
+                route, _, query = path.partition("?")
+                debug_response = await self._debug.handle(route, query)
+                if debug_response is not None:
+                    status_code, body, content_type = debug_response
+                    await self._send_response(
+                        writer,
+                        status_code,
+                        HTTPStatus(status_code).phrase,
+                        body,
+                        content_type=content_type,
+                    )
+                    return
+
             # Check exact path match
             if path != "/metrics":
                 await self._send_response(writer, 404, "Not Found", b"Not found - try /metrics")
@@ -144,7 +196,7 @@ class AsyncMetricsServer:
 
             # Generate metrics data
             try:
-                metrics_data = generate_latest(self._registry)
+                metrics_data = await self._exposition()
             except Exception as e:
                 logger.error(f"Failed to generate metrics: {e}")
                 await self._send_response(
@@ -176,6 +228,29 @@ class AsyncMetricsServer:
             except Exception as e:
                 logger.debug(f"Error closing connection: {e}")
 
+    async def _exposition(self) -> bytes:
+        """The Prometheus payload, regenerated at most once per ``cache_ttl``."""
+        if self._payload is not None and time.monotonic() < self._payload_expires:
+            return self._payload
+        if self._generating is None:
+            self._generating = asyncio.ensure_future(asyncio.to_thread(self._generate))
+            self._generating.add_done_callback(self._generated)
+        # Shielded: a client hanging up must not cancel other scrapes' payload
+        return await asyncio.shield(self._generating)
+
+    def _generate(self) -> bytes:
+        if self._multiprocess_dir is None:
+            return generate_latest(self._registry)
+        cleanup_dead_processes(self._multiprocess_dir)
+        with collect_lock(self._multiprocess_dir):
+            return generate_latest(self._registry)
+
+    def _generated(self, future: asyncio.Future[bytes]) -> None:
+        self._generating = None
+        if not future.cancelled() and future.exception() is None and self.cache_ttl > 0:
+            self._payload = future.result()
+            self._payload_expires = time.monotonic() + self.cache_ttl
+
     async def _send_response(
         self,
         writer: asyncio.StreamWriter,
@@ -240,8 +315,16 @@ class AsyncMetricsServer:
 _async_server_instance: Optional[AsyncMetricsServer] = None
 
 
-async def start_async_server(port: int = 8000, host: str = "localhost") -> AsyncMetricsServer:
-    """Start the global async metrics server."""
+async def start_async_server(
+    port: int = 8000, host: str = "localhost", debug: Optional[bool] = None
+) -> AsyncMetricsServer:
+    """Start the global async metrics server.
+
+    Args:
+        port: Port to listen on (``METRICS_PORT`` takes precedence)
+        host: Interface to listen on
+        debug: Serve the ``/debug/*`` endpoints (default: ``METRICS_DEBUG_ENDPOINTS``)
+    """
     import errno
     import socket
 
@@ -269,7 +352,7 @@ async def start_async_server(port: int = 8000, host: str = "localhost") -> Async
         else:
             raise RuntimeError(f"Cannot bind to {host}:{port} - {e}") from e
 
-    _async_server_instance = AsyncMetricsServer(port=port, host=host)
+    _async_server_instance = AsyncMetricsServer(port=port, host=host, debug=debug)
     await _async_server_instance.start()
     return _async_server_instance
 
@@ -287,7 +370,9 @@ def metrics_app(environ, start_response):
     """WSGI app for multiprocess metrics (legacy compatibility)."""
     registry = CollectorRegistry()
     MultiProcessCollector(registry)
-    data = generate_latest(registry)
+    cleanup_dead_processes()
+    with collect_lock():
+        data = generate_latest(registry)
     status = "200 OK"
     response_headers = [
         ("Content-type", CONTENT_TYPE_LATEST),
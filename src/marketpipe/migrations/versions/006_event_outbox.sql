@@ -0,0 +1,29 @@
+-- Migration 006: Transactional event outbox
+-- Domain events are written here in the same transaction as the state change
+-- that raised them; dispatchers deliver them per consumer and record the outcome.
+
+CREATE TABLE IF NOT EXISTS event_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    event_type TEXT NOT NULL,
+    aggregate_id TEXT NOT NULL,
+    payload TEXT NOT NULL,  -- JSON encoded event
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One row per (consumer, event) once a delivery has been attempted
+CREATE TABLE IF NOT EXISTS event_outbox_deliveries (
+    consumer TEXT NOT NULL,
+    outbox_id INTEGER NOT NULL REFERENCES event_outbox(id) ON DELETE CASCADE,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,  -- Unix seconds
+    delivered_at TIMESTAMP,
+    last_error TEXT,
+    PRIMARY KEY (consumer, outbox_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_outbox_type
+ON event_outbox(event_type);
+
+CREATE INDEX IF NOT EXISTS idx_event_outbox_deliveries_pending
+ON event_outbox_deliveries(consumer, delivered_at, next_attempt_at);
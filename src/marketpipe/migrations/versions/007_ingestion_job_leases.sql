@@ -0,0 +1,9 @@
+-- Migration 007: Ingestion job leases
+-- Workers claiming jobs record themselves as lease owner and renew the lease
+-- while the job runs; IN_PROGRESS jobs whose lease expired can be reclaimed.
+
+ALTER TABLE ingestion_jobs ADD COLUMN lease_owner TEXT;
+ALTER TABLE ingestion_jobs ADD COLUMN lease_expires_at REAL;  -- Unix seconds
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_lease
+ON ingestion_jobs(state, lease_expires_at);
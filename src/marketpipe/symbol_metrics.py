@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Bounded per-symbol metric summaries.
+
+Per-symbol values such as "bars validated for AAPL" used to be recorded
+under metric names of their own (``validation_bars_AAPL``), one SQLite
+series and dashboard entry per symbol. With thousands of symbols that grows
+without bound. Instead, each per-symbol metric keeps one fixed-size summary:
+
+    record_symbol_metric("validation_errors", "AAPL", 3)
+        └─▶ SymbolSummary("validation_errors")
+              ├─ total            sum of every recorded value
+              ├─ top-K            heaviest symbols (Space-Saving, counts may be
+              │                   overestimated by at most ``error``)
+              └─ HyperLogLog      estimated number of distinct symbols (~3%)
+
+Memory per metric is constant whatever the universe size. Summaries are
+exported on ``/metrics`` as
+
+    mp_symbol_top{metric="validation_errors", symbol="AAPL"}   top-K values
+    mp_symbol_distinct{metric="validation_errors"}             distinct symbols
+    mp_symbol_value_total{metric="validation_errors"}          total
+
+``MARKETPIPE_METRICS_TOP_K`` (default 20) sets how many symbols are
+exported per metric; four times as many are tracked so that the exported
+ones are accurate. Summaries live in the process that records them and
+are not merged across ``PROMETHEUS_MULTIPROC_DIR`` worker processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from marketpipe.metrics_debug import watch
+
+DEFAULT_TOP_K = 20
+TRACKED_PER_EXPORTED = 4
+HLL_PRECISION = 10  # 1024 registers, ~3% standard error
+
+
+@dataclass(frozen=True)
+class TopEntry:
+    """A symbol among the heaviest; its true value is in ``[value - error, value]``."""
+
+    symbol: str
+    value: float
+    error: float
+
+
+class SpaceSaving:
+    """Weighted Space-Saving heavy hitters over at most ``capacity`` keys.
+
+    Any key whose total exceeds ``total / capacity`` is guaranteed to be
+    tracked; a new key evicts the lightest one and inherits its value as
+    possible overestimation.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._counts: dict[str, list[float]] = {}  # key -> [value, error]
+
+    def add(self, key: str, value: float) -> None:
+        entry = self._counts.get(key)
+        if entry is not None:
+            entry[0] += value
+        elif len(self._counts) < self.capacity:
+            self._counts[key] = [value, 0.0]
+        else:
+            lightest = min(self._counts, key=lambda k: self._counts[k][0])
+            floor = self._counts.pop(lightest)[0]
+            self._counts[key] = [floor + value, floor]
+
+    def top(self, limit: int) -> list[TopEntry]:
+        ranked = sorted(self._counts.items(), key=lambda item: (-item[1][0], item[0]))
+        return [TopEntry(key, value, error) for key, (value, error) in ranked[:limit]]
+
+
+class HyperLogLog:
+    """Distinct-count estimate in ``2**precision`` one-byte registers."""
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, key: str) -> None:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        h = int.from_bytes(digest, "big")
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def estimate(self) -> float:
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0**-r for r in self._registers)
+        zeros = self._registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)  # linear counting for small sets
+        return raw
+
+
+class SymbolSummary:
+    """Total, heaviest symbols and distinct symbol count of one metric."""
+
+    def __init__(self, name: str, top_k: int = DEFAULT_TOP_K) -> None:
+        self.name = name
+        self.top_k = top_k
+        self.total = 0.0
+        self._heavy = SpaceSaving(top_k * TRACKED_PER_EXPORTED)
+        self._distinct = HyperLogLog()
+        self._lock = threading.Lock()
+
+    def record(self, symbol: str, value: float = 1.0) -> None:
+        with self._lock:
+            self.total += value
+            self._heavy.add(symbol, value)
+            self._distinct.add(symbol)
+
+    def top(self, limit: int = 0) -> list[TopEntry]:
+        """Heaviest symbols, at most ``limit`` (default: ``top_k``)."""
+        with self._lock:
+            return self._heavy.top(limit or self.top_k)
+
+    def distinct(self) -> int:
+        with self._lock:
+            return round(self._distinct.estimate())
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "total": self.total,
+                "distinct_symbols": round(self._distinct.estimate()),
+                "top": [(e.symbol, e.value) for e in self._heavy.top(self.top_k)],
+            }
+
+
+class SymbolMetrics:
+    """Registry of per-symbol summaries, exported as a Prometheus collector."""
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K) -> None:
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        self.top_k = top_k
+        self._summaries: dict[str, SymbolSummary] = {}
+        self._lock = threading.Lock()
+
+    def summary(self, name: str) -> SymbolSummary:
+        """The summary of ``name``, created on first use; keep it to skip the lookup."""
+        summary = self._summaries.get(name)
+        if summary is None:
+            with self._lock:
+                summary = self._summaries.setdefault(name, SymbolSummary(name, self.top_k))
+        return summary
+
+    def record(self, name: str, symbol: str, value: float = 1.0) -> None:
+        self.summary(name).record(symbol, value)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        summaries = list(self._summaries.items())
+        return {name: summary.snapshot() for name, summary in sorted(summaries)}
+
+    def debug_state(self) -> dict[str, Any]:
+        return {"kind": "symbol_metrics", "metrics": self.snapshot()}
+
+    def collect(self) -> Iterator[Any]:
+        top = GaugeMetricFamily(
+            "mp_symbol_top",
+            "Heaviest symbols of per-symbol metrics (top-K summary)",
+            labels=["metric", "symbol"],
+        )
+        distinct = GaugeMetricFamily(
+            "mp_symbol_distinct",
+            "Estimated distinct symbols recorded per per-symbol metric",
+            labels=["metric"],
+        )
+        total = CounterMetricFamily(
+            "mp_symbol_value",
+            "Sum of per-symbol metric values over all symbols",
+            labels=["metric"],
+        )
+        for name, summary in list(self._summaries.items()):
+            for entry in summary.top():
+                top.add_metric([name, entry.symbol], entry.value)
+            distinct.add_metric([name], summary.distinct())
+            total.add_metric([name], summary.total)
+        yield top
+        yield distinct
+        yield total
+
+
+def _top_k_from_env() -> int:
+    try:
+        return max(1, int(os.getenv("MARKETPIPE_METRICS_TOP_K", DEFAULT_TOP_K)))
+    except ValueError:
+        return DEFAULT_TOP_K
+
+
+SYMBOL_METRICS = SymbolMetrics(_top_k_from_env())
+REGISTRY.register(SYMBOL_METRICS)
+watch(SYMBOL_METRICS)
+
+
+def symbol_summary(name: str) -> SymbolSummary:
+    """Pre-resolve the process-wide summary of a per-symbol metric."""
+    return SYMBOL_METRICS.summary(name)
+
+
+def record_symbol_metric(name: str, symbol: str, value: float = 1.0) -> None:
+    """Add ``value`` for ``symbol`` to the process-wide summary of ``name``."""
+    SYMBOL_METRICS.record(name, str(symbol), value)
+
+
+__all__ = [
+    "DEFAULT_TOP_K",
+    "SYMBOL_METRICS",
+    "HyperLogLog",
+    "SpaceSaving",
+    "SymbolMetrics",
+    "SymbolSummary",
+    "TopEntry",
+    "record_symbol_metric",
+    "symbol_summary",
+]
@@ -0,0 +1,288 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Per-stage spans of ingestion jobs.
+
+Ingestion code marks its stages with ``span(name, **attributes)``. Spans
+nest through a context variable, so every asyncio task (one per symbol)
+and every ``asyncio.to_thread`` call continues the span it was started
+from:
+
+    job
+    └─ symbol (symbol=AAPL)
+       ├─ fetch
+       │  ├─ page (page=1) ─┬─ rate_limit_wait
+       │  │                 ├─ http
+       │  │                 ├─ parse_json
+       │  │                 └─ translate
+       │  └─ page (page=2) ...
+       ├─ validate
+       ├─ store            (Parquet write)
+       └─ checkpoint       (SQLite bookkeeping)
+
+Every finished span is observed in the ``mp_stage_duration_seconds``
+Prometheus histogram, labelled by stage name only. While a ``Tracer`` is
+active (``with tracing("trace.json"):``) spans are also collected and
+written on exit as a Chrome trace (chrome://tracing, Perfetto) or, for
+``*.otlp.json`` paths, as OTLP-JSON for OpenTelemetry tooling. Each
+asyncio task and thread gets its own track in the Chrome trace.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from prometheus_client import Histogram
+
+STAGE_DURATION = Histogram(
+    "mp_stage_duration_seconds",
+    "Duration of ingestion stages (job, symbol, page, http, validate, store, ...)",
+    ["stage"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+TRACE_FORMATS = ("chrome", "otlp")
+
+
+@dataclass
+class Span:
+    """One timed stage; ``end_ns`` is 0 until the span finishes."""
+
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    track: int
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("marketpipe_span", default=None)
+_active_tracer: Optional[Tracer] = None
+
+
+class Tracer:
+    """Collects the spans finished while it is active."""
+
+    def __init__(self, service_name: str = "marketpipe") -> None:
+        self.service_name = service_name
+        self.trace_id = secrets.token_hex(16)
+        self._spans: list[Span] = []
+        self._tracks: dict[tuple[int, int], int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def track(self) -> int:
+        """Track of the calling thread and asyncio task, numbered from 1."""
+        try:
+            task = id(asyncio.current_task())
+        except RuntimeError:
+            task = 0
+        key = (threading.get_ident(), task)
+        with self._lock:
+            return self._tracks.setdefault(key, len(self._tracks) + 1)
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def stage_totals(self) -> dict[str, tuple[int, float]]:
+        """``{stage: (count, seconds)}`` in order of first appearance."""
+        totals: dict[str, tuple[int, float]] = {}
+        for span in self.spans:
+            count, seconds = totals.get(span.name, (0, 0.0))
+            totals[span.name] = (count + 1, seconds + span.duration_ns / 1e9)
+        return totals
+
+    def to_chrome(self) -> dict[str, Any]:
+        """Chrome trace event format: one complete ("X") event per span."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"ph": "M", "name": "process_name", "pid": pid, "args": {"name": self.service_name}}
+        ]
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            args = dict(span.attributes)
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "marketpipe",
+                    "ph": "X",
+                    "ts": span.start_ns / 1_000,
+                    "dur": span.duration_ns / 1_000,
+                    "pid": pid,
+                    "tid": span.track,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self) -> dict[str, Any]:
+        """OTLP-JSON ``ExportTraceServiceRequest`` holding every span."""
+        spans = []
+        for span in self.spans:
+            otlp_span: dict[str, Any] = {
+                "traceId": self.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [_otlp_attribute(k, v) for k, v in span.attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", self.service_name)]
+                    },
+                    "scopeSpans": [{"scope": {"name": "marketpipe.tracing"}, "spans": spans}],
+                }
+            ]
+        }
+
+    def write(self, path: Union[str, Path], format: Optional[str] = None) -> Path:
+        """Write the trace to ``path``; the format defaults to the file name's.
+
+        Args:
+            path: Trace file to write
+            format: ``chrome`` or ``otlp``; ``*.otlp.json`` files default to ``otlp``
+        """
+        path = Path(path)
+        format = format or ("otlp" if path.name.endswith(".otlp.json") else "chrome")
+        if format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format {format!r}; expected one of {TRACE_FORMATS}")
+        document = self.to_otlp() if format == "otlp" else self.to_chrome()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document))
+        return path
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    typed: dict[str, Any]
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a stage, nested under the current span.
+
+    Always observed in ``mp_stage_duration_seconds``; the span itself is
+    only created (and yielded) while a tracer is active, otherwise this
+    yields None.
+
+    Args:
+        name: Stage name, also the histogram's ``stage`` label
+        **attributes: Span attributes, e.g. ``symbol="AAPL"``
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        start = time.perf_counter()
+        try:
+            yield None
+        finally:
+            STAGE_DURATION.labels(stage=name).observe(time.perf_counter() - start)
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else None,
+        track=tracer.track(),
+        start_ns=time.time_ns(),
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        tracer.record(current)
+        STAGE_DURATION.labels(stage=name).observe(current.duration_ns / 1e9)
+
+
+def current_span() -> Optional[Span]:
+    """Innermost open span of the calling context, if tracing."""
+    return _current_span.get()
+
+
+def start_tracing(service_name: str = "marketpipe") -> Tracer:
+    """Start collecting spans in a new tracer and return it."""
+    global _active_tracer
+    _active_tracer = Tracer(service_name)
+    return _active_tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop collecting spans and return the tracer that collected them."""
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    return tracer
+
+
+@contextmanager
+def tracing(
+    path: Optional[Union[str, Path]] = None, format: Optional[str] = None
+) -> Iterator[Tracer]:
+    """Collect spans for the duration of the block, then write them to ``path``.
+
+    Example:
+        >>> with tracing("data/traces/ingest.json") as tracer:
+        ...     run_ingestion()
+    """
+    tracer = start_tracing()
+    try:
+        yield tracer
+    finally:
+        stop_tracing()
+        if path is not None:
+            tracer.write(path, format)
+
+
+__all__ = [
+    "STAGE_DURATION",
+    "TRACE_FORMATS",
+    "Span",
+    "Tracer",
+    "current_span",
+    "span",
+    "start_tracing",
+    "stop_tracing",
+    "tracing",
+]
@@ -3,10 +3,21 @@
 
 from __future__ import annotations
 
+import logging
+from typing import Optional
+
 from marketpipe.bootstrap import get_event_bus
+from marketpipe.config.calendar import configured_calendar
+from marketpipe.config.prices import configured_price_type
 from marketpipe.domain.entities import EntityId, OHLCVBar
 from marketpipe.domain.events import IngestionJobCompleted
-from marketpipe.domain.value_objects import Price, Symbol, Timestamp, Volume
+from marketpipe.domain.value_objects import Symbol, Timestamp, Volume
+from marketpipe.infrastructure.messaging.stage_executor import (
+    StageExecutor,
+    StageSettings,
+    register_stage,
+)
+from marketpipe.ingestion.domain.events import as_job_completed
 from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
 
 from ..domain.services import ValidationDomainService
@@ -16,10 +27,12 @@ from ..infrastructure.repositories import CsvReportRepository
 class ValidationRunnerService:
     """Application service for running validation on ingested data."""
 
-    def __init__(self, storage_engine, validator, reporter):
+    def __init__(self, storage_engine, validator, reporter, price_backend=None):
         self._storage_engine = storage_engine
         self._validator = validator
         self._reporter = reporter
+        # Price class of re-read bars: $MARKETPIPE_PRICE_BACKEND unless given
+        self._price_type = configured_price_type(price_backend)
 
     def _extract_provider_feed_info(self, event: IngestionJobCompleted) -> tuple[str, str]:
         """Extract provider and feed information from event or defaults."""
@@ -42,7 +55,7 @@ class ValidationRunnerService:
             provider, feed = self._extract_provider_feed_info(event)
 
             # Record validation start metrics
-            from marketpipe.metrics import record_metric
+            from marketpipe.metrics import record_metric, record_symbol_metric
 
             record_metric("validation_jobs_started", 1, provider=provider, feed=feed)
 
@@ -55,53 +68,17 @@ class ValidationRunnerService:
 
             for symbol_name, df in symbol_dataframes.items():
                 try:
-                    # Convert DataFrame to domain objects
-                    bars = self._convert_dataframe_to_bars(df, symbol_name)
-                    total_bars_validated += len(bars)
-
-                    # Validate using domain service
-                    result = self._validator.validate_bars(symbol_name, bars)
-
-                    # Record validation metrics
-                    error_count = len(result.errors)
-                    total_errors += error_count
-
-                    record_metric(
-                        "validation_bars_processed", len(bars), provider=provider, feed=feed
+                    bars_validated, error_count = self._validate_symbol_frame(
+                        event.job_id, symbol_name, df, provider, feed
                     )
-                    record_metric(
-                        f"validation_bars_{symbol_name}", len(bars), provider=provider, feed=feed
-                    )
-
-                    if error_count > 0:
-                        record_metric(
-                            "validation_errors_found", error_count, provider=provider, feed=feed
-                        )
-                        record_metric(
-                            f"validation_errors_{symbol_name}",
-                            error_count,
-                            provider=provider,
-                            feed=feed,
-                        )
-                        print(f"WARN Validation found {error_count} errors for {symbol_name}")
-                    else:
-                        record_metric("validation_success", 1, provider=provider, feed=feed)
-                        record_metric(
-                            f"validation_success_{symbol_name}", 1, provider=provider, feed=feed
-                        )
-
-                    # Save validation report with job_id
-                    report_path = self._reporter.save(event.job_id, result)
-                    print(f"INFO Validation report written: {report_path}")
-
+                    total_bars_validated += bars_validated
+                    total_errors += error_count
                     symbols_processed += 1
 
                 except Exception as symbol_error:
                     # Record symbol-specific validation failure
                     record_metric("validation_symbol_failures", 1, provider=provider, feed=feed)
-                    record_metric(
-                        f"validation_failure_{symbol_name}", 1, provider=provider, feed=feed
-                    )
+                    record_symbol_metric("validation_symbol_failures", symbol_name)
                     print(f"ERROR Failed to validate symbol {symbol_name}: {symbol_error}")
 
             # Record overall job validation metrics
@@ -128,10 +105,63 @@ class ValidationRunnerService:
             print(f"ERROR Validation failed for job {event.job_id}: {e}")
             raise
 
+    def validate_symbol(self, job_id: str, symbol_name: str, table) -> int:
+        """Validate one symbol's freshly stored bars without reloading them.
+
+        Args:
+            job_id: Ingestion job identifier the report is saved under
+            symbol_name: Symbol the bars belong to
+            table: Arrow table of the symbol's bars
+
+        Returns:
+            Number of validation errors found
+        """
+        _, error_count = self._validate_symbol_frame(
+            job_id, symbol_name, table.to_pandas(), "unknown", "unknown"
+        )
+        return error_count
+
+    def _validate_symbol_frame(
+        self, job_id: str, symbol_name: str, df, provider: str, feed: str
+    ) -> tuple[int, int]:
+        """Validate one symbol's bars, record metrics and save its report.
+
+        Returns:
+            Tuple of (bars validated, validation errors)
+        """
+        from marketpipe.metrics import record_metric, record_symbol_metric
+
+        # Convert DataFrame to domain objects
+        bars = self._convert_dataframe_to_bars(df, symbol_name)
+
+        # Validate using domain service
+        result = self._validator.validate_bars(symbol_name, bars)
+
+        # Record validation metrics
+        error_count = len(result.errors)
+
+        record_metric("validation_bars_processed", len(bars), provider=provider, feed=feed)
+        record_symbol_metric("validation_bars", symbol_name, len(bars))
+
+        if error_count > 0:
+            record_metric("validation_errors_found", error_count, provider=provider, feed=feed)
+            record_symbol_metric("validation_errors", symbol_name, error_count)
+            print(f"WARN Validation found {error_count} errors for {symbol_name}")
+        else:
+            record_metric("validation_success", 1, provider=provider, feed=feed)
+            record_symbol_metric("validation_success", symbol_name)
+
+        # Save validation report with job_id
+        report_path = self._reporter.save(job_id, result)
+        print(f"INFO Validation report written: {report_path}")
+
+        return len(bars), error_count
+
     def _convert_dataframe_to_bars(self, df, symbol_name: str) -> list:
         """Convert DataFrame to OHLCVBar domain objects."""
         bars = []
         symbol = Symbol.from_string(symbol_name)
+        price = self._price_type
 
         for _, row in df.iterrows():
             try:
@@ -139,10 +169,10 @@ class ValidationRunnerService:
                     id=EntityId.generate(),
                     symbol=symbol,
                     timestamp=Timestamp.from_nanoseconds(int(row["ts_ns"])),
-                    open_price=Price.from_float(float(row["open"])),
-                    high_price=Price.from_float(float(row["high"])),
-                    low_price=Price.from_float(float(row["low"])),
-                    close_price=Price.from_float(float(row["close"])),
+                    open_price=price.from_float(float(row["open"])),
+                    high_price=price.from_float(float(row["high"])),
+                    low_price=price.from_float(float(row["low"])),
+                    close_price=price.from_float(float(row["close"])),
                     volume=Volume(int(row["volume"])),
                 )
                 bars.append(bar)
@@ -158,12 +188,46 @@ class ValidationRunnerService:
         """Build service with default dependencies."""
         return cls(
             storage_engine=ParquetStorageEngine("data/raw"),
-            validator=ValidationDomainService(),
+            validator=ValidationDomainService(configured_calendar()),
             reporter=CsvReportRepository(),
         )
 
     @classmethod
-    def register(cls):
-        """Register service to listen for ingestion completion events."""
-        svc = cls.build_default()
-        get_event_bus().subscribe(IngestionJobCompleted, svc.handle_ingestion_completed)
+    def register(cls, settings: Optional[StageSettings] = None) -> StageExecutor:
+        """Register service to listen for ingestion completion events.
+
+        Validation runs on the "validation" stage pool, so publishers of
+        ``IngestionJobCompleted`` do not wait for it.
+
+        Args:
+            settings: Stage settings (default: ``$MARKETPIPE_VALIDATION_STAGE_*``)
+
+        Returns:
+            The stage executor subscribed to the event bus and registered
+            for ingestion coordinators' publishers
+        """
+        settings = settings or StageSettings.from_env("validation")
+        if settings.mode == "process":
+            handler = handle_ingestion_completed_in_worker
+        else:
+            handler = cls.build_default().handle_ingestion_completed
+        stage = StageExecutor("validation", handler, settings)
+        get_event_bus().subscribe(IngestionJobCompleted, stage)
+        # Ingestion coordinators publish on their own async publisher
+        register_stage(stage, "ingestion_job_completed", as_job_completed)
+        logging.getLogger(cls.__name__).info(
+            f"Validation service registered for IngestionJobCompleted events "
+            f"({settings.mode}, {settings.workers} workers)"
+        )
+        return stage
+
+
+_worker_service: Optional[ValidationRunnerService] = None
+
+
+def handle_ingestion_completed_in_worker(event: IngestionJobCompleted) -> None:
+    """Process-pool entry point using one default service per worker process."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = ValidationRunnerService.build_default()
+    _worker_service.handle_ingestion_completed(event)
@@ -3,7 +3,13 @@
 
 from __future__ import annotations
 
+from typing import Any, Optional
+
+import numpy as np
+
+from marketpipe.domain.calendar import EPOCH, NS_PER_DAY, TradingCalendar, default_calendar
 from marketpipe.domain.entities import OHLCVBar
+from marketpipe.domain.value_objects import PRICE_SCALE, Timestamp
 
 from .value_objects import BarError, ValidationResult
 
@@ -11,6 +17,9 @@ from .value_objects import BarError, ValidationResult
 class ValidationDomainService:
     """Domain service for validating OHLCV bars."""
 
+    def __init__(self, calendar: Optional[TradingCalendar] = None):
+        self._calendar = calendar or default_calendar()
+
     def validate_bars(self, symbol: str, bars: list[OHLCVBar]) -> ValidationResult:
         """Validate a collection of OHLCV bars for a symbol."""
         errors = []
@@ -22,12 +31,12 @@ class ValidationDomainService:
             if bar.timestamp_ns <= prev_ts:
                 errors.append(BarError(bar.timestamp_ns, f"non-monotonic timestamp at index {i}"))
 
-            # Check for positive prices
+            # Check for positive prices (integer units work for every price backend)
             if (
-                bar.open_price.value <= 0
-                or bar.high_price.value <= 0
-                or bar.low_price.value <= 0
-                or bar.close_price.value <= 0
+                bar.open_price.units <= 0
+                or bar.high_price.units <= 0
+                or bar.low_price.units <= 0
+                or bar.close_price.units <= 0
             ):
                 errors.append(BarError(bar.timestamp_ns, f"non-positive price at index {i}"))
 
@@ -49,7 +58,7 @@ class ValidationDomainService:
                 )
 
             # Check for zero volume with non-zero price movement (individual bar check)
-            if bar.volume.value == 0 and bar.open_price.value != bar.close_price.value:
+            if bar.volume.value == 0 and bar.open_price.units != bar.close_price.units:
                 errors.append(
                     BarError(
                         bar.timestamp_ns,
@@ -73,12 +82,14 @@ class ValidationDomainService:
 
     def _validate_ohlc_consistency(self, bar: OHLCVBar) -> bool:
         """Validate OHLC price relationships."""
+        high = bar.high_price.units
+        low = bar.low_price.units
         return (
-            bar.high_price.value >= bar.open_price.value
-            and bar.high_price.value >= bar.close_price.value
-            and bar.high_price.value >= bar.low_price.value
-            and bar.low_price.value <= bar.open_price.value
-            and bar.low_price.value <= bar.close_price.value
+            high >= bar.open_price.units
+            and high >= bar.close_price.units
+            and high >= low
+            and low <= bar.open_price.units
+            and low <= bar.close_price.units
         )
 
     def _validate_timestamp_alignment(self, bar: OHLCVBar) -> bool:
@@ -93,11 +104,11 @@ class ValidationDomainService:
         errors = []
 
         # Check for extreme price movements (>50% in one minute)
-        prev_close = previous_bar.close_price.value
-        curr_open = current_bar.open_price.value
+        prev_close = previous_bar.close_price.units
+        curr_open = current_bar.open_price.units
 
         if prev_close > 0:
-            price_change_pct = abs(float(curr_open - prev_close)) / float(prev_close)
+            price_change_pct = abs(curr_open - prev_close) / prev_close
             if price_change_pct > 0.5:  # 50% change
                 errors.append(
                     BarError(
@@ -137,33 +148,55 @@ class ValidationDomainService:
 
         return errors
 
+    def validate_trading_hours_batch(self, timestamps_ns: Any) -> list[BarError]:
+        """Vectorized ``validate_trading_hours`` over an array of bar timestamps.
+
+        Checks every timestamp against the exchange calendar in one pass;
+        timestamps outside the calendar span are reported as out of hours.
+        """
+        ts = np.asarray(timestamps_ns, dtype=np.int64)
+        calendar = self._calendar
+        first, last = calendar.span
+        days = ts // NS_PER_DAY
+        in_span = (days >= (first - EPOCH).days) & (days <= (last - EPOCH).days)
+        in_hours = np.zeros(len(ts), dtype=bool)
+        in_hours[in_span] = calendar.session_mask(ts[in_span])
+        return [
+            BarError(
+                int(ts[i]),
+                f"timestamp {Timestamp.from_nanoseconds(int(ts[i]))} "
+                "is outside regular trading hours",
+            )
+            for i in np.flatnonzero(~in_hours)
+        ]
+
     def validate_price_reasonableness(self, bar: OHLCVBar, symbol: str) -> list[BarError]:
         """Validate that prices are reasonable for the given symbol."""
         errors = []
 
         # Basic sanity checks for price ranges
         prices = [
-            bar.open_price.value,
-            bar.high_price.value,
-            bar.low_price.value,
-            bar.close_price.value,
+            bar.open_price.units / PRICE_SCALE,
+            bar.high_price.units / PRICE_SCALE,
+            bar.low_price.units / PRICE_SCALE,
+            bar.close_price.units / PRICE_SCALE,
         ]
 
         # Check for extremely high prices (>$100,000)
-        if any(float(p) > 100_000 for p in prices):
+        if any(p > 100_000 for p in prices):
             errors.append(
                 BarError(
                     bar.timestamp_ns,
-                    f"unreasonably high price for {symbol}: max={max(float(p) for p in prices)}",
+                    f"unreasonably high price for {symbol}: max={max(prices)}",
                 )
             )
 
         # Check for extremely low prices (<$0.01 for most stocks)
-        if any(float(p) < 0.01 for p in prices):
+        if any(p < 0.01 for p in prices):
             errors.append(
                 BarError(
                     bar.timestamp_ns,
-                    f"unreasonably low price for {symbol}: min={min(float(p) for p in prices)}",
+                    f"unreasonably low price for {symbol}: min={min(prices)}",
                 )
             )
 
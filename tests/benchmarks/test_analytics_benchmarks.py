@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Analytics benchmarks: vectorized kernels vs. object-based calculations.
+
+Times ``OHLCVCalculationService`` on a quarter of 1-minute bars, once with
+``OHLCVBar`` objects and once with the equivalent Arrow table, and a full
+year for a batch of symbols through the columnar path only.
+
+Run with: pytest --benchmark tests/benchmarks/test_analytics_benchmarks.py -s
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from marketpipe.domain.analytics import OHLCVColumns
+from marketpipe.domain.services import OHLCVCalculationService
+from tests.base import BenchmarkTestCase
+
+BARS_PER_DAY = 390
+NS_PER_MINUTE = 60 * 1_000_000_000
+NS_PER_DAY = 1440 * NS_PER_MINUTE
+FIRST_OPEN_NS = 1_704_205_800 * 1_000_000_000  # 2024-01-02 14:30 UTC
+
+
+def trading_days_of_bars(days: int, symbols: tuple[str, ...] = ("AAPL",)) -> OHLCVColumns:
+    """Random-walk 1m bars for consecutive days of regular sessions."""
+    rng = np.random.default_rng(11)
+    minutes = np.arange(BARS_PER_DAY, dtype=np.int64) * NS_PER_MINUTE
+    ts = (FIRST_OPEN_NS + np.arange(days, dtype=np.int64)[:, None] * NS_PER_DAY + minutes).ravel()
+    count = len(ts)
+    parts = []
+    for symbol in symbols:
+        close = np.round(150 + np.cumsum(rng.normal(0, 0.05, count)), 2)
+        parts.append(
+            OHLCVColumns.from_arrays(
+                symbol=symbol,
+                ts_ns=ts,
+                open=close - 0.01,
+                high=close + 0.05,
+                low=close - 0.06,
+                close=close,
+                volume=rng.integers(100, 50_000, count),
+            )
+        )
+    return OHLCVColumns(
+        **{
+            name: np.concatenate([getattr(p, name) for p in parts])
+            for name in OHLCVColumns.__dataclass_fields__
+        }
+    )
+
+
+def run_all(service: OHLCVCalculationService, bars) -> None:
+    service.vwap(bars)
+    service.resample(bars, 300)
+    service.calculate_sma(bars, 20)
+    service.calculate_volatility(bars, 20)
+
+
+def run_all_columns(service: OHLCVCalculationService, table) -> None:
+    service.vwap(table)
+    service.resample_columns(table, 300)
+    service.calculate_sma_columns(table, 20)
+    service.calculate_volatility_columns(table, 20)
+
+
+@pytest.mark.benchmark
+class TestAnalyticsBenchmarks(BenchmarkTestCase):
+    """Object-based vs. vectorized OHLCV calculations."""
+
+    def test_object_vs_vectorized_quarter(self):
+        """Benchmark VWAP, 5m resampling, SMA and volatility on 63 days of bars."""
+        columns = trading_days_of_bars(63)
+        bars = columns.to_bars()
+        table = pa.table(columns.to_dict())
+        service = OHLCVCalculationService()
+
+        with self.measure_time() as object_timer:
+            run_all(service, bars)
+            days = {}
+            for bar in bars:
+                days.setdefault(bar.timestamp.trading_date(), []).append(bar)
+            for day_bars in days.values():
+                service.daily_summary(day_bars)
+
+        with self.measure_time() as vector_timer:
+            run_all_columns(service, table)
+            service.daily_summaries(table)
+
+        speedup = object_timer.elapsed / vector_timer.elapsed
+        assert speedup > 10
+
+        self.record_performance_result(
+            "analytics_quarter",
+            bars=len(bars),
+            object_seconds=object_timer.elapsed,
+            vectorized_seconds=vector_timer.elapsed,
+            speedup=speedup,
+        )
+        print(
+            f"\n{len(bars)} bars: objects {object_timer.elapsed * 1000:8.1f} ms, "
+            f"vectorized {vector_timer.elapsed * 1000:6.1f} ms ({speedup:.0f}x)"
+        )
+
+    def test_vectorized_year_of_symbols(self):
+        """Benchmark a year of 1m bars for 20 symbols in one call per calculation."""
+        symbols = tuple(f"SYM{i}" for i in range(20))
+        table = pa.table(trading_days_of_bars(252, symbols).to_dict())
+        service = OHLCVCalculationService()
+
+        with self.measure_time() as timer:
+            run_all_columns(service, table)
+            service.vwap_by_symbol(table)
+            service.daily_summaries(table)
+
+        self.assert_time_under(timer.elapsed, 15.0)
+        self.record_performance_result(
+            "analytics_year_batch",
+            bars=table.num_rows,
+            seconds=timer.elapsed,
+            bars_per_second=table.num_rows / timer.elapsed,
+        )
+        print(
+            f"\n{table.num_rows} bars, {len(symbols)} symbols: {timer.elapsed * 1000:.1f} ms "
+            f"({table.num_rows / timer.elapsed / 1e6:.1f}M bars/s)"
+        )
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+"""End-to-end ingestion benchmarks over the preset scenarios.
+
+Each scenario ingests, validates and aggregates through the real
+coordinator (see ``marketpipe.bench``); the ``http`` scenario fetches from
+the local Polygon-style stub server. Set ``MARKETPIPE_BENCH_BASELINE`` to a
+baseline file written by ``marketpipe bench run --save-baseline`` to fail
+on regressions against it.
+
+Run with: pytest --benchmark tests/benchmarks/test_ingestion_throughput_benchmarks.py -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from marketpipe.bench import SCENARIOS, compare_results, load_baseline, run_scenario
+from marketpipe.domain.calendar import NS_PER_DAY
+from marketpipe.ingestion.infrastructure.synthetic import FaultRates, SyntheticBarGenerator
+from tests.base import BenchmarkTestCase
+
+
+@pytest.mark.benchmark
+class TestIngestionThroughputBenchmarks(BenchmarkTestCase):
+    """Throughput, stage times and peak RSS of end-to-end ingestion."""
+
+    @pytest.mark.parametrize("name", list(SCENARIOS))
+    def test_scenario_throughput(self, name):
+        """Benchmark one preset scenario and check it against the baseline, if any."""
+        result = run_scenario(SCENARIOS[name], workdir=self.get_temp_dir())
+
+        self.assert_throughput_over(result.bars, result.seconds, 1_000)
+        self.record_performance_result(f"ingest_{name}", **result.to_dict())
+        stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in result.stages.items())
+        print(
+            f"\n{name}: {result.bars} bars in {result.seconds:.2f}s "
+            f"({result.bars_per_second:,.0f} bars/s), peak RSS {result.peak_rss_mb:.0f} MB\n"
+            f"  {stages}"
+        )
+
+        baseline_path = os.environ.get("MARKETPIPE_BENCH_BASELINE")
+        if baseline_path:
+            (comparison,) = compare_results({name: result}, load_baseline(baseline_path))
+            assert not comparison.regressions, comparison.regressions
+
+    def test_synthetic_generator_throughput(self):
+        """The generator must stay well ahead of ingestion it is used to load-test."""
+        generator = SyntheticBarGenerator(
+            sessions="regular", faults=FaultRates(gaps=0.01, duplicates=0.001)
+        )
+        symbols = [f"SYM{i:03d}" for i in range(100)]
+        start = 19_723 * NS_PER_DAY  # 2024-01-01
+
+        t0 = time.perf_counter()
+        bars = sum(len(c) for c in generator.iter_batches(symbols, start, start + 90 * NS_PER_DAY))
+        elapsed = time.perf_counter() - t0
+
+        self.assert_throughput_over(bars, elapsed, 500_000)
+        self.record_performance_result("synthetic_generator", bars=bars, seconds=elapsed)
+        print(f"\nsynthetic: {bars:,} bars in {elapsed:.2f}s ({bars / elapsed:,.0f} bars/s)")
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Storage profile benchmarks for MarketPipe.
+
+Compares on-disk size, write time and read time of one month of 1-minute
+bars written with each Parquet storage profile.
+
+Run with: pytest --benchmark tests/benchmarks/test_storage_benchmarks.py -s
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from marketpipe.infrastructure.storage.parquet_engine import STORAGE_PROFILES, ParquetStorageEngine
+from tests.base import BenchmarkTestCase
+
+BARS_PER_DAY = 390
+TRADING_DAYS = 21
+
+
+def month_of_bars(seed: int = 7) -> dict[date, pd.DataFrame]:
+    """Generate a random-walk month of 1m bars, one frame per trading day."""
+    rng = np.random.default_rng(seed)
+    frames = {}
+    day = date(2024, 1, 2)
+    price = 150.0
+    while len(frames) < TRADING_DAYS:
+        if day.weekday() < 5:
+            open_ns = pd.Timestamp(day, tz="UTC").value + (14 * 60 + 30) * 60 * 1_000_000_000
+            ts = open_ns + np.arange(BARS_PER_DAY, dtype=np.int64) * 60 * 1_000_000_000
+            close = price + np.cumsum(rng.normal(0, 0.05, BARS_PER_DAY)).round(2)
+            price = float(close[-1])
+            frames[day] = pd.DataFrame(
+                {
+                    "ts_ns": ts,
+                    "open": close - 0.01,
+                    "high": close + rng.uniform(0, 0.1, BARS_PER_DAY).round(2),
+                    "low": close - rng.uniform(0, 0.1, BARS_PER_DAY).round(2),
+                    "close": close,
+                    "volume": rng.integers(100, 50_000, BARS_PER_DAY),
+                    "symbol": "AAPL",
+                }
+            )
+        day += timedelta(days=1)
+    return frames
+
+
+@pytest.mark.benchmark
+class TestStorageProfileBenchmarks(BenchmarkTestCase):
+    """Size and scan-speed comparison of Parquet storage profiles."""
+
+    @pytest.mark.parametrize("profile", sorted(STORAGE_PROFILES))
+    def test_profile_size_and_read_time(self, tmp_path, profile):
+        """Benchmark writing and reading one month of bars with a profile."""
+        frames = month_of_bars()
+        engine = ParquetStorageEngine(tmp_path / profile, profile=profile)
+
+        with self.measure_time() as write_timer:
+            for day, df in frames.items():
+                engine.write(df, frame="1m", symbol="AAPL", trading_day=day, job_id=f"AAPL_{day}")
+
+        files = list((tmp_path / profile).rglob("*.parquet"))
+        total_bytes = sum(f.stat().st_size for f in files)
+
+        with self.measure_time() as read_timer:
+            for _ in range(5):
+                df = engine.load_symbol_data("AAPL", "1m")
+
+        with self.measure_time() as column_timer:
+            for _ in range(5):
+                for f in files:
+                    pq.read_table(f, columns=["close"])
+
+        assert len(df) == BARS_PER_DAY * TRADING_DAYS
+        self.assert_time_under(write_timer.elapsed, 10.0)
+
+        self.record_performance_result(
+            f"storage_profile_{profile}",
+            bytes_on_disk=total_bytes,
+            bytes_per_bar=total_bytes / len(df),
+            write_seconds=write_timer.elapsed,
+            read_seconds=read_timer.elapsed / 5,
+            close_column_read_seconds=column_timer.elapsed / 5,
+        )
+        print(
+            f"\n{profile:>9}: {total_bytes / 1024:8.1f} KiB "
+            f"({total_bytes / len(df):5.2f} B/bar), "
+            f"write {write_timer.elapsed * 1000:7.1f} ms, "
+            f"read {read_timer.elapsed / 5 * 1000:7.1f} ms, "
+            f"close-only {column_timer.elapsed / 5 * 1000:6.1f} ms"
+        )
+
+
+@pytest.mark.benchmark
+class TestReadPathBenchmarks(BenchmarkTestCase):
+    """Sequential vs. parallel memory-mapped reads of many partitions."""
+
+    @pytest.mark.parametrize("read_workers", [1, 8])
+    def test_symbol_read_throughput(self, tmp_path, read_workers):
+        """Benchmark loading a month of day partitions with N read threads."""
+        frames = month_of_bars()
+        writer = ParquetStorageEngine(tmp_path)
+        for day, df in frames.items():
+            writer.write(df, frame="1m", symbol="AAPL", trading_day=day, job_id=f"AAPL_{day}")
+
+        engine = ParquetStorageEngine(tmp_path, read_workers=read_workers)
+        with self.measure_time() as table_timer:
+            for _ in range(5):
+                table = engine.load_symbol_table("AAPL", "1m")
+
+        with self.measure_time() as pandas_timer:
+            for _ in range(5):
+                engine.load_symbol_data("AAPL", "1m")
+
+        assert table.num_rows == BARS_PER_DAY * TRADING_DAYS
+
+        self.record_performance_result(
+            f"symbol_read_workers_{read_workers}",
+            arrow_seconds=table_timer.elapsed / 5,
+            pandas_seconds=pandas_timer.elapsed / 5,
+            rows_per_second=table.num_rows / (table_timer.elapsed / 5),
+        )
+        print(
+            f"\nworkers={read_workers}: arrow {table_timer.elapsed / 5 * 1000:6.1f} ms, "
+            f"pandas {pandas_timer.elapsed / 5 * 1000:6.1f} ms"
+        )
+
+
+@pytest.mark.benchmark
+class TestLayoutBenchmarks(BenchmarkTestCase):
+    """Cross-sectional reads of a daily universe in each partition layout."""
+
+    @pytest.mark.parametrize("layout", ["symbol", "clustered"])
+    def test_cross_section_read(self, tmp_path, layout):
+        """Benchmark reading every symbol's bar of one day."""
+        rng = np.random.default_rng(11)
+        symbols = [f"S{i:04d}" for i in range(500)]
+        days = [date(2024, 1, 2) + timedelta(days=i) for i in range(5)]
+        clustered_frames = ["1d"] if layout == "clustered" else []
+        engine = ParquetStorageEngine(tmp_path, clustered_frames=clustered_frames)
+
+        for day in days:
+            ts = pd.Timestamp(day, tz="UTC").value
+            for symbol in symbols:
+                close = float(rng.uniform(10, 500))
+                df = pd.DataFrame(
+                    {
+                        "ts_ns": [ts],
+                        "open": [close],
+                        "high": [close + 1],
+                        "low": [close - 1],
+                        "close": [close],
+                        "volume": [int(rng.integers(1_000, 1_000_000))],
+                        "symbol": [symbol],
+                    }
+                )
+                engine.write(df, frame="1d", symbol=symbol, trading_day=day, job_id=f"{day}")
+        if layout == "clustered":
+            from marketpipe.infrastructure.storage.compaction import ParquetCompactor
+
+            ParquetCompactor(tmp_path).run(today=date(2024, 2, 1))
+
+        files = len(list(tmp_path.rglob("*.parquet")))
+        with self.measure_time() as timer:
+            for day in days:
+                table = engine.load_cross_section("1d", day, columns=["close"])
+
+        assert table.num_rows == len(symbols)
+
+        self.record_performance_result(
+            f"cross_section_{layout}",
+            files=files,
+            seconds_per_day=timer.elapsed / len(days),
+        )
+        print(
+            f"\n{layout:>9}: {files:5d} files, "
+            f"{timer.elapsed / len(days) * 1000:7.1f} ms per cross-section"
+        )
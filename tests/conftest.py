@@ -305,6 +305,12 @@ def benchmark_data(domain_objects):
     }
 
 
+@pytest.fixture(autouse=True)
+def _no_response_cache(monkeypatch):
+    """Keep provider adapters from replaying responses cached by other tests."""
+    monkeypatch.setenv("MARKETPIPE_HTTP_CACHE_DIR", "off")
+
+
 # Performance testing marker
 def pytest_configure(config):
     """Configure pytest with custom markers."""
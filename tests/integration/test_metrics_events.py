@@ -15,7 +15,7 @@ from marketpipe.aggregation.domain.events import AggregationCompleted, Aggregati
 from marketpipe.bootstrap import get_event_bus
 from marketpipe.domain.events import IngestionJobCompleted, ValidationFailed
 from marketpipe.domain.value_objects import Symbol, Timestamp
-from marketpipe.metrics import SqliteMetricsRepository
+from marketpipe.metrics import SYMBOL_METRICS, SqliteMetricsRepository
 from marketpipe.validation.domain.events import ValidationCompleted
 from marketpipe.validation.domain.value_objects import ValidationResult
 
@@ -84,10 +84,10 @@ async def test_ingestion_completed_event_records_metrics(temp_metrics_db, clear_
     assert len(ingest_points) >= 1
     assert ingest_points[0].value == 1.0
 
-    # Check symbol-specific ingestion metrics
-    symbol_points = await repo.get_metrics_history(f"ingest_bars_{symbol}")
-    assert len(symbol_points) >= 1
-    assert symbol_points[0].value == 1500.0
+    # Per-symbol bars go to the bounded summary, not to a metric name per symbol
+    top = {e.symbol: e.value for e in SYMBOL_METRICS.summary("ingest_bars").top()}
+    assert top["AAPL"] >= 1500.0
+    assert await repo.get_metrics_history(f"ingest_bars_{symbol}") == []
 
 
 @pytest.mark.asyncio
@@ -122,9 +122,10 @@ async def test_validation_failed_event_records_metrics(temp_metrics_db, clear_ev
     validation_error_points = await repo.get_metrics_history("validation_errors")
     assert len(validation_error_points) >= 1
 
-    # Check symbol-specific error metrics
-    symbol_error_points = await repo.get_metrics_history(f"validation_errors_{symbol}")
-    assert len(symbol_error_points) >= 1
+    # Per-symbol errors go to the bounded summary, not to a metric name per symbol
+    top = {e.symbol: e.value for e in SYMBOL_METRICS.summary("validation_errors").top()}
+    assert top["GOOGL"] >= 1
+    assert await repo.get_metrics_history(f"validation_errors_{symbol}") == []
 
 
 @pytest.mark.asyncio
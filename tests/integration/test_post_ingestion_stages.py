@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Integration tests for post-ingestion stages fed by the coordinator's publisher."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import weakref
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from marketpipe.domain.events import IngestionJobCompleted
+from marketpipe.domain.value_objects import Symbol, TimeRange, Timestamp
+from marketpipe.infrastructure.events import InMemoryEventPublisher
+from marketpipe.infrastructure.messaging import stage_executor
+from marketpipe.infrastructure.messaging.stage_executor import (
+    StageExecutor,
+    StageSettings,
+    register_stage,
+    subscribe_registered_stages,
+)
+from marketpipe.ingestion.application.commands import CreateIngestionJobCommand
+from marketpipe.ingestion.application.services import (
+    IngestionCoordinatorService,
+    IngestionJobService,
+)
+from marketpipe.ingestion.domain.events import as_job_completed
+from marketpipe.ingestion.domain.services import IngestionDomainService, IngestionProgressTracker
+from marketpipe.ingestion.domain.value_objects import BatchConfiguration, IngestionConfiguration
+from marketpipe.ingestion.infrastructure.parquet_storage import ParquetDataStorage
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from fakes.adapters import FakeMarketDataAdapter, create_test_ohlcv_bars
+from fakes.repositories import (
+    FakeIngestionCheckpointRepository,
+    FakeIngestionJobRepository,
+    FakeIngestionMetricsRepository,
+)
+from fakes.validators import FakeDataValidator
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    """Keep stages registered by other tests away from this one."""
+    monkeypatch.setattr(stage_executor, "_registered", weakref.WeakKeyDictionary())
+
+
+def build_coordinator(tmp_path: Path, publisher: InMemoryEventPublisher, adapter):
+    job_repository = FakeIngestionJobRepository()
+    checkpoint_repository = FakeIngestionCheckpointRepository()
+    metrics_repository = FakeIngestionMetricsRepository()
+    job_service = IngestionJobService(
+        job_repository=job_repository,
+        checkpoint_repository=checkpoint_repository,
+        metrics_repository=metrics_repository,
+        domain_service=IngestionDomainService(),
+        progress_tracker=IngestionProgressTracker(),
+        event_publisher=publisher,
+    )
+    coordinator = IngestionCoordinatorService(
+        job_service=job_service,
+        job_repository=job_repository,
+        checkpoint_repository=checkpoint_repository,
+        metrics_repository=metrics_repository,
+        market_data_provider=adapter,
+        data_validator=FakeDataValidator(),
+        data_storage=ParquetDataStorage(root=tmp_path / "storage"),
+        event_publisher=publisher,
+    )
+    return job_service, coordinator
+
+
+@pytest.mark.asyncio
+async def test_completed_job_reaches_stage_without_publisher_awaiting_it(
+    tmp_path, isolated_registry
+):
+    release = threading.Event()
+    handled = []
+
+    def slow_handler(event):
+        release.wait(5)
+        handled.append(event)
+
+    stage = StageExecutor("post-ingestion", slow_handler, StageSettings(mode="thread"))
+    register_stage(stage, "ingestion_job_completed", as_job_completed)
+    publisher = InMemoryEventPublisher()
+    assert subscribe_registered_stages(publisher) == 1
+
+    symbol = Symbol("AAPL")
+    start = (datetime.now(timezone.utc) - timedelta(days=10)).replace(
+        hour=13, minute=30, second=0, microsecond=0
+    )
+    time_range = TimeRange(start=Timestamp(start), end=Timestamp(start + timedelta(hours=1)))
+    adapter = FakeMarketDataAdapter("test_provider")
+    adapter.set_bars_data(symbol, create_test_ohlcv_bars(symbol, count=10, start_time=start))
+    job_service, coordinator = build_coordinator(tmp_path, publisher, adapter)
+
+    try:
+        job_id = await job_service.create_job(
+            CreateIngestionJobCommand(
+                symbols=[symbol],
+                time_range=time_range,
+                configuration=IngestionConfiguration(
+                    output_path=tmp_path / "data",
+                    compression="zstd",
+                    max_workers=1,
+                    batch_size=1000,
+                    rate_limit_per_minute=200,
+                    feed_type="iex",
+                ),
+                batch_config=BatchConfiguration.default(),
+            )
+        )
+        result = await coordinator.execute_job(job_id)
+
+        # The job finished while the stage handler is still blocked
+        assert result["status"] == "completed"
+        assert handled == []
+        assert stage.pending == 1
+
+        release.set()
+        assert stage.drain(timeout=5)
+        (event,) = handled
+        assert isinstance(event, IngestionJobCompleted)
+        assert event.job_id == str(job_id)
+    finally:
+        release.set()
+        stage.shutdown()
@@ -266,9 +266,9 @@ class TestRealAggregationEndToEnd:
                     # 1-hour bars should align to hour boundaries
                     assert first_datetime.minute == 0, f"1h timestamp not aligned: {first_datetime}"
                 elif spec.name == "1d":
-                    # 1-day bars should align to day boundaries (market open)
+                    # 1-day bars are stamped with the day's session open (14:30 UTC in EST)
                     assert (
-                        first_datetime.hour == 13 and first_datetime.minute == 30
+                        first_datetime.hour == 14 and first_datetime.minute == 30
                     ), f"1d timestamp not aligned: {first_datetime}"
 
                 print(f"✓ {spec.name} timestamps properly aligned")
@@ -205,6 +205,37 @@ async def test_async_server_handles_concurrent_requests():
         await server.stop()
 
 
+@pytest.mark.asyncio
+async def test_async_server_caches_exposition():
+    """Test that scrapes within the TTL share one generated payload."""
+    port = find_free_port()
+    server = AsyncMetricsServer(port=port, cache_ttl=60)
+
+    with patch("marketpipe.metrics_server.generate_latest", return_value=b"payload 1\n") as gen:
+        async with server.run_context():
+            async with httpx.AsyncClient() as client:
+                responses = await asyncio.gather(
+                    *(client.get(f"http://localhost:{port}/metrics") for _ in range(10))
+                )
+                assert all(r.content == b"payload 1\n" for r in responses)
+                assert gen.call_count == 1
+
+                # Expired payloads are regenerated
+                server._payload_expires = 0.0
+                gen.return_value = b"payload 2\n"
+                response = await client.get(f"http://localhost:{port}/metrics")
+                assert response.content == b"payload 2\n"
+                assert gen.call_count == 2
+
+    uncached = AsyncMetricsServer(port=find_free_port(), cache_ttl=0)
+    with patch("marketpipe.metrics_server.generate_latest", return_value=b"x\n") as gen:
+        async with uncached.run_context():
+            async with httpx.AsyncClient() as client:
+                for _ in range(3):
+                    await client.get(f"http://localhost:{uncached.port}/metrics")
+        assert gen.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_async_server_context_manager():
     """Test async server as context manager."""
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the opt-in /debug/ endpoints of the async metrics server."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+import tracemalloc
+
+import httpx
+import pytest
+
+from marketpipe.infrastructure.messaging.stage_executor import StageExecutor, StageSettings
+from marketpipe.infrastructure.storage.writer import ParquetBatchWriter
+from marketpipe.ingestion.infrastructure.rate_limit import RateLimiter
+from marketpipe.metrics_server import AsyncMetricsServer
+
+
+def find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("", 0))
+        return s.getsockname()[1]
+
+
+async def get(server: AsyncMetricsServer, path: str) -> httpx.Response:
+    async with httpx.AsyncClient(timeout=10) as client:
+        return await client.get(f"http://localhost:{server.port}{path}")
+
+
+@pytest.mark.asyncio
+async def test_debug_endpoints_are_off_by_default(monkeypatch):
+    monkeypatch.delenv("METRICS_DEBUG_ENDPOINTS", raising=False)
+    async with AsyncMetricsServer(port=find_free_port()).run_context() as server:
+        assert (await get(server, "/debug/state")).status_code == 404
+
+    monkeypatch.setenv("METRICS_DEBUG_ENDPOINTS", "1")
+    async with AsyncMetricsServer(port=find_free_port()).run_context() as server:
+        assert (await get(server, "/debug/state")).status_code == 200
+        assert (await get(server, "/debug/nothing")).status_code == 404
+        assert (await get(server, "/metrics")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_state_reports_rate_limiters_and_queues():
+    limiter = RateLimiter(capacity=10, refill_rate=1.0)
+    limiter.set_provider_name("debug-test")
+    limiter.acquire()
+    stage = StageExecutor("debug_test", lambda event: None, StageSettings(workers=2))
+    writer = ParquetBatchWriter(engine=None, workers=3, max_pending=7)
+
+    async with AsyncMetricsServer(port=find_free_port(), debug=True).run_context() as server:
+        state = (await get(server, "/debug/state?ignored=1")).json()
+
+    assert state["asyncio_tasks"] >= 1 and state["threads"] >= 1
+    components = state["components"]
+    (bucket,) = [c for c in components if c.get("provider") == "debug-test"]
+    assert bucket["kind"] == "rate_limiter" and bucket["capacity"] == 10
+    assert bucket["retry_after_seconds"] == 0
+    (queue,) = [c for c in components if c.get("name") == "debug_test"]
+    assert queue == {
+        "kind": "stage",
+        "name": "debug_test",
+        "mode": "thread",
+        "workers": 2,
+        "pending": 0,
+        "max_pending": 64,
+    }
+    # Other tests' writers may still be alive; max_pending=7 is only this one
+    (writer_state,) = [
+        c for c in components if c["kind"] == "parquet_writer" and c["max_pending"] == 7
+    ]
+    assert {"workers": 3, "pending": 0}.items() <= writer_state.items()
+    del stage, writer
+
+
+@pytest.mark.asyncio
+async def test_task_dump_shows_stacks():
+    async def stuck_on_event(event: asyncio.Event) -> None:
+        await event.wait()
+
+    event = asyncio.Event()
+    task = asyncio.create_task(stuck_on_event(event), name="stuck-job")
+    async with AsyncMetricsServer(port=find_free_port(), debug=True).run_context() as server:
+        dump = (await get(server, "/debug/tasks")).text
+    event.set()
+    await task
+
+    assert "stuck-job" in dump and "in stuck_on_event" in dump
+    assert "threads ===" in dump and "Thread MainThread" in dump
+
+
+@pytest.mark.asyncio
+async def test_profile_samples_busy_threads():
+    done = threading.Event()
+
+    def spin_in_thread() -> None:
+        while not done.is_set():
+            sum(range(1000))
+
+    thread = threading.Thread(target=spin_in_thread, daemon=True)
+    thread.start()
+    try:
+        async with AsyncMetricsServer(port=find_free_port(), debug=True).run_context() as server:
+            started = time.perf_counter()
+            top = await get(server, "/debug/profile?seconds=0.3&interval=0.002&format=top")
+            elapsed = time.perf_counter() - started
+            folded = await get(server, "/debug/profile?seconds=0.1")
+            assert (await get(server, "/debug/profile?seconds=600")).status_code == 400
+            assert (await get(server, "/debug/profile?seconds=soon")).status_code == 400
+    finally:
+        done.set()
+        thread.join()
+
+    assert top.status_code == 200 and elapsed >= 0.3
+    assert "samples in" in top.text and ":spin_in_thread" in top.text
+    assert any(":spin_in_thread " in line for line in folded.text.splitlines())
+
+
+@pytest.mark.asyncio
+async def test_memory_snapshots_and_diffs():
+    assert not tracemalloc.is_tracing()
+    retained = []
+    try:
+        async with AsyncMetricsServer(port=find_free_port(), debug=True).run_context() as server:
+            started = await get(server, "/debug/memory")
+            assert "tracemalloc started" in started.text and tracemalloc.is_tracing()
+
+            await get(server, "/debug/memory")
+            retained.append([bytearray(1024) for _ in range(2000)])
+            diff = (await get(server, "/debug/memory?diff=1&limit=5")).text
+
+            stopped = await get(server, "/debug/memory?stop=1")
+            assert "stopped" in stopped.text and not tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    lines = diff.splitlines()
+    assert lines[0].startswith("traced:") and len(lines) <= 6
+    assert "test_debug_endpoints.py" in diff and "(+" in diff
@@ -88,3 +88,36 @@ def test_duckdb_sql_execution():
     assert second_bar["volume"] == 8500.0  # Sum of volumes from bars 5-9 (1500+1600+1700+1800+1900)
 
     con.close()
+
+
+def test_daily_bars_are_stamped_with_session_open():
+    """1d bars group UTC days and take the day's DST-aware open from the calendar."""
+    from marketpipe.domain.calendar import NS_PER_DAY, TradingCalendar
+
+    minute = 60_000_000_000
+    winter = 1705415400000000000  # 2024-01-16 14:30 UTC (09:30 EST)
+    summer = 1718631000000000000  # 2024-06-17 13:30 UTC (09:30 EDT)
+    ts = [winter + i * minute for i in range(3)] + [summer + i * minute for i in range(3)]
+    bars = pa.table(
+        {
+            "symbol": ["AAPL"] * 6,
+            "ts_ns": ts,
+            "open": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "high": [2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+            "low": [0.5, 1.5, 2.5, 3.5, 4.5, 5.5],
+            "close": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5],
+            "volume": [10, 20, 30, 40, 50, 60],
+        }
+    )
+    sessions = TradingCalendar(2024, 2024).session_table([t // NS_PER_DAY for t in ts])
+
+    con = duckdb.connect(":memory:")
+    con.register("bars", bars)
+    con.register("sessions", pa.table(sessions))
+    result = con.execute(AggregationDomainService.duckdb_sql(FrameSpec("1d", 86400))).fetch_df()
+    con.close()
+
+    assert result["ts_ns"].tolist() == [winter, summer]
+    assert result["open"].tolist() == [1.0, 4.0]
+    assert result["close"].tolist() == [3.5, 6.5]
+    assert result["volume"].tolist() == [60, 150]
@@ -1,6 +1,7 @@
 """Additional tests for DuckDB aggregation engine to improve coverage."""
 
 import tempfile
+from datetime import date
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -157,40 +158,43 @@ def test_duckdb_aggregation_engine_get_aggregated_data():
 
         engine = DuckDBAggregationEngine(raw_root, agg_root)
 
-        # Mock the agg storage load method
-        with patch.object(engine._agg_storage, "load_symbol_data") as mock_load:
-            sample_df = pd.DataFrame(
-                {
-                    "symbol": ["AAPL"] * 3,
-                    "ts_ns": [
-                        1704105000000000000,
-                        1704105300000000000,
-                        1704105600000000000,
-                    ],
-                    "open": [150.0, 151.0, 152.0],
-                    "high": [150.5, 151.5, 152.5],
-                    "low": [149.5, 150.5, 151.5],
-                    "close": [150.2, 151.2, 152.2],
-                    "volume": [1000, 1100, 1200],
-                }
-            )
-
-            mock_load.return_value = sample_df
-
-            frame_spec = FrameSpec(name="5m", seconds=300)
-
-            # Test without time filtering
-            result = engine.get_aggregated_data("AAPL", frame_spec)
-            assert len(result) == 3
-
-            # Test with time filtering
-            start_ts = 1704105100000000000
-            end_ts = 1704105500000000000
-
+        sample_df = pd.DataFrame(
+            {
+                "symbol": ["AAPL"] * 3,
+                "ts_ns": [
+                    1704105000000000000,
+                    1704105300000000000,
+                    1704105600000000000,
+                ],
+                "open": [150.0, 151.0, 152.0],
+                "high": [150.5, 151.5, 152.5],
+                "low": [149.5, 150.5, 151.5],
+                "close": [150.2, 151.2, 152.2],
+                "volume": [1000, 1100, 1200],
+            }
+        )
+        engine._agg_storage.write(
+            sample_df, frame="5m", symbol="AAPL", trading_day=date(2024, 1, 1), job_id="job"
+        )
+
+        frame_spec = FrameSpec(name="5m", seconds=300)
+
+        # Test without time filtering
+        result = engine.get_aggregated_data("AAPL", frame_spec)
+        assert len(result) == 3
+
+        # Test with time filtering (pushed down to the Parquet scan)
+        start_ts = 1704105100000000000
+        end_ts = 1704105500000000000
+
+        with patch.object(
+            engine._agg_storage, "load_symbol_data", wraps=engine._agg_storage.load_symbol_data
+        ) as load:
             result_filtered = engine.get_aggregated_data("AAPL", frame_spec, start_ts, end_ts)
-            assert len(result_filtered) == 1  # Only middle record should match
 
-            mock_load.assert_called()
+        assert len(result_filtered) == 1  # Only middle record should match
+        assert load.call_args.kwargs["start_ts"] == start_ts
+        assert load.call_args.kwargs["end_ts"] == end_ts
 
 
 def test_duckdb_aggregation_engine_error_handling():
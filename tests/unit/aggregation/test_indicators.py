@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the DuckDB indicator library."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from marketpipe.aggregation.domain.indicators import (
+    IndicatorSpec,
+    compile_indicator_sql,
+    parse_indicators,
+)
+from marketpipe.aggregation.infrastructure import duckdb_views
+from marketpipe.aggregation.infrastructure.indicators import (
+    compute_indicators,
+    load_indicators,
+    materialize_indicators,
+)
+from marketpipe.cli import app
+
+DAY_NS = 86_400 * 1_000_000_000
+FIRST_DAY_NS = 1_704_067_200 * 1_000_000_000  # 2024-01-01 00:00 UTC
+
+
+def random_bars(rows: int = 600, symbols=("AAPL", "MSFT")) -> pd.DataFrame:
+    """Random-walk daily bars, shuffled so SQL has to order them."""
+    rng = np.random.default_rng(4)
+    frames = []
+    for symbol in symbols:
+        close = 100 + np.cumsum(rng.normal(0, 1.0, rows))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "symbol": symbol,
+                    "ts_ns": FIRST_DAY_NS + np.arange(rows, dtype=np.int64) * DAY_NS,
+                    "open": close + rng.normal(0, 0.3, rows),
+                    "high": close + 1.0,
+                    "low": close - 1.0,
+                    "close": close,
+                    "volume": rng.integers(1, 10_000, rows),
+                }
+            )
+        )
+    return pd.concat(frames).sample(frac=1, random_state=2).reset_index(drop=True)
+
+
+def pandas_reference(bars: pd.DataFrame) -> dict[str, pd.Series]:
+    """Reference implementations of one symbol's indicators, in time order."""
+    close, high, low, volume = bars["close"], bars["high"], bars["low"], bars["volume"]
+    prev_close = close.shift()
+    delta = close.diff().iloc[1:]
+    gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+    loss = (-delta).clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+    true_range = pd.concat(
+        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
+    ).max(axis=1)
+    typical = (high + low + close) / 3
+    vwap = (typical * volume).rolling(20).sum() / volume.rolling(20).sum()
+    spread = np.sqrt((typical**2 * volume).rolling(20).sum() / volume.rolling(20).sum() - vwap**2)
+    return {
+        "sma_20": close.rolling(20).mean(),
+        "ema_12_high": high.ewm(span=12, adjust=False, min_periods=12).mean(),
+        "ema_200": close.ewm(span=200, adjust=False, min_periods=200).mean(),
+        "rsi_14": (100 - 100 / (1 + gain / loss)).reindex(close.index),
+        "atr_14": true_range.ewm(alpha=1 / 14, adjust=False, min_periods=14).mean(),
+        "volatility_20": np.log(close / prev_close).rolling(20).std(),
+        "vwap_20": vwap,
+        "vwap_upper_20": vwap + 2.5 * spread,
+        "vwap_lower_20": vwap - 2.5 * spread,
+        "zscore_30": (close - close.rolling(30).mean()) / close.rolling(30).std(),
+    }
+
+
+SPECS = [
+    "sma:20",
+    "ema:12:high",
+    "ema:200",
+    "rsi:14",
+    "atr:14",
+    "volatility:20",
+    "vwap_bands:20:2.5",
+    "zscore:30",
+]
+
+
+def test_sql_matches_reference_implementations():
+    bars = random_bars()
+    con = duckdb.connect(":memory:")
+    con.register("bars", bars)
+
+    result = con.execute(compile_indicator_sql(SPECS)).fetch_df()
+
+    assert list(result.columns[:2]) == ["symbol", "ts_ns"]
+    for symbol, group in bars.sort_values("ts_ns").groupby("symbol"):
+        got = result[result["symbol"] == symbol].reset_index(drop=True)
+        assert got["ts_ns"].is_monotonic_increasing
+        for name, expected in pandas_reference(group.reset_index(drop=True)).items():
+            np.testing.assert_allclose(
+                got[name].to_numpy(dtype=float), expected.to_numpy(), rtol=1e-9, err_msg=name
+            )
+
+
+def test_warm_up_matches_calculation_service():
+    from marketpipe.domain.analytics import OHLCVColumns
+    from marketpipe.domain.services import OHLCVCalculationService
+
+    bars = random_bars(rows=40, symbols=("AAPL",))
+    con = duckdb.connect(":memory:")
+    con.register("bars", bars)
+    result = con.execute(compile_indicator_sql(["sma:5", "volatility:5"])).fetch_df()
+
+    columns = OHLCVColumns.from_table(bars.sort_values("ts_ns"))
+    service = OHLCVCalculationService()
+    np.testing.assert_allclose(
+        result["sma_5"], service.calculate_sma_columns(columns, 5), rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        result["volatility_5"], service.calculate_volatility_columns(columns, 5), rtol=1e-9
+    )
+
+
+def test_parse_indicators():
+    specs = parse_indicators(["SMA:20", "sma:20", "ema:9:open", "vwap_bands:10:1.5"])
+
+    assert specs == [
+        IndicatorSpec("sma", 20),
+        IndicatorSpec("ema", 9, column="open"),
+        IndicatorSpec("vwap_bands", 10, width=1.5),
+    ]
+    assert [s.name for s in specs] == ["sma_20", "ema_9_open", "vwap_bands_10"]
+    assert specs[2].output_columns == ("vwap_10", "vwap_upper_10", "vwap_lower_10")
+    for bad, message in [
+        ("macd:12", "Unknown indicator"),
+        ("sma", "expected kind:period"),
+        ("ema:1", "at least 2"),
+        ("sma:5:volume", "column must be"),
+        ("rsi:14:2", "takes no argument"),
+        ("vwap_bands:20:wide", "band width"),
+    ]:
+        with pytest.raises(ValueError, match=message):
+            parse_indicators([bad])
+    with pytest.raises(ValueError, match="At least one"):
+        parse_indicators([])
+
+
+@pytest.fixture
+def agg_root(tmp_path):
+    """An aggregated lake with a by-symbol 1d frame."""
+    bars = random_bars(rows=300)
+    for symbol, group in bars.groupby("symbol"):
+        path = tmp_path / "agg" / "frame=1d" / f"symbol={symbol}" / "date=2024"
+        path.mkdir(parents=True)
+        group.drop(columns="symbol").to_parquet(path / "part.parquet")
+    duckdb_views.set_agg_root(tmp_path / "agg")
+    yield tmp_path
+    duckdb_views.set_agg_root("data/agg")
+
+
+def test_range_values_match_full_history(agg_root):
+    full = compute_indicators(["ema:20", "rsi:14"], symbols=["MSFT"])
+    ranged = compute_indicators(
+        ["ema:20", "rsi:14"], symbols=["MSFT"], start=date(2024, 3, 1), end=date(2024, 3, 31)
+    )
+
+    assert set(full["symbol"]) == {"MSFT"} and len(full) == 300
+    assert len(ranged) == 31
+    expected = full[full["ts_ns"].isin(ranged["ts_ns"])].reset_index(drop=True)
+    pd.testing.assert_frame_equal(ranged, expected)
+
+
+def test_materialize_then_load(agg_root):
+    output = agg_root / "indicators"
+    computed = compute_indicators(["sma:10", "atr:14"])
+
+    assert materialize_indicators(["sma:10", "atr:14"], output) == 600
+    loaded = load_indicators(output)
+    pd.testing.assert_frame_equal(loaded, computed, check_dtype=False)
+
+    # Re-materializing one symbol replaces only that symbol
+    assert materialize_indicators(["sma:10", "atr:14"], output, symbols=["AAPL"]) == 300
+    assert len(load_indicators(output)) == 600
+    aapl = load_indicators(output, symbols=["AAPL"], end=date(2024, 1, 10))
+    assert list(aapl["symbol"].unique()) == ["AAPL"] and len(aapl) == 10
+
+
+def test_cli_compute_and_show(agg_root, monkeypatch):
+    monkeypatch.setenv("MARKETPIPE_AGG_ROOT", str(agg_root / "agg"))
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app,
+        ["indicators", "compute", "-i", "sma:5", "-s", "AAPL", "--start", "2024-02-01", "--csv"],
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.stdout.strip().splitlines()
+    assert lines[0] == "symbol,ts_ns,sma_5" and len(lines) == 1 + 300 - 31
+
+    output = agg_root / "indicators"
+    result = runner.invoke(app, ["indicators", "compute", "-i", "zscore:20", "-o", str(output)])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(
+        app, ["indicators", "show", "--root", str(output), "-s", "MSFT", "--csv"]
+    )
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[0] == "symbol,ts_ns,zscore_20"
+
+    result = runner.invoke(app, ["indicators", "compute", "-i", "macd:12"])
+    assert result.exit_code == 2
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for incremental (skip-if-present) ingestion in the coordinator."""
+
+from __future__ import annotations
+
+import sys
+import types
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from marketpipe.domain.calendar import default_calendar
+from marketpipe.domain.value_objects import Symbol, TimeRange
+from marketpipe.ingestion.application.services import IngestionCoordinatorService
+from marketpipe.ingestion.domain.entities import IngestionJob, IngestionJobId
+from marketpipe.ingestion.domain.value_objects import IngestionConfiguration, PartitionCoverage
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from fakes.events import FakeEventPublisher
+from fakes.repositories import (
+    FakeIngestionCheckpointRepository,
+    FakeIngestionJobRepository,
+    FakeIngestionMetricsRepository,
+)
+
+
+class RecordingProvider:
+    def __init__(self):
+        self.calls: list[tuple[int, int]] = []
+
+    async def fetch_bars(self, symbol, start_timestamp, end_timestamp, batch_size, timeframe):
+        self.calls.append((start_timestamp, end_timestamp))
+        return []
+
+
+class CoverageStorage:
+    def __init__(self, coverage):
+        self.coverage = coverage
+
+    async def store_bars(self, bars, config):  # pragma: no cover - no bars are produced
+        raise AssertionError("nothing should be stored")
+
+    async def get_coverage(self, symbol, timeframe, start_date, end_date):
+        return self.coverage
+
+
+def make_job(incremental: bool) -> IngestionJob:
+    configuration = IngestionConfiguration(
+        output_path=Path("/tmp/test"),
+        compression="snappy",
+        max_workers=1,
+        batch_size=1000,
+        rate_limit_per_minute=None,
+        feed_type="iex",
+        incremental=incremental,
+    )
+    return IngestionJob(
+        job_id=IngestionJobId.generate(),
+        configuration=configuration,
+        symbols=[Symbol("AAPL")],
+        time_range=TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 11)),
+    )
+
+
+def make_coordinator(provider, storage) -> IngestionCoordinatorService:
+    return IngestionCoordinatorService(
+        job_service=types.SimpleNamespace(),
+        job_repository=FakeIngestionJobRepository(),
+        checkpoint_repository=FakeIngestionCheckpointRepository(),
+        metrics_repository=FakeIngestionMetricsRepository(),
+        market_data_provider=provider,
+        data_validator=types.SimpleNamespace(),
+        data_storage=storage,
+        event_publisher=FakeEventPublisher(),
+    )
+
+
+def ns(day: date) -> int:
+    return int(datetime.combine(day, datetime.min.time(), timezone.utc).timestamp() * 1e9)
+
+
+def full_day(day: date) -> PartitionCoverage:
+    open_ns, close_ns = default_calendar().session_bounds(day)
+    return PartitionCoverage(
+        trading_day=day, row_count=390, min_ts_ns=open_ns, max_ts_ns=close_ns - 60_000_000_000
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_fetches_only_missing_days():
+    provider = RecordingProvider()
+    storage = CoverageStorage({date(2024, 1, 8): full_day(date(2024, 1, 8))})
+
+    await make_coordinator(provider, storage)._process_symbol(make_job(True), Symbol("AAPL"))
+
+    assert provider.calls == [(ns(date(2024, 1, 9)), ns(date(2024, 1, 11)))]
+
+
+@pytest.mark.asyncio
+async def test_incremental_skips_fully_covered_symbol():
+    provider = RecordingProvider()
+    storage = CoverageStorage({date(2024, 1, d): full_day(date(2024, 1, d)) for d in (8, 9, 10)})
+
+    count, partition = await make_coordinator(provider, storage)._process_symbol(
+        make_job(True), Symbol("AAPL")
+    )
+
+    assert provider.calls == []
+    assert count == 0
+    assert partition is None  # nothing written
+
+
+@pytest.mark.asyncio
+async def test_non_incremental_ignores_coverage():
+    provider = RecordingProvider()
+    storage = CoverageStorage({date(2024, 1, 8): full_day(date(2024, 1, 8))})
+
+    await make_coordinator(provider, storage)._process_symbol(make_job(False), Symbol("AAPL"))
+
+    assert provider.calls == [(ns(date(2024, 1, 8)), ns(date(2024, 1, 11)))]
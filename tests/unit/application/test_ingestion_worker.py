@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for lease-based job claiming and the ingestion worker."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from marketpipe.domain.value_objects import Symbol, TimeRange
+from marketpipe.ingestion.application.worker import IngestionWorker, WorkerSettings
+from marketpipe.ingestion.domain.entities import IngestionJob, IngestionJobId, ProcessingState
+from marketpipe.ingestion.domain.value_objects import IngestionConfiguration
+from marketpipe.ingestion.infrastructure.repositories import SqliteIngestionJobRepository
+
+
+def make_job(symbol: str, day: str = "2024-01-08") -> IngestionJob:
+    return IngestionJob(
+        job_id=IngestionJobId(Symbol(symbol), day),
+        configuration=IngestionConfiguration(
+            output_path=Path("/tmp/test"),
+            compression="snappy",
+            max_workers=1,
+            batch_size=1000,
+            rate_limit_per_minute=None,
+            feed_type="iex",
+        ),
+        symbols=[Symbol(symbol)],
+        time_range=TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 9)),
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return SqliteIngestionJobRepository(tmp_path / "jobs.db")
+
+
+async def enqueue(repo, *symbols: str) -> list[IngestionJobId]:
+    jobs = [make_job(symbol) for symbol in symbols]
+    for job in jobs:
+        await repo.save(job)
+    return [job.job_id for job in jobs]
+
+
+def settings(**kwargs) -> WorkerSettings:
+    kwargs.setdefault("poll_interval", 0.05)
+    return WorkerSettings(**kwargs)
+
+
+class TestLeases:
+    @pytest.mark.asyncio
+    async def test_claims_are_exclusive(self, repo):
+        await enqueue(repo, "AAPL", "MSFT", "GOOG")
+
+        first = await repo.fetch_and_lock(ProcessingState.PENDING, 2, "w1", 60)
+        second = await repo.fetch_and_lock(ProcessingState.PENDING, 2, "w2", 60)
+
+        assert len(first) == 2 and len(second) == 1
+        assert {j.job_id for j in first}.isdisjoint({j.job_id for j in second})
+        assert all(j.state == ProcessingState.IN_PROGRESS for j in first + second)
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, repo):
+        (job_id,) = await enqueue(repo, "AAPL")
+        await repo.fetch_and_lock(ProcessingState.PENDING, 1, "crashed", 0.01)
+        await asyncio.sleep(0.05)
+
+        reclaimed = await repo.fetch_and_lock(ProcessingState.PENDING, 1, "w2", 60)
+
+        assert [j.job_id for j in reclaimed] == [job_id]
+        # The crashed worker no longer holds the lease
+        assert await repo.renew_leases("crashed", [job_id], 60) == []
+        assert await repo.renew_leases("w2", [job_id], 60) == [job_id]
+
+    @pytest.mark.asyncio
+    async def test_jobs_claimed_without_lease_are_not_reclaimed(self, repo):
+        await enqueue(repo, "AAPL")
+        assert len(await repo.fetch_and_lock(ProcessingState.PENDING, 1)) == 1
+
+        assert await repo.fetch_and_lock(ProcessingState.PENDING, 1, "w2", 60) == []
+
+    @pytest.mark.asyncio
+    async def test_saving_a_running_job_keeps_its_lease(self, repo):
+        (job_id,) = await enqueue(repo, "AAPL")
+        (job,) = await repo.fetch_and_lock(ProcessingState.PENDING, 1, "w1", 60)
+
+        await repo.save(job)
+
+        assert await repo.renew_leases("w1", [job_id], 60) == [job_id]
+
+    @pytest.mark.asyncio
+    async def test_release_with_requeue_returns_job_to_pending(self, repo):
+        (job_id,) = await enqueue(repo, "AAPL")
+        await repo.fetch_and_lock(ProcessingState.PENDING, 1, "w1", 60)
+
+        assert await repo.release_leases("w1", [job_id], requeue=True) == 1
+
+        assert (await repo.get_by_id(job_id)).state == ProcessingState.PENDING
+
+
+class TestIngestionWorker:
+    @pytest.mark.asyncio
+    async def test_runs_queue_with_bounded_concurrency(self, repo):
+        await enqueue(repo, "AAPL", "MSFT", "GOOG", "AMZN", "NVDA")
+        running = 0
+        peak = 0
+
+        async def run_job(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        worker = IngestionWorker(repo, run_job, settings(concurrency=2))
+        completed = await worker.run(until_idle=True)
+
+        assert completed == 5
+        assert peak == 2
+        assert await repo.fetch_and_lock(ProcessingState.PENDING, 5, "w2", 60) == []
+
+    @pytest.mark.asyncio
+    async def test_failed_job_does_not_stop_worker(self, repo):
+        await enqueue(repo, "AAPL", "MSFT")
+
+        async def run_job(job):
+            if job.job_id.symbol == Symbol("AAPL"):
+                raise RuntimeError("provider down")
+
+        completed = await IngestionWorker(repo, run_job, settings()).run(until_idle=True)
+
+        assert completed == 1
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_renews_lease_of_long_job(self, repo):
+        (job_id,) = await enqueue(repo, "AAPL")
+
+        async def run_job(job):
+            await asyncio.sleep(0.5)
+
+        worker = IngestionWorker(repo, run_job, settings(lease_seconds=0.15))
+        task = asyncio.create_task(worker.run(until_idle=True))
+        await asyncio.sleep(0.3)
+
+        # Well past the original lease, yet nobody else can claim the job
+        assert await repo.fetch_and_lock(ProcessingState.PENDING, 1, "w2", 60) == []
+        assert await task == 1
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_cancels_job(self, repo):
+        await enqueue(repo, "AAPL")
+        cancelled = asyncio.Event()
+
+        async def run_job(job):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def lost(worker_id, job_ids, lease_seconds):
+            return []
+
+        repo.renew_leases = lost
+        worker = IngestionWorker(repo, run_job, settings(lease_seconds=0.15))
+
+        assert await asyncio.wait_for(worker.run(until_idle=True), 5) == 0
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_stop_requeues_running_jobs(self, repo):
+        (job_id,) = await enqueue(repo, "AAPL")
+        started = asyncio.Event()
+
+        async def run_job(job):
+            started.set()
+            await asyncio.sleep(10)
+
+        stop = asyncio.Event()
+        worker = IngestionWorker(repo, run_job, settings())
+        task = asyncio.create_task(worker.run(stop))
+        await asyncio.wait_for(started.wait(), 5)
+        stop.set()
+
+        assert await asyncio.wait_for(task, 5) == 0
+        assert (await repo.get_by_id(job_id)).state == ProcessingState.PENDING
+
+
+def test_settings_validation_and_env(monkeypatch):
+    with pytest.raises(ValueError, match="concurrency"):
+        WorkerSettings(concurrency=0)
+
+    monkeypatch.setenv("MARKETPIPE_WORKER_CONCURRENCY", "4")
+    monkeypatch.setenv("MARKETPIPE_WORKER_LEASE_SECONDS", "30")
+    from_env = WorkerSettings.from_env()
+
+    assert (from_env.concurrency, from_env.lease_seconds, from_env.heartbeat_interval) == (
+        4,
+        30.0,
+        10.0,
+    )
+    assert from_env.worker_id != WorkerSettings.from_env().worker_id
+
+
+class EmptyProvider:
+    async def fetch_bars(self, symbol, start_timestamp, end_timestamp, batch_size, timeframe):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_coordinator_runs_claimed_job_without_starting_it_again(repo):
+    from marketpipe.ingestion.application.services import IngestionCoordinatorService
+
+    await enqueue(repo, "AAPL")
+    (job,) = await repo.fetch_and_lock(ProcessingState.PENDING, 1, "w1", 60)
+
+    class NoStartJobService:
+        async def start_job(self, command):
+            raise AssertionError("claimed job started twice")
+
+    coordinator = IngestionCoordinatorService(
+        job_service=NoStartJobService(),
+        job_repository=repo,
+        checkpoint_repository=None,
+        metrics_repository=None,
+        market_data_provider=EmptyProvider(),
+        data_validator=None,
+        data_storage=None,
+        event_publisher=None,
+    )
+
+    summary = await coordinator.execute_job(job.job_id)
+
+    assert summary["job_id"] == str(job.job_id)
@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the memory budget bounding the bars in flight during ingestion."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import sys
+import threading
+import types
+from datetime import date
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+from prometheus_client import REGISTRY
+
+from marketpipe.domain.entities import EntityId, OHLCVBar
+from marketpipe.domain.value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from marketpipe.infrastructure.messaging.stage_executor import StageSettings
+from marketpipe.ingestion.application.services import IngestionCoordinatorService
+from marketpipe.ingestion.domain.entities import IngestionJob, IngestionJobId
+from marketpipe.ingestion.domain.value_objects import IngestionConfiguration
+from marketpipe.ingestion.infrastructure.memory_budget import (
+    BAR_BYTES,
+    MEMORY_BUDGET_PROCESS_BYTES,
+    MemoryBudget,
+)
+from marketpipe.ingestion.infrastructure.symbol_pipeline import SymbolPipeline
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from fakes.events import FakeEventPublisher
+from fakes.repositories import (
+    FakeIngestionCheckpointRepository,
+    FakeIngestionJobRepository,
+    FakeIngestionMetricsRepository,
+)
+
+
+def waits() -> float:
+    return REGISTRY.get_sample_value("mp_memory_budget_waits_total") or 0.0
+
+
+@pytest.mark.asyncio
+async def test_reservations_wait_for_room():
+    budget = MemoryBudget(limit_bytes=1000, poll_interval=0.005)
+    before = waits()
+    first = await budget.reserve(600)
+    second = asyncio.create_task(budget.reserve(600))
+    await asyncio.sleep(0.05)
+    assert not second.done() and budget.waiting == 1
+
+    first.release()
+    reservation = await asyncio.wait_for(second, 1)
+    assert budget.in_flight == 600 and waits() == before + 1
+
+    # Measured sizes may overshoot; nothing else is admitted meanwhile
+    reservation.resize(5000)
+    assert budget.tight and budget.peak == 5000
+    reservation.release()
+    # A symbol larger than the budget still runs when it is alone
+    (await budget.reserve(10_000)).release()
+    assert budget.in_flight == 0
+    with pytest.raises(ValueError):
+        MemoryBudget(limit_bytes=0)
+
+
+def test_estimates_scale_with_range_and_timeframe():
+    day_ns = 86_400 * 10**9
+    week_1m = MemoryBudget.estimate_bytes(0, 7 * day_ns, "1m")
+    assert week_1m == 5 * 960 * BAR_BYTES
+    assert MemoryBudget.estimate_bytes(0, 7 * day_ns, "5m") == week_1m // 5
+    assert MemoryBudget.estimate_bytes(0, 7 * day_ns, "1d") == 5 * BAR_BYTES
+
+
+class SlowProvider:
+    def __init__(self):
+        self.fetching = 0
+        self.most_fetching = 0
+
+    async def fetch_bars(self, symbol, start_timestamp, end_timestamp, batch_size, timeframe):
+        self.fetching += 1
+        self.most_fetching = max(self.most_fetching, self.fetching)
+        await asyncio.sleep(0.02)
+        self.fetching -= 1
+        return [
+            OHLCVBar(
+                id=EntityId.generate(),
+                symbol=symbol,
+                timestamp=Timestamp.from_nanoseconds(start_timestamp),
+                open_price=Price.from_float(1.0),
+                high_price=Price.from_float(1.0),
+                low_price=Price.from_float(1.0),
+                close_price=Price.from_float(1.0),
+                volume=Volume(1),
+            )
+        ]
+
+
+class AcceptAllValidator:
+    async def validate_bars(self, bars):
+        return types.SimpleNamespace(is_valid=True, valid_bars=bars, errors=[])
+
+
+class CountingStorage:
+    async def store_bars(self, bars, config):
+        return types.SimpleNamespace(record_count=len(bars))
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fetches_within_budget():
+    symbols = [Symbol(s) for s in ("AAPL", "MSFT", "NVDA", "AMZN", "META", "TSLA")]
+    time_range = TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 9))
+    job = IngestionJob(
+        job_id=IngestionJobId("job-1"),
+        configuration=IngestionConfiguration(
+            output_path=Path("/tmp/test"),
+            compression="snappy",
+            max_workers=1,
+            batch_size=1000,
+            rate_limit_per_minute=None,
+            feed_type="iex",
+        ),
+        symbols=symbols,
+        time_range=time_range,
+    )
+    estimate = MemoryBudget.estimate_bytes(
+        int(time_range.start.value.timestamp() * 1e9), int(time_range.end.value.timestamp() * 1e9)
+    )
+    # Room for two symbols' estimated bars at a time
+    budget = MemoryBudget(limit_bytes=int(estimate * 2.5), poll_interval=0.002)
+    provider = SlowProvider()
+    coordinator = IngestionCoordinatorService(
+        job_service=types.SimpleNamespace(),
+        job_repository=FakeIngestionJobRepository(),
+        checkpoint_repository=FakeIngestionCheckpointRepository(),
+        metrics_repository=FakeIngestionMetricsRepository(),
+        market_data_provider=provider,
+        data_validator=AcceptAllValidator(),
+        data_storage=CountingStorage(),
+        event_publisher=FakeEventPublisher(),
+        memory_budget=budget,
+    )
+
+    results = [result async for _, result in coordinator._symbol_results(job)]
+
+    assert [count for count, _ in results] == [1] * len(symbols)
+    assert provider.most_fetching == 2
+    assert budget.in_flight == 0 and estimate * 2 <= budget.peak <= estimate * 2.5
+
+
+class RecordingAggregation:
+    def __init__(self):
+        self.tables: list[pa.Table] = []
+
+    def aggregate_symbol(self, job_id, symbol, table):
+        self.tables.append(table)
+        return 1
+
+
+def bars_table(rows: int = 1000) -> pa.Table:
+    return pa.table({"ts_ns": pa.array(range(rows), pa.int64()), "close": [1.5] * rows})
+
+
+def test_pipeline_spills_tables_while_budget_is_tight(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "marketpipe.aggregation.infrastructure.duckdb_views.refresh_views", lambda: None
+    )
+    budget = MemoryBudget(limit_bytes=10**9, spill_dir=tmp_path / "spill")
+    aggregation = RecordingAggregation()
+    pipeline = SymbolPipeline(
+        aggregation, settings=StageSettings(mode="inline"), memory_budget=budget
+    )
+
+    # Roomy: the table stays in memory and counts against the budget while queued
+    table = bars_table()
+    pipeline.submit("job-1", "AAPL", table)
+    assert aggregation.tables[-1] is table
+    assert budget.peak == table.nbytes
+
+    # Tight: the table goes to an Arrow IPC file and is mapped back by the stage
+    reservation = asyncio.run(budget.reserve(int(0.9 * 10**9)))
+    spilled_before = REGISTRY.get_sample_value("mp_memory_spilled_bytes_total")
+    pipeline.submit("job-1", "MSFT", bars_table(500))
+    assert aggregation.tables[-1].num_rows == 500
+    assert aggregation.tables[-1].column("close").to_pylist() == [1.5] * 500
+    assert REGISTRY.get_sample_value("mp_memory_spilled_bytes_total") > spilled_before
+    assert pipeline.finish("job-1")["frames_written"] == 2
+
+    reservation.release()
+    aggregation.tables.clear()
+    gc.collect()
+    assert budget.in_flight == 0
+    assert list((tmp_path / "spill").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_async_submit_spills_off_the_event_loop(tmp_path, monkeypatch):
+    budget = MemoryBudget(limit_bytes=1000, spill_dir=tmp_path / "spill")
+    spilled_on = []
+    original = budget.spill
+
+    def spill(table):
+        spilled_on.append(threading.current_thread())
+        return original(table)
+
+    monkeypatch.setattr(budget, "spill", spill)
+    aggregation = RecordingAggregation()
+    pipeline = SymbolPipeline(
+        aggregation, settings=StageSettings(mode="inline"), memory_budget=budget
+    )
+    reservation = await budget.reserve(900)
+
+    await pipeline.submit_async("job-1", "AAPL", bars_table(10))
+
+    assert spilled_on and spilled_on[0] is not threading.main_thread()
+    assert aggregation.tables[-1].num_rows == 10
+    reservation.release()
+
+
+def test_limit_and_peak_are_not_summed_over_processes():
+    budget = MemoryBudget(limit_bytes=4096)
+    budget._adjust(100)
+    budget._adjust(-100)
+
+    assert MEMORY_BUDGET_PROCESS_BYTES._multiprocess_mode == "max"
+    assert REGISTRY.get_sample_value("mp_memory_budget_process_bytes", {"kind": "limit"}) == 4096
+    assert REGISTRY.get_sample_value("mp_memory_budget_process_bytes", {"kind": "peak"}) == 100
+    assert REGISTRY.get_sample_value("mp_memory_budget_bytes", {"kind": "peak"}) is None
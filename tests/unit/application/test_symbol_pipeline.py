@@ -0,0 +1,257 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for per-symbol pipelining of validation and aggregation."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import types
+from datetime import date
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from marketpipe.aggregation.application.services import AggregationRunnerService
+from marketpipe.aggregation.domain.services import AggregationDomainService
+from marketpipe.aggregation.domain.value_objects import DEFAULT_SPECS
+from marketpipe.aggregation.infrastructure.duckdb_engine import DuckDBAggregationEngine
+from marketpipe.domain.entities import EntityId, OHLCVBar
+from marketpipe.domain.value_objects import Price, Symbol, TimeRange, Timestamp, Volume
+from marketpipe.infrastructure.messaging.stage_executor import StageSettings
+from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+from marketpipe.ingestion.application.services import IngestionCoordinatorService
+from marketpipe.ingestion.domain.entities import IngestionJob, IngestionJobId
+from marketpipe.ingestion.domain.value_objects import IngestionConfiguration
+from marketpipe.ingestion.infrastructure.symbol_pipeline import SymbolPipeline
+from marketpipe.validation.application.services import ValidationRunnerService
+from marketpipe.validation.domain.services import ValidationDomainService
+from marketpipe.validation.infrastructure.repositories import CsvReportRepository
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from fakes.events import FakeEventPublisher
+from fakes.repositories import (
+    FakeIngestionCheckpointRepository,
+    FakeIngestionJobRepository,
+    FakeIngestionMetricsRepository,
+)
+
+# 2024-01-02 14:30 UTC
+START_NS = 1_704_205_800_000_000_000
+MINUTE_NS = 60_000_000_000
+
+
+def minute_bars(symbol: str, count: int = 120) -> pa.Table:
+    return pa.table(
+        {
+            "ts_ns": pa.array([START_NS + i * MINUTE_NS for i in range(count)], pa.int64()),
+            "open": [100.0 + i for i in range(count)],
+            "high": [101.0 + i for i in range(count)],
+            "low": [99.0 + i for i in range(count)],
+            "close": [100.5 + i for i in range(count)],
+            "volume": pa.array([1000] * count, pa.int64()),
+            "symbol": [symbol] * count,
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_view_refresh(monkeypatch):
+    monkeypatch.setattr(
+        "marketpipe.aggregation.infrastructure.duckdb_views.refresh_views", lambda: None
+    )
+
+
+@pytest.fixture
+def aggregation(tmp_path):
+    engine = DuckDBAggregationEngine(raw_root=tmp_path / "raw", agg_root=tmp_path / "agg")
+    return AggregationRunnerService(engine=engine, domain=AggregationDomainService())
+
+
+class RecordingValidation:
+    def __init__(self):
+        self.calls: list[tuple[str, str, int]] = []
+
+    def validate_symbol(self, job_id, symbol, table):
+        self.calls.append((job_id, symbol, table.num_rows))
+        return 0
+
+
+class TestSymbolPipeline:
+    def test_aggregates_each_symbol_from_memory(self, tmp_path, aggregation):
+        validation = RecordingValidation()
+        pipeline = SymbolPipeline(aggregation, validation, StageSettings(workers=2))
+
+        pipeline.submit("job-1", "AAPL", minute_bars("AAPL"))
+        pipeline.submit("job-1", "MSFT", minute_bars("MSFT"))
+        summary = pipeline.finish("job-1", timeout=30)
+        pipeline.shutdown()
+
+        # Nothing was written to the raw root, so the bars never came from disk
+        assert not list((tmp_path / "raw").rglob("*.parquet"))
+        assert summary == {"drained": True, "frames_written": 2 * len(DEFAULT_SPECS)}
+        assert sorted(validation.calls) == [("job-1", "AAPL", 120), ("job-1", "MSFT", 120)]
+
+        agg = ParquetStorageEngine(tmp_path / "agg")
+        bars_1h = agg.load_symbol_data(symbol="MSFT", frame="1h")
+        assert bars_1h["volume"].tolist() == [30_000, 60_000, 30_000]
+
+    def test_symbol_is_aggregated_before_job_finishes(self, aggregation):
+        aggregated = threading.Event()
+        original = aggregation.aggregate_symbol
+
+        def aggregate_symbol(job_id, symbol, table):
+            frames = original(job_id, symbol, table)
+            aggregated.set()
+            return frames
+
+        aggregation.aggregate_symbol = aggregate_symbol
+        pipeline = SymbolPipeline(aggregation, settings=StageSettings())
+
+        pipeline.submit("job-1", "AAPL", minute_bars("AAPL"))
+
+        assert aggregated.wait(30)
+        assert pipeline.finish("job-1", timeout=30)["frames_written"] == len(DEFAULT_SPECS)
+        pipeline.shutdown()
+
+    def test_accepts_domain_bars(self, aggregation):
+        bars = [
+            OHLCVBar(
+                id=EntityId.generate(),
+                symbol=Symbol("AAPL"),
+                timestamp=Timestamp.from_nanoseconds(START_NS + i * MINUTE_NS),
+                open_price=Price.from_float(100.0),
+                high_price=Price.from_float(101.0),
+                low_price=Price.from_float(99.0),
+                close_price=Price.from_float(100.5),
+                volume=Volume(10),
+            )
+            for i in range(5)
+        ]
+        pipeline = SymbolPipeline(aggregation, settings=StageSettings(mode="inline"))
+
+        pipeline.submit("job-1", "AAPL", bars)
+
+        assert pipeline.finish("job-1")["frames_written"] == len(DEFAULT_SPECS)
+
+    @pytest.mark.asyncio
+    async def test_submit_async_converts_off_the_event_loop(self, aggregation, monkeypatch):
+        threads = []
+        original = ParquetStorageEngine.bars_to_table
+
+        def bars_to_table(bars):
+            threads.append(threading.current_thread())
+            return original(bars)
+
+        monkeypatch.setattr(ParquetStorageEngine, "bars_to_table", staticmethod(bars_to_table))
+        bars = [
+            OHLCVBar(
+                id=EntityId.generate(),
+                symbol=Symbol("AAPL"),
+                timestamp=Timestamp.from_nanoseconds(START_NS),
+                open_price=Price.from_float(100.0),
+                high_price=Price.from_float(101.0),
+                low_price=Price.from_float(99.0),
+                close_price=Price.from_float(100.5),
+                volume=Volume(10),
+            )
+        ]
+        pipeline = SymbolPipeline(aggregation, settings=StageSettings(workers=1))
+
+        await pipeline.submit_async("job-1", "AAPL", bars)
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert pipeline.finish("job-1", timeout=30)["frames_written"] == len(DEFAULT_SPECS)
+        pipeline.shutdown()
+
+    def test_process_mode_rejected(self, aggregation):
+        with pytest.raises(ValueError, match="in memory"):
+            SymbolPipeline(aggregation, settings=StageSettings(mode="process"))
+
+
+def test_validate_symbol_writes_report(tmp_path):
+    service = ValidationRunnerService(
+        storage_engine=None,
+        validator=ValidationDomainService(),
+        reporter=CsvReportRepository(tmp_path),
+    )
+
+    errors = service.validate_symbol("job-1", "AAPL", minute_bars("AAPL", 10))
+
+    assert errors == 0
+    assert (tmp_path / "job-1" / "job-1_AAPL.csv").exists()
+
+
+class RecordingPipeline:
+    def __init__(self):
+        self.submitted: list[tuple[str, str, int]] = []
+
+    async def submit_async(self, job_id, symbol, bars):
+        self.submitted.append((job_id, symbol, len(bars)))
+
+
+class OneBarProvider:
+    async def fetch_bars(self, symbol, start_timestamp, end_timestamp, batch_size, timeframe):
+        return [
+            OHLCVBar(
+                id=EntityId.generate(),
+                symbol=symbol,
+                timestamp=Timestamp.from_nanoseconds(start_timestamp),
+                open_price=Price.from_float(1.0),
+                high_price=Price.from_float(1.0),
+                low_price=Price.from_float(1.0),
+                close_price=Price.from_float(1.0),
+                volume=Volume(1),
+            )
+        ]
+
+
+class AcceptAllValidator:
+    async def validate_bars(self, bars):
+        return types.SimpleNamespace(is_valid=True, valid_bars=bars, errors=[])
+
+
+class RecordingStorage:
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.pending_at_store: list[int] = []
+
+    async def store_bars(self, bars, config):
+        self.pending_at_store.append(len(self.pipeline.submitted))
+        return types.SimpleNamespace(record_count=len(bars))
+
+
+@pytest.mark.asyncio
+async def test_coordinator_hands_stored_bars_to_pipeline():
+    pipeline = RecordingPipeline()
+    storage = RecordingStorage(pipeline)
+    coordinator = IngestionCoordinatorService(
+        job_service=types.SimpleNamespace(),
+        job_repository=FakeIngestionJobRepository(),
+        checkpoint_repository=FakeIngestionCheckpointRepository(),
+        metrics_repository=FakeIngestionMetricsRepository(),
+        market_data_provider=OneBarProvider(),
+        data_validator=AcceptAllValidator(),
+        data_storage=storage,
+        event_publisher=FakeEventPublisher(),
+        symbol_pipeline=pipeline,
+    )
+    job = IngestionJob(
+        job_id=IngestionJobId("job-1"),
+        configuration=IngestionConfiguration(
+            output_path=Path("/tmp/test"),
+            compression="snappy",
+            max_workers=1,
+            batch_size=1000,
+            rate_limit_per_minute=None,
+            feed_type="iex",
+        ),
+        symbols=[Symbol("AAPL")],
+        time_range=TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 9)),
+    )
+
+    await coordinator._process_symbol(job, Symbol("AAPL"))
+
+    # Submitted only after the bars were stored
+    assert storage.pending_at_store == [0]
+    assert pipeline.submitted == [("job-1", "AAPL", 1)]
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the compact CLI command."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from marketpipe.cli import app
+from marketpipe.infrastructure.storage.compaction import CompactionScheduler
+from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+
+
+def day_frame(symbol: str, day: date) -> pd.DataFrame:
+    base = int(datetime(day.year, day.month, day.day, 14, 30, tzinfo=timezone.utc).timestamp())
+    return pd.DataFrame(
+        {
+            "ts_ns": [(base + 60 * i) * 1_000_000_000 for i in range(3)],
+            "open": [100.0] * 3,
+            "high": [101.0] * 3,
+            "low": [99.0] * 3,
+            "close": [100.0] * 3,
+            "volume": [1000] * 3,
+            "symbol": [symbol] * 3,
+        }
+    )
+
+
+@pytest.fixture
+def raw_root(tmp_path):
+    engine = ParquetStorageEngine(tmp_path)
+    for symbol in ("AAPL", "MSFT"):
+        for day in (date(2024, 1, 2), date(2024, 1, 3)):
+            engine.write(
+                day_frame(symbol, day),
+                frame="1m",
+                symbol=symbol,
+                trading_day=day,
+                job_id=f"{symbol}_{day}",
+            )
+    return tmp_path
+
+
+def test_interval_mode_only_compacts_selected_symbols(raw_root, monkeypatch):
+    async def single_pass(self):
+        await self.run_once()
+
+    monkeypatch.setattr(CompactionScheduler, "run_forever", single_pass)
+
+    result = CliRunner().invoke(
+        app, ["compact", "--root", str(raw_root), "--interval", "60", "--symbol", "AAPL"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (raw_root / "frame=1m" / "symbol=AAPL" / "date=2024-01").exists()
+    assert not (raw_root / "frame=1m" / "symbol=MSFT" / "date=2024-01").exists()
@@ -184,7 +184,7 @@ def test_ingest_cli_wires_polygon_provider_config():
 
             captured: dict[str, dict[str, object]] = {}
 
-            def _stub(provider_config, output_path):
+            def _stub(provider_config, output_path, **kwargs):
                 captured["config"] = provider_config
                 return mock_job_service, mock_coordinator_service
 
@@ -344,3 +344,19 @@ workers: 4
         assert config_dict["end"] == date(2025, 1, 7)
         assert "batch_size" in config_dict
         assert "provider" in config_dict
+
+    def test_shard_validation(self):
+        """Test that the shard index must fall within the shard count."""
+        config = IngestionJobConfig(
+            symbols=["AAPL"], start=date(2025, 1, 1), end=date(2025, 1, 7), shard_count=4
+        )
+        assert (config.shard_index, config.shard_count) == (0, 4)
+
+        with pytest.raises(ValueError, match="shard_index must be less than shard_count"):
+            IngestionJobConfig(
+                symbols=["AAPL"],
+                start=date(2025, 1, 1),
+                end=date(2025, 1, 7),
+                shard_index=4,
+                shard_count=4,
+            )
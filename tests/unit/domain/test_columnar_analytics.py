@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Parity tests: vectorized analytics against the object-based calculations."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from marketpipe.domain.analytics import OHLCVColumns
+from marketpipe.domain.entities import OHLCVBar
+from marketpipe.domain.services import OHLCVCalculationService
+
+NS_PER_MINUTE = 60 * 1_000_000_000
+DAY_START = 1_705_305_600 * 1_000_000_000  # 2024-01-15 00:00 UTC
+
+
+def random_columns(symbols=("AAPL", "MSFT", "NVDA"), minutes=900, seed=3) -> OHLCVColumns:
+    """Random-walk minute bars spanning three UTC days, with gaps and missing fields."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for i, symbol in enumerate(symbols):
+        ts = DAY_START + 14 * 60 * NS_PER_MINUTE
+        ts = ts + np.sort(rng.choice(minutes * 2, minutes, replace=False)) * NS_PER_MINUTE
+        close = np.round(100 * (i + 1) + np.cumsum(rng.normal(0, 0.2, minutes)), 2)
+        open_ = np.round(close + rng.normal(0, 0.05, minutes), 4)
+        volume = rng.integers(0, 5_000, minutes)
+        volume[rng.random(minutes) < 0.05] = 0
+        vwap = np.where(rng.random(minutes) < 0.5, np.nan, close)
+        trade_count = np.where(rng.random(minutes) < 0.01, np.nan, volume // 10)
+        parts.append(
+            OHLCVColumns.from_arrays(
+                symbol=symbol,
+                ts_ns=ts,
+                open=open_,
+                high=np.round(np.maximum(open_, close) + 0.0123, 4),
+                low=np.round(np.minimum(open_, close) - 0.0321, 4),
+                close=close,
+                volume=volume,
+                trade_count=trade_count,
+                vwap=vwap,
+            )
+        )
+    return OHLCVColumns(
+        **{
+            name: np.concatenate([getattr(p, name) for p in parts])
+            for name in OHLCVColumns.__dataclass_fields__
+        }
+    )
+
+
+def as_arrow(columns: OHLCVColumns) -> pa.Table:
+    """Arrow table in the storage schema, with null trade counts and VWAPs."""
+    data = columns.to_dict()
+    missing = np.isnan(columns.trade_count)
+    data["trade_count"] = pa.array(
+        np.nan_to_num(columns.trade_count).astype(np.int64), mask=missing
+    )
+    data["vwap"] = pa.array(columns.vwap, mask=np.isnan(columns.vwap))
+    data["symbol"] = pa.array(columns.symbol.tolist(), pa.string())
+    return pa.table(data)
+
+
+def as_pandas(columns: OHLCVColumns) -> pd.DataFrame:
+    """DataFrame in the storage schema, with nullable integer trade counts."""
+    return as_arrow(columns).to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+
+
+@pytest.fixture(scope="module")
+def columns() -> OHLCVColumns:
+    return random_columns()
+
+
+@pytest.fixture(scope="module")
+def bars_by_symbol(columns):
+    bars = columns.to_bars()
+    return {s: [b for b in bars if b.symbol.value == s] for s in ("AAPL", "MSFT", "NVDA")}
+
+
+@pytest.fixture
+def service():
+    return OHLCVCalculationService()
+
+
+def same_floats(vectorized, expected, rel=1e-12):
+    expected = np.array([np.nan if v is None else v for v in expected], dtype=np.float64)
+    np.testing.assert_array_equal(np.isnan(vectorized), np.isnan(expected))
+    np.testing.assert_allclose(vectorized, expected, rtol=rel, equal_nan=True)
+
+
+def test_vwap_matches(service, columns, bars_by_symbol):
+    aapl = columns.take(np.flatnonzero(columns.symbol == "AAPL"))
+
+    expected = service.vwap(bars_by_symbol["AAPL"])
+
+    assert float(service.vwap(as_pandas(aapl))) == pytest.approx(float(expected), rel=1e-12)
+    by_symbol = service.vwap_by_symbol(as_arrow(columns))
+    for symbol, bars in bars_by_symbol.items():
+        assert float(by_symbol[symbol]) == pytest.approx(float(service.vwap(bars)), rel=1e-12)
+
+
+def test_daily_summaries_match(service, columns, bars_by_symbol):
+    summaries = service.daily_summaries(columns)
+
+    expected = []
+    for bars in bars_by_symbol.values():
+        for day in sorted({b.timestamp.trading_date() for b in bars}):
+            expected.append(
+                service.daily_summary([b for b in bars if b.timestamp.trading_date() == day])
+            )
+    assert len(summaries) == len(expected) == 9
+    for got, want in zip(summaries, expected):
+        assert (got.symbol, got.trading_date, got.bar_count) == (
+            want.symbol,
+            want.trading_date,
+            want.bar_count,
+        )
+        assert (got.open_price, got.high_price, got.low_price, got.close_price) == (
+            want.open_price,
+            want.high_price,
+            want.low_price,
+            want.close_price,
+        )
+        assert got.volume == want.volume
+        assert abs(got.vwap.units - want.vwap.units) <= 1
+        assert (got.first_bar_time, got.last_bar_time) == (want.first_bar_time, want.last_bar_time)
+
+
+@pytest.mark.parametrize("frame_seconds", [300, 420, 3600])
+def test_resample_matches(service, columns, bars_by_symbol, frame_seconds):
+    resampled = service.resample_columns(as_arrow(columns), frame_seconds)
+
+    for symbol, bars in bars_by_symbol.items():
+        got = resampled.take(np.flatnonzero(resampled.symbol == symbol))
+        want = OHLCVColumns.from_bars(service.resample(bars, frame_seconds))
+        for name in ("ts_ns", "open", "high", "low", "close", "volume", "trade_count"):
+            np.testing.assert_array_equal(getattr(got, name), getattr(want, name), err_msg=name)
+        np.testing.assert_allclose(got.vwap, want.vwap, atol=1.01e-4)
+
+
+def test_rolling_statistics_match(service, columns, bars_by_symbol):
+    sma = service.calculate_sma_columns(as_pandas(columns), 20, "high")
+    volatility = service.calculate_volatility_columns(columns, 30)
+
+    for symbol, bars in bars_by_symbol.items():
+        rows = columns.symbol == symbol
+        same_floats(sma[rows], service.calculate_sma(bars, 20, "high"))
+        same_floats(volatility[rows], service.calculate_volatility(bars, 30), rel=1e-9)
+
+
+def test_columnar_input_keeps_declared_types(service, columns, bars_by_symbol):
+    aapl = as_arrow(columns.take(np.flatnonzero(columns.symbol == "AAPL")))
+
+    resampled = service.resample(aapl, 300)
+    assert all(isinstance(bar, OHLCVBar) for bar in resampled)
+    want = OHLCVColumns.from_bars(service.resample(bars_by_symbol["AAPL"], 300))
+    got = OHLCVColumns.from_bars(resampled)
+    for name in ("ts_ns", "open", "high", "low", "close", "volume"):
+        np.testing.assert_array_equal(getattr(got, name), getattr(want, name), err_msg=name)
+    for got, want in (
+        (service.calculate_sma(aapl, 20), service.calculate_sma(bars_by_symbol["AAPL"], 20)),
+        (
+            service.calculate_volatility(aapl, 30),
+            service.calculate_volatility(bars_by_symbol["AAPL"], 30),
+        ),
+    ):
+        assert isinstance(got, list)
+        assert [v is None for v in got] == [v is None for v in want]
+        assert [v for v in got if v is not None] == pytest.approx(
+            [v for v in want if v is not None], rel=1e-9
+        )
+
+
+def test_single_series_validation_matches(service, columns):
+    aapl = columns.take(np.flatnonzero(columns.symbol == "AAPL"))
+
+    with pytest.raises(ValueError, match="same symbol"):
+        service.daily_summary(columns)
+    with pytest.raises(ValueError, match="same trading date"):
+        service.daily_summary(aapl)
+    with pytest.raises(ValueError, match="no bars"):
+        service.vwap(aapl.take(np.arange(0)))
+    with pytest.raises(ValueError, match="no volume"):
+        service.vwap(as_pandas(aapl).assign(volume=0))
+    with pytest.raises(ValueError, match="sorted by timestamp"):
+        service.resample(aapl.take(np.arange(len(aapl))[::-1]), 300)
+
+
+def test_columnar_round_trips(columns):
+    table = as_arrow(columns)
+
+    for restored in (OHLCVColumns.coerce(table), OHLCVColumns.coerce(as_pandas(columns))):
+        for name in OHLCVColumns.__dataclass_fields__:
+            np.testing.assert_array_equal(getattr(restored, name), getattr(columns, name))
+
+
+def test_interleaved_symbols_are_grouped(service, columns):
+    shuffled = columns.take(np.random.default_rng(5).permutation(len(columns)))
+
+    assert service.daily_summaries(shuffled) == service.daily_summaries(columns)
+    expected_vwaps = service.vwap_by_symbol(columns)
+    for symbol, vwap in service.vwap_by_symbol(shuffled).items():
+        assert float(vwap) == pytest.approx(float(expected_vwaps[symbol]), rel=1e-12)
+    sma = service.calculate_sma_columns(shuffled, 5)
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        rows = shuffled.symbol == symbol
+        expected = service.calculate_sma_columns(shuffled.take(np.flatnonzero(rows)), 5)
+        np.testing.assert_array_equal(sma[rows], expected)
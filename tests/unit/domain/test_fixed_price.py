@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the fixed-point price backend."""
+
+from __future__ import annotations
+
+import random
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from marketpipe.domain.value_objects import (
+    FixedPrice,
+    Price,
+    Symbol,
+    TimeRange,
+    price_type,
+)
+
+
+def test_from_float_matches_decimal_rounding():
+    rng = random.Random(7)
+    values = [rng.uniform(0, 5000) for _ in range(20_000)]
+    # Exact half-way ties in decimal that are not ties in binary, and vice versa
+    values += [1.00005, 2.00015, 0.00005, 123.45675, 0.1 + 0.2, 1e12 + 0.00005]
+
+    for value in values:
+        assert FixedPrice.from_float(value).units == Price.from_float(value).units, value
+
+
+def test_arithmetic_is_exact_and_matches_price():
+    a, b = FixedPrice.from_string("10.5"), FixedPrice.from_string("3.3333")
+    pa, pb = a.to_price(), b.to_price()
+
+    assert (a + b).units == 138333
+    assert (a - b) == pa - pb
+    assert a * b == pa * pb
+    assert a / b == pa / pb
+    assert a / 3 == pa / 3
+    assert a * 1.5 == pa * 1.5
+    assert FixedPrice.from_float(0.1) + FixedPrice.from_float(0.2) == FixedPrice.from_float(0.3)
+
+
+def test_interoperates_with_price():
+    fixed = FixedPrice.from_float(123.45)
+    price = Price.from_float(123.45)
+
+    assert fixed == price and price == fixed
+    assert hash(fixed) == hash(price)
+    assert fixed.value == price.value == Decimal("123.4500")
+    assert fixed.to_float() == price.to_float()
+    assert price.units == fixed.units == 1_234_500
+    assert Price.from_float(1.0) < fixed <= price
+    assert FixedPrice.from_price(price) == fixed
+    assert str(fixed) == "$123.4500"
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="negative"):
+        FixedPrice.from_float(-0.00001)
+    with pytest.raises(ValueError, match="negative"):
+        FixedPrice(1) - FixedPrice(2)
+    with pytest.raises(ValueError, match="out of range"):
+        FixedPrice(10**18)
+    with pytest.raises(TypeError):
+        FixedPrice(1.5)
+    with pytest.raises(ValueError, match="Invalid price format"):
+        FixedPrice.from_string("abc")
+    with pytest.raises(ValueError, match="zero"):
+        FixedPrice(1) / FixedPrice.zero()
+
+
+def test_backend_lookup_ignores_environment(monkeypatch):
+    monkeypatch.setenv("MARKETPIPE_PRICE_BACKEND", "fixed")
+    assert price_type() is Price
+    assert price_type("fixed") is FixedPrice
+    with pytest.raises(ValueError, match="Unknown price backend"):
+        price_type("float")
+
+
+def test_configured_backend_from_environment(monkeypatch):
+    from marketpipe.config.prices import configured_price_type
+
+    monkeypatch.delenv("MARKETPIPE_PRICE_BACKEND", raising=False)
+    assert configured_price_type() is Price
+    monkeypatch.setenv("MARKETPIPE_PRICE_BACKEND", "fixed")
+    assert configured_price_type() is FixedPrice
+    assert configured_price_type("decimal") is Price
+
+
+@pytest.mark.asyncio
+async def test_fixed_backend_bars_validate_and_store(tmp_path):
+    from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+    from marketpipe.ingestion.infrastructure.fake_adapter import FakeMarketDataAdapter
+    from marketpipe.validation.domain.services import ValidationDomainService
+
+    adapter = FakeMarketDataAdapter(price_backend="fixed")
+    time_range = TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 9))
+    fixed_bars = await adapter.fetch_bars_for_symbol(Symbol("AAPL"), time_range)
+
+    assert all(isinstance(bar.close_price, FixedPrice) for bar in fixed_bars)
+    result = ValidationDomainService().validate_bars("AAPL", fixed_bars)
+    assert result.total == len(fixed_bars) > 0
+    assert not [e for e in result.errors if "price" in e.reason or "OHLC" in e.reason]
+
+    table = ParquetStorageEngine(tmp_path).bars_to_table(fixed_bars)
+    assert table.column("close").to_pylist() == [bar.close_price.to_float() for bar in fixed_bars]
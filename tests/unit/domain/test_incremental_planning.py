@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for incremental ingestion range planning."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from marketpipe.domain.calendar import NS_PER_MINUTE, default_calendar
+from marketpipe.domain.value_objects import TimeRange, Timestamp
+from marketpipe.ingestion.domain.services import IngestionDomainService
+from marketpipe.ingestion.domain.value_objects import PartitionCoverage
+
+TODAY = date(2024, 6, 1)
+
+
+@pytest.fixture
+def service():
+    return IngestionDomainService()
+
+
+def session_coverage(day: date, stale: bool = False, until_ns=None) -> PartitionCoverage:
+    """One bar per session minute, up to ``until_ns`` (default: the close)."""
+    open_ns, close_ns = default_calendar().session_bounds(day)
+    last_ns = (until_ns or close_ns) - NS_PER_MINUTE
+    return PartitionCoverage(
+        trading_day=day,
+        row_count=(last_ns - open_ns) // NS_PER_MINUTE + 1,
+        min_ts_ns=open_ns,
+        max_ts_ns=last_ns,
+        stale=stale,
+    )
+
+
+def covered(*days: date, stale: bool = False) -> dict[date, PartitionCoverage]:
+    return {d: session_coverage(d, stale=stale) for d in days}
+
+
+def week() -> TimeRange:
+    # Monday 2024-01-08 through Friday 2024-01-12 (end exclusive)
+    return TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 13))
+
+
+def as_dates(ranges: list[TimeRange]) -> list[tuple[date, date]]:
+    return [(r.start.value.date(), r.end.value.date()) for r in ranges]
+
+
+def test_empty_storage_fetches_whole_range(service):
+    ranges = service.plan_incremental_ranges(week(), {}, today=TODAY)
+
+    assert as_dates(ranges) == [(date(2024, 1, 8), date(2024, 1, 13))]
+
+
+def test_fully_covered_range_fetches_nothing(service):
+    days = [date(2024, 1, d) for d in range(8, 13)]
+    assert service.plan_incremental_ranges(week(), covered(*days), today=TODAY) == []
+
+
+def test_gaps_are_merged_into_runs(service):
+    coverage = covered(date(2024, 1, 8), date(2024, 1, 11))
+
+    ranges = service.plan_incremental_ranges(week(), coverage, today=TODAY)
+
+    assert as_dates(ranges) == [
+        (date(2024, 1, 9), date(2024, 1, 11)),
+        (date(2024, 1, 12), date(2024, 1, 13)),
+    ]
+
+
+def test_weekends_do_not_split_runs(service):
+    # Friday and the following Monday missing, weekend in between
+    time_range = TimeRange.from_dates(date(2024, 1, 18), date(2024, 1, 23))
+    coverage = covered(date(2024, 1, 18))
+
+    ranges = service.plan_incremental_ranges(time_range, coverage, today=TODAY)
+
+    assert as_dates(ranges) == [(date(2024, 1, 19), date(2024, 1, 23))]
+
+
+def test_holidays_are_not_fetched(service):
+    # Friday missing, then a weekend and Martin Luther King Jr. Day
+    time_range = TimeRange.from_dates(date(2024, 1, 11), date(2024, 1, 16))
+    coverage = covered(date(2024, 1, 11))
+
+    ranges = service.plan_incremental_ranges(time_range, coverage, today=TODAY)
+
+    assert as_dates(ranges) == [(date(2024, 1, 12), date(2024, 1, 13))]
+
+
+def test_stale_and_current_days_are_refetched(service):
+    days = [date(2024, 1, d) for d in range(8, 13)]
+    coverage = {**covered(*days), **covered(date(2024, 1, 9), stale=True)}
+
+    ranges = service.plan_incremental_ranges(week(), coverage, today=date(2024, 1, 12))
+
+    assert as_dates(ranges) == [
+        (date(2024, 1, 9), date(2024, 1, 10)),
+        (date(2024, 1, 12), date(2024, 1, 13)),
+    ]
+
+
+def test_ranges_are_clipped_to_request(service):
+    time_range = TimeRange(
+        Timestamp(datetime(2024, 1, 8, 14, 30, tzinfo=timezone.utc)),
+        Timestamp(datetime(2024, 1, 9, 16, 0, tzinfo=timezone.utc)),
+    )
+
+    (only,) = service.plan_incremental_ranges(time_range, {}, today=TODAY)
+
+    assert only.start.value == time_range.start.value
+    assert only.end.value == time_range.end.value
+
+
+def test_partly_fetched_day_is_refetched(service):
+    days = [date(2024, 1, d) for d in range(8, 13)]
+    open_ns, _ = default_calendar().session_bounds(date(2024, 1, 10))
+    # A run that died two hours into the session
+    coverage = {
+        **covered(*days),
+        date(2024, 1, 10): session_coverage(
+            date(2024, 1, 10), until_ns=open_ns + 120 * NS_PER_MINUTE
+        ),
+    }
+
+    ranges = service.plan_incremental_ranges(week(), coverage, today=TODAY)
+
+    assert as_dates(ranges) == [(date(2024, 1, 10), date(2024, 1, 11))]
+
+
+def test_sparse_day_is_refetched(service):
+    day = date(2024, 1, 9)
+    open_ns, close_ns = default_calendar().session_bounds(day)
+    # First and last bar present, but a page of the session missing
+    sparse = PartitionCoverage(
+        trading_day=day, row_count=40, min_ts_ns=open_ns, max_ts_ns=close_ns - NS_PER_MINUTE
+    )
+
+    assert day not in service.covered_days(week(), {day: sparse}, today=TODAY)
+
+
+def test_coverage_is_compared_with_the_requested_window(service):
+    day = date(2024, 1, 8)
+    open_ns, _ = default_calendar().session_bounds(day)
+    until_ns = open_ns + 60 * NS_PER_MINUTE
+    # The first session hour is stored and only the first session hour is requested
+    time_range = TimeRange(
+        Timestamp(datetime.fromtimestamp(open_ns / 1e9, tz=timezone.utc)),
+        Timestamp(datetime.fromtimestamp(until_ns / 1e9, tz=timezone.utc)),
+    )
+    coverage = {day: session_coverage(day, until_ns=until_ns)}
+
+    assert service.plan_incremental_ranges(time_range, coverage, today=TODAY) == []
+    assert (
+        service.plan_incremental_ranges(week(), coverage, today=TODAY)[0].start.value.date() == day
+    )
+
+
+def test_coverage_uses_the_timeframe(service):
+    day = date(2024, 1, 8)
+    open_ns, close_ns = default_calendar().session_bounds(day)
+    # 78 five-minute bars are a full session; as one-minute bars they are too few
+    five_minute = PartitionCoverage(
+        trading_day=day, row_count=78, min_ts_ns=open_ns, max_ts_ns=close_ns - 5 * NS_PER_MINUTE
+    )
+
+    assert day in service.covered_days(week(), {day: five_minute}, TODAY, frame_seconds=300)
+    assert day not in service.covered_days(week(), {day: five_minute}, TODAY, frame_seconds=60)
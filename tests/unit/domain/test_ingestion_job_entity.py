@@ -314,6 +314,19 @@ class TestIngestionJobDomainEvents:
         assert event.bars_processed == 100
         assert event.partition == partition
 
+    def test_symbol_without_partition_emits_no_batch_event(self):
+        """Test that a symbol with nothing written (already stored) raises no batch event."""
+        job = create_test_ingestion_job()
+        job.start()
+        job.clear_domain_events()  # Clear start event
+
+        symbol = job.symbols[0]
+        job.mark_symbol_processed(symbol, 0, None)
+
+        assert symbol in job.processed_symbols
+        assert job.completed_partitions == []
+        assert not any(isinstance(e, IngestionBatchProcessed) for e in job.domain_events)
+
     def test_emits_job_completed_event_when_job_finishes(self):
         """Test that completing a job emits IngestionJobCompleted event."""
         job = create_test_ingestion_job()
@@ -340,21 +340,28 @@ class TestSymbolBarsAggregate:
 
     def test_has_gaps_detection(self, aggregate, symbol):
         """Test gap detection in trading data."""
+        # 2024-01-15 is a market holiday: no session, so no minutes are expected
+        holiday = aggregate
+        aggregate = SymbolBarsAggregate(symbol, date(2024, 1, 16))
         # Add only a few bars (much less than expected 390 minutes)
         for minute in range(3):
-            bar = OHLCVBar(
-                id=EntityId.generate(),
-                symbol=symbol,
-                timestamp=Timestamp(datetime(2024, 1, 15, 9, 30 + minute, 0, tzinfo=timezone.utc)),
-                open_price=Price(Decimal("100.00")),
-                high_price=Price(Decimal("100.00")),
-                low_price=Price(Decimal("100.00")),
-                close_price=Price(Decimal("100.00")),
-                volume=Volume(1000),
-            )
-            aggregate.add_bar(bar)
+            for target, day in ((holiday, 15), (aggregate, 16)):
+                bar = OHLCVBar(
+                    id=EntityId.generate(),
+                    symbol=symbol,
+                    timestamp=Timestamp(
+                        datetime(2024, 1, day, 14, 30 + minute, 0, tzinfo=timezone.utc)
+                    ),
+                    open_price=Price(Decimal("100.00")),
+                    high_price=Price(Decimal("100.00")),
+                    low_price=Price(Decimal("100.00")),
+                    close_price=Price(Decimal("100.00")),
+                    volume=Volume(1000),
+                )
+                target.add_bar(bar)
 
         assert aggregate.has_gaps()  # Should detect gaps with only 3 bars
+        assert not holiday.has_gaps()
 
     def test_event_creation_and_commitment(self, aggregate, sample_bar):
         """Test that events are created correctly and can be committed."""
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for consistent-hash symbol sharding."""
+
+from __future__ import annotations
+
+import itertools
+import string
+import subprocess
+import sys
+
+import pytest
+
+from marketpipe.ingestion.domain.sharding import (
+    ConsistentHashRing,
+    ShardSpec,
+    select_shard,
+    verify_shard_coverage,
+)
+
+UNIVERSE = ["".join(letters) for letters in itertools.product(string.ascii_uppercase, repeat=3)][
+    :3000
+]
+
+
+def test_shards_partition_the_universe():
+    assignment = ConsistentHashRing(4).assign(UNIVERSE)
+
+    owned = [symbol for symbols in assignment.values() for symbol in symbols]
+    assert sorted(owned) == sorted(UNIVERSE)
+    # Virtual nodes keep every shard within 20% of an even split
+    assert all(abs(len(s) - 750) < 150 for s in assignment.values())
+
+
+@pytest.mark.parametrize("shards", [2, 4, 8])
+def test_adding_a_shard_moves_about_one_nth(shards):
+    before = ConsistentHashRing(shards)
+    after = ConsistentHashRing(shards + 1)
+
+    moved = [s for s in UNIVERSE if before.shard_for(s) != after.shard_for(s)]
+
+    assert len(moved) / len(UNIVERSE) == pytest.approx(1 / (shards + 1), abs=0.05)
+    # Symbols only ever move to the new shard
+    assert {after.shard_for(s) for s in moved} == {shards}
+
+
+def test_assignment_is_stable_across_processes():
+    script = (
+        "from marketpipe.ingestion.domain.sharding import ConsistentHashRing;"
+        "print([ConsistentHashRing(3).shard_for(s) for s in ('AAPL', 'MSFT', 'NVDA', 'SPY')])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    ring = ConsistentHashRing(3)
+    assert out == str([ring.shard_for(s) for s in ("AAPL", "MSFT", "NVDA", "SPY")])
+
+
+def test_select_shard_keeps_input_order():
+    symbols = ["MSFT", "AAPL", "NVDA", "AMZN", "GOOGL", "TSLA"]
+
+    selected = [select_shard(symbols, ShardSpec(i, 3)) for i in range(3)]
+
+    assert sorted(itertools.chain(*selected)) == sorted(symbols)
+    for part in selected:
+        assert part == [s for s in symbols if s in part]
+    assert select_shard(symbols, ShardSpec()) == symbols
+
+
+def test_shard_spec_validation():
+    with pytest.raises(ValueError, match="index"):
+        ShardSpec(index=3, count=3)
+    with pytest.raises(ValueError, match="count"):
+        ShardSpec(index=0, count=0)
+    with pytest.raises(ValueError, match="2-shard ring"):
+        ConsistentHashRing(2).select(["AAPL"], ShardSpec(0, 3))
+
+
+def test_verify_reports_gaps_under_owning_shard():
+    ring = ConsistentHashRing(2)
+    stored = set(UNIVERSE[:100]) - {UNIVERSE[7]}
+
+    report = verify_shard_coverage(UNIVERSE[:100], 2, stored.__contains__)
+
+    gaps = {shard.index: shard.missing for shard in report if shard.missing}
+    assert gaps == {ring.shard_for(UNIVERSE[7]): [UNIVERSE[7]]}
+    assert sum(shard.covered for shard in report) == 99
+
+
+def test_verify_cli_exits_nonzero_on_gaps(tmp_path):
+    from typer.testing import CliRunner
+
+    from marketpipe.cli.shards import shards_app
+
+    (tmp_path / "frame=1m" / "symbol=AAPL").mkdir(parents=True)
+    runner = CliRunner()
+
+    result = runner.invoke(
+        shards_app,
+        ["verify", "-s", "AAPL,MSFT", "-n", "2", "--date", "2026-10-16", "--output", str(tmp_path)],
+    )
+
+    assert result.exit_code == 1
+    assert "2 symbol(s) missing" in result.output
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the precomputed exchange trading calendar."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from marketpipe.config.calendar import CALENDAR_YEARS_ENV, configured_calendar
+from marketpipe.domain.calendar import (
+    NS_PER_MINUTE,
+    TradingCalendar,
+    default_calendar,
+    nyse_early_closes,
+    nyse_holidays,
+)
+from marketpipe.domain.services import TradingCalendarService
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    return TradingCalendar(2015, 2027)
+
+
+def utc_ns(*args) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp()) * 1_000_000_000
+
+
+def test_holidays_match_published_schedules():
+    assert sorted(nyse_holidays(2024)) == [
+        date(2024, 1, 1),
+        date(2024, 1, 15),
+        date(2024, 2, 19),
+        date(2024, 3, 29),
+        date(2024, 5, 27),
+        date(2024, 6, 19),
+        date(2024, 7, 4),
+        date(2024, 9, 2),
+        date(2024, 11, 28),
+        date(2024, 12, 25),
+    ]
+    # Weekend observance: Juneteenth and July 4 on Sunday, Christmas on Saturday
+    assert date(2022, 6, 20) in nyse_holidays(2022)
+    assert date(2021, 7, 5) in nyse_holidays(2021)
+    assert date(2021, 12, 24) in nyse_holidays(2021)
+    # A Saturday New Year's Day is not observed (2021-12-31 traded)
+    assert date(2021, 12, 31) not in nyse_holidays(2021)
+    assert date(2022, 1, 1) not in nyse_holidays(2022)
+    # Juneteenth only from 2022; special closures
+    assert date(2021, 6, 18) not in nyse_holidays(2021)
+    assert nyse_holidays(2018)[date(2018, 12, 5)].startswith("Bush")
+    assert nyse_holidays(2025)[date(2025, 4, 18)] == "Good Friday"
+
+
+def test_early_closes():
+    assert nyse_early_closes(2024) == {date(2024, 7, 3), date(2024, 11, 29), date(2024, 12, 24)}
+    # July 3 on a Friday is the observed holiday, Dec 24 on a Saturday is not a session
+    assert nyse_early_closes(2020) == {date(2020, 11, 27), date(2020, 12, 24)}
+    assert nyse_early_closes(2022) == {date(2022, 11, 25)}
+
+
+def test_session_bounds_follow_dst(calendar):
+    # 09:30 New York is 14:30 UTC in winter and 13:30 UTC in summer
+    assert calendar.session_bounds(date(2024, 3, 8)) == (
+        utc_ns(2024, 3, 8, 14, 30),
+        utc_ns(2024, 3, 8, 21, 0),
+    )
+    assert calendar.session_bounds(date(2024, 3, 11)) == (
+        utc_ns(2024, 3, 11, 13, 30),
+        utc_ns(2024, 3, 11, 20, 0),
+    )
+    assert calendar.session_bounds(date(2024, 11, 29))[1] == utc_ns(2024, 11, 29, 18, 0)
+    assert calendar.utc_offset(date(2024, 7, 1)) == timedelta(hours=-4)
+    # Closed days keep the nominal open and an empty session
+    opening, closing = calendar.session_bounds(date(2024, 1, 15))
+    assert opening == closing == utc_ns(2024, 1, 15, 14, 30)
+
+
+def test_session_mask_and_expected_bars(calendar):
+    ts = np.array(
+        [
+            utc_ns(2024, 1, 16, 14, 29),  # before the open
+            utc_ns(2024, 1, 16, 14, 30),  # open
+            utc_ns(2024, 1, 16, 20, 59),  # last minute
+            utc_ns(2024, 1, 16, 21, 0),  # close
+            utc_ns(2024, 1, 15, 15, 0),  # holiday
+            utc_ns(2024, 1, 13, 15, 0),  # Saturday
+            utc_ns(2024, 7, 3, 16, 59),  # early close, last minute
+            utc_ns(2024, 7, 3, 17, 0),  # early close
+        ]
+    )
+
+    assert calendar.session_mask(ts).tolist() == [
+        False,
+        True,
+        True,
+        False,
+        False,
+        False,
+        True,
+        False,
+    ]
+    days = [date(2024, 1, 16), date(2024, 1, 15), date(2024, 7, 3), date(2024, 1, 13)]
+    assert calendar.expected_bars(days).tolist() == [390, 0, 210, 0]
+    assert calendar.expected_bars(days, frame_seconds=300).tolist() == [78, 0, 42, 0]
+    assert calendar.expected_bars(np.array([19738])).tolist() == [390]  # epoch day of 2024-01-16
+
+
+def test_next_and_previous_sessions(calendar):
+    assert calendar.next_trading_day(date(2024, 1, 12)) == date(2024, 1, 16)
+    assert calendar.previous_trading_day(date(2024, 1, 16)) == date(2024, 1, 12)
+    assert calendar.next_trading_day(date(2024, 12, 24)) == date(2024, 12, 26)
+    assert calendar.previous_trading_day(date(2024, 12, 28)) == date(2024, 12, 27)
+    assert calendar.trading_days(date(2024, 12, 23), date(2024, 12, 29)) == [
+        date(2024, 12, 23),
+        date(2024, 12, 24),
+        date(2024, 12, 26),
+        date(2024, 12, 27),
+    ]
+    # 252 sessions in 2024
+    assert len(calendar.trading_days(date(2024, 1, 1), date(2024, 12, 31))) == 252
+
+
+def test_lookups_outside_span_raise(calendar):
+    with pytest.raises(ValueError, match="outside trading calendar span"):
+        calendar.is_trading_day(date(2030, 1, 2))
+    with pytest.raises(ValueError, match="outside trading calendar span"):
+        calendar.session_mask([utc_ns(2014, 6, 2, 15, 0)])
+    table = calendar.session_table([0, 16_800, 16_800])  # 1970-01-01 and 2015-12-31
+    assert table["day"].tolist() == [16_800]
+    assert (table["open_ns"] - table["day"] * 86_400 * 10**9).tolist() == [870 * NS_PER_MINUTE]
+
+
+def test_default_calendar_span(monkeypatch):
+    monkeypatch.setenv(CALENDAR_YEARS_ENV, "2020-2021")
+    assert default_calendar().span == (date(2000, 1, 1), date(2040, 12, 31))
+    assert default_calendar((2020, 2021)).span == (date(2020, 1, 1), date(2021, 12, 31))
+
+
+def test_configured_calendar_span_from_env(monkeypatch):
+    monkeypatch.setenv(CALENDAR_YEARS_ENV, "2020-2021")
+    assert configured_calendar().span == (date(2020, 1, 1), date(2021, 12, 31))
+    monkeypatch.setenv(CALENDAR_YEARS_ENV, "recent")
+    with pytest.raises(ValueError, match=CALENDAR_YEARS_ENV):
+        configured_calendar()
+
+
+def test_service_uses_calendar_with_fallback(calendar):
+    service = TradingCalendarService(calendar)
+
+    assert not service.is_trading_day(date(2024, 1, 15))
+    assert service.get_next_trading_day(date(2024, 1, 12)) == date(2024, 1, 16)
+    times = service.get_trading_session_times(date(2024, 7, 3))
+    assert times["regular_close"].hour == 13 and times["post_market_close"].hour == 17
+    assert times["regular_open"].utcoffset() == timedelta(hours=-4)
+    # Outside the span: weekday rules
+    assert service.is_trading_day(date(2030, 1, 1))
+    assert service.get_previous_trading_day(date(2031, 1, 6)) == date(2031, 1, 3)
@@ -31,7 +31,7 @@ def valid_bar(symbol):
     return OHLCVBar(
         id=EntityId.generate(),
         symbol=symbol,
-        timestamp=Timestamp(datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)),  # 9:30 AM ET
+        timestamp=Timestamp(datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)),  # 9:30 AM ET
         open_price=Price(Decimal("100.00")),
         high_price=Price(Decimal("101.00")),
         low_price=Price(Decimal("99.50")),
@@ -46,7 +46,7 @@ def valid_bar(symbol):
 def valid_bars(symbol):
     """List of valid OHLCV bars for batch testing."""
     bars = []
-    base_time = datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)  # 9:30 AM ET
+    base_time = datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)  # 9:30 AM ET
 
     for i in range(3):
         bar = OHLCVBar(
@@ -79,7 +79,7 @@ class TestMarketDataValidationService:
         reasonable_bar = OHLCVBar(
             id=EntityId.generate(),
             symbol=symbol,
-            timestamp=Timestamp(datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)),
+            timestamp=Timestamp(datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)),
             open_price=Price(Decimal("100.00")),
             high_price=Price(Decimal("101.00")),
             low_price=Price(Decimal("99.50")),
@@ -113,7 +113,7 @@ class TestMarketDataValidationService:
             id=EntityId.generate(),
             symbol=symbol,
             timestamp=Timestamp(
-                datetime(2024, 1, 15, 22, 30, 0, tzinfo=timezone.utc)
+                datetime(2024, 1, 16, 22, 30, 0, tzinfo=timezone.utc)
             ),  # 10:30 PM UTC = 5:30 PM ET (after hours)
             open_price=Price(Decimal("100.00")),
             high_price=Price(Decimal("101.00")),
@@ -132,7 +132,7 @@ class TestMarketDataValidationService:
             id=EntityId.generate(),
             symbol=symbol,
             timestamp=Timestamp(
-                datetime(2024, 1, 15, 8, 0, 0, tzinfo=timezone.utc)
+                datetime(2024, 1, 16, 8, 0, 0, tzinfo=timezone.utc)
             ),  # 8:00 AM UTC (too early)
             open_price=Price(Decimal("100.00")),
             high_price=Price(Decimal("101.00")),
@@ -161,7 +161,7 @@ class TestMarketDataValidationService:
             OHLCVBar(
                 id=EntityId.generate(),
                 symbol=symbol,
-                timestamp=Timestamp(datetime(2024, 1, 15, 14, 31, 0, tzinfo=timezone.utc)),  # Later
+                timestamp=Timestamp(datetime(2024, 1, 16, 14, 31, 0, tzinfo=timezone.utc)),  # Later
                 open_price=Price(Decimal("100.00")),
                 high_price=Price(Decimal("101.00")),
                 low_price=Price(Decimal("99.50")),
@@ -172,7 +172,7 @@ class TestMarketDataValidationService:
                 id=EntityId.generate(),
                 symbol=symbol,
                 timestamp=Timestamp(
-                    datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)
+                    datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)
                 ),  # Earlier
                 open_price=Price(Decimal("101.00")),
                 high_price=Price(Decimal("102.00")),
@@ -192,7 +192,7 @@ class TestMarketDataValidationService:
             OHLCVBar(
                 id=EntityId.generate(),
                 symbol=symbol,
-                timestamp=Timestamp(datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)),
+                timestamp=Timestamp(datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)),
                 open_price=Price(Decimal("100.00")),
                 high_price=Price(Decimal("100.00")),
                 low_price=Price(Decimal("100.00")),
@@ -202,7 +202,7 @@ class TestMarketDataValidationService:
             OHLCVBar(
                 id=EntityId.generate(),
                 symbol=symbol,
-                timestamp=Timestamp(datetime(2024, 1, 15, 14, 31, 0, tzinfo=timezone.utc)),
+                timestamp=Timestamp(datetime(2024, 1, 16, 14, 31, 0, tzinfo=timezone.utc)),
                 open_price=Price(Decimal("200.00")),  # 100% increase
                 high_price=Price(Decimal("200.00")),
                 low_price=Price(Decimal("200.00")),
@@ -221,7 +221,7 @@ class TestMarketDataValidationService:
             OHLCVBar(
                 id=EntityId.generate(),
                 symbol=symbol,
-                timestamp=Timestamp(datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)),
+                timestamp=Timestamp(datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)),
                 open_price=Price(Decimal("100.00")),
                 high_price=Price(Decimal("100.00")),
                 low_price=Price(Decimal("100.00")),
@@ -231,7 +231,7 @@ class TestMarketDataValidationService:
             OHLCVBar(
                 id=EntityId.generate(),
                 symbol=symbol,
-                timestamp=Timestamp(datetime(2024, 1, 15, 14, 31, 0, tzinfo=timezone.utc)),
+                timestamp=Timestamp(datetime(2024, 1, 16, 14, 31, 0, tzinfo=timezone.utc)),
                 open_price=Price(Decimal("100.00")),
                 high_price=Price(Decimal("101.00")),
                 low_price=Price(Decimal("100.00")),
@@ -247,7 +247,7 @@ class TestMarketDataValidationService:
     def test_validate_batch_with_sustained_zero_volume_returns_errors(self, service, symbol):
         """Test that sustained zero volume is caught."""
         bars = []
-        base_time = datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)
+        base_time = datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)
 
         # Create 6 bars with zero volume (should trigger warning at 5+)
         for i in range(6):
@@ -270,7 +270,7 @@ class TestMarketDataValidationService:
     def test_validate_batch_with_extreme_volume_spike_returns_errors(self, service, symbol):
         """Test that extreme volume spikes are caught."""
         bars = []
-        base_time = datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)
+        base_time = datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)
 
         # Create 15 bars with normal volume
         for i in range(15):
@@ -315,7 +315,7 @@ class TestMarketDataValidationService:
             OHLCVBar(
                 id=EntityId.generate(),
                 symbol=symbol,
-                timestamp=Timestamp(datetime(2024, 1, 15, 14, 31, 0, tzinfo=timezone.utc)),  # Later
+                timestamp=Timestamp(datetime(2024, 1, 16, 14, 31, 0, tzinfo=timezone.utc)),  # Later
                 open_price=Price(Decimal("100.00")),
                 high_price=Price(Decimal("101.00")),
                 low_price=Price(Decimal("99.50")),
@@ -326,7 +326,7 @@ class TestMarketDataValidationService:
                 id=EntityId.generate(),
                 symbol=symbol,
                 timestamp=Timestamp(
-                    datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)
+                    datetime(2024, 1, 16, 14, 30, 0, tzinfo=timezone.utc)
                 ),  # Earlier
                 open_price=Price(Decimal("101.00")),
                 high_price=Price(Decimal("102.00")),
@@ -357,7 +357,7 @@ class TestMarketDataValidationService:
         extended_hours_bar = OHLCVBar(
             id=EntityId.generate(),
             symbol=symbol,
-            timestamp=Timestamp(datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)),  # 7:00 AM ET
+            timestamp=Timestamp(datetime(2024, 1, 16, 12, 0, 0, tzinfo=timezone.utc)),  # 7:00 AM ET
             open_price=Price(Decimal("100.00")),
             high_price=Price(Decimal("101.00")),
             low_price=Price(Decimal("99.50")),
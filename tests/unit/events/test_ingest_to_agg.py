@@ -31,7 +31,7 @@ def test_subscribe_and_publish(monkeypatch):
     InMemoryEventBus.clear_subscriptions()
 
     # Register aggregation service
-    AggregationRunnerService.register()
+    stage = AggregationRunnerService.register()
 
     # Mock the record_metric function to avoid metrics issues
     with patch("marketpipe.metrics.record_metric"):
@@ -48,6 +48,8 @@ def test_subscribe_and_publish(monkeypatch):
                     success=True,
                 )
             )
+            # Aggregation runs on the stage pool, off the publisher
+            stage.drain()
 
     # Verify the job was processed
     assert called == ["job-x"]
@@ -73,7 +75,7 @@ def test_aggregation_service_handles_multiple_events(monkeypatch):
     InMemoryEventBus.clear_subscriptions()
 
     # Register service
-    AggregationRunnerService.register()
+    stage = AggregationRunnerService.register()
 
     # Mock the record_metric function to avoid metrics issues
     with patch("marketpipe.metrics.record_metric"):
@@ -108,6 +110,7 @@ def test_aggregation_service_handles_multiple_events(monkeypatch):
                     success=True,
                 )
             )
+            stage.drain()
 
     # Verify all jobs were processed
     assert called_jobs == ["job-1", "job-2", "job-3"]
@@ -135,7 +138,7 @@ def test_aggregation_service_error_handling(monkeypatch):
     InMemoryEventBus.clear_subscriptions()
 
     # Register service
-    AggregationRunnerService.register()
+    stage = AggregationRunnerService.register()
 
     # Mock the record_metric function to avoid metrics issues
     with patch("marketpipe.metrics.record_metric"):
@@ -163,6 +166,7 @@ def test_aggregation_service_error_handling(monkeypatch):
             except Exception:
                 # This is expected due to re-raising in the service
                 pass
+            stage.drain()
 
     # Verify error was processed (the mock was called)
     assert error_count == 1
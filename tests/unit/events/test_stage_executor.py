@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for running post-ingestion stages off the event publisher."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from marketpipe.domain.events import IngestionJobCompleted
+from marketpipe.domain.value_objects import Symbol
+from marketpipe.infrastructure.messaging.in_memory_bus import InMemoryEventBus
+from marketpipe.infrastructure.messaging.stage_executor import (
+    STAGE_EVENTS,
+    StageExecutor,
+    StageSettings,
+)
+
+PARENT_PID = os.getpid()
+
+
+def completed(job_id: str) -> IngestionJobCompleted:
+    return IngestionJobCompleted(
+        job_id=job_id,
+        symbol=Symbol("AAPL"),
+        trading_date=date(2024, 1, 15),
+        bars_processed=10,
+        success=True,
+    )
+
+
+def fail_in_parent(event) -> None:
+    if os.getpid() == PARENT_PID:
+        raise RuntimeError("handler ran in the publishing process")
+
+
+def outcome_count(stage: str, outcome: str) -> float:
+    return STAGE_EVENTS.labels(stage=stage, outcome=outcome)._value.get()
+
+
+class TestStageExecutor:
+    def test_publish_returns_before_handler_finishes(self):
+        release = threading.Event()
+        handled = []
+
+        def slow_handler(event):
+            release.wait(5)
+            handled.append(event.job_id)
+
+        stage = StageExecutor("slow", slow_handler, StageSettings(mode="thread"))
+        bus = InMemoryEventBus()
+        InMemoryEventBus.clear_subscriptions()
+        bus.subscribe(IngestionJobCompleted, stage)
+
+        started = time.monotonic()
+        bus.publish(completed("job-1"))
+
+        assert time.monotonic() - started < 1
+        assert stage.pending == 1
+        release.set()
+        assert stage.drain(timeout=5)
+        assert handled == ["job-1"]
+        InMemoryEventBus.clear_subscriptions()
+
+    def test_repeated_events_for_a_job_run_once(self):
+        release = threading.Event()
+        handled = []
+
+        def handler(event):
+            release.wait(5)
+            handled.append(event.job_id)
+
+        stage = StageExecutor("dedupe", handler, StageSettings(mode="thread", workers=2))
+        before = outcome_count("dedupe", "deduplicated")
+
+        first = stage.submit(completed("job-1"))
+        duplicate = stage.submit(completed("job-1"))
+        stage.submit(completed("job-2"))
+        release.set()
+        stage.drain(timeout=5)
+
+        assert duplicate is first
+        assert sorted(handled) == ["job-1", "job-2"]
+        assert outcome_count("dedupe", "deduplicated") - before == 1
+
+        # Once finished, the job can be handled again
+        stage.submit(completed("job-1")).result(timeout=5)
+        assert handled.count("job-1") == 2
+
+    def test_submit_blocks_when_stage_is_full(self):
+        release = threading.Event()
+        stage = StageExecutor(
+            "bounded", lambda e: release.wait(5), StageSettings(mode="thread", max_pending=1)
+        )
+        stage.submit(completed("job-1"))
+        submitted = threading.Event()
+
+        def submit_second():
+            stage.submit(completed("job-2"))
+            submitted.set()
+
+        threading.Thread(target=submit_second, daemon=True).start()
+
+        assert not submitted.wait(0.2)
+        release.set()
+        assert submitted.wait(5)
+        assert stage.drain(timeout=5)
+
+    def test_submit_with_timeout_fails_when_stage_is_full(self):
+        release = threading.Event()
+        stage = StageExecutor(
+            "bounded_timeout",
+            lambda e: release.wait(5),
+            StageSettings(mode="thread", max_pending=1),
+        )
+        stage.submit(completed("job-1"))
+
+        with pytest.raises(TimeoutError, match="bounded_timeout"):
+            stage.submit(completed("job-2"), timeout=0)
+        with pytest.raises(TimeoutError):
+            stage.submit(completed("job-2"), timeout=0.05)
+
+        release.set()
+        assert stage.drain(timeout=5)
+        assert stage.submit(completed("job-2"), timeout=0).result(5) is True
+
+    @pytest.mark.asyncio
+    async def test_submit_async_waits_without_blocking_the_loop(self):
+        release = threading.Event()
+        stage = StageExecutor(
+            "bounded_async", lambda e: release.wait(5), StageSettings(mode="thread", max_pending=1)
+        )
+        await stage.submit_async(completed("job-1"))
+        second = asyncio.ensure_future(stage.submit_async(completed("job-2")))
+
+        # The loop keeps running while the second event waits for a slot
+        await asyncio.sleep(0.2)
+        assert not second.done()
+        release.set()
+        future = await asyncio.wait_for(second, 5)
+        assert future.result(5) is True
+        assert stage.drain(timeout=5)
+
+    def test_handler_errors_are_counted_not_raised(self):
+        def broken(event):
+            raise ValueError("boom")
+
+        stage = StageExecutor("broken", broken, StageSettings(mode="thread"))
+        before = outcome_count("broken", "failed")
+
+        future = stage.submit(completed("job-1"))
+        stage.drain(timeout=5)
+
+        with pytest.raises(ValueError, match="boom"):
+            future.result()
+        assert outcome_count("broken", "failed") - before == 1
+        assert stage.pending == 0
+
+    def test_inline_mode_runs_in_publisher(self):
+        threads = []
+        stage = StageExecutor(
+            "inline", lambda e: threads.append(threading.get_ident()), StageSettings(mode="inline")
+        )
+
+        stage(completed("job-1"))
+
+        assert threads == [threading.get_ident()]
+
+    def test_process_mode_runs_in_worker_process(self):
+        stage = StageExecutor("process", fail_in_parent, StageSettings(mode="process"))
+
+        stage.submit(completed("job-1")).result(timeout=30)
+        stage.shutdown()
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            stage.submit(completed("job-2"))
+
+
+class TestStageSettings:
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("MARKETPIPE_AGGREGATION_STAGE_MODE", "Process")
+        monkeypatch.setenv("MARKETPIPE_AGGREGATION_STAGE_WORKERS", "3")
+
+        settings = StageSettings.from_env("aggregation")
+
+        assert (settings.mode, settings.workers, settings.max_pending) == ("process", 3, 64)
+
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError, match="Unknown stage mode"):
+            StageSettings(mode="fiber")
@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for Parquet partition compaction."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from marketpipe.infrastructure.storage.compaction import (
+    CompactionPolicy,
+    CompactionScheduler,
+    IOThrottle,
+    ParquetCompactor,
+)
+from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+
+TODAY = date(2024, 3, 15)
+
+
+def day_frame(day: date, rows: int = 3, price: float = 100.0) -> pd.DataFrame:
+    base = int(datetime(day.year, day.month, day.day, 14, 30, tzinfo=timezone.utc).timestamp())
+    ts = [(base + 60 * i) * 1_000_000_000 for i in range(rows)]
+    return pd.DataFrame(
+        {
+            "ts_ns": ts,
+            "open": [price] * rows,
+            "high": [price + 1] * rows,
+            "low": [price - 1] * rows,
+            "close": [price] * rows,
+            "volume": [1000] * rows,
+            "symbol": ["AAPL"] * rows,
+        }
+    )
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> ParquetStorageEngine:
+    engine = ParquetStorageEngine(tmp_path)
+    # Written in reverse so compaction has to sort
+    for day in (date(2024, 1, 4), date(2024, 1, 3), date(2024, 1, 2), date(2024, 2, 1)):
+        engine.write(
+            day_frame(day), frame="1m", symbol="AAPL", trading_day=day, job_id=f"AAPL_{day}"
+        )
+    return engine
+
+
+@pytest.fixture
+def compactor(tmp_path: Path) -> ParquetCompactor:
+    return ParquetCompactor(tmp_path)
+
+
+def symbol_dir(root: Path) -> Path:
+    return root / "frame=1m" / "symbol=AAPL"
+
+
+class TestCompactionPlan:
+    def test_groups_days_into_month_buckets(self, engine, compactor):
+        tasks = compactor.plan(today=TODAY)
+
+        assert [(t.label, len(t.source_files)) for t in tasks] == [("2024-01", 3)]
+
+    def test_open_bucket_is_skipped(self, engine, compactor):
+        assert compactor.plan(today=date(2024, 1, 20)) == []
+
+    def test_stale_day_blocks_bucket(self, engine, compactor):
+        engine.mark_stale("1m", "AAPL", date(2024, 1, 3))
+
+        assert compactor.plan(today=TODAY) == []
+
+    def test_filters(self, engine, compactor):
+        assert compactor.plan(frames=["5m"], today=TODAY) == []
+        assert compactor.plan(symbols=["msft"], today=TODAY) == []
+        assert len(compactor.plan(symbols=["aapl"], today=TODAY)) == 1
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError, match="granularity"):
+            CompactionPolicy(granularity="week")
+
+
+class TestCompaction:
+    def test_merges_sorted_and_removes_sources(self, engine, compactor, tmp_path):
+        (result,) = compactor.run(today=TODAY)
+
+        assert result.rows == 9
+        assert (
+            result.output_path
+            == symbol_dir(tmp_path) / "date=2024-01" / "AAPL_2024-01.compacted.parquet"
+        )
+        assert sorted(p.name for p in symbol_dir(tmp_path).iterdir() if p.is_dir()) == [
+            "date=2024-01",
+            "date=2024-02-01",
+        ]
+
+        table = pq.read_table(result.output_path)
+        ts = table.column("ts_ns").to_pylist()
+        assert ts == sorted(ts)
+        assert pq.ParquetFile(result.output_path).metadata.row_group(0).sorting_columns
+
+    def test_readers_see_same_data_after_compaction(self, engine, compactor):
+        before = engine.load_symbol_data("AAPL", "1m").reset_index(drop=True)
+        coverage_before = engine.partition_coverage("1m", "AAPL")
+
+        compactor.run(today=TODAY)
+
+        after = engine.load_symbol_data("AAPL", "1m").reset_index(drop=True)
+        pd.testing.assert_frame_equal(before, after, check_dtype=False)
+        assert engine.partition_coverage("1m", "AAPL") == coverage_before
+        assert len(engine.load_partition("1m", "AAPL", date(2024, 1, 3))) == 3
+        window = engine.load_symbol_data(
+            "AAPL", "1m", start_date=date(2024, 1, 3), end_date=date(2024, 1, 3)
+        )
+        assert len(window) == 3
+
+    def test_views_and_list_jobs_over_compacted_tree(
+        self, engine, compactor, tmp_path, monkeypatch
+    ):
+        from marketpipe.aggregation.infrastructure import duckdb_views
+
+        compactor.run(today=TODAY)
+        monkeypatch.setattr(duckdb_views, "AGG_ROOT", tmp_path)
+        duckdb_views._attach_partition("1m")
+        rows = (
+            duckdb_views._get_connection()
+            .execute("SELECT date, typeof(date), count(*) FROM bars_1m GROUP BY ALL ORDER BY date")
+            .fetchall()
+        )
+
+        assert rows == [
+            (date(2024, 1, 2), "DATE", 3),
+            (date(2024, 1, 3), "DATE", 3),
+            (date(2024, 1, 4), "DATE", 3),
+            (date(2024, 2, 1), "DATE", 3),
+        ]
+        assert engine.list_jobs("1m", "AAPL") == ["AAPL_2024-02-01"]
+
+    def test_second_pass_is_noop(self, engine, compactor):
+        compactor.run(today=TODAY)
+
+        assert compactor.run(today=TODAY) == []
+
+    def test_dry_run_changes_nothing(self, engine, compactor, tmp_path):
+        before = sorted(symbol_dir(tmp_path).rglob("*.parquet"))
+
+        (result,) = compactor.run(dry_run=True, today=TODAY)
+
+        assert result.bytes_written == 0
+        assert sorted(symbol_dir(tmp_path).rglob("*.parquet")) == before
+
+    def test_overwrite_after_compaction_replaces_day(self, engine, compactor):
+        compactor.run(today=TODAY)
+
+        day = date(2024, 1, 3)
+        engine.write(
+            day_frame(day, rows=2, price=200.0),
+            frame="1m",
+            symbol="AAPL",
+            trading_day=day,
+            job_id=f"AAPL_{day}",
+            overwrite=True,
+        )
+
+        partition = engine.load_partition("1m", "AAPL", day)
+        assert len(partition) == 2
+        assert set(partition["open"]) == {200.0}
+        assert len(engine.load_symbol_data("AAPL", "1m")) == 2 + 3 + 3 + 3
+
+    def test_append_after_compaction_keeps_compacted_rows(self, engine, compactor, tmp_path):
+        compactor.run(today=TODAY)
+
+        day = date(2024, 1, 3)
+        engine.write(
+            day_frame(day, rows=1, price=200.0),
+            frame="1m",
+            symbol="AAPL",
+            trading_day=day,
+            job_id="other-job",
+        )
+
+        restored = symbol_dir(tmp_path) / "date=2024-01-03" / "AAPL_2024-01-03.compacted.parquet"
+        assert restored.exists()
+        assert len(engine.load_partition("1m", "AAPL", day)) == 4
+
+    def test_write_racing_compaction_releases_day(self, engine, compactor, tmp_path, monkeypatch):
+        day = date(2024, 1, 3)
+        commit = engine._commit_partition_file
+
+        def commit_after_compaction(*args, **kwargs):
+            # Compaction runs between the writer's bucket check and its commit
+            compactor.run(today=TODAY)
+            return commit(*args, **kwargs)
+
+        monkeypatch.setattr(engine, "_commit_partition_file", commit_after_compaction)
+        path = engine.write(
+            day_frame(day, rows=1, price=200.0),
+            frame="1m",
+            symbol="AAPL",
+            trading_day=day,
+            job_id="other-job",
+        )
+
+        assert path.exists()
+        restored = symbol_dir(tmp_path) / "date=2024-01-03" / "AAPL_2024-01-03.compacted.parquet"
+        assert restored.exists()
+        assert len(engine.load_partition("1m", "AAPL", day)) == 4
+        assert len(engine.load_symbol_data("AAPL", "1m")) == 13
+
+    def test_lock_files_stay_outside_partition_tree(self, engine, compactor, tmp_path):
+        assert not (tmp_path / ParquetStorageEngine.LOCK_DIR).exists()
+
+        compactor.run(today=TODAY)
+        engine.load_symbol_data("AAPL", "1m")
+
+        assert (tmp_path / ParquetStorageEngine.LOCK_DIR / "1m.lock").exists()
+        assert list((tmp_path / "frame=1m").rglob("*.lock")) == []
+
+    def test_mark_stale_on_compacted_day(self, engine, compactor):
+        compactor.run(today=TODAY)
+
+        assert engine.mark_stale("1m", "AAPL", date(2024, 1, 3))
+        assert not engine.partition_coverage("1m", "AAPL")[date(2024, 1, 3)].is_complete
+        assert engine.partition_coverage("1m", "AAPL")[date(2024, 1, 4)].is_complete
+
+    def test_year_buckets_absorb_month_buckets(self, engine, tmp_path):
+        ParquetCompactor(tmp_path).run(today=TODAY)
+        yearly = ParquetCompactor(tmp_path, CompactionPolicy(granularity="year"))
+
+        (result,) = yearly.run(today=date(2025, 1, 10))
+
+        assert result.rows == 12
+        assert len(ParquetStorageEngine(tmp_path).load_symbol_data("AAPL", "1m")) == 12
+
+
+def test_partition_span_labels():
+    span = ParquetStorageEngine.partition_span
+    assert span("2024-02-10") == (date(2024, 2, 10), date(2024, 2, 10))
+    assert span("2024-02") == (date(2024, 2, 1), date(2024, 2, 29))
+    assert span("2024-12") == (date(2024, 12, 1), date(2024, 12, 31))
+    assert span("2024") == (date(2024, 1, 1), date(2024, 12, 31))
+    assert span("bogus") is None
+
+
+def test_io_throttle_sleeps_when_ahead(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    throttle = IOThrottle(bytes_per_second=1000)
+    throttle.consume(500)
+
+    assert sleeps and sleeps[0] == pytest.approx(0.5, abs=0.05)
+
+
+def test_scheduler_runs_until_stopped(engine, tmp_path):
+    scheduler = CompactionScheduler(
+        ParquetCompactor(tmp_path, CompactionPolicy(settle_days=0)), interval_seconds=0.01
+    )
+
+    async def run():
+        await scheduler.start()
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+    asyncio.run(run())
+
+    assert (symbol_dir(tmp_path) / "date=2024-01" / "AAPL_2024-01.compacted.parquet").exists()
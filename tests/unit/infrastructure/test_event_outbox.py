@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the durable SQLite event outbox."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from marketpipe.domain.events import IngestionJobCompleted as DomainJobCompleted
+from marketpipe.domain.value_objects import Symbol, TimeRange
+from marketpipe.infrastructure.messaging.outbox import (
+    OutboxDispatcher,
+    SqliteEventOutbox,
+    decode_event,
+    encode_event,
+)
+from marketpipe.ingestion.domain.entities import IngestionJob, IngestionJobId
+from marketpipe.ingestion.domain.events import IngestionJobCompleted, IngestionJobStarted
+from marketpipe.ingestion.domain.value_objects import IngestionConfiguration
+from marketpipe.ingestion.infrastructure.repositories import SqliteIngestionJobRepository
+
+
+def completed_event(n: int = 0) -> IngestionJobCompleted:
+    return IngestionJobCompleted(
+        job_id=IngestionJobId(Symbol("AAPL"), f"2024-01-{n + 1:02d}"),
+        symbols_processed=1,
+        total_bars_processed=390,
+        partitions_created=1,
+        completed_at=datetime(2024, 1, 2, 21, tzinfo=timezone.utc),
+    )
+
+
+def make_job() -> IngestionJob:
+    return IngestionJob(
+        job_id=IngestionJobId(Symbol("AAPL"), "2024-01-08"),
+        configuration=IngestionConfiguration(
+            output_path=Path("/tmp/test"),
+            compression="snappy",
+            max_workers=1,
+            batch_size=1000,
+            rate_limit_per_minute=None,
+            feed_type="iex",
+        ),
+        symbols=[Symbol("AAPL")],
+        time_range=TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 9)),
+    )
+
+
+class Recorder:
+    def __init__(self, fail_times: int = 0):
+        self.events = []
+        self.fail_times = fail_times
+
+    def __call__(self, event):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("consumer down")
+        self.events.append(event)
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return SqliteEventOutbox(tmp_path / "jobs.db", max_attempts=3)
+
+
+def test_codec_round_trips_events():
+    event = completed_event()
+
+    decoded = decode_event(encode_event(event))
+
+    assert decoded == event
+    assert decoded.job_id.symbol == Symbol("AAPL")
+    assert decoded.event_id == event.event_id
+
+
+def test_codec_rejects_foreign_classes():
+    payload = '{"__object__": "os:PathLike", "state": {}}'
+
+    with pytest.raises(ValueError, match="Refusing"):
+        decode_event(payload)
+    with pytest.raises(ValueError, match="not a class"):
+        decode_event('{"__object__": "marketpipe.domain.events:datetime.now", "state": {}}')
+    with pytest.raises(ValueError, match="not an event"):
+        decode_event('{"__object__": "marketpipe.domain.value_objects:Volume", "state": {}}')
+
+
+def test_dispatch_delivers_in_batches_once_per_consumer(outbox):
+    assert outbox.append([completed_event(i) for i in range(5)]) == 5
+    received = Recorder()
+    dispatcher = OutboxDispatcher(outbox, received, consumer="aggregation", batch_size=2)
+
+    assert dispatcher.dispatch_once() == 2
+    assert dispatcher.drain() == 3
+    assert dispatcher.drain() == 0
+    assert [e.job_id.day for e in received.events] == [f"2024-01-0{i + 1}" for i in range(5)]
+
+    # Another consumer keeps its own progress
+    assert OutboxDispatcher(outbox, Recorder(), consumer="validation").drain() == 5
+    assert outbox.stats("aggregation").delivered == 5
+
+
+def test_append_ignores_duplicate_events(outbox):
+    event = completed_event()
+
+    assert outbox.append([event]) == 1
+    assert outbox.append([event]) == 0
+
+
+def test_failed_delivery_backs_off_then_retries(outbox, monkeypatch):
+    outbox.append([completed_event()])
+    received = Recorder(fail_times=1)
+    dispatcher = OutboxDispatcher(outbox, received, consumer="c", backoff_base=60)
+
+    assert dispatcher.drain() == 0
+    assert outbox.stats("c").pending == 1
+    # Not due until the backoff has passed
+    assert dispatcher.drain() == 0
+
+    import marketpipe.infrastructure.messaging.outbox as outbox_module
+
+    later = outbox_module.time.time() + 61
+    monkeypatch.setattr(outbox_module.time, "time", lambda: later)
+    assert dispatcher.drain() == 1
+    assert len(received.events) == 1
+
+
+def test_backoff_is_exponential_and_capped(outbox):
+    dispatcher = OutboxDispatcher(outbox, Recorder(), backoff_base=1, backoff_max=10)
+
+    assert [dispatcher.backoff(n) for n in (1, 2, 3, 4, 5)] == [1, 2, 4, 8, 10]
+
+
+def test_dead_letters_after_max_attempts_and_requeue(outbox):
+    outbox.append([completed_event()])
+    dispatcher = OutboxDispatcher(outbox, Recorder(fail_times=99), consumer="c", backoff_base=0)
+
+    for _ in range(5):
+        dispatcher.drain()
+
+    stats = outbox.stats("c")
+    assert (stats.pending, stats.dead) == (0, 1)
+
+    assert outbox.requeue_dead("c") == 1
+    assert outbox.stats("c").pending == 1
+
+
+def test_new_dispatcher_resumes_undelivered_events(outbox):
+    outbox.append([completed_event(i) for i in range(3)])
+    OutboxDispatcher(outbox, Recorder(), consumer="c", batch_size=1).dispatch_once()
+
+    # Simulates a restart: fresh outbox and dispatcher over the same file
+    reopened = SqliteEventOutbox(outbox.db_path, max_attempts=3)
+    received = Recorder()
+
+    assert OutboxDispatcher(reopened, received, consumer="c").drain() == 2
+    assert [e.job_id.day for e in received.events] == ["2024-01-02", "2024-01-03"]
+
+
+@pytest.mark.asyncio
+async def test_repository_saves_events_with_job_state(tmp_path):
+    db_path = tmp_path / "jobs.db"
+    repo = SqliteIngestionJobRepository(db_path, outbox=True)
+    job = make_job()
+    job.start()
+
+    await repo.save(job)
+    await repo.save(job)  # saving again before the events are cleared stores them once
+
+    received = Recorder()
+    OutboxDispatcher(SqliteEventOutbox(db_path), received).drain()
+    assert [type(e) for e in received.events] == [IngestionJobStarted]
+    assert received.events[0].job_id == job.job_id
+
+
+@pytest.mark.asyncio
+async def test_repository_skips_outbox_when_disabled(tmp_path, monkeypatch):
+    monkeypatch.delenv("MARKETPIPE_EVENT_OUTBOX", raising=False)
+    db_path = tmp_path / "jobs.db"
+    job = make_job()
+    job.start()
+
+    await SqliteIngestionJobRepository(db_path).save(job)
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM event_outbox").fetchone()[0] == 0
+
+
+def test_cli_translates_completion_for_post_processing():
+    from marketpipe.ingestion.domain.events import as_job_completed
+
+    translated = as_job_completed(completed_event())
+
+    assert isinstance(translated, DomainJobCompleted)
+    assert translated.job_id == "AAPL_2024-01-01"
+    assert translated.symbol == Symbol("AAPL")
+    assert translated.trading_date == date(2024, 1, 1)
+    assert translated.bars_processed == 390
@@ -3,14 +3,22 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
+from decimal import Decimal
 from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
-from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+from marketpipe.infrastructure.storage.parquet_engine import (
+    OHLCV_SCHEMA,
+    ParquetStorageEngine,
+    StorageProfile,
+    get_storage_profile,
+)
 
 
 @pytest.fixture
@@ -68,6 +76,127 @@ class TestParquetStorageEngineInitialization:
         assert engine._root == tmp_path
 
 
+class TestParquetStorageProfiles:
+    """Test storage profile encodings."""
+
+    @staticmethod
+    def _encodings(path: Path) -> dict[str, tuple[str, ...]]:
+        row_group = pq.ParquetFile(path).metadata.row_group(0)
+        return {
+            row_group.column(i).path_in_schema: row_group.column(i).encodings
+            for i in range(row_group.num_columns)
+        }
+
+    def test_default_profile_uses_typed_encodings(
+        self, engine: ParquetStorageEngine, sample_df: pd.DataFrame
+    ):
+        """Test that the balanced profile applies per-column encodings."""
+        path = engine.write(
+            sample_df.iloc[::-1],
+            frame="1m",
+            symbol="AAPL",
+            trading_day=date(2022, 1, 1),
+            job_id="j",
+        )
+
+        encodings = self._encodings(path)
+        assert "DELTA_BINARY_PACKED" in encodings["ts_ns"]
+        assert "DELTA_BINARY_PACKED" in encodings["volume"]
+        assert "RLE_DICTIONARY" in encodings["close"]
+        assert "RLE_DICTIONARY" in encodings["symbol"]
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.row_group(0).sorting_columns[0].column_index == 0
+        assert metadata.row_group(0).column(0).has_column_index
+        assert pq.read_table(path).column("ts_ns").to_pylist() == sorted(sample_df["ts_ns"])
+
+    def test_legacy_profile_matches_previous_layout(self, tmp_path: Path, sample_df: pd.DataFrame):
+        """Test that the legacy profile writes plain, undictionaried columns."""
+        engine = ParquetStorageEngine(tmp_path, profile="legacy")
+        path = engine.write(
+            sample_df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 1), job_id="j"
+        )
+
+        encodings = self._encodings(path)
+        assert "RLE_DICTIONARY" not in encodings["symbol"]
+        assert "BYTE_STREAM_SPLIT" not in encodings["close"]
+
+    def test_adjusted_profile_splits_float_prices(self, tmp_path: Path, sample_df: pd.DataFrame):
+        """Test that the adjusted profile writes prices with BYTE_STREAM_SPLIT."""
+        engine = ParquetStorageEngine(tmp_path, profile="adjusted")
+        path = engine.write(
+            sample_df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 1), job_id="j"
+        )
+
+        assert "BYTE_STREAM_SPLIT" in self._encodings(path)["close"]
+
+    def test_exact_profile_stores_decimal_prices(self, tmp_path: Path, sample_df: pd.DataFrame):
+        """Test that the exact profile writes DECIMAL(18, 4) prices and reads back floats."""
+        df = sample_df.assign(open=[100.1234, 0.0001], vwap=[100.25, None])
+        engine = ParquetStorageEngine(tmp_path, profile="exact")
+        path = engine.write(df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 1), job_id="j")
+
+        column = pq.ParquetFile(path).schema.column(1)
+        assert str(column.logical_type) == "Decimal(precision=18, scale=4)"
+        assert pq.read_table(path).column("open").to_pylist()[1] == Decimal("0.0001")
+
+        loaded = engine.load_partition("1m", "AAPL", date(2022, 1, 1))
+        assert loaded["open"].dtype == "float64"
+        assert list(loaded["open"]) == [100.1234, 0.0001]
+        assert loaded["vwap"].isna().tolist() == [False, True]
+
+    def test_decimal_and_float_files_read_together(self, tmp_path: Path, sample_df: pd.DataFrame):
+        """Test that both price encodings load into one float frame, via Arrow and DuckDB."""
+        from marketpipe.loader import load_ohlcv
+
+        root = tmp_path / "raw"
+        ParquetStorageEngine(root, profile="exact").write(
+            sample_df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 1), job_id="a"
+        )
+        ParquetStorageEngine(root).write(
+            sample_df.assign(ts_ns=sample_df["ts_ns"] + 86_400 * 1_000_000_000),
+            frame="1m",
+            symbol="AAPL",
+            trading_day=date(2022, 1, 2),
+            job_id="b",
+        )
+
+        arrow = ParquetStorageEngine(root).load_symbol_data("AAPL", "1m")
+        duck = load_ohlcv("AAPL", root=tmp_path)
+
+        assert list(arrow["close"]) == list(duck["close"]) == [100.5, 101.5] * 2
+        assert duck["close"].dtype == "float64"
+
+    def test_profile_from_environment(self, tmp_path: Path, monkeypatch):
+        """Test that the default profile can be chosen by environment variable."""
+        monkeypatch.setenv("MARKETPIPE_PARQUET_PROFILE", "compact")
+        assert ParquetStorageEngine(tmp_path).profile.name == "compact"
+        assert ParquetStorageEngine(tmp_path, profile="fast")._compression == "lz4"
+
+    def test_unknown_profile_raises_error(self):
+        """Test that an unknown profile name is rejected."""
+        with pytest.raises(ValueError, match="Unknown storage profile"):
+            get_storage_profile("bogus")
+
+    def test_compression_override_drops_level(self):
+        """Test that a codec override does not inherit the profile's zstd level."""
+        profile = StorageProfile(name="t", compression="zstd", compression_level=9)
+        options = profile.write_options(OHLCV_SCHEMA, "snappy")
+        assert options["compression"] == "snappy"
+        assert "compression_level" not in options
+
+    def test_incompatible_types_fall_back_to_inference(
+        self, engine: ParquetStorageEngine, sample_df: pd.DataFrame
+    ):
+        """Test that fractional volume is written as float without DELTA encoding."""
+        df = sample_df.assign(volume=[1.5, 2.5])
+
+        path = engine.write(df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 1), job_id="j")
+
+        assert pq.read_table(path).column("volume").to_pylist() == [1.5, 2.5]
+        assert "DELTA_BINARY_PACKED" not in self._encodings(path)["volume"]
+
+
 class TestParquetStorageEngineWrite:
     """Test write operations."""
 
@@ -419,6 +548,23 @@ class TestParquetStorageEngineRead:
 
         assert df_loaded.empty
 
+    def test_reads_of_missing_data_create_nothing(
+        self, engine: ParquetStorageEngine, sample_df: pd.DataFrame, tmp_path: Path
+    ):
+        """Reads never create frame or symbol directories (or their lock files)."""
+        engine.write(sample_df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 1), job_id="j")
+        before = sorted(tmp_path.rglob("*"))
+
+        engine.load_partition("1m", "MSFT", date(2022, 1, 1))
+        engine.load_symbol_data("MSFT", "1m")
+        engine.load_symbol_data("AAPL", "5m")
+        engine.partition_coverage("MSFT", "1m")
+        clustered = ParquetStorageEngine(tmp_path, clustered_frames=["5m"])
+        clustered.load_cross_section("5m", date(2022, 1, 1))
+        clustered.partition_coverage("AAPL", "5m")
+
+        assert sorted(tmp_path.rglob("*")) == before
+
 
 class TestParquetStorageEngineUtilities:
     """Test utility operations."""
@@ -563,6 +709,219 @@ class TestParquetStorageEngineUtilities:
         assert len(result["corruption_details"]) == 1
 
 
+class TestParquetStorageEngineCoverage:
+    """Test coverage reporting used by incremental ingestion."""
+
+    def test_partition_coverage_reads_footer_stats(
+        self, engine: ParquetStorageEngine, sample_df: pd.DataFrame
+    ):
+        """Test that coverage reports row counts and ts_ns bounds per day."""
+        engine.write(sample_df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 1), job_id="j")
+
+        coverage = engine.partition_coverage("1m", "AAPL")
+
+        day = coverage[date(2022, 1, 1)]
+        assert day.row_count == 2
+        assert day.min_ts_ns == 1640995800000000000
+        assert day.max_ts_ns == 1640995860000000000
+        assert day.is_complete
+
+    def test_partition_coverage_date_filter(
+        self, engine: ParquetStorageEngine, sample_df: pd.DataFrame
+    ):
+        """Test that coverage honours the date window."""
+        for day in (date(2022, 1, 3), date(2022, 1, 4)):
+            engine.write(sample_df, frame="1m", symbol="AAPL", trading_day=day, job_id="j")
+
+        coverage = engine.partition_coverage(
+            "1m", "AAPL", start_date=date(2022, 1, 4), end_date=date(2022, 1, 4)
+        )
+        assert list(coverage) == [date(2022, 1, 4)]
+
+    def test_mark_stale_until_rewritten(
+        self, engine: ParquetStorageEngine, sample_df: pd.DataFrame
+    ):
+        """Test that stale marking is cleared by the next write."""
+        day = date(2022, 1, 3)
+        engine.write(sample_df, frame="1m", symbol="AAPL", trading_day=day, job_id="j")
+
+        assert engine.mark_stale("1m", "AAPL", day)
+        assert not engine.partition_coverage("1m", "AAPL")[day].is_complete
+
+        engine.write(
+            sample_df, frame="1m", symbol="AAPL", trading_day=day, job_id="j", overwrite=True
+        )
+        assert engine.partition_coverage("1m", "AAPL")[day].is_complete
+
+    def test_mark_stale_missing_partition(self, engine: ParquetStorageEngine):
+        """Test that marking a missing partition is a no-op."""
+        assert engine.mark_stale("1m", "AAPL", date(2022, 1, 3)) is False
+
+    def test_corrupted_file_is_stale(
+        self, engine: ParquetStorageEngine, sample_df: pd.DataFrame, tmp_path: Path
+    ):
+        """Test that unreadable files do not count as coverage."""
+        day = date(2022, 1, 3)
+        engine.write(sample_df, frame="1m", symbol="AAPL", trading_day=day, job_id="j")
+        (tmp_path / "frame=1m" / "symbol=AAPL" / "date=2022-01-03" / "bad.parquet").write_text(
+            "not parquet"
+        )
+
+        assert not engine.partition_coverage("1m", "AAPL")[day].is_complete
+
+
+class TestParquetStorageEnginePushdown:
+    """Test column projection and ts_ns predicate pushdown on reads."""
+
+    MINUTE_NS = 60 * 1_000_000_000
+
+    @pytest.fixture
+    def week(self, engine: ParquetStorageEngine) -> ParquetStorageEngine:
+        """Five days of 60 one-minute bars starting 14:30 UTC."""
+        for offset in range(5):
+            day = date(2022, 1, 3) + timedelta(days=offset)
+            open_ns = int(pd.Timestamp(day, tz="UTC").value) + 870 * self.MINUTE_NS
+            engine.write(
+                pd.DataFrame(
+                    {
+                        "ts_ns": [open_ns + i * self.MINUTE_NS for i in range(60)],
+                        "open": [100.0 + offset] * 60,
+                        "high": [101.0 + offset] * 60,
+                        "low": [99.0 + offset] * 60,
+                        "close": [100.5 + offset] * 60,
+                        "volume": [1000] * 60,
+                        "symbol": ["AAPL"] * 60,
+                    }
+                ),
+                frame="1m",
+                symbol="AAPL",
+                trading_day=day,
+                job_id="j",
+            )
+        return engine
+
+    def test_columns_projection(self, week: ParquetStorageEngine):
+        """Test that only the requested columns are returned, in ts_ns order."""
+        df = week.load_symbol_data("AAPL", "1m", columns=["close"])
+
+        assert list(df.columns) == ["close"]
+        assert len(df) == 300
+        assert df["close"].is_monotonic_increasing
+
+    def test_ts_range_filter(self, week: ParquetStorageEngine):
+        """Test that a ts_ns window returns only rows inside it (inclusive)."""
+        start = int(pd.Timestamp("2022-01-05 14:40", tz="UTC").value)
+        end = start + 9 * self.MINUTE_NS
+
+        df = week.load_symbol_data("AAPL", "1m", start_ts=start, end_ts=end)
+
+        assert len(df) == 10
+        assert df["ts_ns"].min() == start
+        assert df["ts_ns"].max() == end
+
+    def test_ts_range_skips_other_partitions(self, week: ParquetStorageEngine, tmp_path: Path):
+        """Test that partitions outside the ts_ns window are never opened."""
+        (tmp_path / "frame=1m" / "symbol=AAPL" / "date=2022-01-03" / "bad.parquet").write_text(
+            "not parquet"
+        )
+        start = int(pd.Timestamp("2022-01-06 14:30", tz="UTC").value)
+
+        with patch.object(week.log, "warning") as warning:
+            df = week.load_symbol_data("AAPL", "1m", start_ts=start, end_ts=start)
+
+        assert len(df) == 1
+        warning.assert_not_called()
+
+    def test_load_partition_with_filters(self, week: ParquetStorageEngine):
+        """Test that load_partition accepts the same projection and filters."""
+        start = int(pd.Timestamp("2022-01-04 15:00", tz="UTC").value)
+
+        df = week.load_partition(
+            "1m", "AAPL", date(2022, 1, 4), columns=["ts_ns", "volume"], start_ts=start
+        )
+
+        assert list(df.columns) == ["ts_ns", "volume"]
+        assert len(df) == 30
+
+    def test_pushdown_into_compacted_bucket(self, week: ParquetStorageEngine, tmp_path: Path):
+        """Test that filters apply inside month buckets holding many days."""
+        from marketpipe.infrastructure.storage.compaction import ParquetCompactor
+
+        ParquetCompactor(tmp_path).run(today=date(2022, 3, 1))
+        start = int(pd.Timestamp("2022-01-05 14:30", tz="UTC").value)
+
+        df = week.load_symbol_data(
+            "AAPL", "1m", columns=["open"], start_ts=start, end_ts=start + 4 * self.MINUTE_NS
+        )
+
+        assert list(df["open"]) == [102.0] * 5
+
+
+class TestParquetStorageEngineArrowReads:
+    """Test the parallel Arrow read path."""
+
+    @pytest.fixture
+    def days(self, tmp_path: Path, sample_df: pd.DataFrame) -> list[date]:
+        days = [date(2022, 1, 3) + timedelta(days=i) for i in range(6)]
+        writer = ParquetStorageEngine(tmp_path)
+        # Written out of order so the read path has to sort across files
+        for i, day in enumerate(reversed(days)):
+            shift = (days[-1 - i] - days[0]).days * 86_400 * 1_000_000_000
+            writer.write(
+                sample_df.assign(ts_ns=sample_df["ts_ns"] + shift),
+                frame="1m",
+                symbol="AAPL",
+                trading_day=day,
+                job_id="job1",
+            )
+        return days
+
+    def test_symbol_table_returns_arrow(self, tmp_path: Path, days: list[date]):
+        """Test that the table variant returns a sorted Arrow table."""
+        table = ParquetStorageEngine(tmp_path).load_symbol_table("AAPL", "1m")
+
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 12
+        ts = table.column("ts_ns").to_pylist()
+        assert ts == sorted(ts)
+
+    def test_parallel_matches_sequential(self, tmp_path: Path, days: list[date]):
+        """Test that concurrent reads return the same rows as sequential reads."""
+        parallel = ParquetStorageEngine(tmp_path, read_workers=8).load_symbol_data("AAPL", "1m")
+        sequential = ParquetStorageEngine(tmp_path, read_workers=1).load_symbol_data("AAPL", "1m")
+
+        pd.testing.assert_frame_equal(parallel, sequential)
+
+    def test_concat_does_not_copy_chunks(self, tmp_path: Path, days: list[date]):
+        """Test that per-file tables are concatenated as chunks, not copied."""
+        table = ParquetStorageEngine(tmp_path).load_symbol_table("AAPL", "1m", columns=["close"])
+
+        assert table.column("close").num_chunks == len(days)
+
+    def test_job_tables_group_by_symbol(self, tmp_path: Path, days: list[date]):
+        """Test that job tables are returned per symbol."""
+        tables = ParquetStorageEngine(tmp_path).load_job_tables("job1")
+
+        assert list(tables) == ["AAPL"]
+        assert tables["AAPL"].num_rows == 12
+
+    def test_mixed_file_types_are_promoted(self, tmp_path: Path, sample_df: pd.DataFrame):
+        """Test that files written with differing inferred types still concatenate."""
+        engine = ParquetStorageEngine(tmp_path)
+        engine.write(sample_df, frame="1m", symbol="AAPL", trading_day=date(2022, 1, 3), job_id="a")
+        engine.write(
+            sample_df.assign(ts_ns=sample_df["ts_ns"] + 86_400 * 1_000_000_000, volume=[1.5, 2.5]),
+            frame="1m",
+            symbol="AAPL",
+            trading_day=date(2022, 1, 4),
+            job_id="b",
+        )
+
+        df = engine.load_symbol_data("AAPL", "1m")
+
+        assert list(df["volume"]) == [1000, 1500, 1.5, 2.5]
+
+
 class TestParquetStorageEngineErrorHandling:
     """Test error handling scenarios."""
 
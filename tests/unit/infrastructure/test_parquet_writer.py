@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the background Parquet writer and non-blocking store_bars."""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from marketpipe.domain.value_objects import Symbol
+from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+from marketpipe.infrastructure.storage.writer import ParquetBatchWriter
+from marketpipe.ingestion.domain.value_objects import IngestionConfiguration
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from fakes.adapters import create_test_ohlcv_bars
+
+
+def config(tmp_path: Path) -> IngestionConfiguration:
+    return IngestionConfiguration(
+        output_path=tmp_path,
+        compression="zstd",
+        max_workers=1,
+        batch_size=1000,
+        rate_limit_per_minute=None,
+        feed_type="iex",
+    )
+
+
+def frame(rows: int = 2) -> pd.DataFrame:
+    base = int(datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc).timestamp()) * 1_000_000_000
+    return pd.DataFrame(
+        {
+            "ts_ns": [base + i * 60_000_000_000 for i in range(rows)],
+            "open": [1.0] * rows,
+            "high": [2.0] * rows,
+            "low": [0.5] * rows,
+            "close": [1.5] * rows,
+            "volume": [100] * rows,
+            "symbol": ["AAPL"] * rows,
+        }
+    )
+
+
+class TestStoreBars:
+    def test_multi_day_bars_are_split_per_day(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        # 23:00 UTC + 180 minutes crosses midnight
+        start = datetime(2024, 1, 2, 23, 0, tzinfo=timezone.utc)
+        bars = create_test_ohlcv_bars(Symbol("AAPL"), count=180, start_time=start)
+
+        partition = asyncio.run(engine.store_bars(bars, config(tmp_path)))
+        engine.close()
+
+        assert partition.record_count == 180
+        day_one = engine.load_partition("1m", "AAPL", date(2024, 1, 2))
+        day_two = engine.load_partition("1m", "AAPL", date(2024, 1, 3))
+        assert (len(day_one), len(day_two)) == (60, 120)
+        assert day_one["open"].iloc[0] == pytest.approx(100.0)
+        assert day_two["volume"].iloc[-1] == 1000 + 179 * 10
+
+    def test_unsorted_bars_are_written_sorted(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        start = datetime(2024, 1, 2, 15, 0, tzinfo=timezone.utc)
+        bars = create_test_ohlcv_bars(Symbol("AAPL"), count=10, start_time=start)[::-1]
+
+        partition = asyncio.run(engine.store_bars(bars, config(tmp_path)))
+        engine.close()
+
+        ts = pq.read_table(partition.file_path).column("ts_ns").to_pylist()
+        assert ts == sorted(ts)
+
+    def test_closing_owner_stops_writer_threads(self, tmp_path):
+        def writer_threads():
+            return [t for t in threading.enumerate() if t.name.startswith("parquet-writer-")]
+
+        before = len(writer_threads())
+        bars = create_test_ohlcv_bars(Symbol("AAPL"), count=5)
+        with ParquetStorageEngine(tmp_path, write_workers=2) as engine:
+            asyncio.run(engine.store_bars(bars, config(tmp_path)))
+            assert len(writer_threads()) == before + 2
+
+        assert len(writer_threads()) == before
+
+    def test_event_loop_keeps_running_during_writes(self, tmp_path, monkeypatch):
+        engine = ParquetStorageEngine(tmp_path)
+        original = engine.write_table
+
+        def slow_write_table(*args, **kwargs):
+            time.sleep(0.3)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(engine, "write_table", slow_write_table)
+        start = datetime(2024, 1, 2, 15, 0, tzinfo=timezone.utc)
+        bars = create_test_ohlcv_bars(Symbol("AAPL"), count=5, start_time=start)
+
+        async def run():
+            ticks = 0
+            store = asyncio.create_task(engine.store_bars(bars, config(tmp_path)))
+            while not store.done():
+                await asyncio.sleep(0.01)
+                ticks += 1
+            await store
+            return ticks
+
+        ticks = asyncio.run(run())
+        engine.close()
+
+        assert ticks >= 10
+
+
+class TestParquetBatchWriter:
+    def test_write_errors_propagate_to_future(self, tmp_path):
+        writer = ParquetBatchWriter(ParquetStorageEngine(tmp_path), workers=1)
+
+        future = writer.submit(
+            ParquetStorageEngine(tmp_path).to_table(frame().drop(columns="close")),
+            frame="1m",
+            symbol="AAPL",
+            trading_day=date(2024, 1, 2),
+            job_id="j",
+        )
+
+        with pytest.raises(ValueError, match="missing required columns"):
+            future.result(timeout=5)
+        writer.close()
+
+    def test_full_queue_raises_without_blocking(self, tmp_path, monkeypatch):
+        engine = ParquetStorageEngine(tmp_path)
+        release = threading.Event()
+        monkeypatch.setattr(engine, "write_table", lambda *a, **k: release.wait(5))
+        writer = ParquetBatchWriter(engine, workers=1, max_pending=1)
+        table = engine.to_table(frame())
+        kwargs = {"frame": "1m", "symbol": "AAPL", "trading_day": date(2024, 1, 2), "job_id": "j"}
+
+        writer.submit(table, **kwargs)  # picked up by the worker
+        deadline = time.monotonic() + 5
+        while writer.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.submit(table, **kwargs)  # fills the queue
+
+        with pytest.raises(queue.Full):
+            writer.submit(table, block=False, **kwargs)
+
+        release.set()
+        writer.flush()
+        writer.close()
+
+    def test_closed_writer_rejects_submissions(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        writer = ParquetBatchWriter(engine)
+        writer.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.submit(
+                engine.to_table(frame()),
+                frame="1m",
+                symbol="AAPL",
+                trading_day=date(2024, 1, 2),
+                job_id="j",
+            )
+
+
+class TestAtomicCommit:
+    def test_no_lock_or_temp_files_left_behind(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        path = engine.write(
+            frame(), frame="1m", symbol="AAPL", trading_day=date(2024, 1, 2), job_id="j"
+        )
+
+        assert sorted(p.name for p in path.parent.iterdir()) == ["j.parquet"]
+
+    def test_concurrent_create_has_single_winner(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        df = frame()
+
+        def write(_):
+            try:
+                engine.write(
+                    df, frame="1m", symbol="AAPL", trading_day=date(2024, 1, 2), job_id="j"
+                )
+                return True
+            except FileExistsError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(write, range(8)))
+
+        assert results.count(True) == 1
+        assert len(engine.load_partition("1m", "AAPL", date(2024, 1, 2))) == 2
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the on-disk provider response cache."""
+
+from __future__ import annotations
+
+import json
+import time
+import types
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from marketpipe.ingestion.infrastructure.alpaca_client import AlpacaClient
+from marketpipe.ingestion.infrastructure.auth import HeaderTokenAuth
+from marketpipe.ingestion.infrastructure.models import ClientConfig
+from marketpipe.ingestion.infrastructure.response_cache import (
+    DEFAULT_CACHE_DIR,
+    CachePolicy,
+    ResponseCache,
+)
+
+HISTORICAL_END = datetime(2023, 1, 3, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "http")
+
+
+class TestCacheKeys:
+    def test_key_ignores_param_order_and_credentials(self):
+        a = ResponseCache.make_key("polygon", "/v2/aggs", {"limit": 10, "apikey": "one"})
+        b = ResponseCache.make_key("polygon", "/v2/aggs", {"apikey": "two", "limit": "10"})
+        assert a == b
+
+    def test_key_differs_by_provider_endpoint_and_params(self):
+        base = ResponseCache.make_key("polygon", "/a", {"x": 1})
+        assert base != ResponseCache.make_key("finnhub", "/a", {"x": 1})
+        assert base != ResponseCache.make_key("polygon", "/b", {"x": 1})
+        assert base != ResponseCache.make_key("polygon", "/a", {"x": 2})
+
+
+class TestCacheStorage:
+    def test_roundtrip(self, cache):
+        body = {"results": [{"t": 1, "o": 1.5}]}
+        path = cache.put("polygon", "/a", {"x": 1}, body, data_end=HISTORICAL_END)
+
+        assert path.name.endswith(".json.gz")
+        assert cache.get("polygon", "/a", {"x": 1}) == body
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get("polygon", "/missing", {}) is None
+
+    def test_credentials_not_written_to_disk(self, cache):
+        path = cache.put("polygon", "/a", {"apikey": "secret"}, {}, data_end=HISTORICAL_END)
+        import gzip
+
+        with gzip.open(path, "rt") as fh:
+            assert "secret" not in fh.read()
+
+    def test_corrupt_entry_is_discarded(self, cache):
+        path = cache.put("polygon", "/a", {}, {"ok": True}, data_end=HISTORICAL_END)
+        path.write_bytes(b"not gzip")
+
+        assert cache.get("polygon", "/a", {}) is None
+        assert not path.exists()
+
+    def test_current_day_entries_expire(self, tmp_path):
+        cache = ResponseCache(tmp_path, CachePolicy(current_day_ttl=0.01))
+        cache.put("polygon", "/a", {}, {"ok": True}, data_end=datetime.now(timezone.utc))
+        time.sleep(0.02)
+
+        assert cache.get("polygon", "/a", {}) is None
+        assert cache.purge_expired() == 1
+
+    def test_clear_by_provider(self, cache):
+        cache.put("polygon", "/a", {}, {}, data_end=HISTORICAL_END)
+        cache.put("finnhub", "/a", {}, {}, data_end=HISTORICAL_END)
+
+        assert cache.clear("polygon") == 1
+        assert cache.get("finnhub", "/a", {}) == {}
+
+
+class TestCachePolicy:
+    def test_historical_is_immutable(self):
+        policy = CachePolicy(current_day_ttl=60)
+        assert policy.ttl_for(HISTORICAL_END, today=date(2024, 1, 1)) is None
+
+    def test_current_day_is_short_lived(self):
+        policy = CachePolicy(current_day_ttl=60)
+        today = date(2024, 1, 1)
+        end = datetime(2024, 1, 1, 20, tzinfo=timezone.utc)
+        assert policy.ttl_for(end, today=today) == 60
+        assert policy.ttl_for(end + timedelta(days=1), today=today) == 60
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("MARKETPIPE_HTTP_CACHE_DIR", raising=False)
+        cache = ResponseCache.from_env()
+        assert cache is not None
+        assert cache.root == DEFAULT_CACHE_DIR and (tmp_path / "data" / "http_cache").is_dir()
+
+        monkeypatch.setenv("MARKETPIPE_HTTP_CACHE_DIR", "off")
+        assert ResponseCache.from_env() is None
+
+        monkeypatch.setenv("MARKETPIPE_HTTP_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("MARKETPIPE_HTTP_CACHE_TTL", "15")
+        cache = ResponseCache.from_env()
+        assert cache is not None
+        assert cache.policy.current_day_ttl == 15
+
+
+def test_alpaca_client_replays_from_cache(monkeypatch, cache):
+    page = {
+        "bars": {"AAPL": [{"t": "2023-01-02T14:30:00Z", "o": 1, "h": 2, "l": 1, "c": 2, "v": 5}]}
+    }
+    calls = []
+
+    def mock_get(url, params=None, headers=None, timeout=None):
+        calls.append(params)
+        return types.SimpleNamespace(
+            status_code=200, json=lambda: page, text=json.dumps(page), headers={}
+        )
+
+    monkeypatch.setattr(httpx, "get", mock_get)
+
+    client = AlpacaClient(
+        config=ClientConfig(api_key="k", base_url="http://x"),
+        auth=HeaderTokenAuth("id", "sec"),
+        response_cache=cache,
+    )
+    start_ms = int(datetime(2023, 1, 2, tzinfo=timezone.utc).timestamp() * 1000)
+    end_ms = int(HISTORICAL_END.timestamp() * 1000)
+
+    first = client.fetch_batch("AAPL", start_ms, end_ms)
+    second = client.fetch_batch("AAPL", start_ms, end_ms)
+
+    assert len(calls) == 1
+    assert first == second
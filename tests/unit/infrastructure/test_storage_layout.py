@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the symbol-clustered partition layout and layout migration."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from marketpipe.infrastructure.storage.compaction import CompactionPolicy, ParquetCompactor
+from marketpipe.infrastructure.storage.layout import (
+    CLUSTERED_FILE,
+    LAYOUT_BY_SYMBOL,
+    LAYOUT_CLUSTERED,
+    detect_layout,
+    parse_part_name,
+    part_name,
+    read_layout_marker,
+)
+from marketpipe.infrastructure.storage.parquet_engine import ParquetStorageEngine
+from marketpipe.infrastructure.storage.relayout import LayoutMigrator
+from marketpipe.loader import load_ohlcv
+
+DAY_ONE = date(2024, 1, 2)
+DAY_TWO = date(2024, 1, 3)
+SYMBOLS = ("AAPL", "MSFT", "NVDA")
+
+
+def bars(symbol: str, day: date, rows: int = 3, price: float = 100.0) -> pd.DataFrame:
+    base = int(datetime(day.year, day.month, day.day, 14, 30, tzinfo=timezone.utc).timestamp())
+    return pd.DataFrame(
+        {
+            "ts_ns": [(base + i * 60) * 1_000_000_000 for i in range(rows)],
+            "open": [price] * rows,
+            "high": [price + 1] * rows,
+            "low": [price - 1] * rows,
+            "close": [price + 0.5] * rows,
+            "volume": [1000 + i for i in range(rows)],
+            "symbol": [symbol] * rows,
+        }
+    )
+
+
+def populate(engine: ParquetStorageEngine, frame: str = "1d") -> None:
+    for day in (DAY_ONE, DAY_TWO):
+        for i, symbol in enumerate(SYMBOLS):
+            engine.write(
+                bars(symbol, day, price=100.0 + i),
+                frame=frame,
+                symbol=symbol,
+                trading_day=day,
+                job_id=f"{symbol}_{day}",
+            )
+
+
+@pytest.fixture
+def clustered(tmp_path):
+    engine = ParquetStorageEngine(tmp_path, clustered_frames=["1d"])
+    populate(engine)
+    return engine
+
+
+class TestLayoutHelpers:
+    def test_part_names_round_trip(self):
+        assert parse_part_name(part_name("BRK.B", "job_2024-01-02")) == ("BRK.B", "job_2024-01-02")
+        assert parse_part_name(CLUSTERED_FILE) is None
+
+    def test_detect_layout_from_directories(self, tmp_path):
+        assert detect_layout(tmp_path / "missing", LAYOUT_CLUSTERED) == LAYOUT_CLUSTERED
+        (tmp_path / "a" / "symbol=AAPL").mkdir(parents=True)
+        (tmp_path / "b" / "date=2024-01-02").mkdir(parents=True)
+
+        assert detect_layout(tmp_path / "a") == LAYOUT_BY_SYMBOL
+        assert detect_layout(tmp_path / "b") == LAYOUT_CLUSTERED
+
+    def test_unknown_marker_is_rejected(self, tmp_path):
+        (tmp_path / "_LAYOUT").write_text("sideways\n")
+
+        with pytest.raises(ValueError, match="Unknown layout"):
+            read_layout_marker(tmp_path)
+
+
+class TestClusteredEngine:
+    def test_writes_land_in_part_files_next_to_day(self, clustered, tmp_path):
+        day_dir = tmp_path / "frame=1d" / f"date={DAY_ONE}"
+
+        assert read_layout_marker(tmp_path / "frame=1d") == LAYOUT_CLUSTERED
+        assert sorted(p.name for p in day_dir.glob("*.parquet")) == [
+            part_name(s, f"{s}_{DAY_ONE}") for s in SYMBOLS
+        ]
+        assert not list((tmp_path / "frame=1d").glob("symbol=*"))
+
+    def test_other_frames_keep_symbol_layout(self, clustered, tmp_path):
+        clustered.write(
+            bars("AAPL", DAY_ONE), frame="1m", symbol="AAPL", trading_day=DAY_ONE, job_id="j"
+        )
+
+        assert clustered.frame_layout("1m") == LAYOUT_BY_SYMBOL
+        assert (tmp_path / "frame=1m" / "symbol=AAPL" / f"date={DAY_ONE}" / "j.parquet").exists()
+
+    def test_symbol_reads_before_and_after_compaction(self, clustered, tmp_path):
+        before = clustered.load_symbol_data("MSFT", "1d")
+        ParquetCompactor(tmp_path).run(today=date(2024, 2, 1))
+        after = clustered.load_symbol_data("MSFT", "1d")
+
+        day_dir = tmp_path / "frame=1d" / f"date={DAY_ONE}"
+        assert [p.name for p in day_dir.glob("*.parquet")] == [CLUSTERED_FILE]
+        assert len(before) == len(after) == 6
+        assert set(after["symbol"]) == {"MSFT"}
+        pd.testing.assert_frame_equal(before, after, check_like=True)
+
+    def test_day_file_has_one_sorted_row_group_per_symbol_block(self, clustered, tmp_path):
+        ParquetCompactor(tmp_path).run(today=date(2024, 2, 1))
+        path = tmp_path / "frame=1d" / f"date={DAY_ONE}" / CLUSTERED_FILE
+
+        table = pq.read_table(path)
+        assert table.column("symbol").to_pylist() == [s for s in SYMBOLS for _ in range(3)]
+        sorting = pq.read_metadata(path).row_group(0).sorting_columns
+        assert [c.column_index for c in sorting] == [
+            table.schema.get_field_index("symbol"),
+            table.schema.get_field_index("ts_ns"),
+        ]
+
+    def test_row_groups_never_split_a_small_symbol(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        table = pa.concat_tables(
+            [pa.Table.from_pandas(bars(s, DAY_ONE, rows=5)) for s in ("A", "B", "C")]
+        )
+        path = tmp_path / CLUSTERED_FILE
+        engine.replace_file(table, path, row_group_size=7, row_group_by="symbol")
+
+        metadata = pq.read_metadata(path)
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [5, 5, 5]
+
+    def test_cross_section_reads_one_day_of_all_symbols(self, clustered, tmp_path):
+        ParquetCompactor(tmp_path).run(today=date(2024, 2, 1))
+        # A later part file for one symbol is read alongside the day file
+        clustered.write(
+            bars("NVDA", DAY_ONE, rows=1, price=500.0).assign(ts_ns=lambda d: d.ts_ns + 1),
+            frame="1d",
+            symbol="NVDA",
+            trading_day=DAY_ONE,
+            job_id="late",
+        )
+
+        table = clustered.load_cross_section("1d", DAY_ONE, columns=["close"])
+        subset = clustered.load_cross_section("1d", DAY_ONE, symbols=["AAPL"])
+
+        assert table.column_names == ["symbol", "close"]
+        assert table.num_rows == 10
+        assert table.column("symbol").to_pylist() == sorted(table.column("symbol").to_pylist())
+        assert set(subset.column("symbol").to_pylist()) == {"AAPL"}
+
+    def test_cross_section_matches_across_layouts(self, clustered, tmp_path):
+        by_symbol = ParquetStorageEngine(tmp_path / "by_symbol")
+        populate(by_symbol)
+
+        expected = by_symbol.load_cross_section("1d", DAY_TWO, columns=["close", "volume"])
+        actual = clustered.load_cross_section("1d", DAY_TWO, columns=["close", "volume"])
+
+        assert actual.to_pylist() == expected.to_pylist()
+
+    def test_overwrite_replaces_compacted_rows(self, clustered, tmp_path):
+        ParquetCompactor(tmp_path).run(today=date(2024, 2, 1))
+
+        clustered.write(
+            bars("AAPL", DAY_ONE, rows=2, price=200.0),
+            frame="1d",
+            symbol="AAPL",
+            trading_day=DAY_ONE,
+            job_id="fix",
+            overwrite=True,
+        )
+
+        aapl = clustered.load_partition("1d", "AAPL", DAY_ONE)
+        assert len(aapl) == 2
+        assert set(aapl["open"]) == {200.0}
+        assert len(clustered.load_partition("1d", "MSFT", DAY_ONE)) == 3
+
+    def test_coverage_and_stale_marking_are_per_symbol(self, clustered):
+        assert clustered.mark_stale("1d", "AAPL", DAY_ONE)
+        assert not clustered.mark_stale("1d", "TSLA", DAY_ONE)
+
+        aapl = clustered.partition_coverage("1d", "AAPL")
+        msft = clustered.partition_coverage("1d", "MSFT")
+
+        assert aapl[DAY_ONE].stale and aapl[DAY_ONE].row_count == 3
+        assert not msft[DAY_ONE].stale
+        assert set(msft) == {DAY_ONE, DAY_TWO}
+
+    def test_job_operations_find_part_files(self, clustered):
+        assert set(clustered.load_job_tables(f"AAPL_{DAY_ONE}")) == {"AAPL"}
+        assert clustered.list_jobs("1d", "AAPL") == [f"AAPL_{DAY_ONE}", f"AAPL_{DAY_TWO}"]
+        assert clustered.delete_job(f"AAPL_{DAY_ONE}") == 1
+        assert clustered.get_storage_stats()["symbols"] == list(SYMBOLS)
+
+
+class TestLayoutMigration:
+    def test_round_trip_preserves_data(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        populate(engine)
+        engine.mark_stale("1d", "MSFT", DAY_TWO)
+        before = engine.load_symbol_data("NVDA", "1d")
+        migrator = LayoutMigrator(tmp_path)
+
+        result = migrator.migrate("1d", LAYOUT_CLUSTERED)
+
+        frame_dir = tmp_path / "frame=1d"
+        assert (result.days, result.files_read, result.rows) == (2, 6, 18)
+        assert engine.frame_layout("1d") == LAYOUT_CLUSTERED
+        assert not list(frame_dir.glob("symbol=*"))
+        assert (frame_dir / f"date={DAY_ONE}" / CLUSTERED_FILE).exists()
+        assert engine.partition_coverage("1d", "MSFT")[DAY_TWO].stale
+        pd.testing.assert_frame_equal(engine.load_symbol_data("NVDA", "1d"), before)
+
+        migrator.migrate("1d", LAYOUT_BY_SYMBOL)
+
+        assert engine.frame_layout("1d") == LAYOUT_BY_SYMBOL
+        assert not list(frame_dir.glob("date=*"))
+        assert engine.partition_coverage("1d", "MSFT")[DAY_TWO].stale
+        pd.testing.assert_frame_equal(engine.load_symbol_data("NVDA", "1d"), before)
+
+    def test_compacted_buckets_are_split_into_days(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        populate(engine)
+        ParquetCompactor(tmp_path, CompactionPolicy(granularity="month")).run(
+            today=date(2024, 3, 1)
+        )
+
+        LayoutMigrator(tmp_path).migrate("1d", LAYOUT_CLUSTERED)
+
+        for day in (DAY_ONE, DAY_TWO):
+            assert engine.load_cross_section("1d", day).num_rows == 9
+
+    def test_dry_run_changes_nothing(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        populate(engine)
+
+        result = LayoutMigrator(tmp_path).migrate("1d", LAYOUT_CLUSTERED, dry_run=True)
+
+        assert (result.days, result.files_read, result.files_written) == (2, 6, 0)
+        assert engine.frame_layout("1d") == LAYOUT_BY_SYMBOL
+        assert not list((tmp_path / "frame=1d").glob("date=*"))
+
+    def test_rerun_removes_leftovers_of_interrupted_migration(self, tmp_path):
+        engine = ParquetStorageEngine(tmp_path)
+        populate(engine)
+        migrator = LayoutMigrator(tmp_path)
+        migrator.migrate("1d", LAYOUT_CLUSTERED)
+        # Simulate a crash after the marker flipped but before cleanup
+        (tmp_path / "frame=1d" / "symbol=AAPL" / "date=2024-01-02").mkdir(parents=True)
+
+        result = migrator.migrate("1d", LAYOUT_CLUSTERED)
+
+        assert result.files_written == 0
+        assert not list((tmp_path / "frame=1d").glob("symbol=*"))
+
+
+class TestClusteredQueries:
+    def test_loader_filters_clustered_frame_by_symbol(self, clustered, tmp_path):
+        df = load_ohlcv("MSFT", timeframe="1d", root=tmp_path)
+
+        assert len(df) == 6
+        assert set(df["symbol"]) == {"MSFT"}
+
+    def test_duckdb_view_reads_clustered_frame(self, clustered, tmp_path, monkeypatch):
+        from marketpipe.aggregation.infrastructure import duckdb_views
+
+        monkeypatch.setattr(duckdb_views, "AGG_ROOT", tmp_path)
+        ParquetCompactor(tmp_path).run(today=date(2024, 2, 1))
+        duckdb_views.ensure_views()
+
+        result = duckdb_views.query(
+            "SELECT symbol, COUNT(*) AS n FROM bars_1d GROUP BY symbol ORDER BY symbol"
+        )
+
+        assert result["symbol"].tolist() == list(SYMBOLS)
+        assert result["n"].tolist() == [6, 6, 6]
+        assert isinstance(duckdb_views._get_connection(), duckdb.DuckDBPyConnection)
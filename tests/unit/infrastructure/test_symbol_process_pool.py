@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for process-pool symbol ingestion and the shared rate limiter."""
+
+from __future__ import annotations
+
+import multiprocessing
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from marketpipe.domain.value_objects import Symbol, TimeRange
+from marketpipe.ingestion.domain.entities import IngestionJob, IngestionJobId, ProcessingState
+from marketpipe.ingestion.domain.value_objects import IngestionConfiguration, IngestionPartition
+from marketpipe.ingestion.infrastructure import rate_limit
+from marketpipe.ingestion.infrastructure.process_pool import SymbolProcessPool
+from marketpipe.ingestion.infrastructure.rate_limit import (
+    SharedRateLimiter,
+    create_rate_limiter_from_config,
+    install_shared_rate_limiter,
+)
+from marketpipe.ingestion.infrastructure.repositories import SqliteIngestionJobRepository
+
+
+def drain(limiter: SharedRateLimiter, tokens: int) -> None:
+    for _ in range(tokens):
+        limiter.acquire()
+
+
+class StubCoordinator:
+    """Worker-process coordinator: one bar per letter of the symbol."""
+
+    async def process_symbol(self, job, symbol):
+        if symbol.value == "BAD":
+            raise ConnectionError("provider down")
+        return len(symbol.value), IngestionPartition(
+            symbol=symbol,
+            file_path=Path(f"/tmp/{symbol.value}.parquet"),
+            record_count=len(symbol.value),
+            file_size_bytes=1,
+            created_at=datetime.now(timezone.utc),
+        )
+
+
+def build_stub_coordinator() -> StubCoordinator:
+    return StubCoordinator()
+
+
+class PolygonRequestCoordinator:
+    """Worker-process coordinator: three rate-limited Polygon requests per symbol."""
+
+    def __init__(self):
+        from marketpipe.ingestion.infrastructure.polygon_adapter import PolygonMarketDataAdapter
+
+        # Built after the pool installs its limiter, as in real workers
+        self.adapter = PolygonMarketDataAdapter(api_key="test", rate_limit_per_minute=600)
+
+    async def process_symbol(self, job, symbol):
+        import time
+
+        times = []
+        for _ in range(3):
+            await self.adapter._apply_rate_limit()
+            times.append(time.time())
+        return times, None
+
+
+def build_polygon_coordinator() -> PolygonRequestCoordinator:
+    return PolygonRequestCoordinator()
+
+
+def make_job(*symbols: str) -> IngestionJob:
+    return IngestionJob(
+        job_id=IngestionJobId(Symbol(symbols[0]), "2024-01-08"),
+        configuration=IngestionConfiguration(
+            output_path=Path("/tmp/test"),
+            compression="snappy",
+            max_workers=2,
+            batch_size=1000,
+            rate_limit_per_minute=None,
+            feed_type="iex",
+        ),
+        symbols=[Symbol(s) for s in symbols],
+        time_range=TimeRange.from_dates(date(2024, 1, 8), date(2024, 1, 9)),
+    )
+
+
+class TestSharedRateLimiter:
+    def test_processes_draw_on_one_bucket(self):
+        limiter = SharedRateLimiter(capacity=10, refill_rate=0.001)
+
+        child = multiprocessing.get_context("spawn").Process(target=drain, args=(limiter, 4))
+        child.start()
+        child.join(60)
+
+        assert child.exitcode == 0
+        assert limiter.get_available_tokens() == pytest.approx(6, abs=0.1)
+
+    def test_retry_after_empties_bucket(self):
+        limiter = SharedRateLimiter(capacity=10, refill_rate=1000)
+
+        limiter._start_retry_after(60)
+
+        assert limiter._take(1) > 59
+        limiter.reset()
+        assert limiter._take(1) == 0
+
+    def test_installed_limiter_is_used_by_adapters(self):
+        limiter = SharedRateLimiter(capacity=5, refill_rate=1)
+        install_shared_rate_limiter(limiter)
+        try:
+            assert create_rate_limiter_from_config(200, provider_name="alpaca") is limiter
+            assert limiter._provider_name == "alpaca"
+        finally:
+            install_shared_rate_limiter(None)
+
+        assert rate_limit._shared_limiter is None
+        assert create_rate_limiter_from_config(200) is not limiter
+
+
+class TestSymbolProcessPool:
+    @pytest.mark.asyncio
+    async def test_results_stream_back_per_symbol(self):
+        pool = SymbolProcessPool(build_stub_coordinator, workers=2, rate_limit_per_min=600)
+        job = make_job("AAPL", "MSFT", "BAD")
+        try:
+            results = {symbol.value: r async for symbol, r in pool.process(job, list(job.symbols))}
+        finally:
+            pool.shutdown()
+
+        assert results["AAPL"][0] == 4
+        assert results["MSFT"][1].symbol == Symbol("MSFT")
+        assert isinstance(results["BAD"], RuntimeError)
+        assert "ConnectionError: provider down" in str(results["BAD"])
+
+    @pytest.mark.asyncio
+    async def test_workers_share_non_alpaca_provider_quota(self):
+        # 120/min with a burst of 2: 2 requests at once, then one every 0.5s
+        pool = SymbolProcessPool(
+            build_polygon_coordinator, workers=2, rate_limit_per_min=120, burst_size=2
+        )
+        job = make_job("AAPL", "MSFT")
+        try:
+            results = [r async for _, r in pool.process(job, list(job.symbols))]
+        finally:
+            pool.shutdown()
+
+        times = sorted(t for r in results for t in r[0])
+        assert len(times) == 6
+        # Per-process buckets would allow all 6 within ~0.5s; one shared
+        # bucket needs 4 refills of 0.5s after the burst, and never lets 3
+        # requests through within one refill.
+        assert times[-1] - times[0] >= 1.8
+        for earlier, later in zip(times, times[2:]):
+            assert later - earlier >= 0.45
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError, match="workers"):
+            SymbolProcessPool(build_stub_coordinator, workers=0, rate_limit_per_min=None)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_records_symbols_from_worker_processes(tmp_path):
+    from marketpipe.ingestion.application.services import IngestionCoordinatorService
+
+    repo = SqliteIngestionJobRepository(tmp_path / "jobs.db")
+    await repo.save(make_job("AAPL", "MSFT"))
+    (job,) = await repo.fetch_and_lock(ProcessingState.PENDING, 1, "w1", 60)
+
+    class Publisher:
+        async def publish(self, event):
+            pass
+
+    pool = SymbolProcessPool(build_stub_coordinator, workers=2, rate_limit_per_min=None)
+    coordinator = IngestionCoordinatorService(
+        job_service=None,
+        job_repository=repo,
+        checkpoint_repository=None,
+        metrics_repository=None,
+        market_data_provider=object(),
+        data_validator=None,
+        data_storage=None,
+        event_publisher=Publisher(),
+        symbol_executor=pool,
+    )
+    try:
+        summary = await coordinator.execute_job(job.job_id)
+    finally:
+        pool.shutdown()
+
+    assert (summary["symbols_processed"], summary["total_bars"]) == (2, 8)
+    assert (await repo.get_by_id(job.job_id)).state == ProcessingState.COMPLETED
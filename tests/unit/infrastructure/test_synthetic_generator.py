@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the vectorized synthetic bar generator and the fake provider on top of it."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+from datetime import date
+
+import numpy as np
+import pytest
+
+from marketpipe.domain.calendar import NS_PER_DAY, NS_PER_MINUTE, TradingCalendar
+from marketpipe.domain.market_data import MarketDataUnavailableError
+from marketpipe.domain.value_objects import Symbol, TimeRange
+from marketpipe.ingestion.infrastructure.fake_adapter import FakeMarketDataAdapter
+from marketpipe.ingestion.infrastructure.synthetic import FaultRates, SyntheticBarGenerator
+
+DAY = 19_723  # 2024-01-01, a Monday and a market holiday
+START = DAY * NS_PER_DAY
+
+
+def test_bars_are_consistent_and_do_not_depend_on_the_request():
+    generator = SyntheticBarGenerator(seed=7)
+    week = generator.generate("AAPL", START, START + 7 * NS_PER_DAY)
+    assert len(week) == 7 * 1440
+    assert np.all(np.diff(week.ts_ns) == NS_PER_MINUTE)
+    assert np.all(week.high >= np.maximum(week.open, week.close))
+    assert np.all(week.low <= np.minimum(week.open, week.close))
+    assert np.all(week.volume >= 1) and np.all(week.low > 0)
+
+    # An unaligned slice of the same week matches bar for bar
+    part = generator.generate("AAPL", START + 2_000 * NS_PER_MINUTE + 1, START + 3 * NS_PER_DAY)
+    assert part.ts_ns[0] == START + 2_001 * NS_PER_MINUTE
+    offset = 2_001
+    for name in ("open", "high", "low", "close", "volume", "vwap"):
+        assert np.array_equal(getattr(part, name), getattr(week, name)[offset : offset + len(part)])
+
+    assert not np.array_equal(
+        generator.generate("MSFT", START, START + NS_PER_DAY).close, week.close[:1440]
+    )
+    assert not np.array_equal(
+        SyntheticBarGenerator(seed=8).generate("AAPL", START, START + NS_PER_DAY).close,
+        week.close[:1440],
+    )
+
+
+def test_seeding_is_stable_across_processes():
+    code = (
+        "from marketpipe.ingestion.infrastructure.synthetic import SyntheticBarGenerator;"
+        f"print(SyntheticBarGenerator(seed=7).generate('AAPL', {START}, {START + NS_PER_DAY}).close.sum())"
+    )
+    here = SyntheticBarGenerator(seed=7).generate("AAPL", START, START + NS_PER_DAY).close.sum()
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code], capture_output=True, text=True, check=True
+    )
+    assert float(out.stdout.strip()) == pytest.approx(here, abs=0)
+
+
+def test_regular_sessions_follow_the_exchange_calendar():
+    generator = SyntheticBarGenerator(sessions="regular", calendar=TradingCalendar(2023, 2025))
+    bars = generator.generate("AAPL", START, START + 7 * NS_PER_DAY, frame_seconds=300)
+
+    days = bars.ts_ns // NS_PER_DAY - DAY
+    # Monday is New Year's Day; Saturday and Sunday have no session
+    assert sorted(set(days.tolist())) == [1, 2, 3, 4]
+    assert len(bars) == 4 * 78
+    assert bars.ts_ns[0] == (DAY + 1) * NS_PER_DAY + (14 * 60 + 30) * NS_PER_MINUTE
+
+    hourly = generator.generate("AAPL", START + NS_PER_DAY, START + 2 * NS_PER_DAY, 3600)
+    assert len(hourly) == 7  # 14:30 ... 20:30, the last one partial
+
+
+def test_bar_faults():
+    clean = SyntheticBarGenerator(seed=1).generate("AAPL", START, START + NS_PER_DAY)
+
+    def faulty(**rates):
+        generator = SyntheticBarGenerator(seed=1, faults=FaultRates(**rates))
+        return generator.generate("AAPL", START, START + NS_PER_DAY)
+
+    gaps = faulty(gaps=0.05)
+    assert 1300 < len(gaps) < 1400 and np.isin(gaps.ts_ns, clean.ts_ns).all()
+
+    duplicates = faulty(duplicates=0.05)
+    assert 1480 < len(duplicates) < 1540
+    assert np.count_nonzero(np.diff(duplicates.ts_ns) == 0) == len(duplicates) - 1440
+
+    swapped = faulty(out_of_order=0.05)
+    assert len(swapped) == 1440 and 40 < np.count_nonzero(np.diff(swapped.ts_ns) < 0) < 100
+    assert np.array_equal(np.sort(swapped.ts_ns), clean.ts_ns)
+
+    violations = faulty(ohlc_violations=0.05)
+    broken = violations.high < np.maximum(violations.open, violations.close)
+    assert 40 < broken.sum() < 100
+    assert np.array_equal(violations.close, clean.close)
+
+    # Faults are part of the data: same seed, same faults
+    assert np.array_equal(
+        faulty(gaps=0.05, duplicates=0.05).ts_ns, faulty(gaps=0.05, duplicates=0.05).ts_ns
+    )
+
+
+def test_fault_rates_parse_and_request_faults():
+    rates = FaultRates.parse("gaps=0.01, rate_limited=0.2,timeouts=0.1")
+    assert rates == FaultRates(gaps=0.01, rate_limited=0.2, timeouts=0.1)
+    assert FaultRates.from_config({"duplicates": "0.5"}).duplicates == 0.5
+    assert FaultRates.parse("") == FaultRates() and not FaultRates().corrupts_bars
+    with pytest.raises(ValueError, match="Unknown fault"):
+        FaultRates.parse("gapz=0.1")
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        FaultRates(gaps=1.5)
+    with pytest.raises(ValueError, match="Invalid fault rate"):
+        FaultRates.parse("gaps=often")
+
+    generator = SyntheticBarGenerator(faults=rates)
+    faults = [generator.request_fault("AAPL", attempt) for attempt in range(2_000)]
+    assert 300 < faults.count("rate_limited") < 500
+    assert 130 < faults.count("timeout") < 270
+    assert faults == [generator.request_fault("AAPL", attempt) for attempt in range(2_000)]
+
+
+def fetch(adapter: FakeMarketDataAdapter, symbol: str = "AAPL", timeframe: str = "1m"):
+    time_range = TimeRange.from_dates(date(2024, 1, 2), date(2024, 1, 3))
+    return asyncio.run(adapter.fetch_bars_for_symbol(Symbol(symbol), time_range, 1000, timeframe))
+
+
+def test_fake_provider_is_reproducible():
+    first = fetch(FakeMarketDataAdapter(seed=5))
+    second = fetch(FakeMarketDataAdapter(seed=5))
+    assert len(first) == 1440
+    assert [(b.timestamp_ns, b.close_price, b.volume) for b in first] == [
+        (b.timestamp_ns, b.close_price, b.volume) for b in second
+    ]
+    assert len(fetch(FakeMarketDataAdapter(sessions="regular"), timeframe="5m")) == 78
+
+
+def test_fake_provider_injects_faults():
+    # Bars that break OHLC rules cannot become entities and are dropped
+    adapter = FakeMarketDataAdapter(faults=FaultRates(ohlc_violations=0.05, duplicates=0.05))
+    bars = fetch(adapter)
+    assert 1400 < len(bars) < 1500 and len({b.timestamp_ns for b in bars}) < len(bars)
+
+    adapter = FakeMarketDataAdapter.from_config(
+        {"provider": "fake", "faults": "rate_limited=0.5,timeouts=0.5"}
+    )
+    outcomes = []
+    for _ in range(20):
+        try:
+            fetch(adapter)
+            outcomes.append("ok")
+        except MarketDataUnavailableError:
+            outcomes.append("rate_limited")
+        except TimeoutError:
+            outcomes.append("timeout")
+    assert set(outcomes) == {"rate_limited", "timeout"}
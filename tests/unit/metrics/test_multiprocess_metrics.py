@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for metrics aggregated across processes and batched SQLite metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+from prometheus_client import CollectorRegistry
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from marketpipe.metrics import MetricsBatch, SqliteMetricsRepository
+from marketpipe.metrics_multiprocess import cleanup_dead_processes, multiprocess_enabled
+from marketpipe.metrics_server import AsyncMetricsServer
+
+# A worker process: counts 3 jobs, observes one latency, reports 5 queued writes
+WORKER = """
+import sys
+from prometheus_client import Counter, Gauge, Histogram
+
+Counter("mp_test_jobs", "Jobs", ["kind"]).labels(kind="ingest").inc(3)
+Histogram("mp_test_latency_seconds", "Latency").observe(0.2)
+Gauge("mp_test_queue_depth", "Queue", multiprocess_mode="livesum").set(5)
+print("ready", flush=True)
+sys.stdin.read()
+"""
+
+
+def start_worker(directory) -> subprocess.Popen:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(directory)}
+    worker = subprocess.Popen(
+        [sys.executable, "-c", WORKER],
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert worker.stdout.readline().strip() == "ready"
+    return worker
+
+
+def stop(worker: subprocess.Popen) -> None:
+    worker.communicate("")
+    assert worker.returncode == 0
+
+
+def db_files(directory) -> list[str]:
+    return sorted(f.name for f in directory.glob("*.db"))
+
+
+def collect(directory) -> CollectorRegistry:
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry, path=str(directory))
+    return registry
+
+
+def test_exited_workers_are_archived(tmp_path):
+    live, exited = start_worker(tmp_path), [start_worker(tmp_path) for _ in range(2)]
+    for worker in exited:
+        stop(worker)
+
+    assert cleanup_dead_processes(str(tmp_path)) == sorted(w.pid for w in exited)
+    assert db_files(tmp_path) == sorted(
+        [
+            "counter_archive.db",
+            "histogram_archive.db",
+            f"counter_{live.pid}.db",
+            f"histogram_{live.pid}.db",
+            f"gauge_livesum_{live.pid}.db",
+        ]
+    )
+    registry = collect(tmp_path)
+    assert registry.get_sample_value("mp_test_jobs_total", {"kind": "ingest"}) == 9
+    assert registry.get_sample_value("mp_test_latency_seconds_count") == 3
+    assert registry.get_sample_value("mp_test_queue_depth") == 5
+
+    stop(live)
+    assert cleanup_dead_processes(str(tmp_path)) == [live.pid]
+    # Archiving twice adds to the existing totals
+    assert db_files(tmp_path) == [
+        "counter_archive.db",
+        "histogram_archive.db",
+    ]
+    registry = collect(tmp_path)
+    assert registry.get_sample_value("mp_test_jobs_total", {"kind": "ingest"}) == 9
+    assert registry.get_sample_value("mp_test_latency_seconds_bucket", {"le": "0.25"}) == 3
+    assert registry.get_sample_value("mp_test_queue_depth") is None
+
+
+def test_archiving_waits_for_the_collect_lock_of_other_processes(tmp_path):
+    import threading
+
+    exited = start_worker(tmp_path)
+    stop(exited)
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from marketpipe.metrics_multiprocess import collect_lock\n"
+            f"with collect_lock({str(tmp_path)!r}):\n"
+            "    print('locked', flush=True)\n"
+            "    sys.stdin.read()\n",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert holder.stdout.readline().strip() == "locked"
+
+    archived: list[int] = []
+    cleanup = threading.Thread(
+        target=lambda: archived.extend(cleanup_dead_processes(str(tmp_path)))
+    )
+    cleanup.start()
+    cleanup.join(0.5)
+    assert cleanup.is_alive()  # blocked by the other process's lock
+    assert f"counter_{exited.pid}.db" in db_files(tmp_path)
+
+    holder.communicate("")
+    cleanup.join(10)
+    assert archived == [exited.pid]
+    assert db_files(tmp_path) == ["counter_archive.db", "histogram_archive.db"]
+
+
+@pytest.mark.asyncio
+async def test_server_sums_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    # The variable is set after prometheus_client was imported: this process keeps its own
+    assert not multiprocess_enabled()
+    live, exited = start_worker(tmp_path), start_worker(tmp_path)
+    stop(exited)
+
+    with socket.socket() as s:
+        s.bind(("", 0))
+        port = s.getsockname()[1]
+    try:
+        async with AsyncMetricsServer(port=port, cache_ttl=0).run_context():
+            async with httpx.AsyncClient(timeout=10) as client:
+                text = (await client.get(f"http://localhost:{port}/metrics")).text
+    finally:
+        stop(live)
+
+    assert 'mp_test_jobs_total{kind="ingest"} 6.0' in text
+    assert "mp_test_queue_depth 5.0" in text
+    assert not (tmp_path / f"counter_{exited.pid}.db").exists()
+
+
+def test_metrics_batch_writes_in_transactions(tmp_path):
+    repo = SqliteMetricsRepository(str(tmp_path / "metrics.db"))
+    batch = MetricsBatch(str(tmp_path / "metrics.db"), flush_rows=3, flush_seconds=60)
+    batch.add("batched", 1.0, "alpaca", "iex")
+    batch.add("batched", 2.0, "alpaca", "iex")
+    assert batch.pending == 2
+    assert asyncio.run(repo.get_metrics_history("batched")) == []
+
+    batch.add("batched", 3.0, "alpaca", "iex")  # full batch: written by the flush thread
+    deadline = time.monotonic() + 5
+    points = asyncio.run(repo.get_metrics_history("batched"))
+    while len(points) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+        points = asyncio.run(repo.get_metrics_history("batched"))
+    assert [(p.value, p.provider) for p in points] == [
+        (1.0, "alpaca"),
+        (2.0, "alpaca"),
+        (3.0, "alpaca"),
+    ]
+
+    # Readers of the repository see the points this process buffered
+    repo.enqueue("buffered", 7.0)
+    other = SqliteMetricsRepository(str(tmp_path / "metrics.db"))
+    assert [p.value for p in asyncio.run(other.get_metrics_history("buffered"))] == [7.0]
+    assert batch.flush() == 0
+
+
+def test_readers_wait_for_rows_the_flush_thread_is_writing(tmp_path, monkeypatch):
+    import sqlite3
+    import threading
+
+    repo = SqliteMetricsRepository(str(tmp_path / "metrics.db"))
+    repo.enqueue("in_flight", 4.0)
+
+    connecting = threading.Event()
+    release = threading.Event()
+    connect = sqlite3.connect
+
+    def slow_connect(*args, **kwargs):
+        if threading.current_thread().name == "slow-flush":
+            connecting.set()
+            release.wait(5)
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr("marketpipe.metrics.sqlite3.connect", slow_connect)
+    flusher = threading.Thread(target=repo._batch.flush, name="slow-flush")
+    flusher.start()
+    assert connecting.wait(5)
+    assert repo._batch.pending == 0  # taken by the flush, not yet committed
+
+    threading.Timer(0.2, release.set).start()
+    points = asyncio.run(repo.get_metrics_history("in_flight"))
+    flusher.join(5)
+
+    assert [p.value for p in points] == [4.0]
+
+
+def test_metrics_batch_recreates_a_removed_database(tmp_path, caplog, monkeypatch):
+    db_path = tmp_path / "metrics.db"
+    repo = SqliteMetricsRepository(str(db_path))
+    repo.enqueue("recreated", 1.0)
+    db_path.unlink()
+
+    assert repo._batch.flush() == 1
+    assert [p.value for p in asyncio.run(repo.get_metrics_history("recreated"))] == [1.0]
+
+    # Earlier tests may have disabled the logger through logging.config
+    monkeypatch.setattr(logging.getLogger("marketpipe.metrics"), "disabled", False)
+    gone = MetricsBatch(str(tmp_path / "gone" / "metrics.db"))
+    gone.add("dropped", 1.0, "alpaca", "iex")
+    with caplog.at_level(logging.WARNING, logger="marketpipe.metrics"):
+        assert gone.flush() == 0
+    assert gone.pending == 0
+    assert "Dropped 1 metric rows" in caplog.text
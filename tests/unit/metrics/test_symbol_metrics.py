@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for bounded per-symbol summaries and pre-resolved metric handles."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest
+
+from marketpipe.metrics import PROCESSING_TIME, REQUESTS, metric_handle, record_metric
+from marketpipe.symbol_metrics import HyperLogLog, SpaceSaving, SymbolMetrics
+
+
+def test_space_saving_keeps_heavy_hitters_in_bounded_memory():
+    rng = random.Random(3)
+    sketch = SpaceSaving(capacity=40)
+    exact: dict[str, float] = {}
+    # 5,000 symbols with a long tail and a few heavy ones
+    for i in range(20_000):
+        symbol = f"S{int(rng.paretovariate(1.2)) % 5_000}" if i % 4 else f"HEAVY{i % 3}"
+        sketch.add(symbol, 2.0)
+        exact[symbol] = exact.get(symbol, 0.0) + 2.0
+
+    top = sketch.top(5)
+    assert len(sketch._counts) == 40
+    heaviest = sorted(exact, key=exact.get, reverse=True)[:5]
+    assert [e.symbol for e in top][:3] == heaviest[:3]
+    for entry in top:
+        assert entry.value - entry.error <= exact[entry.symbol] <= entry.value
+    with pytest.raises(ValueError):
+        SpaceSaving(0)
+
+
+def test_hyperloglog_estimates_distinct_symbols():
+    small, large = HyperLogLog(), HyperLogLog()
+    for i in range(50):
+        small.add(f"SYM{i}")
+        small.add(f"SYM{i}")
+    for i in range(20_000):
+        large.add(f"SYM{i}")
+    assert small.estimate() == pytest.approx(50, abs=2)
+    assert large.estimate() == pytest.approx(20_000, rel=0.1)
+    assert len(large._registers) == 1024
+
+
+def test_summaries_are_exported_with_bounded_series():
+    metrics = SymbolMetrics(top_k=3)
+    registry = CollectorRegistry()
+    registry.register(metrics)
+    summary = metrics.summary("validation_errors")
+    assert metrics.summary("validation_errors") is summary
+    metrics.record("validation_errors", "AAPL", 500)
+    metrics.record("validation_errors", "MSFT", 200)
+    for i in range(1_000):
+        summary.record(f"SYM{i}", 1)
+
+    text = generate_latest(registry).decode()
+    series = [line for line in text.splitlines() if line.startswith("mp_symbol_top{")]
+    assert len(series) == 3
+    assert 'mp_symbol_top{metric="validation_errors",symbol="AAPL"} 500.0' in text
+    assert 'mp_symbol_value_total{metric="validation_errors"} 1700.0' in text
+    distinct = registry.get_sample_value("mp_symbol_distinct", {"metric": "validation_errors"})
+    assert distinct == pytest.approx(1_000, rel=0.1)
+    snapshot = metrics.snapshot()["validation_errors"]
+    assert snapshot["top"][:2] == [("AAPL", 500.0), ("MSFT", 200.0)]
+
+
+def test_metric_handles_are_resolved_once(monkeypatch):
+    monkeypatch.setenv("MP_DISABLE_SQLITE_METRICS", "1")
+    handle = metric_handle("ingest_request_total", provider="handle-test", feed="iex")
+    assert metric_handle("ingest_request_total", provider="handle-test", feed="iex") is handle
+
+    requests = REQUESTS.labels(source="unknown", provider="handle-test", feed="iex")
+    before = requests._value.get()
+    ingestion = PROCESSING_TIME.labels(operation="ingestion")
+    observed = ingestion._count.get()
+    handle.record(2)
+    record_metric("ingest_request_total", 3, provider="handle-test", feed="iex")
+    assert requests._value.get() == before + 5
+    assert ingestion._count.get() == observed + 2
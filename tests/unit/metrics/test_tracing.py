@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for per-stage tracing spans and the sampling CPU profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+from datetime import date
+
+import pytest
+from prometheus_client import REGISTRY
+
+from marketpipe.bench.stub_server import StubBarServer
+from marketpipe.domain.value_objects import Symbol, TimeRange
+from marketpipe.ingestion.infrastructure.polygon_adapter import PolygonMarketDataAdapter
+from marketpipe.profiling import SamplingProfiler
+from marketpipe.tracing import current_span, span, tracing
+
+
+def stage_count(stage: str) -> float:
+    return REGISTRY.get_sample_value("mp_stage_duration_seconds_count", {"stage": stage}) or 0.0
+
+
+def test_spans_nest_across_tasks_and_threads():
+    async def symbol(name: str) -> None:
+        with span("symbol", symbol=name):
+            await asyncio.sleep(0.01)
+            with span("store"):
+                await asyncio.to_thread(time.sleep, 0.001)
+
+    async def job() -> None:
+        with span("job"):
+            await asyncio.gather(symbol("AAPL"), symbol("MSFT"))
+
+    before = stage_count("store")
+    with tracing() as tracer:
+        asyncio.run(job())
+    assert stage_count("store") == before + 2
+
+    spans = {(s.name, s.attributes.get("symbol")): s for s in tracer.spans}
+    root = spans[("job", None)]
+    aapl, msft = spans[("symbol", "AAPL")], spans[("symbol", "MSFT")]
+    assert root.parent_id is None
+    assert aapl.parent_id == msft.parent_id == root.span_id
+    # Concurrent symbols land on tracks of their own
+    assert len({root.track, aapl.track, msft.track}) == 3
+    stores = [s for s in tracer.spans if s.name == "store"]
+    assert {s.parent_id for s in stores} == {aapl.span_id, msft.span_id}
+    assert all(s.duration_ns >= 1_000_000 for s in stores)
+    assert tracer.stage_totals()["symbol"][0] == 2
+
+
+def test_span_without_tracer_only_observes_the_histogram():
+    before = stage_count("unit_test_stage")
+    with span("unit_test_stage") as current:
+        assert current is None and current_span() is None
+    assert stage_count("unit_test_stage") == before + 1
+
+
+def test_trace_files(tmp_path):
+    with tracing(tmp_path / "trace.json") as tracer:
+        with span("job", job_id="J1"):
+            with pytest.raises(ValueError):
+                with span("page", page=1, cached=False):
+                    raise ValueError("bad page")
+    tracer.write(tmp_path / "trace.otlp.json")
+
+    chrome = json.loads((tmp_path / "trace.json").read_text())
+    events = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in events] == ["job", "page"]
+    assert events[1]["args"] == {"page": 1, "cached": False, "error": "ValueError: bad page"}
+    assert events[0]["ts"] <= events[1]["ts"] and events[0]["dur"] >= events[1]["dur"]
+
+    otlp = json.loads((tmp_path / "trace.otlp.json").read_text())
+    spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    page, job = spans
+    assert page["parentSpanId"] == job["spanId"] and "parentSpanId" not in job
+    assert page["traceId"] == job["traceId"] and len(job["traceId"]) == 32
+    assert page["status"] == {"code": 2, "message": "ValueError: bad page"}
+    assert page["attributes"] == [
+        {"key": "page", "value": {"intValue": "1"}},
+        {"key": "cached", "value": {"boolValue": False}},
+    ]
+    with pytest.raises(ValueError, match="Unknown trace format"):
+        tracer.write(tmp_path / "trace.txt", format="jaeger")
+
+
+def test_http_adapter_stages():
+    with StubBarServer() as server:
+        adapter = PolygonMarketDataAdapter(
+            api_key="test", base_url=server.base_url, rate_limit_per_minute=1000
+        )
+        time_range = TimeRange.from_dates(date(2024, 1, 2), date(2024, 1, 3))
+        with tracing() as tracer:
+            with span("fetch"):
+                bars = asyncio.run(
+                    adapter.fetch_bars_for_symbol(Symbol("AAPL"), time_range, 1000, "1m")
+                )
+    assert len(bars) == 1441
+
+    by_id = {s.span_id: s for s in tracer.spans}
+    pages = [s for s in tracer.spans if s.name == "page"]
+    assert [p.attributes["page"] for p in pages] == [1, 2]
+    for name in ("rate_limit_wait", "http", "parse_json", "translate"):
+        stages = [s for s in tracer.spans if s.name == name]
+        assert len(stages) == 2, name
+        # Each stage is nested somewhere below a page
+        for stage in stages:
+            parent = by_id[stage.parent_id]
+            while parent.name != "page":
+                parent = by_id[parent.parent_id]
+
+
+def test_sampling_profiler(tmp_path):
+    def busy_loop(seconds: float) -> int:
+        end, n = time.perf_counter() + seconds, 0
+        while time.perf_counter() < end:
+            n += 1
+        return n
+
+    with SamplingProfiler(interval=0.002) as profiler:
+        busy_loop(0.2)
+    # Other threads left behind by earlier tests may be sampled too
+    assert any(f.endswith(":busy_loop") for f, _ in profiler.top(100))
+
+    lines = profiler.write(tmp_path / "run.folded").read_text().splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == profiler.samples
+    assert any(line.startswith("MainThread;") and ":busy_loop " in line for line in lines)
+    with pytest.raises(ValueError):
+        SamplingProfiler(interval=0)
+
+
+def test_sampling_profiler_counts_stacks(tmp_path):
+    profiler = SamplingProfiler()
+
+    def leaf():
+        for _ in range(3):
+            profiler._sample("worker", sys._getframe())
+
+    def caller():
+        leaf()
+        profiler._sample("worker", sys._getframe())
+
+    caller()
+
+    leaf_label, caller_label = f"{__name__}:leaf", f"{__name__}:caller"
+    assert profiler.samples == 4
+    assert profiler.top(2) == [(leaf_label, 3), (caller_label, 1)]
+    lines = profiler.write(tmp_path / "run.folded").read_text().splitlines()
+    assert lines[0].startswith("worker;") and lines[0].endswith(f";{caller_label};{leaf_label} 3")
+    assert lines[1].endswith(f";{caller_label} 1")
+
+
+def test_ingest_profile_run_writes_trace_and_profile(tmp_path, monkeypatch, capsys):
+    from marketpipe.cli.ohlcv_ingest import _run_traced
+
+    async def run_ingestion():
+        with span("job"):
+            await asyncio.to_thread(time.sleep, 0.05)
+        return "job-1", {}
+
+    monkeypatch.chdir(tmp_path)
+    assert _run_traced(run_ingestion, tmp_path / "ingest.otlp.json", True) == ("job-1", {})
+
+    out = capsys.readouterr().out
+    assert "job" in out and "Trace written" in out and "CPU profile" in out
+    assert json.loads((tmp_path / "ingest.otlp.json").read_text())["resourceSpans"]
+    assert len(list((tmp_path / "data" / "profiles").glob("ingest-*.folded"))) == 1
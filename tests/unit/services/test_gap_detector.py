@@ -244,3 +244,18 @@ class TestGapDetectorService:
             expected_missing = [d for d in all_days_in_range if d != dt.date(2023, 1, 15)]
 
             assert missing == expected_missing
+
+    def test_find_missing_days_with_calendar_skips_closed_days(self):
+        """With a trading calendar only exchange sessions can be missing."""
+        from marketpipe.domain.calendar import TradingCalendar
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = GapDetectorService(Path(temp_dir), calendar=TradingCalendar(2022, 2023))
+            jan_dir = Path(temp_dir) / "symbol=AAPL" / "year=2023" / "month=01"
+            jan_dir.mkdir(parents=True)
+            (jan_dir / "day=03.parquet").touch()
+
+            # Jan 1 (Sunday) and its observed holiday Jan 2 are not sessions
+            missing = service.find_missing_days("AAPL", dt.date(2022, 12, 31), dt.date(2023, 1, 9))
+
+            assert missing == [dt.date(2023, 1, d) for d in (4, 5, 6, 9)]
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the end-to-end ingestion benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+from typer.testing import CliRunner
+
+from marketpipe.bench import (
+    BenchResult,
+    BenchScenario,
+    ResultStore,
+    compare_results,
+    get_scenario,
+    load_baseline,
+    run_scenario,
+    save_baseline,
+)
+from marketpipe.bench.scenarios import start_date
+from marketpipe.bench.stub_server import StubBarServer
+from marketpipe.cli import app
+from marketpipe.ingestion.infrastructure import provider_registry
+from marketpipe.ingestion.infrastructure.synthetic import FaultRates, SyntheticBarGenerator
+
+
+def result(scenario: str = "smoke", bars: int = 10_000, seconds: float = 1.0, rss: float = 200.0):
+    return BenchResult(
+        scenario=scenario,
+        bars=bars,
+        seconds=seconds,
+        stages={"fetch": 0.4, "store": 0.2},
+        peak_rss_mb=rss,
+        params={"symbols": 2, "days": 2},
+    )
+
+
+def test_scenarios():
+    assert start_date(date(2026, 10, 18)) == date(2026, 9, 7)  # a Monday
+    assert get_scenario("wide").symbol_names[-1] == "SYM019"
+    custom = BenchScenario.custom(10, 5, "5m", "http")
+    assert custom.name == "http-10x5d-5m"
+    assert (custom.end - custom.start).days == 5
+    with pytest.raises(KeyError, match="available: smoke"):
+        get_scenario("nope")
+    with pytest.raises(ValueError, match="at most 30"):
+        BenchScenario.custom(1, 31)
+    with pytest.raises(ValueError, match="source"):
+        BenchScenario.custom(1, 1, source="ftp")
+
+
+def test_result_store_and_baseline_round_trip(tmp_path):
+    store = ResultStore(tmp_path / "results.jsonl")
+    assert store.load() == [] and store.latest() == {}
+    store.append(result(bars=8_000))
+    store.append(result(bars=9_000))
+    store.append(result("wide"))
+
+    latest = store.latest()
+    assert latest["smoke"].bars == 9_000 and latest["smoke"].bars_per_second == 9_000
+    assert json.loads((tmp_path / "results.jsonl").read_text().splitlines()[0])[
+        "bars_per_second"
+    ] == pytest.approx(8_000)
+
+    path = tmp_path / "baseline.json"
+    save_baseline({"smoke": latest["smoke"]}, path)
+    save_baseline({"wide": latest["wide"]}, path)
+    assert load_baseline(path) == latest
+
+
+def test_compare_flags_throughput_and_memory_regressions():
+    baseline = {"smoke": result(), "wide": result("wide"), "long": result("long")}
+    current = {
+        "smoke": result(bars=9_500),  # -5%: within threshold
+        "wide": result("wide", bars=8_000),  # -20%
+        "long": result("long", rss=260.0),  # +30% memory
+        "http": result("http"),
+    }
+
+    comparisons = {c.scenario: c for c in compare_results(current, baseline, threshold=0.10)}
+
+    assert comparisons["smoke"].regressions == []
+    assert comparisons["smoke"].throughput_change == pytest.approx(-0.05)
+    assert comparisons["wide"].regressions == ["throughput 8,000 bars/s vs 10,000 (-20.0%)"]
+    assert comparisons["long"].regressions == ["peak RSS 260 MB vs 200 MB (+30.0%)"]
+    assert comparisons["http"].baseline is None and comparisons["http"].regressions == []
+    assert comparisons["smoke"].stage_changes == {"fetch": 0.0, "store": 0.0}
+    with pytest.raises(ValueError):
+        compare_results(current, baseline, threshold=-1)
+
+
+def test_stub_server_pages_cover_the_day():
+    with StubBarServer() as server:
+        url = f"{server.base_url}/v2/aggs/ticker/AAPL/range/5/minute/2024-01-02/2024-01-02"
+        with urlopen(f"{url}?limit=200") as response:
+            first = json.load(response)
+        with urlopen(first["next_url"]) as response:
+            second = json.load(response)
+        with urlopen(f"{url}?limit=1000") as response:
+            whole = json.load(response)
+        with pytest.raises(HTTPError, match="404"):
+            urlopen(f"{server.base_url}/v2/reference/tickers")
+
+    rows = first["results"] + second["results"]
+    assert len(rows) == 288 and "next_url" not in second
+    assert rows == whole["results"]
+    assert rows[1]["t"] - rows[0]["t"] == 300_000
+    assert all(r["l"] <= min(r["o"], r["c"]) and r["h"] >= max(r["o"], r["c"]) for r in rows)
+
+
+def test_stub_server_injects_rate_limits():
+    generator = SyntheticBarGenerator(faults=FaultRates(rate_limited=0.5))
+    url = "/v2/aggs/ticker/AAPL/range/1/minute/2024-01-02/2024-01-02"
+    statuses = []
+    with StubBarServer(generator=generator, retry_after=3) as server:
+        for _ in range(12):
+            try:
+                with urlopen(server.base_url + url) as response:
+                    statuses.append(response.status)
+            except HTTPError as e:
+                assert e.headers["Retry-After"] == "3"
+                statuses.append(e.code)
+    assert set(statuses) == {200, 429}
+    assert server.faults == {"rate_limited": statuses.count(429)}
+
+
+def test_run_scenario_measures_each_stage(tmp_path, monkeypatch):
+    metrics_db = os.environ.get("METRICS_DB_PATH")
+    # Other tests clear the global provider registry; the bench must not need it
+    monkeypatch.setattr(provider_registry, "_REGISTRY", {})
+    monkeypatch.setattr(provider_registry, "_AUTO_REGISTERED", True)
+
+    outcome = run_scenario(get_scenario("smoke"), workdir=tmp_path, workers=2)
+
+    assert outcome.bars == 2 * 2 * 1440
+    assert outcome.seconds > 0 and outcome.peak_rss_mb > 0
+    assert set(outcome.stages) == {"fetch", "validate", "store", "pipeline_validation", "aggregate"}
+    assert any((tmp_path / "raw").rglob("*.parquet"))
+    assert any((tmp_path / "agg").rglob("*.parquet"))
+    assert os.environ.get("METRICS_DB_PATH") == metrics_db
+
+
+def test_cli_compare_exits_on_regression(tmp_path):
+    results, baseline = tmp_path / "results.jsonl", tmp_path / "baseline.json"
+    save_baseline({"smoke": result()}, baseline)
+    ResultStore(results).append(result(bars=5_000))
+    args = ["bench", "compare", "--results", str(results), "--baseline", str(baseline)]
+
+    failed = CliRunner().invoke(app, args)
+    passed = CliRunner().invoke(app, [*args, "--threshold", "0.6"])
+
+    assert failed.exit_code == 1 and "❌ smoke: throughput 5,000" in failed.output
+    assert passed.exit_code == 0 and "✅ smoke: 5,000 bars/s (-50.0%)" in passed.output
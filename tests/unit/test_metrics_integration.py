@@ -109,42 +109,27 @@ async def test_sqlite_metrics_repository_performance_trends(metrics_repo):
     assert all(trend.bucket_start < trend.bucket_end for trend in trends)
 
 
-def test_record_metric_function_updates_prometheus_and_sqlite(temp_db):
+def test_record_metric_function_updates_prometheus_and_sqlite(temp_db, monkeypatch):
     """Test that record_metric updates both Prometheus and SQLite."""
-    # Set the global repository to use temp database
     import marketpipe.metrics as metrics_module
 
-    # Temporarily replace the global repository
-    original_repo = metrics_module._metrics_repo
-    metrics_module._metrics_repo = SqliteMetricsRepository(temp_db)
+    # The global repository follows METRICS_DB_PATH; never share data/db/core.db
+    # with other tests (or other xdist workers)
+    monkeypatch.setenv("METRICS_DB_PATH", temp_db)
+    monkeypatch.delenv("MP_DISABLE_SQLITE_METRICS", raising=False)
+    monkeypatch.setattr(metrics_module, "_metrics_repo", None)
 
-    try:
-        # Test recording metrics
-        record_metric("ingest_test_metric", 123.45)
-        record_metric("validation_test_metric", 67.89)
+    record_metric("ingest_test_metric", 123.45)
+    record_metric("validation_test_metric", 67.89)
 
-        # Check SQLite storage (run synchronously since record_metric handles async internally)
-        repo = metrics_module.get_metrics_repository()
+    # Reads flush this process's buffered rows first
+    repo = metrics_module.get_metrics_repository()
+    assert repo.db_path == temp_db
+    ingest_points = asyncio.run(repo.get_metrics_history("ingest_test_metric"))
+    validation_points = asyncio.run(repo.get_metrics_history("validation_test_metric"))
 
-        # Give it a moment for async operations
-        import time
-
-        time.sleep(0.1)
-
-        # Verify metrics were stored
-        ingest_points = asyncio.run(repo.get_metrics_history("ingest_test_metric"))
-        validation_points = asyncio.run(repo.get_metrics_history("validation_test_metric"))
-
-        assert len(ingest_points) >= 1
-        assert len(validation_points) >= 1
-
-        # Check values
-        assert any(p.value == 123.45 for p in ingest_points)
-        assert any(p.value == 67.89 for p in validation_points)
-
-    finally:
-        # Restore original repository
-        metrics_module._metrics_repo = original_repo
+    assert [p.value for p in ingest_points] == [123.45]
+    assert [p.value for p in validation_points] == [67.89]
 
 
 @pytest.mark.asyncio
@@ -241,3 +241,17 @@ def test_timestamp_alignment_validation():
     # since we can't create bars with misaligned timestamps easily
     invalid_bar = _bar(90_000_000_000)  # 1.5 minutes
     assert not service._validate_timestamp_alignment(invalid_bar)
+
+
+def test_validate_trading_hours_batch():
+    """Vectorized trading hours check uses the exchange calendar."""
+    service = ValidationDomainService()
+    in_session = 1705415400000000000  # 2024-01-16 14:30 UTC, the open
+    holiday = in_session - 86_400_000_000_000  # Martin Luther King Jr. Day
+
+    errors = service.validate_trading_hours_batch([in_session, holiday, 60_000_000_000])
+
+    assert [e.ts_ns for e in errors] == [holiday, 60_000_000_000]
+    assert all("outside regular trading hours" in e.reason for e in errors)
+    assert service.validate_trading_hours(_bar(in_session)) == []
+    assert len(service.validate_trading_hours(_bar(holiday))) == 1